@@ -2,6 +2,7 @@
 
 import { useState, useTransition } from "react";
 import { useRouter } from "next/navigation";
+import Link from "next/link";
 import { toast } from "sonner";
 import { Badge } from "@/components/ui/badge";
 import { Button } from "@/components/ui/button";
@@ -21,7 +22,7 @@ import {
 import { Textarea } from "@/components/ui/textarea";
 import { Label } from "@/components/ui/label";
 import { approveSuggestion, rejectSuggestion } from "./actions";
-import type { MarketSuggestion, SuggestionStatus } from "@/lib/suggestions-db";
+import type { DuplicateCandidate, MarketSuggestion, SuggestionStatus } from "@/lib/suggestions-db";
 import type { Market } from "@/lib/markets-data";
 import type { MarketFormValues } from "@/lib/admin-schema";
 
@@ -114,6 +115,30 @@ function DiffTable({ current, proposed }: { current: Market | null; proposed: Ma
   );
 }
 
+function DuplicateCandidates({ candidates }: { candidates: DuplicateCandidate[] }) {
+  if (candidates.length === 0) {
+    return <p className="text-sm text-muted-foreground">No likely duplicates found.</p>;
+  }
+
+  return (
+    <div className="rounded-md border border-yellow-300 bg-yellow-50 dark:border-yellow-800 dark:bg-yellow-950/20 px-3 py-2 text-sm space-y-1">
+      <p className="font-medium">Possible duplicates</p>
+      <ul className="space-y-1">
+        {candidates.map((c) => (
+          <li key={c.market_id} className="flex items-center justify-between gap-2">
+            <Link href={`/markets/${c.market_id}`} target="_blank" className="underline underline-offset-2">
+              {c.name}
+            </Link>
+            <span className="text-muted-foreground whitespace-nowrap">
+              {Math.round(c.confidence * 100)}%{c.distance_km !== null && ` · ${c.distance_km.toFixed(1)} km`}
+            </span>
+          </li>
+        ))}
+      </ul>
+    </div>
+  );
+}
+
 function SuggestionDetail({
   suggestion,
   currentMarket,
@@ -144,6 +169,10 @@ function SuggestionDetail({
         </div>
       )}
 
+      {suggestion.type === "new" && suggestion.duplicate_candidates && (
+        <DuplicateCandidates candidates={suggestion.duplicate_candidates} />
+      )}
+
       {suggestion.type === "new" && (
         <div className="space-y-2 text-sm">
           <div className="grid grid-cols-2 gap-x-4 gap-y-1">
@@ -1,6 +1,6 @@
 import { notFound } from "next/navigation";
 import type { Metadata } from "next";
-import { getMarketById } from "@/lib/db";
+import { getMarketById, getNearbyMarkets } from "@/lib/db";
 import MarketDetailClient from "@/components/market-detail-client";
 
 interface MarketPageProps {
@@ -95,7 +95,10 @@ export async function generateMetadata({ params }: MarketPageProps): Promise<Met
 
 export default async function MarketPage({ params }: MarketPageProps) {
   const resolvedParams = await params;
-  const market = await getMarketById(resolvedParams.id);
+  const [market, nearbyMarkets] = await Promise.all([
+    getMarketById(resolvedParams.id),
+    getNearbyMarkets(resolvedParams.id),
+  ]);
 
   if (!market) {
     notFound();
@@ -103,5 +106,5 @@ export default async function MarketPage({ params }: MarketPageProps) {
 
   // Read language cookie on the server (LanguageProvider in RootLayout already uses it)
   // No need to pass initialLanguage; MarketDetailClient will use the shared context.
-  return <MarketDetailClient market={market} />;
+  return <MarketDetailClient market={market} nearbyMarkets={nearbyMarkets} />;
 }
@@ -18,6 +18,7 @@ import {
 } from "lucide-react";
 import Link from "next/link";
 import { Market } from "@/lib/markets-data";
+import type { NearbyMarket } from "@/lib/db";
 import { useLanguage } from "@/components/language-provider";
 import openDirections from "@/lib/directions";
 import InteractiveMap from "@/components/interactive-map";
@@ -26,9 +27,10 @@ import { DirectionsChooserDialog } from "@/components/directions-chooser-dialog"
 
 interface MarketDetailClientProps {
   market: Market;
+  nearbyMarkets?: NearbyMarket[];
 }
 
-export default function MarketDetailClient({ market }: MarketDetailClientProps) {
+export default function MarketDetailClient({ market, nearbyMarkets = [] }: MarketDetailClientProps) {
   // Use the shared language context so translations stay consistent across the app
   const { t, language } = useLanguage();
   const [showDirectionsDialog, setShowDirectionsDialog] = useState(false);
@@ -452,6 +454,27 @@ export default function MarketDetailClient({ market }: MarketDetailClientProps)
                 </CardContent>
               </Card>
 
+              {/* Nearest markets (precomputed in pasar_malam_neighbors) */}
+              {nearbyMarkets.length > 0 && (
+                <Card>
+                  <CardHeader>
+                    <CardTitle>{t.nearbyMarkets}</CardTitle>
+                  </CardHeader>
+                  <CardContent className="space-y-3">
+                    {nearbyMarkets.map(({ market: nearby, distance_km }) => (
+                      <Link
+                        key={nearby.id}
+                        href={`/markets/${nearby.id}`}
+                        className="flex justify-between gap-3 text-sm hover:underline"
+                      >
+                        <span className="font-medium">{nearby.name}</span>
+                        <span className="text-muted-foreground whitespace-nowrap">{distance_km.toFixed(1)} km</span>
+                      </Link>
+                    ))}
+                  </CardContent>
+                </Card>
+              )}
+
               {/* Other Markets in the Same State */}
               <Card>
                 <CardHeader>
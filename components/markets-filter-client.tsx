@@ -28,6 +28,17 @@ import { createBrowserSupabaseClient } from "@/lib/supabase-client";
 import { Loader2 } from "lucide-react";
 import { dbRowToMarket } from "@/lib/db-transform";
 import MarketCard from "@/components/market-card";
+import {
+  loadAllSearchIndexes,
+  loadSearchIndex,
+  marketFingerprint,
+  marketSearchText,
+  matchesSearchQuery,
+  parseSearchQuery,
+  searchIndexPositions,
+  searchIndexText,
+  type SearchIndex,
+} from "@/lib/search-index";
 
 const malaysianStates = [
   "Semua Negeri",
@@ -49,6 +60,18 @@ const malaysianStates = [
   "Terengganu",
 ];
 
+// Normalized search text per market object, computed the first time the search looks at it
+const marketSearchTexts = new WeakMap<Market, string>();
+
+function getMarketSearchText(market: Market): string {
+  let text = marketSearchTexts.get(market);
+  if (text === undefined) {
+    text = marketSearchText(market);
+    marketSearchTexts.set(market, text);
+  }
+  return text;
+}
+
 const daysOfWeek = ["Semua Hari", "Isnin", "Selasa", "Rabu", "Khamis", "Jumaat", "Sabtu", "Ahad"];
 
 function calculateDistance(lat1: number, lon1: number, lat2: number, lon2: number): number {
@@ -306,14 +329,76 @@ export default function MarketsFilterClient({ initialMarkets, initialState }: Ma
     }
   };
 
+  // Search folds abbreviations and spelling variants ("Kg. Bahru" matches "Kampung Baru")
+  const parsedQuery = useMemo(() => parseSearchQuery(searchQuery), [searchQuery]);
+
+  // Trigram indexes are fetched when the user starts typing: the selected state's
+  // file, or every state's for "Semua Negeri"
+  const isAllStates = selectedState === "All States" || selectedState === "Semua Negeri";
+  const searchIndexKey = isAllStates ? "*" : selectedState;
+  const [searchIndexes, setSearchIndexes] = useState<{ key: string; indexes: SearchIndex[] } | null>(null);
+  const hasSearchIndexes = searchIndexes !== null && (searchIndexes.key === searchIndexKey || searchIndexes.key === "*");
+  useEffect(() => {
+    if (parsedQuery.length === 0 || hasSearchIndexes) return;
+    let cancelled = false;
+    const load = isAllStates
+      ? loadAllSearchIndexes()
+      : loadSearchIndex(selectedState).then((index) => (index ? [index] : []));
+    load.then((indexes) => {
+      if (!cancelled) setSearchIndexes({ key: searchIndexKey, indexes });
+    });
+    return () => {
+      cancelled = true;
+    };
+  }, [parsedQuery.length, hasSearchIndexes, isAllStates, selectedState, searchIndexKey]);
+
+  // Markets missing from the index or edited since it was built are matched on their
+  // current text; everything else is looked up in the index
+  const searchIndexLookup = useMemo(() => {
+    if (!hasSearchIndexes || !searchIndexes) return null;
+    const fingerprints = new Map<string, string>();
+    for (const index of searchIndexes.indexes) {
+      for (const [id, , , fingerprint] of index.markets) fingerprints.set(id, fingerprint);
+    }
+    return {
+      indexes: searchIndexes.indexes,
+      marketsById: new Map(markets.map((market) => [market.id, market])),
+      unindexed: markets.filter((market) => fingerprints.get(market.id) !== marketFingerprint(market)),
+    };
+  }, [hasSearchIndexes, searchIndexes, markets]);
+
+  const marketStates = useMemo(() => Array.from(new Set(markets.map((market) => market.state))), [markets]);
+
+  const searchMatches = useMemo(() => {
+    if (parsedQuery.length === 0) return null;
+    const ids = new Set<string>();
+    const addIfMatches = (market: Market) => {
+      if (matchesSearchQuery(getMarketSearchText(market), parsedQuery)) ids.add(market.id);
+    };
+
+    if (searchIndexLookup) {
+      // Index hits are rechecked because trigrams of different words can combine into a false hit
+      for (const index of searchIndexLookup.indexes) {
+        for (const position of searchIndexPositions(index, parsedQuery)) {
+          const market = searchIndexLookup.marketsById.get(index.markets[position][0]);
+          if (market) addIfMatches(market);
+        }
+      }
+      searchIndexLookup.unindexed.forEach(addIfMatches);
+    } else {
+      // Index not loaded yet
+      markets.forEach(addIfMatches);
+    }
+
+    // A state name lists every market in that state
+    const states = new Set(marketStates.filter((state) => matchesSearchQuery(searchIndexText(state), parsedQuery)));
+    return { ids, states };
+  }, [parsedQuery, searchIndexLookup, markets, marketStates]);
+
   const filteredAndSortedMarkets = useMemo(() => {
     const filtered = markets.filter((market) => {
       const matchesSearch =
-        searchQuery === "" ||
-        market.name.toLowerCase().includes(searchQuery.toLowerCase()) ||
-        market.district.toLowerCase().includes(searchQuery.toLowerCase()) ||
-        market.state.toLowerCase().includes(searchQuery.toLowerCase()) ||
-        market.address.toLowerCase().includes(searchQuery.toLowerCase());
+        searchMatches === null || searchMatches.ids.has(market.id) || searchMatches.states.has(market.state);
 
       const matchesState =
         selectedState === "All States" || selectedState === "Semua Negeri" || market.state === selectedState;
@@ -376,7 +461,17 @@ export default function MarketsFilterClient({ initialMarkets, initialState }: Ma
     });
 
     return filtered;
-  }, [searchQuery, selectedState, selectedDay, sortBy, sortOrder, filters, userLocation, openNow, markets]);
+  }, [
+    searchMatches,
+    selectedState,
+    selectedDay,
+    sortBy,
+    sortOrder,
+    filters,
+    userLocation,
+    openNow,
+    markets,
+  ]);
 
   // Reset visible results when filters or sorting change
   useEffect(() => {
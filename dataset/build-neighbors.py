@@ -0,0 +1,151 @@
+import pandas as pd
+import numpy as np
+from datetime import datetime
+from typing import List, Tuple
+
+from geo import CELL_SIZE_DEG, build_grid, haversine_km, min_cell_km, parse_location, ring_candidates
+
+# Number of nearby markets stored per market
+K_NEIGHBORS = 5
+
+INPUT_FILE = 'supabase/seed-2.csv'
+OUTPUT_FILE = 'supabase/seed-neighbors.sql'
+
+
+def k_nearest(lat: np.ndarray, lon: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the k nearest other points for every point.
+    Returns (indices, distances_km), both shaped (n, k). Rows with fewer than k
+    other points are padded with -1 / inf.
+
+    Points are processed one grid cell at a time: every point in a cell shares
+    the same candidate set, so distances are computed as one vectorized
+    (points in cell) x (candidates) matrix. The search ring grows until the kth
+    distance is within the radius guaranteed to be fully covered by the ring.
+    """
+    n = len(lat)
+    result_idx = np.full((n, k), -1, dtype=int)
+    result_dist = np.full((n, k), np.inf)
+    if n < 2:
+        return result_idx, result_dist
+
+    grid = build_grid(lat, lon)
+    cell_km = min_cell_km(lat)
+
+    max_radius = int(np.ceil(max(np.ptp(lat), np.ptp(lon)) / CELL_SIZE_DEG)) + 1
+    k_eff = min(k, n - 1)
+
+    for cell, members in grid.items():
+        radius = 1
+        while True:
+            candidates = ring_candidates(grid, cell, radius)
+            if len(candidates) > k_eff or radius >= max_radius:
+                distances = haversine_km(
+                    lat[members][:, None], lon[members][:, None],
+                    lat[candidates][None, :], lon[candidates][None, :],
+                )
+                # Exclude each point from its own neighbor list
+                distances[members[:, None] == candidates[None, :]] = np.inf
+
+                nearest = np.argsort(distances, axis=1, kind='stable')[:, :k_eff]
+                nearest_dist = np.take_along_axis(distances, nearest, axis=1)
+
+                # Any point outside the ring is at least radius * cell_km away
+                if radius >= max_radius or nearest_dist[:, -1].max() <= radius * cell_km:
+                    result_idx[members, :k_eff] = candidates[nearest]
+                    result_dist[members, :k_eff] = nearest_dist
+                    break
+            radius += 1
+
+    return result_idx, result_dist
+
+
+def escape_sql_string(value: str) -> str:
+    """Escape single quotes in SQL strings."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def market_coordinates(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Markets with coordinates from an `id`/`location` frame, as id, _latitude, _longitude.
+    Ids are the primary key; the first row of a duplicate id is kept as the database does.
+    """
+    df = df.drop_duplicates(subset='id', keep='first')
+    coords = df['location'].apply(parse_location)
+    df = pd.DataFrame({
+        'id': df['id'],
+        '_latitude': coords.apply(lambda x: x[0]),
+        '_longitude': coords.apply(lambda x: x[1]),
+    })
+    return df.dropna(subset=['_latitude', '_longitude']).reset_index(drop=True)
+
+
+def build_neighbor_values(markets: pd.DataFrame, k: int = K_NEIGHBORS) -> List[str]:
+    """VALUES tuples (market_id, neighbor_id, rank, distance_km) of the k nearest markets of every market."""
+    neighbor_idx, neighbor_dist = k_nearest(
+        markets['_latitude'].to_numpy(dtype=float),
+        markets['_longitude'].to_numpy(dtype=float),
+        k,
+    )
+
+    ids = markets['id'].to_numpy()
+    values = []
+    for market_pos in range(len(markets)):
+        for rank in range(k):
+            neighbor_pos = neighbor_idx[market_pos, rank]
+            if neighbor_pos < 0:
+                break
+            values.append(
+                f"({escape_sql_string(ids[market_pos])}, {escape_sql_string(ids[neighbor_pos])}, "
+                f"{rank + 1}, {neighbor_dist[market_pos, rank]:.3f})"
+            )
+    return values
+
+
+def build_neighbors_sql(values: List[str]) -> str:
+    """Wrap VALUES tuples into the full seed script."""
+    sql_lines = []
+    sql_lines.append("-- SQL Seed Script for pasar_malam_neighbors table")
+    sql_lines.append(f"-- Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    sql_lines.append(f"-- Total records: {len(values)}")
+    sql_lines.append("")
+    sql_lines.append("TRUNCATE \"public\".\"pasar_malam_neighbors\";")
+    sql_lines.append("")
+    sql_lines.append("INSERT INTO \"public\".\"pasar_malam_neighbors\" (")
+    sql_lines.append("    \"market_id\", \"neighbor_id\", \"rank\", \"distance_km\"")
+    sql_lines.append(") VALUES")
+    sql_lines.append("")
+    sql_lines.append(",\n".join(values))
+    sql_lines.append(";")
+    sql_lines.append("")
+    sql_lines.append("-- End of seed script")
+    return '\n'.join(sql_lines)
+
+
+def main():
+    # Load seed CSV (ids match the pasar_malams table)
+    print(f"Loading {INPUT_FILE}...")
+    df = pd.read_csv(INPUT_FILE, usecols=['id', 'location'])
+    print(f"Loaded {len(df)} rows")
+
+    duplicate_count = df['id'].duplicated().sum()
+    if duplicate_count:
+        print(f"Dropped {duplicate_count} rows with duplicate ids")
+
+    markets = market_coordinates(df)
+    print(f"{len(markets)} markets with coordinates")
+
+    print(f"\nFinding {K_NEIGHBORS} nearest markets...")
+    values = build_neighbor_values(markets)
+
+    print(f"\nWriting SQL to {OUTPUT_FILE}...")
+    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
+        f.write(build_neighbors_sql(values))
+
+    print(f"Generated {len(values)} neighbor rows")
+    print(f"Saved to {OUTPUT_FILE}")
+    print("\nDone!")
+
+
+if __name__ == '__main__':
+    main()
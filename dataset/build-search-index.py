@@ -0,0 +1,123 @@
+import pandas as pd
+import json
+import os
+import re
+from collections import defaultdict
+from typing import Dict, List
+
+from text_normalize import search_index_text, text_fingerprint, text_trigrams
+
+# Columns that are searchable from the markets filter
+SEARCH_COLUMNS = ['name', 'address', 'district']
+
+INPUT_FILE = 'supabase/seed-2.csv'
+OUTPUT_DIR = 'public/search-index'
+
+
+def state_slug(state: str) -> str:
+    """Convert state name to file name, e.g. "Pulau Pinang" -> "pulau-pinang"."""
+    slug = re.sub(r'[^a-z0-9]+', '-', str(state).lower()).strip('-')
+    return slug or 'unknown'
+
+
+def market_raw_text(row: pd.Series) -> str:
+    """Searchable columns of a market row joined by newlines (the fingerprinted text)."""
+    return '\n'.join(str(row[col]) for col in SEARCH_COLUMNS)
+
+
+def market_search_text(row: pd.Series) -> str:
+    """Combine and normalize the searchable columns of a market row."""
+    return search_index_text(' '.join(str(row[col]) for col in SEARCH_COLUMNS if row[col]))
+
+
+def build_postings(search_texts: List[str]) -> Dict[str, List[int]]:
+    """
+    Build trigram -> sorted market positions.
+    Positions are delta-encoded to keep the JSON small:
+    [3, 7, 8] -> [3, 4, 1]
+    """
+    postings: Dict[str, List[int]] = defaultdict(list)
+    for position, text in enumerate(search_texts):
+        for trigram in text_trigrams(text):
+            postings[trigram].append(position)
+
+    encoded = {}
+    for trigram in sorted(postings):
+        positions = postings[trigram]
+        encoded[trigram] = [positions[0]] + [b - a for a, b in zip(positions, positions[1:])]
+    return encoded
+
+
+def build_state_index(state: str, df: pd.DataFrame) -> Dict:
+    """Build the search index artifact for a single state."""
+    df = df.sort_values('id').reset_index(drop=True)
+    search_texts = df.apply(market_search_text, axis=1).tolist()
+
+    return {
+        'version': 2,
+        'state': state,
+        # Position in this list is the market number used in the postings; the fingerprint
+        # lets the frontend spot markets edited after the index was built
+        'markets': [
+            [row['id'], row['name'], row['district'], text_fingerprint(market_raw_text(row))]
+            for _, row in df.iterrows()
+        ],
+        'trigrams': build_postings(search_texts),
+    }
+
+
+def load_markets(input_file: str) -> pd.DataFrame:
+    """Load the searchable columns of the seed CSV."""
+    return pd.read_csv(input_file, usecols=['id', 'state'] + SEARCH_COLUMNS, keep_default_na=False)
+
+
+def index_file_name(state: str) -> str:
+    return f"{state_slug(state)}.json"
+
+
+def dump_index(index: Dict) -> str:
+    """Serialize a state index compactly (it is fetched by the browser)."""
+    return json.dumps(index, ensure_ascii=False, separators=(',', ':'))
+
+
+def dump_manifest(market_counts: Dict[str, int]) -> str:
+    """Serialize the manifest listing every state file and its market count."""
+    manifest = {
+        'version': 2,
+        'states': {
+            state: {'file': index_file_name(state), 'markets': count}
+            for state, count in sorted(market_counts.items())
+        },
+    }
+    return json.dumps(manifest, ensure_ascii=False, indent=2)
+
+
+def main():
+    # Load seed CSV (names and addresses are already title-cased and districts extracted)
+    print(f"Loading {INPUT_FILE}...")
+    df = load_markets(INPUT_FILE)
+    print(f"Loaded {len(df)} rows")
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    market_counts = {}
+    for state, state_df in df.groupby('state', sort=True):
+        index = build_state_index(state, state_df)
+        output_file = os.path.join(OUTPUT_DIR, index_file_name(state))
+
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(dump_index(index))
+
+        market_counts[state] = len(index['markets'])
+        print(f"  {state}: {len(index['markets'])} markets, {len(index['trigrams'])} trigrams -> {output_file}")
+
+    manifest_file = os.path.join(OUTPUT_DIR, 'manifest.json')
+    with open(manifest_file, 'w', encoding='utf-8') as f:
+        f.write(dump_manifest(market_counts))
+
+    print(f"\nSaved manifest to {manifest_file}")
+    print("\nDone!")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,334 @@
+import pandas as pd
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import re
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from script_loader import DATASET_DIR, load_script
+
+data_processing = load_script('data-processing.py')
+generate_seed_sql = load_script('generate-seed-sql.py')
+sql_to_csv = load_script('../supabase/sql_to_csv.py')
+
+FIXTURE_DIR = os.path.join(DATASET_DIR, 'fixtures')
+FIXTURE_FILE = os.path.join(FIXTURE_DIR, 'raw-markets.csv')
+GOLDEN_FILE = os.path.join(FIXTURE_DIR, 'golden.json')
+BASELINE_FILE = os.path.join(FIXTURE_DIR, 'throughput-baseline.json')
+
+STAGES = ['data-processing', 'generate-seed-sql', 'sql_to_csv']
+
+# Allowed throughput drop against the baseline before failing (0.25 = 25% slower)
+DEFAULT_TOLERANCE = 0.25
+
+# Throughput is recorded relative to a fixed calibration workload run in the same
+# process, so the baseline carries over between machines of different speed
+BASELINE_VERSION = 2
+CALIBRATION_ROWS = 10000
+
+# The fixture is tiled to this many rows for throughput runs, so timings are not dominated by overhead
+THROUGHPUT_ROWS = 2000
+
+# Each stage is timed this many times, each run paired with a calibration run;
+# the median ratio counts
+THROUGHPUT_REPEATS = 7
+
+# created_at / updated_at change on every run and are left out of the comparison
+TIMESTAMP_PATTERN = re.compile(r"'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{6}\+00'")
+TIMESTAMP_COLUMNS = {'created_at', 'updated_at'}
+
+# Mismatching rows reported per stage, and characters shown per value
+MAX_REPORTED_DIFFS = 5
+MAX_VALUE_CHARS = 80
+
+
+def run_data_processing(raw_df: pd.DataFrame) -> str:
+    """Stage 1: raw rows -> processed-markets.csv content."""
+    # process_markets prints progress for every step
+    with contextlib.redirect_stdout(io.StringIO()):
+        return data_processing.process_markets(raw_df.copy()).to_csv(index=False)
+
+
+def run_generate_seed_sql(processed_csv: str) -> str:
+    """Stage 2: processed-markets.csv content -> seed-2.sql content."""
+    df = pd.read_csv(io.StringIO(processed_csv))
+    return generate_seed_sql.build_seed_sql([generate_seed_sql.build_value_row(row) for _, row in df.iterrows()])
+
+
+def run_sql_to_csv(seed_sql: str) -> Tuple[str, List]:
+    """Stage 3: seed-2.sql content -> seed-2.csv content, plus rows skipped by the converter."""
+    columns, rows, skipped = sql_to_csv.sql_to_rows(seed_sql)
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(columns)
+    writer.writerows(rows)
+    return output.getvalue(), skipped
+
+
+def processed_rows(processed_csv: str) -> Tuple[List[str], List[List[str]]]:
+    df = pd.read_csv(io.StringIO(processed_csv), dtype=str, keep_default_na=False)
+    return list(df.columns), df.values.tolist()
+
+
+def seed_sql_rows(seed_sql: str) -> Tuple[List[str], List[str]]:
+    """VALUES rows as raw SQL text with the timestamps masked."""
+    columns = sql_to_csv.parse_sql_columns(seed_sql)
+    return columns, [TIMESTAMP_PATTERN.sub("'<timestamp>'", row) for row in sql_to_csv.parse_sql_values(seed_sql)]
+
+
+def seed_csv_rows(seed_csv: str) -> Tuple[List[str], List[List[str]]]:
+    reader = csv.reader(io.StringIO(seed_csv))
+    columns = next(reader)
+    keep = [pos for pos, column in enumerate(columns) if column not in TIMESTAMP_COLUMNS]
+    return [columns[pos] for pos in keep], [[row[pos] for pos in keep] for row in reader]
+
+
+def run_round_trip(raw_df: pd.DataFrame) -> Tuple[Dict[str, Dict], List[str], List[str]]:
+    """
+    Run every stage on the fixture.
+    Returns per-stage {"columns", "rows"}, market names (for diff reports) and integrity errors.
+    """
+    processed_csv = run_data_processing(raw_df)
+    seed_sql = run_generate_seed_sql(processed_csv)
+    seed_csv, skipped = run_sql_to_csv(seed_sql)
+
+    outputs = {}
+    for stage, (columns, rows) in zip(STAGES, [
+        processed_rows(processed_csv), seed_sql_rows(seed_sql), seed_csv_rows(seed_csv),
+    ]):
+        outputs[stage] = {'columns': columns, 'rows': rows}
+    names = pd.read_csv(io.StringIO(processed_csv))['name'].astype(str).tolist()
+
+    errors = []
+    for row_number, count, preview in skipped:
+        errors.append(f"sql_to_csv skipped row {row_number} ({count} columns): {preview}")
+    counts = {stage: len(output['rows']) for stage, output in outputs.items()}
+    if len(set(counts.values())) != 1:
+        errors.append(f"row counts differ between stages: {counts}")
+
+    return outputs, names, errors
+
+
+def shorten(value: Any) -> str:
+    text = repr(value)
+    return text if len(text) <= MAX_VALUE_CHARS else text[:MAX_VALUE_CHARS - 3] + '...'
+
+
+def row_fields(stage: str, columns: List[str], row: Any) -> Dict[str, str]:
+    """Map a golden or actual row to {column: value}; SQL rows are split into their values."""
+    if stage == 'generate-seed-sql':
+        row = sql_to_csv.parse_row(row)
+    return dict(zip(columns, row))
+
+
+def diff_row(stage: str, expected_columns: List[str], expected: Any,
+             actual_columns: List[str], actual: Any) -> List[str]:
+    """Describe which fields of one row changed."""
+    expected_fields = row_fields(stage, expected_columns, expected)
+    actual_fields = row_fields(stage, actual_columns, actual)
+    lines = []
+    for column in expected_columns + [c for c in actual_columns if c not in expected_fields]:
+        old = expected_fields.get(column, '<missing>')
+        new = actual_fields.get(column, '<missing>')
+        if old != new:
+            lines.append(f"{column}: {shorten(old)} != {shorten(new)}")
+    if not lines:
+        # Same values, different SQL formatting (quoting, casts, NULL vs '')
+        lines.append(f"{shorten(expected)} != {shorten(actual)}")
+    return lines
+
+
+def compare_golden(outputs: Dict[str, Dict], names: List[str], golden: Dict) -> List[str]:
+    """Compare every output row, field by field, with the golden outputs."""
+    errors = []
+    for stage in STAGES:
+        expected_output = golden['stages'].get(stage, {})
+        expected_columns = expected_output.get('columns', [])
+        expected = expected_output.get('rows', [])
+        actual_columns = outputs[stage]['columns']
+        actual = outputs[stage]['rows']
+
+        if expected_columns != actual_columns:
+            errors.append(f"{stage}: columns changed from {expected_columns} to {actual_columns}")
+        if len(expected) != len(actual):
+            errors.append(f"{stage}: expected {len(expected)} rows, got {len(actual)}")
+
+        diffs = [pos for pos in range(min(len(expected), len(actual))) if expected[pos] != actual[pos]]
+        if diffs:
+            errors.append(f"{stage}: {len(diffs)} rows differ from golden output")
+            for pos in diffs[:MAX_REPORTED_DIFFS]:
+                name = names[pos] if pos < len(names) else '?'
+                errors.append(f"  row {pos + 1} ({name}):")
+                for line in diff_row(stage, expected_columns, expected[pos], actual_columns, actual[pos]):
+                    errors.append(f"    {line}")
+    return errors
+
+
+def calibration_frame(rows: int) -> pd.DataFrame:
+    """Fixed synthetic rows for the calibration workload."""
+    return pd.DataFrame({
+        'name': [f"pasar  malam taman {i % 97}  jalan {i}" for i in range(rows)],
+        'payload': [json.dumps({'days': ['mon', 'tue'][:i % 2 + 1], 'times': [{'start': '18:00', 'end': f'{i % 24:02d}:00'}]})
+                    for i in range(rows)],
+    })
+
+
+def run_calibration(frame: pd.DataFrame) -> str:
+    """
+    Reference workload with the same mix as the stages (pandas apply, regex,
+    title-casing, JSON and CSV writing). Stage throughput is divided by its rate.
+    """
+    names = frame['name'].apply(lambda x: re.sub(r'\s+', ' ', x).title())
+    payloads = frame['payload'].apply(lambda x: json.dumps(json.loads(x), sort_keys=True))
+    output = io.StringIO()
+    csv.writer(output).writerows(zip(names, payloads))
+    return output.getvalue()
+
+
+def timed(func: Callable, arg: Any) -> Tuple[float, Any]:
+    started = time.perf_counter()
+    result = func(arg)
+    return max(time.perf_counter() - started, 1e-9), result
+
+
+def time_stage(func: Callable, arg: Any, rows: int, frame: pd.DataFrame) -> Tuple[float, float, Any]:
+    """
+    Time a stage THROUGHPUT_REPEATS times, each run right after a calibration run.
+    Returns the best rows/second, the median of stage rate / calibration rate
+    (pairing the runs cancels slow drift in machine load) and the stage output.
+    """
+    rates, ratios = [], []
+    result = None
+    for _ in range(THROUGHPUT_REPEATS):
+        calibration_elapsed, _ = timed(run_calibration, frame)
+        elapsed, result = timed(func, arg)
+        rates.append(rows / elapsed)
+        ratios.append((rows / elapsed) / (len(frame) / calibration_elapsed))
+    return max(rates), statistics.median(ratios), result
+
+
+def measure_throughput(raw_df: pd.DataFrame) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """
+    Rows/second of each stage on the fixture tiled to THROUGHPUT_ROWS rows, and the
+    stage rates relative to the calibration workload (the figure compared with the baseline).
+    """
+    copies = max(1, THROUGHPUT_ROWS // max(len(raw_df), 1))
+    tiled = pd.concat([raw_df] * copies, ignore_index=True)
+    frame = calibration_frame(CALIBRATION_ROWS)
+
+    processing_rate, processing_ratio, processed_csv = time_stage(run_data_processing, tiled, len(tiled), frame)
+    processed_rows = len(pd.read_csv(io.StringIO(processed_csv)))
+    seed_rate, seed_ratio, seed_sql = time_stage(run_generate_seed_sql, processed_csv, processed_rows, frame)
+    csv_rate, csv_ratio, _ = time_stage(run_sql_to_csv, seed_sql, processed_rows, frame)
+
+    throughput = {
+        'data-processing': round(processing_rate, 1),
+        'generate-seed-sql': round(seed_rate, 1),
+        'sql_to_csv': round(csv_rate, 1),
+    }
+    relative = {
+        'data-processing': round(processing_ratio, 4),
+        'generate-seed-sql': round(seed_ratio, 4),
+        'sql_to_csv': round(csv_ratio, 4),
+    }
+    return throughput, relative
+
+
+def compare_throughput(relative: Dict[str, float], baseline: Dict[str, float], tolerance: float) -> List[str]:
+    """Fail stages whose calibrated throughput is below the baseline by more than the tolerance."""
+    errors = []
+    for stage in STAGES:
+        expected = baseline.get(stage)
+        if expected is None:
+            continue
+        minimum = expected * (1 - tolerance)
+        if relative[stage] < minimum:
+            errors.append(f"{stage}: {relative[stage]:.3f}x calibration is below baseline "
+                          f"{expected:.3f}x (minimum {minimum:.3f}x with {tolerance:.0%} tolerance)")
+    return errors
+
+
+def load_baseline() -> Dict[str, float]:
+    """Calibrated per-stage baseline, or {} if there is none (or it predates calibration)."""
+    if not os.path.exists(BASELINE_FILE):
+        return {}
+    with open(BASELINE_FILE, encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('version') != BASELINE_VERSION:
+        return {}
+    return baseline.get('relative', {})
+
+
+def write_json(path: str, data: Dict):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+        f.write('\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check the raw CSV -> seed-2.csv round trip against golden outputs.')
+    parser.add_argument('--update-golden', action='store_true', help='Rewrite the golden outputs from this run')
+    parser.add_argument('--update-baseline', action='store_true', help='Rewrite the throughput baseline from this run')
+    parser.add_argument('--skip-throughput', action='store_true', help='Only check the data')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f'Allowed throughput drop, default {DEFAULT_TOLERANCE}')
+    args = parser.parse_args()
+
+    raw_df = pd.read_csv(FIXTURE_FILE)
+    print(f"Loaded fixture {os.path.relpath(FIXTURE_FILE)}: {len(raw_df)} rows")
+
+    errors = []
+
+    print("\nRunning round trip...")
+    outputs, names, integrity_errors = run_round_trip(raw_df)
+    errors.extend(integrity_errors)
+    for stage in STAGES:
+        print(f"  {stage}: {len(outputs[stage]['rows'])} rows")
+
+    if args.update_golden:
+        write_json(GOLDEN_FILE, {
+            'fixture': os.path.basename(FIXTURE_FILE),
+            'stages': outputs,
+        })
+        print(f"Updated {os.path.relpath(GOLDEN_FILE)}")
+    elif os.path.exists(GOLDEN_FILE):
+        with open(GOLDEN_FILE, encoding='utf-8') as f:
+            errors.extend(compare_golden(outputs, names, json.load(f)))
+    else:
+        errors.append(f"{os.path.relpath(GOLDEN_FILE)} not found, run with --update-golden")
+
+    if not args.skip_throughput:
+        print(f"\nMeasuring throughput ({THROUGHPUT_ROWS} rows, {THROUGHPUT_REPEATS} runs against calibration)...")
+        throughput, relative = measure_throughput(raw_df)
+        baseline = load_baseline()
+
+        for stage in STAGES:
+            expected = baseline.get(stage)
+            change = f", {relative[stage] / expected - 1:+.0%} vs baseline" if expected else ""
+            print(f"  {stage}: {throughput[stage]:.0f} rows/s ({relative[stage]:.3f}x calibration{change})")
+
+        if args.update_baseline:
+            write_json(BASELINE_FILE, {'version': BASELINE_VERSION, 'relative': relative})
+            print(f"Updated {os.path.relpath(BASELINE_FILE)}")
+        elif not baseline:
+            print(f"  No calibrated baseline in {os.path.relpath(BASELINE_FILE)}, skipping the comparison "
+                  "(record one with --update-baseline)")
+        else:
+            errors.extend(compare_throughput(relative, baseline, args.tolerance))
+
+    if errors:
+        print("\nFAILED")
+        for error in errors:
+            print(f"  {error}")
+        exit(1)
+
+    print("\nAll checks passed!")
+
+
+if __name__ == '__main__':
+    main()
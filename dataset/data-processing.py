@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+import base64
 import json
 import re
 import glob
@@ -20,6 +21,9 @@ DAY_MAPPING = {
 ALL_DAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
 ALL_DAYS_ABBR = ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']
 
+# crowd_profile byte for hours Google does not report (popularity itself is 0-100)
+CROWD_UNKNOWN = 255
+
 # Short forms that should remain uppercase
 SHORT_FORMS = {'AU2', 'ASSB', 'KT', 'KB', 'LRT', 'MDDM', 'FAMA', 'JPS', 'UTC'}
 
@@ -252,142 +256,228 @@ def create_location_jsonb(latitude: float, longitude: float, gmaps_link: str) ->
     return json.dumps(location)
 
 
-# Load all CSV files matching the pattern
-# Try both relative paths (if run from root) and current directory (if run from dataset/)
-csv_files = glob.glob('dataset/pasar-malam-in-*.csv') + glob.glob('pasar-malam-in-*.csv')
-csv_files = list(set(csv_files))  # Remove duplicates
-print(f"Found {len(csv_files)} CSV files to process")
-
-# Load all dataframes
-dataframes = []
-for csv_file in csv_files:
-    try:
-        df = pd.read_csv(csv_file)
-        dataframes.append(df)
-        print(f"Loaded {csv_file}: {len(df)} rows")
-    except Exception as e:
-        print(f"Error loading {csv_file}: {e}")
-
-if not dataframes:
-    print("No dataframes loaded. Exiting.")
-    exit(1)
-
-# Merge all dataframes
-df = pd.concat(dataframes, ignore_index=True)
-print(f"\nTotal rows after merge: {len(df)}")
-
-# Columns to remove
-columns_to_remove = [
-    'place_id', 'description', 'is_spending_on_ads', 'reviews', 'rating', 'competitors',
-    'website', 'phone', 'can_claim', 'owner', 'owner_posts', 'featured_image',
-    'main_category', 'categories', 'status', 'is_temporarily_closed', 'is_permanently_closed',
-    'price_range', 'reviews_per_rating', 'reviews_link', 'plus_code', 'detailed_address',
-    'time_zone', 'cid', 'data_id', 'kgmid', 'about', 'most_popular_times', 'popular_times',
-    'menu', 'reservations', 'order_online_links', 'image_count', 'images', 'featured_images',
-    'on_site_places', 'customer_updates', 'featured_question', 'review_keywords',
-    'featured_reviews', 'detailed_reviews', 'query'
-]
-
-# Filter rows before removing columns (we need is_temporarily_closed and is_permanently_closed for filtering)
-print("\nFiltering rows...")
-initial_count = len(df)
-
-# Filter out rows where is_temporarily_closed or is_permanently_closed have truthy values
-if 'is_temporarily_closed' in df.columns:
-    # Remove rows where value is truthy (non-empty, non-null, not "false", not "0")
-    mask_temp = df['is_temporarily_closed'].apply(
-        lambda x: pd.isna(x) or str(x).strip().lower() in ['', 'false', '0', 'nan', 'none']
-    )
-    df = df[mask_temp]
-
-if 'is_permanently_closed' in df.columns:
-    mask_perm = df['is_permanently_closed'].apply(
-        lambda x: pd.isna(x) or str(x).strip().lower() in ['', 'false', '0', 'nan', 'none']
-    )
-    df = df[mask_perm]
-
-filtered_count = len(df)
-print(f"Filtered out {initial_count - filtered_count} rows (temporarily/permanently closed)")
-
-# Remove columns (only if they exist)
-columns_to_remove_existing = [col for col in columns_to_remove if col in df.columns]
-df = df.drop(columns=columns_to_remove_existing, errors='ignore')
-print(f"Removed {len(columns_to_remove_existing)} columns")
-
-# Apply quote cleaning and title case to name and address columns
-if 'name' in df.columns:
-    print("\nCleaning quotes and applying title case to 'name' column...")
-    df['name'] = df['name'].apply(title_case_with_exceptions)
-
-if 'address' in df.columns:
-    print("Applying title case to 'address' column...")
-    df['address'] = df['address'].apply(title_case_with_exceptions)
-
-# Rename columns
-rename_map = {}
-if 'link' in df.columns:
-    rename_map['link'] = 'gmaps_link'
-if 'workday_timing' in df.columns:
-    rename_map['workday_timing'] = 'opening_hour'
-
-if rename_map:
-    df = df.rename(columns=rename_map)
-    print(f"Renamed columns: {rename_map}")
-
-# Transform closed_on to opening_day
-if 'closed_on' in df.columns:
-    print("\nTransforming closed_on to opening_day...")
-    df['opening_day'] = df['closed_on'].apply(transform_closed_on_to_opening_day)
-    # Convert to JSON string for storage
-    df['opening_day'] = df['opening_day'].apply(lambda x: json.dumps(x) if isinstance(x, list) else json.dumps([]))
-    df = df.drop(columns=['closed_on'], errors='ignore')
-    print("Transformed closed_on to opening_day")
-
-# Transform coordinates
-if 'coordinates' in df.columns:
-    print("\nTransforming coordinates...")
-    df['coordinates_jsonb'] = df['coordinates'].apply(
-        lambda x: json.dumps(parse_coordinates(x)) if parse_coordinates(x) else None
-    )
-    # Extract latitude and longitude for location JSONB
-    coords_data = df['coordinates'].apply(parse_coordinates)
-    df['_latitude'] = coords_data.apply(lambda x: x['latitude'] if x and 'latitude' in x else None)
-    df['_longitude'] = coords_data.apply(lambda x: x['longitude'] if x and 'longitude' in x else None)
-    df = df.drop(columns=['coordinates'], errors='ignore')
-    print("Transformed coordinates to JSONB format")
-
-# Create location JSONB
-if 'gmaps_link' in df.columns and '_latitude' in df.columns and '_longitude' in df.columns:
-    print("\nCreating location JSONB...")
-    df['location'] = df.apply(
-        lambda row: create_location_jsonb(
-            row['_latitude'],
-            row['_longitude'],
-            row['gmaps_link']
-        ),
-        axis=1
-    )
-    # Remove temporary columns
-    df = df.drop(columns=['_latitude', '_longitude', 'coordinates_jsonb'], errors='ignore')
-    print("Created location JSONB")
-
-# Transform hours to schedule
-if 'hours' in df.columns:
-    print("\nTransforming hours to schedule...")
-    df['schedule'] = df['hours'].apply(
-        lambda x: json.dumps(transform_hours_to_schedule(x)) if not pd.isna(x) else json.dumps([])
-    )
-    df = df.drop(columns=['hours'], errors='ignore')
-    print("Transformed hours to schedule format")
-
-# Save to output file
-# Try both relative paths (if run from root) and current directory (if run from dataset/)
-if os.path.exists('dataset'):
-    output_file = 'dataset/processed-markets.csv'
-else:
-    output_file = 'processed-markets.csv'
-print(f"\nSaving to {output_file}...")
-df.to_csv(output_file, index=False)
-print(f"Saved {len(df)} rows to {output_file}")
-print(f"\nFinal columns: {list(df.columns)}")
-print("\nProcessing complete!")
\ No newline at end of file
+def is_valid_popularity_entry(entry: Any) -> bool:
+    """
+    Check one popular_times entry: hour_of_day must be an int 0-23 and
+    popularity_percentage a number (scrapes sometimes hold null for either).
+    """
+    if not isinstance(entry, dict):
+        return False
+    hour = entry.get('hour_of_day')
+    value = entry.get('popularity_percentage')
+    if not isinstance(hour, int) or isinstance(hour, bool) or not 0 <= hour < 24:
+        return False
+    if not isinstance(value, (int, float)) or isinstance(value, bool) or np.isnan(value):
+        return False
+    return True
+
+
+def transform_popular_times_to_crowd_profile(popular_times: pd.Series) -> pd.Series:
+    """
+    Pack Google's per-hour busyness into a base64 string of 7x24 uint8 values
+    (Monday-Sunday, hour 0-23, popularity 0-100), 168 bytes before encoding.
+    Hours Google does not report are CROWD_UNKNOWN (255), so they are not read as idle.
+    Input: '{"Monday": [{"hour_of_day": 18, "popularity_percentage": 48, ...}], ...}'
+    Output: "//////////////////////8wAA..." (224 characters), or None if there is no data
+    """
+    # Collect every (row, day, hour, popularity) into flat lists, then fill one array
+    # Most rows are "Not Present"; only parse the ones holding a JSON object
+    present = popular_times.astype(str).str.startswith('{').to_numpy()
+
+    rows, days, hours, values = [], [], [], []
+    for row_idx in np.flatnonzero(present):
+        value = popular_times.iloc[row_idx]
+        try:
+            data = json.loads(value)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(data, dict):
+            continue
+        for day_name, entries in data.items():
+            if day_name not in ALL_DAYS or not isinstance(entries, list):
+                continue
+            for entry in entries:
+                if is_valid_popularity_entry(entry):
+                    rows.append(row_idx)
+                    days.append(ALL_DAYS.index(day_name))
+                    hours.append(entry['hour_of_day'])
+                    values.append(entry['popularity_percentage'])
+
+    profiles = np.full((len(popular_times), len(ALL_DAYS), 24), CROWD_UNKNOWN, dtype=np.uint8)
+    rows = np.array(rows, dtype=np.intp)
+    days = np.array(days, dtype=np.intp)
+    hours = np.array(hours, dtype=np.intp)
+    values = np.array(values, dtype=float)
+    profiles[rows, days, hours] = np.clip(np.rint(values), 0, 100).astype(np.uint8)
+
+    has_data = np.zeros(len(popular_times), dtype=bool)
+    has_data[rows] = True
+
+    packed = [
+        base64.b64encode(profile.tobytes()).decode('ascii') if present else None
+        for profile, present in zip(profiles, has_data)
+    ]
+    return pd.Series(packed, index=popular_times.index, dtype=object)
+
+
+def process_markets(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Apply every filter and transformation to raw scraped rows.
+    All steps are row-wise, so one state file can be processed on its own.
+    """
+    # Columns to remove
+    columns_to_remove = [
+        'place_id', 'description', 'is_spending_on_ads', 'reviews', 'rating', 'competitors',
+        'website', 'phone', 'can_claim', 'owner', 'owner_posts', 'featured_image',
+        'main_category', 'categories', 'status', 'is_temporarily_closed', 'is_permanently_closed',
+        'price_range', 'reviews_per_rating', 'reviews_link', 'plus_code', 'detailed_address',
+        'time_zone', 'cid', 'data_id', 'kgmid', 'about', 'most_popular_times',
+        'menu', 'reservations', 'order_online_links', 'image_count', 'images', 'featured_images',
+        'on_site_places', 'customer_updates', 'featured_question', 'review_keywords',
+        'featured_reviews', 'detailed_reviews', 'query'
+    ]
+
+    # Filter rows before removing columns (we need is_temporarily_closed and is_permanently_closed for filtering)
+    print("\nFiltering rows...")
+    initial_count = len(df)
+
+    # Filter out rows where is_temporarily_closed or is_permanently_closed have truthy values
+    if 'is_temporarily_closed' in df.columns:
+        # Remove rows where value is truthy (non-empty, non-null, not "false", not "0")
+        mask_temp = df['is_temporarily_closed'].apply(
+            lambda x: pd.isna(x) or str(x).strip().lower() in ['', 'false', '0', 'nan', 'none']
+        )
+        df = df[mask_temp]
+
+    if 'is_permanently_closed' in df.columns:
+        mask_perm = df['is_permanently_closed'].apply(
+            lambda x: pd.isna(x) or str(x).strip().lower() in ['', 'false', '0', 'nan', 'none']
+        )
+        df = df[mask_perm]
+
+    filtered_count = len(df)
+    print(f"Filtered out {initial_count - filtered_count} rows (temporarily/permanently closed)")
+
+    # Remove columns (only if they exist)
+    columns_to_remove_existing = [col for col in columns_to_remove if col in df.columns]
+    df = df.drop(columns=columns_to_remove_existing, errors='ignore')
+    print(f"Removed {len(columns_to_remove_existing)} columns")
+
+    # Apply quote cleaning and title case to name and address columns
+    if 'name' in df.columns:
+        print("\nCleaning quotes and applying title case to 'name' column...")
+        df['name'] = df['name'].apply(title_case_with_exceptions)
+
+    if 'address' in df.columns:
+        print("Applying title case to 'address' column...")
+        df['address'] = df['address'].apply(title_case_with_exceptions)
+
+    # Rename columns
+    rename_map = {}
+    if 'link' in df.columns:
+        rename_map['link'] = 'gmaps_link'
+    if 'workday_timing' in df.columns:
+        rename_map['workday_timing'] = 'opening_hour'
+
+    if rename_map:
+        df = df.rename(columns=rename_map)
+        print(f"Renamed columns: {rename_map}")
+
+    # Transform closed_on to opening_day
+    if 'closed_on' in df.columns:
+        print("\nTransforming closed_on to opening_day...")
+        df['opening_day'] = df['closed_on'].apply(transform_closed_on_to_opening_day)
+        # Convert to JSON string for storage
+        df['opening_day'] = df['opening_day'].apply(lambda x: json.dumps(x) if isinstance(x, list) else json.dumps([]))
+        df = df.drop(columns=['closed_on'], errors='ignore')
+        print("Transformed closed_on to opening_day")
+
+    # Transform coordinates
+    if 'coordinates' in df.columns:
+        print("\nTransforming coordinates...")
+        df['coordinates_jsonb'] = df['coordinates'].apply(
+            lambda x: json.dumps(parse_coordinates(x)) if parse_coordinates(x) else None
+        )
+        # Extract latitude and longitude for location JSONB
+        coords_data = df['coordinates'].apply(parse_coordinates)
+        df['_latitude'] = coords_data.apply(lambda x: x['latitude'] if x and 'latitude' in x else None)
+        df['_longitude'] = coords_data.apply(lambda x: x['longitude'] if x and 'longitude' in x else None)
+        df = df.drop(columns=['coordinates'], errors='ignore')
+        print("Transformed coordinates to JSONB format")
+
+    # Create location JSONB
+    if 'gmaps_link' in df.columns and '_latitude' in df.columns and '_longitude' in df.columns:
+        print("\nCreating location JSONB...")
+        df['location'] = df.apply(
+            lambda row: create_location_jsonb(
+                row['_latitude'],
+                row['_longitude'],
+                row['gmaps_link']
+            ),
+            axis=1
+        )
+        # Remove temporary columns
+        df = df.drop(columns=['_latitude', '_longitude', 'coordinates_jsonb'], errors='ignore')
+        print("Created location JSONB")
+
+    # Transform hours to schedule
+    if 'hours' in df.columns:
+        print("\nTransforming hours to schedule...")
+        df['schedule'] = df['hours'].apply(
+            lambda x: json.dumps(transform_hours_to_schedule(x)) if not pd.isna(x) else json.dumps([])
+        )
+        df = df.drop(columns=['hours'], errors='ignore')
+        print("Transformed hours to schedule format")
+
+    # Transform popular_times to crowd_profile
+    if 'popular_times' in df.columns:
+        print("\nTransforming popular_times to crowd_profile...")
+        df['crowd_profile'] = transform_popular_times_to_crowd_profile(df['popular_times'])
+        df = df.drop(columns=['popular_times'], errors='ignore')
+        print(f"Packed crowd profiles for {df['crowd_profile'].notna().sum()} markets")
+
+    return df
+
+
+def main():
+    # Load all CSV files matching the pattern
+    # Try both relative paths (if run from root) and current directory (if run from dataset/)
+    csv_files = glob.glob('dataset/pasar-malam-in-*.csv') + glob.glob('pasar-malam-in-*.csv')
+    csv_files = sorted(set(csv_files))  # Remove duplicates, stable order
+    print(f"Found {len(csv_files)} CSV files to process")
+
+    # Load all dataframes
+    dataframes = []
+    for csv_file in csv_files:
+        try:
+            df = pd.read_csv(csv_file)
+            dataframes.append(df)
+            print(f"Loaded {csv_file}: {len(df)} rows")
+        except Exception as e:
+            print(f"Error loading {csv_file}: {e}")
+
+    if not dataframes:
+        print("No dataframes loaded. Exiting.")
+        exit(1)
+
+    # Merge all dataframes
+    df = pd.concat(dataframes, ignore_index=True)
+    print(f"\nTotal rows after merge: {len(df)}")
+
+    df = process_markets(df)
+
+    # Save to output file
+    # Try both relative paths (if run from root) and current directory (if run from dataset/)
+    if os.path.exists('dataset'):
+        output_file = 'dataset/processed-markets.csv'
+    else:
+        output_file = 'processed-markets.csv'
+    print(f"\nSaving to {output_file}...")
+    df.to_csv(output_file, index=False)
+    print(f"Saved {len(df)} rows to {output_file}")
+    print(f"\nFinal columns: {list(df.columns)}")
+    print("\nProcessing complete!")
+
+
+if __name__ == '__main__':
+    main()
@@ -2,7 +2,7 @@ import pandas as pd
 import json
 import re
 from datetime import datetime, timezone
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 # Malaysian states mapping (common variations)
 STATE_MAPPING = {
@@ -150,32 +150,8 @@ def format_timestamp() -> str:
     return f"'{datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S.%f')}+00'"
 
 
-# Load processed CSV
-print("Loading processed-markets.csv...")
-df = pd.read_csv('dataset/processed-markets.csv')
-
-print(f"Loaded {len(df)} rows")
-
-# Generate SQL
-print("\nGenerating SQL INSERT statements...")
-
-sql_lines = []
-sql_lines.append("-- SQL Seed Script for pasar_malams table")
-sql_lines.append(f"-- Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-sql_lines.append(f"-- Total records: {len(df)}")
-sql_lines.append("")
-sql_lines.append("INSERT INTO \"public\".\"pasar_malams\" (")
-sql_lines.append("    \"id\", \"name\", \"address\", \"district\", \"state\", \"status\",")
-sql_lines.append("    \"description\", \"area_m2\", \"total_shop\",")
-sql_lines.append("    \"parking_available\", \"parking_accessible\", \"parking_notes\",")
-sql_lines.append("    \"amen_toilet\", \"amen_prayer_room\",")
-sql_lines.append("    \"location\", \"schedule\",")
-sql_lines.append("    \"created_at\", \"updated_at\", \"shop_list\"")
-sql_lines.append(") VALUES")
-sql_lines.append("")
-
-values = []
-for idx, row in df.iterrows():
+def build_value_row(row: pd.Series) -> str:
+    """Build the VALUES tuple for one processed market row."""
     # Generate ID from name
     market_id = slugify(row['name'])
     
@@ -203,27 +179,67 @@ for idx, row in df.iterrows():
         format_timestamp(),  # created_at
         format_timestamp(),  # updated_at
         'NULL',  # shop_list
+        format_nullable_string(row.get('crowd_profile')),  # crowd_profile
     ]
     
-    values.append("(" + ", ".join(value_parts) + ")")
-    
-    if (idx + 1) % 100 == 0:
-        print(f"  Processed {idx + 1}/{len(df)} rows...")
+    return "(" + ", ".join(value_parts) + ")"
 
-# Join values with commas
-sql_lines.append(",\n".join(values))
-sql_lines.append(";")
-sql_lines.append("")
-sql_lines.append("-- End of seed script")
 
-# Write to file
-output_file = 'supabase/seed-2.sql'
-print(f"\nWriting SQL to {output_file}...")
+def build_seed_sql(values: List[str]) -> str:
+    """Wrap VALUES tuples into the full seed script."""
+    sql_lines = []
+    sql_lines.append("-- SQL Seed Script for pasar_malams table")
+    sql_lines.append(f"-- Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    sql_lines.append(f"-- Total records: {len(values)}")
+    sql_lines.append("")
+    sql_lines.append("INSERT INTO \"public\".\"pasar_malams\" (")
+    sql_lines.append("    \"id\", \"name\", \"address\", \"district\", \"state\", \"status\",")
+    sql_lines.append("    \"description\", \"area_m2\", \"total_shop\",")
+    sql_lines.append("    \"parking_available\", \"parking_accessible\", \"parking_notes\",")
+    sql_lines.append("    \"amen_toilet\", \"amen_prayer_room\",")
+    sql_lines.append("    \"location\", \"schedule\",")
+    sql_lines.append("    \"created_at\", \"updated_at\", \"shop_list\",")
+    sql_lines.append("    \"crowd_profile\"")
+    sql_lines.append(") VALUES")
+    sql_lines.append("")
+    
+    # Join values with commas
+    sql_lines.append(",\n".join(values))
+    sql_lines.append(";")
+    sql_lines.append("")
+    sql_lines.append("-- End of seed script")
+    
+    return '\n'.join(sql_lines)
 
-with open(output_file, 'w', encoding='utf-8') as f:
-    f.write('\n'.join(sql_lines))
 
-print(f"Generated {len(df)} INSERT statements")
-print(f"Saved to {output_file}")
-print("\nDone!")
+def main():
+    # Load processed CSV
+    print("Loading processed-markets.csv...")
+    df = pd.read_csv('dataset/processed-markets.csv')
+    
+    print(f"Loaded {len(df)} rows")
+    
+    # Generate SQL
+    print("\nGenerating SQL INSERT statements...")
+    
+    values = []
+    for idx, row in df.iterrows():
+        values.append(build_value_row(row))
+        
+        if (idx + 1) % 100 == 0:
+            print(f"  Processed {idx + 1}/{len(df)} rows...")
+    
+    # Write to file
+    output_file = 'supabase/seed-2.sql'
+    print(f"\nWriting SQL to {output_file}...")
+    
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(build_seed_sql(values))
+    
+    print(f"Generated {len(df)} INSERT statements")
+    print(f"Saved to {output_file}")
+    print("\nDone!")
+
 
+if __name__ == '__main__':
+    main()
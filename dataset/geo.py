@@ -0,0 +1,84 @@
+"""
+Coordinate helpers shared by the dataset scripts: location parsing,
+vectorized haversine distance and a lat/lon grid index.
+"""
+import json
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Grid cell size in degrees (~28 km at the equator)
+CELL_SIZE_DEG = 0.25
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def parse_location(location: Any) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Extract latitude and longitude from location JSONB (string or dict).
+    Input: '{"latitude": 2.47, "longitude": 102.22, "gmaps_link": "..."}'
+    Output: (2.47, 102.22)
+    """
+    if location is None or (not isinstance(location, dict) and pd.isna(location)) or location == '':
+        return None, None
+
+    try:
+        location = json.loads(location) if isinstance(location, str) else location
+        latitude = location.get('latitude')
+        longitude = location.get('longitude')
+        if latitude is None or longitude is None:
+            return None, None
+        return float(latitude), float(longitude)
+    except (json.JSONDecodeError, TypeError, ValueError, AttributeError):
+        return None, None
+
+
+def haversine_km(lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    """
+    Great-circle distance in kilometres. Inputs are in degrees and broadcast,
+    so (m, 1) against (1, n) returns an (m, n) distance matrix.
+    """
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def grid_cell(lat: np.ndarray, lon: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Grid cell (row, col) of each point."""
+    return np.floor(lat / CELL_SIZE_DEG).astype(int), np.floor(lon / CELL_SIZE_DEG).astype(int)
+
+
+def build_grid(lat: np.ndarray, lon: np.ndarray) -> Dict[Tuple[int, int], np.ndarray]:
+    """Bucket point indices into CELL_SIZE_DEG x CELL_SIZE_DEG cells."""
+    cell_rows, cell_cols = grid_cell(lat, lon)
+
+    grid: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+    for idx, cell in enumerate(zip(cell_rows, cell_cols)):
+        grid[cell].append(idx)
+
+    return {cell: np.array(indices) for cell, indices in grid.items()}
+
+
+def ring_candidates(grid: Dict[Tuple[int, int], np.ndarray], cell: Tuple[int, int], radius: int) -> np.ndarray:
+    """Indices of all points in cells within `radius` cells of `cell` (a square ring search)."""
+    row, col = cell
+    found = [
+        grid[(r, c)]
+        for r in range(row - radius, row + radius + 1)
+        for c in range(col - radius, col + radius + 1)
+        if (r, c) in grid
+    ]
+    return np.concatenate(found) if found else np.array([], dtype=int)
+
+
+def min_cell_km(lat: np.ndarray) -> float:
+    """
+    Smallest width of a grid cell in km over the given latitudes
+    (longitude degrees shrink away from the equator).
+    """
+    km_per_deg = np.radians(1) * EARTH_RADIUS_KM * np.cos(np.radians(np.abs(lat).max()))
+    return CELL_SIZE_DEG * km_per_deg
@@ -0,0 +1,389 @@
+import pandas as pd
+import numpy as np
+import argparse
+import json
+import os
+import urllib.request
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from geo import build_grid, grid_cell, haversine_km, parse_location, ring_candidates
+from script_loader import load_script
+from text_normalize import normalize_search_text, text_trigrams
+
+# Reuse the exact transforms applied to scraped markets
+data_processing = load_script('data-processing.py')
+
+# Markets further apart than this are not considered the same place
+MATCH_RADIUS_KM = 2.0
+
+# Markets outside MATCH_RADIUS_KM are still candidates if their names are this similar
+# (they are only reported when either side has no location)
+MIN_NAME_SIMILARITY = 0.5
+
+# Both sides located but further apart than MATCH_RADIUS_KM: capped below MIN_CONFIDENCE
+MAX_CONFIDENCE_OUTSIDE_RADIUS = 0.4
+
+# Candidates below this confidence are not reported
+MIN_CONFIDENCE = 0.5
+
+# Proximity alone cannot flag a market: below this name similarity the
+# confidence is capped at the name similarity
+MIN_NAME_SIMILARITY_NEARBY = 0.3
+
+# Without a distance signal a name match is weaker evidence; the remaining
+# fields are not rescaled above this
+MAX_CONFIDENCE_WITHOUT_LOCATION = 0.6
+
+# Words shared by most market names; left out of the name trigrams so
+# "Pasar Malam Taman Universiti" is compared on "universiti". A name made only
+# of these is no evidence on its own: its confidence is capped at the proximity
+GENERIC_NAME_TOKENS = {'pasar', 'malam', 'night', 'market', 'taman', 'bazar', 'bazaar', 'tapak'}
+
+MAX_CANDIDATES = 3
+
+# Score weights; a weight is dropped when either side lacks that field
+WEIGHTS = {
+    'name': 0.45,
+    'distance': 0.35,
+    'address': 0.1,
+    'schedule': 0.1,
+}
+
+DEFAULT_MARKETS_FILE = 'supabase/seed-2.csv'
+DEFAULT_OUTPUT_JSON = 'dataset/suggestion-duplicates.json'
+DEFAULT_OUTPUT_SQL = 'supabase/suggestion-duplicates.sql'
+
+# Supabase REST page size (PostgREST default max-rows)
+PAGE_SIZE = 1000
+
+
+def normalize_text(text: Any) -> str:
+    """Apply the data-processing cleanup, then the search normalization."""
+    if text is None or (isinstance(text, float) and pd.isna(text)):
+        return ''
+    return normalize_search_text(data_processing.title_case_with_exceptions(str(text)))
+
+
+def distinctive_words(name: Any) -> List[str]:
+    """Words of a normalized market name that are not in GENERIC_NAME_TOKENS."""
+    return [word for word in normalize_text(name).split() if word not in GENERIC_NAME_TOKENS]
+
+
+def name_trigrams(name: Any) -> Set[str]:
+    """
+    Trigrams of the distinctive words of a market name.
+    Falls back to the whole name when every word is generic ("Pasar Malam").
+    """
+    return text_trigrams(' '.join(distinctive_words(name)) or normalize_text(name))
+
+
+def normalize_schedule(schedule: Any) -> FrozenSet[Tuple[str, str, str]]:
+    """
+    Flatten a schedule to a set of (day, start, end) so different groupings compare equal.
+    Input: [{"days": ["mon", "tue"], "times": [{"start": "18:00", "end": "00:00"}]}]
+    Output: {("mon", "18:00", "00:00"), ("tue", "18:00", "00:00")}
+    """
+    if isinstance(schedule, str):
+        try:
+            schedule = json.loads(schedule)
+        except json.JSONDecodeError:
+            return frozenset()
+
+    if not isinstance(schedule, list):
+        return frozenset()
+
+    slots = set()
+    for entry in schedule:
+        if not isinstance(entry, dict):
+            continue
+        for day in entry.get('days') or []:
+            day = data_processing.DAY_MAPPING.get(day, str(day).lower()[:3])
+            if day not in data_processing.ALL_DAYS_ABBR:
+                continue
+            for time in entry.get('times') or []:
+                if isinstance(time, dict) and time.get('start') and time.get('end'):
+                    slots.add((day, time['start'], time['end']))
+    return frozenset(slots)
+
+
+def jaccard(a: Set, b: Set) -> Optional[float]:
+    """Jaccard similarity, or None if either side is empty."""
+    if not a or not b:
+        return None
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+def prepare(df: pd.DataFrame) -> pd.DataFrame:
+    """Add normalized columns used for matching to a markets or suggestions frame."""
+    df = df.copy()
+    df['_name_trigrams'] = df['name'].apply(name_trigrams)
+    df['_generic_name'] = df['name'].apply(lambda x: not distinctive_words(x))
+    df['_address_trigrams'] = df['address'].apply(lambda x: text_trigrams(normalize_text(x)))
+    df['_schedule'] = df['schedule'].apply(normalize_schedule)
+    coords = df['location'].apply(parse_location)
+    df['_latitude'] = coords.apply(lambda x: x[0]).astype(float)
+    df['_longitude'] = coords.apply(lambda x: x[1]).astype(float)
+    return df.reset_index(drop=True)
+
+
+def build_name_index(name_trigrams: List[Set[str]]) -> Dict[str, np.ndarray]:
+    """Trigram -> positions of markets whose name contains it."""
+    postings: Dict[str, List[int]] = defaultdict(list)
+    for position, trigrams in enumerate(name_trigrams):
+        for trigram in trigrams:
+            postings[trigram].append(position)
+    return {trigram: np.array(positions) for trigram, positions in postings.items()}
+
+
+def name_similarities(query: Set[str], index: Dict[str, np.ndarray], sizes: np.ndarray) -> np.ndarray:
+    """Jaccard similarity of one name against every market name, via the trigram index."""
+    hits = [index[trigram] for trigram in query if trigram in index]
+    if not hits:
+        return np.zeros(len(sizes))
+    shared = np.bincount(np.concatenate(hits), minlength=len(sizes))
+    return shared / (len(query) + sizes - shared)
+
+
+def nearby_markets(markets: pd.DataFrame, suggestions: pd.DataFrame) -> List[Dict[int, float]]:
+    """
+    For every suggestion, the markets within MATCH_RADIUS_KM as {market position: distance}.
+    Suggestions are batched per grid cell: each batch is one vectorized distance matrix
+    against the markets in the surrounding cells.
+    """
+    nearby: List[Dict[int, float]] = [{} for _ in range(len(suggestions))]
+
+    located_markets = markets.index[markets['_latitude'].notna() & markets['_longitude'].notna()].to_numpy()
+    located_suggestions = suggestions.index[
+        suggestions['_latitude'].notna() & suggestions['_longitude'].notna()
+    ].to_numpy()
+    if len(located_markets) == 0 or len(located_suggestions) == 0:
+        return nearby
+
+    market_lat = markets['_latitude'].to_numpy()[located_markets]
+    market_lon = markets['_longitude'].to_numpy()[located_markets]
+    suggestion_lat = suggestions['_latitude'].to_numpy()[located_suggestions]
+    suggestion_lon = suggestions['_longitude'].to_numpy()[located_suggestions]
+
+    grid = build_grid(market_lat, market_lon)
+    cell_rows, cell_cols = grid_cell(suggestion_lat, suggestion_lon)
+
+    batches: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+    for pos, cell in enumerate(zip(cell_rows, cell_cols)):
+        batches[cell].append(pos)
+
+    # A 0.25 degree cell is wider than MATCH_RADIUS_KM, so the adjacent ring covers the radius
+    for cell, members in batches.items():
+        candidates = ring_candidates(grid, cell, 1)
+        if len(candidates) == 0:
+            continue
+        members = np.array(members)
+        distances = haversine_km(
+            suggestion_lat[members][:, None], suggestion_lon[members][:, None],
+            market_lat[candidates][None, :], market_lon[candidates][None, :],
+        )
+        for row, suggestion_pos in enumerate(members):
+            within = np.nonzero(distances[row] <= MATCH_RADIUS_KM)[0]
+            nearby[located_suggestions[suggestion_pos]] = {
+                int(located_markets[candidates[col]]): float(distances[row, col]) for col in within
+            }
+
+    return nearby
+
+
+def score_candidate(suggestion: Dict[str, Any], market: Dict[str, Any], name_sim: float,
+                    distance_km: Optional[float]) -> Dict[str, Any]:
+    """
+    Combine the per-field similarities into a single confidence score.
+    distance_km is None when the market is outside MATCH_RADIUS_KM or either side has no location;
+    it is computed here for located markets outside the radius so the report shows the real distance.
+    """
+    both_located = not (pd.isna(suggestion['_latitude']) or pd.isna(market['_latitude']))
+    if distance_km is None and both_located:
+        distance_km = float(haversine_km(suggestion['_latitude'], suggestion['_longitude'],
+                                         market['_latitude'], market['_longitude']))
+    proximity = None if distance_km is None else max(0.0, 1 - distance_km / MATCH_RADIUS_KM)
+
+    scores = {
+        'name': name_sim,
+        'distance': proximity,
+        'address': jaccard(suggestion['_address_trigrams'], market['_address_trigrams']),
+        'schedule': jaccard(suggestion['_schedule'], market['_schedule']),
+    }
+    available = {field: score for field, score in scores.items() if score is not None}
+    total_weight = sum(WEIGHTS[field] for field in available)
+    confidence = sum(WEIGHTS[field] * score for field, score in available.items()) / total_weight
+
+    if proximity is None:
+        confidence = min(confidence, MAX_CONFIDENCE_WITHOUT_LOCATION)
+    elif distance_km > MATCH_RADIUS_KM:
+        confidence = min(confidence, MAX_CONFIDENCE_OUTSIDE_RADIUS)
+    if name_sim < MIN_NAME_SIMILARITY_NEARBY:
+        confidence = min(confidence, name_sim)
+    if suggestion['_generic_name'] or market['_generic_name']:
+        confidence = min(confidence, proximity or 0.0)
+
+    return {
+        'market_id': market['id'],
+        'name': market['name'],
+        'confidence': round(confidence, 3),
+        'distance_km': None if distance_km is None else round(distance_km, 3),
+        'name_similarity': round(name_sim, 3),
+    }
+
+
+def match_suggestions(markets: pd.DataFrame, suggestions: pd.DataFrame) -> List[List[Dict[str, Any]]]:
+    """Return the likely duplicates of every suggestion, best first."""
+    name_index = build_name_index(markets['_name_trigrams'].tolist())
+    name_sizes = markets['_name_trigrams'].apply(len).to_numpy()
+    nearby = nearby_markets(markets, suggestions)
+    market_records = markets.to_dict('records')
+
+    results = []
+    for pos, suggestion in enumerate(suggestions.to_dict('records')):
+        name_sims = name_similarities(suggestion['_name_trigrams'], name_index, name_sizes)
+        candidates = set(nearby[pos]) | set(np.nonzero(name_sims >= MIN_NAME_SIMILARITY)[0].tolist())
+
+        scored = [
+            score_candidate(suggestion, market_records[market_pos], float(name_sims[market_pos]),
+                            nearby[pos].get(market_pos))
+            for market_pos in candidates
+        ]
+        scored = [match for match in scored if match['confidence'] >= MIN_CONFIDENCE]
+        scored.sort(key=lambda match: (-match['confidence'], match['market_id']))
+        results.append(scored[:MAX_CANDIDATES])
+
+    return results
+
+
+def fetch_table(base_url: str, key: str, path: str) -> List[Dict[str, Any]]:
+    """Fetch every row of a Supabase REST query, one page at a time."""
+    rows: List[Dict[str, Any]] = []
+    while True:
+        request = urllib.request.Request(
+            f"{base_url.rstrip('/')}/rest/v1/{path}",
+            headers={
+                'apikey': key,
+                'Authorization': f'Bearer {key}',
+                'Range': f'{len(rows)}-{len(rows) + PAGE_SIZE - 1}',
+            },
+        )
+        with urllib.request.urlopen(request) as response:
+            page = json.loads(response.read().decode('utf-8'))
+        rows.extend(page)
+        if len(page) < PAGE_SIZE:
+            return rows
+
+
+def load_suggestions(dump_file: Optional[str], base_url: str, key: str) -> pd.DataFrame:
+    """Load pending "new" suggestions from a JSON dump or from Supabase."""
+    if dump_file:
+        with open(dump_file, encoding='utf-8') as f:
+            rows = json.load(f)
+        rows = [row for row in rows if row.get('type') == 'new' and row.get('status', 'pending') == 'pending']
+    else:
+        rows = fetch_table(base_url, key, 'market_suggestions?select=id,data&type=eq.new&status=eq.pending&order=created_at')
+
+    records = []
+    for row in rows:
+        data = row.get('data') or {}
+        if isinstance(data, str):
+            data = json.loads(data)
+        records.append({
+            'id': row['id'],
+            'name': data.get('name'),
+            'address': data.get('address'),
+            'location': data.get('location'),
+            'schedule': data.get('schedule') or [],
+        })
+    return pd.DataFrame(records, columns=['id', 'name', 'address', 'location', 'schedule'])
+
+
+def load_markets(markets_file: Optional[str], base_url: str, key: str) -> pd.DataFrame:
+    """Load existing markets from a seed CSV or from Supabase."""
+    if markets_file:
+        df = pd.read_csv(markets_file, usecols=['id', 'name', 'address', 'location', 'schedule'])
+    else:
+        df = pd.DataFrame(fetch_table(base_url, key, 'pasar_malams?select=id,name,address,location,schedule&order=id'))
+    return df.drop_duplicates(subset='id', keep='first')
+
+
+def build_update_sql(suggestions: pd.DataFrame, matches: List[List[Dict[str, Any]]]) -> str:
+    """Write all annotations back in a single UPDATE ... FROM (VALUES ...) statement."""
+    values = []
+    for suggestion_id, candidates in zip(suggestions['id'], matches):
+        candidates_json = json.dumps(candidates, ensure_ascii=False).replace("'", "''")
+        suggestion_id = str(suggestion_id).replace("'", "''")
+        values.append(f"('{suggestion_id}'::uuid, '{candidates_json}'::jsonb)")
+
+    sql_lines = []
+    sql_lines.append("-- Duplicate candidates for pending market suggestions")
+    sql_lines.append(f"-- Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    sql_lines.append(f"-- Total suggestions: {len(values)}")
+    sql_lines.append("")
+    sql_lines.append("UPDATE \"public\".\"market_suggestions\" AS s SET")
+    sql_lines.append("    \"duplicate_candidates\" = v.candidates,")
+    sql_lines.append("    \"duplicate_checked_at\" = now()")
+    sql_lines.append("FROM (VALUES")
+    sql_lines.append(",\n".join(values))
+    sql_lines.append(") AS v(id, candidates)")
+    sql_lines.append("WHERE s.id = v.id;")
+    sql_lines.append("")
+    return '\n'.join(sql_lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Find likely duplicates of pending market suggestions.')
+    parser.add_argument('--suggestions', help='JSON dump of market_suggestions rows (default: fetch from Supabase)')
+    parser.add_argument('--markets', help=f'Markets CSV (default: {DEFAULT_MARKETS_FILE} with --suggestions, '
+                                          'otherwise fetch from Supabase)')
+    parser.add_argument('--output-json', default=DEFAULT_OUTPUT_JSON)
+    parser.add_argument('--output-sql', default=DEFAULT_OUTPUT_SQL)
+    args = parser.parse_args()
+
+    base_url = os.environ.get('NEXT_PUBLIC_SUPABASE_URL', '')
+    key = os.environ.get('SUPABASE_SERVICE_ROLE_KEY', '')
+    markets_file = args.markets or (DEFAULT_MARKETS_FILE if args.suggestions else None)
+    if (not args.suggestions or not markets_file) and not (base_url and key):
+        print("Set NEXT_PUBLIC_SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY, or pass --suggestions. Exiting.")
+        exit(1)
+
+    print("Loading suggestions...")
+    suggestions = load_suggestions(args.suggestions, base_url, key)
+    print(f"Loaded {len(suggestions)} pending suggestions")
+
+    if suggestions.empty:
+        print("Nothing to match.")
+        return
+
+    print("Loading markets...")
+    markets = load_markets(markets_file, base_url, key)
+    print(f"Loaded {len(markets)} markets")
+
+    print("\nNormalizing...")
+    markets = prepare(markets)
+    suggestions = prepare(suggestions)
+
+    print("Matching...")
+    matches = match_suggestions(markets, suggestions)
+    flagged = sum(1 for candidates in matches if candidates)
+    print(f"Found likely duplicates for {flagged}/{len(suggestions)} suggestions")
+
+    report = [
+        {'suggestion_id': suggestion_id, 'name': name, 'candidates': candidates}
+        for suggestion_id, name, candidates in zip(suggestions['id'], suggestions['name'], matches)
+    ]
+    with open(args.output_json, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\nSaved report to {args.output_json}")
+
+    with open(args.output_sql, 'w', encoding='utf-8') as f:
+        f.write(build_update_sql(suggestions, matches))
+    print(f"Saved SQL to {args.output_sql}")
+    print("\nDone!")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,27 @@
+"""
+Import the pipeline scripts (e.g. the hyphenated data-processing.py) as
+modules so their transforms can be reused without running them.
+"""
+import importlib.util
+import os
+import sys
+from types import ModuleType
+
+DATASET_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_script(file_name: str) -> ModuleType:
+    """
+    Load a script by path relative to the dataset directory.
+    Input: "data-processing.py" or "../supabase/sql_to_csv.py"
+    Output: module "data_processing" / "sql_to_csv" (cached in sys.modules)
+    """
+    module_name = os.path.splitext(os.path.basename(file_name))[0].replace('-', '_')
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(DATASET_DIR, file_name))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
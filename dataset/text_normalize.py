@@ -0,0 +1,146 @@
+"""
+Search text normalization shared by the dataset scripts.
+
+Folds common Malay abbreviations and spelling variants to a single canonical
+form so that "Kg. Baru", "Kampong Bahru" and "kampung baru" all produce the
+same tokens and trigrams.
+"""
+import re
+import unicodedata
+from typing import Dict, List, Set
+
+# Abbreviation / spelling variant -> canonical token
+TOKEN_VARIANTS: Dict[str, str] = {
+    # Abbreviations
+    'kg': 'kampung',
+    'kpg': 'kampung',
+    'kamp': 'kampung',
+    'tmn': 'taman',
+    'jln': 'jalan',
+    'jl': 'jalan',
+    'lrg': 'lorong',
+    'bdr': 'bandar',
+    'bt': 'batu',
+    'bkt': 'bukit',
+    'sg': 'sungai',
+    'sgi': 'sungai',
+    'psr': 'pasar',
+    'pdg': 'padang',
+    'tg': 'tanjung',
+    'tj': 'tanjung',
+    'tjg': 'tanjung',
+    'tgk': 'tengku',
+    'ptg': 'permatang',
+    'pmtg': 'permatang',
+    'pkn': 'pekan',
+    'kt': 'kuala terengganu',
+    'kb': 'kota baru',
+    'kl': 'kuala lumpur',
+    'jb': 'johor baru',
+    'pm': 'pasar malam',
+    # Spelling variants (old and new Malay spelling, English names)
+    'kampong': 'kampung',
+    'ayer': 'air',
+    'seri': 'sri',
+    'bahru': 'baru',
+    'bharu': 'baru',
+    'baharu': 'baru',
+    'tasek': 'tasik',
+    'tanjong': 'tanjung',
+    'sungei': 'sungai',
+    'malacca': 'melaka',
+    'penang': 'pinang',
+    'pasarmalam': 'pasar malam',
+}
+
+# Old-spelling digraphs that map onto the modern spelling ("Chempaka" -> "Cempaka")
+# Only applied to words of at least DIGRAPH_MIN_LENGTH letters, so that short
+# abbreviations without a TOKEN_VARIANTS entry are left alone
+DIGRAPH_MIN_LENGTH = 3
+DIGRAPH_VARIANTS = [
+    ('ch', 'c'),
+    ('dj', 'j'),
+    ('tj', 'c'),
+    ('oe', 'u'),
+]
+
+
+def strip_accents(text: str) -> str:
+    """Remove diacritics so that e.g. "é" matches "e"."""
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def normalize_token(token: str) -> str:
+    """Map a single lowercase token to its canonical form."""
+    token = TOKEN_VARIANTS.get(token, token)
+    if ' ' in token or len(token) < DIGRAPH_MIN_LENGTH:
+        return token
+    for old, new in DIGRAPH_VARIANTS:
+        token = token.replace(old, new)
+    return token
+
+
+def normalize_search_text(text: str) -> str:
+    """
+    Normalize free text for search.
+    Input: "Kg. Bahru, Jln Chempaka 3"
+    Output: "kampung baru jalan cempaka 3"
+    """
+    if text is None or text != text or text == '':
+        return ''
+
+    text = strip_accents(str(text)).lower()
+    # Keep only alphanumerics; punctuation separates words ("kg.baru" -> "kg baru")
+    tokens = re.findall(r'[a-z0-9]+', text)
+
+    return ' '.join(normalize_token(token) for token in tokens)
+
+
+def search_index_text(text: str) -> str:
+    """
+    Text that is indexed for typeahead: the normalized words, followed by the
+    original spelling of every word that was folded, so a partly typed word
+    matches either form ("Penan" still finds "Penang", indexed as "pinang").
+    Input: "Kg. Penang"
+    Output: "kampung pinang kg penang"
+    """
+    if text is None or text != text or text == '':
+        return ''
+
+    tokens = re.findall(r'[a-z0-9]+', strip_accents(str(text)).lower())
+    normalized = [normalize_token(token) for token in tokens]
+    originals = []
+    for token, folded in zip(tokens, normalized):
+        if token != folded and token not in originals:
+            originals.append(token)
+    return ' '.join(normalized + originals)
+
+
+def text_fingerprint(text: str) -> str:
+    """
+    32-bit FNV-1a hash of the code points of a string, as 8 hex digits.
+    lib/search-index.ts computes the same hash to tell whether a market's
+    text changed since the index was built.
+    """
+    value = 0x811c9dc5
+    for ch in text:
+        value = ((value ^ ord(ch)) * 0x01000193) & 0xffffffff
+    return f'{value:08x}'
+
+
+def word_trigrams(word: str) -> List[str]:
+    """
+    Split a single word into trigrams, padded the same way as pg_trgm
+    (two spaces in front, one behind): "pasar" -> "  p", " pa", "pas", "asa", "sar", "ar ".
+    """
+    padded = f'  {word} '
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def text_trigrams(text: str) -> Set[str]:
+    """Return the set of trigrams for already-normalized text."""
+    trigrams: Set[str] = set()
+    for word in text.split():
+        trigrams.update(word_trigrams(word))
+    return trigrams
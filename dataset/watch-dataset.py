@@ -0,0 +1,346 @@
+import pandas as pd
+import argparse
+import contextlib
+import csv
+import glob
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Set, Tuple
+
+from script_loader import DATASET_DIR, load_script
+
+# Loaded once; every batch reuses the warm interpreter and imports
+data_processing = load_script('data-processing.py')
+generate_seed_sql = load_script('generate-seed-sql.py')
+sql_to_csv = load_script('../supabase/sql_to_csv.py')
+build_search_index = load_script('build-search-index.py')
+build_neighbors = load_script('build-neighbors.py')
+
+ROOT_DIR = os.path.dirname(DATASET_DIR)
+INPUT_PATTERN = os.path.join(DATASET_DIR, 'pasar-malam-in-*.csv')
+PROCESSED_FILE = os.path.join(DATASET_DIR, 'processed-markets.csv')
+SEED_FILE = os.path.join(ROOT_DIR, 'supabase', 'seed-2.sql')
+SEED_CSV_FILE = os.path.join(ROOT_DIR, 'supabase', 'seed-2.csv')
+SEARCH_INDEX_DIR = os.path.join(ROOT_DIR, 'public', 'search-index')
+NEIGHBORS_FILE = os.path.join(ROOT_DIR, 'supabase', 'seed-neighbors.sql')
+
+# seed-2.csv columns, in the order of the seed INSERT statement
+SEED_COLUMNS = sql_to_csv.parse_sql_columns(generate_seed_sql.build_seed_sql([]))
+
+# How often the dataset directory is scanned
+POLL_SECONDS = 1.0
+
+# A file must be unchanged for this long before it is processed, so a
+# scraper writing several files (or one file in chunks) becomes one batch
+DEBOUNCE_SECONDS = 5.0
+
+# Upper bound on files processed in one batch; the rest wait for the next one
+MAX_BATCH_FILES = 4
+
+# File signature used to detect new or changed files
+Signature = Tuple[int, int]  # (mtime_ns, size)
+
+
+def file_signature(path: str) -> Optional[Signature]:
+    """Return (mtime_ns, size) of a file, or None if it disappeared."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def write_atomic(path: str, text: str):
+    """
+    Write a file through a temporary file in the same directory and rename it
+    into place, so readers (or a Ctrl-C mid-write) never see a truncated file.
+    """
+    directory = os.path.dirname(path)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f'.{os.path.basename(path)}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        if os.path.exists(path):
+            shutil.copymode(path, temp_path)
+        else:
+            os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(temp_path)
+        raise
+
+
+class DatasetWatcher:
+    """
+    Keeps the processed rows, seed VALUES and seed CSV rows of every state
+    file in memory, so a changed file only reprocesses its own state and the
+    outputs are rebuilt by joining the cached parts. Search index files are
+    only rewritten for the states of the changed files, and the neighbors
+    seed only when market ids or locations changed.
+
+    Memory stays bounded: raw frames are dropped after processing, only one
+    processed frame, one list of VALUES strings and one list of CSV rows are
+    kept per state file, and the pending queue holds at most one entry per file.
+    """
+
+    def __init__(self):
+        self.processed: Dict[str, pd.DataFrame] = {}
+        self.seed_values: Dict[str, List[str]] = {}
+        self.csv_rows: Dict[str, List[List[str]]] = {}
+        self.processed_signatures: Dict[str, Signature] = {}
+        # state -> hash of its searchable rows when its index file was last written
+        self.index_signatures: Dict[str, str] = {}
+        # hash of every market id and location when seed-neighbors.sql was last written
+        self.neighbors_signature: Optional[str] = None
+        # path -> (signature, monotonic time it was last seen changing)
+        self.pending: Dict[str, Tuple[Optional[Signature], float]] = {}
+        self.lock = threading.Lock()
+        self.status = {
+            'started_at': datetime.now().isoformat(timespec='seconds'),
+            'queue_depth': 0,
+            'batches': 0,
+            'markets': 0,
+            'last_batch': None,
+            'last_error': None,
+        }
+
+    def scan(self):
+        """Queue files that are new, changed or deleted since they were last processed."""
+        now = time.monotonic()
+        current = {path: file_signature(path) for path in glob.glob(INPUT_PATTERN)}
+        known = set(self.processed_signatures) | set(self.pending)
+
+        for path in set(current) | known:
+            signature = current.get(path)
+            if signature == self.processed_signatures.get(path):
+                self.pending.pop(path, None)
+                continue
+            queued = self.pending.get(path)
+            if queued is None or queued[0] != signature:
+                # Restart the debounce timer on every change
+                self.pending[path] = (signature, now)
+
+        with self.lock:
+            self.status['queue_depth'] = len(self.pending)
+
+    def ready_batch(self) -> List[str]:
+        """Files whose last change is older than DEBOUNCE_SECONDS."""
+        now = time.monotonic()
+        ready = sorted(path for path, (_, seen) in self.pending.items() if now - seen >= DEBOUNCE_SECONDS)
+        return ready[:MAX_BATCH_FILES]
+
+    def process_file(self, path: str) -> int:
+        """Reprocess one state file into the cache. Returns its market count."""
+        signature = file_signature(path)
+        if signature is None:
+            # Deleted: drop the state from the outputs
+            self.processed.pop(path, None)
+            self.seed_values.pop(path, None)
+            self.csv_rows.pop(path, None)
+            self.processed_signatures.pop(path, None)
+            return 0
+
+        # The scripts print progress for every step; keep the daemon log to one line per batch
+        with contextlib.redirect_stdout(io.StringIO()):
+            df = data_processing.process_markets(pd.read_csv(path))
+
+        self.processed[path] = df.reset_index(drop=True)
+        self.seed_values[path] = [generate_seed_sql.build_value_row(row) for _, row in df.iterrows()]
+        self.csv_rows[path] = self.convert_values(path, self.seed_values[path])
+        self.processed_signatures[path] = signature
+        return len(df)
+
+    @staticmethod
+    def convert_values(path: str, values: List[str]) -> List[List[str]]:
+        """Convert VALUES tuples to seed-2.csv rows the way sql_to_csv.py does, skipping malformed rows."""
+        rows = []
+        for row_number, value in enumerate(values, start=1):
+            row = sql_to_csv.parse_row(value[1:-1])
+            if len(row) != len(SEED_COLUMNS):
+                print(f"[watch] seed-2.csv: skipped {os.path.basename(path)} row {row_number} "
+                      f"({len(row)} columns): {value[1:121]}")
+                continue
+            rows.append(row)
+        return rows
+
+    def row_states(self, path: str) -> Set[str]:
+        """States of the cached CSV rows of a file."""
+        state_col = SEED_COLUMNS.index('state')
+        return {row[state_col] for row in self.csv_rows.get(path, [])}
+
+    def write_outputs(self, states: Set[str]) -> Tuple[int, List[str], bool]:
+        """
+        Rebuild processed-markets.csv, seed-2.sql and seed-2.csv from the cached
+        per-state parts, then the search index files of the given states and
+        seed-neighbors.sql. Returns the market count, the states whose index
+        was rewritten and whether the neighbors were rebuilt.
+        """
+        paths = sorted(self.processed)
+        frames = [self.processed[path] for path in paths]
+        df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        write_atomic(PROCESSED_FILE, df.to_csv(index=False))
+
+        values = [value for path in paths for value in self.seed_values[path]]
+        write_atomic(SEED_FILE, generate_seed_sql.build_seed_sql(values))
+
+        rows = [row for path in paths for row in self.csv_rows[path]]
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(SEED_COLUMNS)
+        writer.writerows(rows)
+        write_atomic(SEED_CSV_FILE, output.getvalue())
+
+        markets = pd.DataFrame(rows, columns=SEED_COLUMNS)
+        return len(values), self.write_search_index(markets, states), self.write_neighbors(markets)
+
+    def write_search_index(self, markets: pd.DataFrame, states: Set[str]) -> List[str]:
+        """Rewrite the index files of the given states if their searchable rows changed since the last batch."""
+        columns = ['id', 'state'] + build_search_index.SEARCH_COLUMNS
+        touched = markets.loc[markets['state'].isin(states), columns]
+        groups = dict(tuple(touched.groupby('state', sort=True)))
+        signatures = {
+            state: hashlib.sha1(state_df.sort_values('id').to_csv(index=False).encode('utf-8')).hexdigest()
+            for state, state_df in groups.items()
+        }
+
+        changed = [state for state, signature in signatures.items() if self.index_signatures.get(state) != signature]
+        removed = [state for state in states if state not in signatures and state in self.index_signatures]
+        if not changed and not removed:
+            return []
+
+        os.makedirs(SEARCH_INDEX_DIR, exist_ok=True)
+        for state in changed:
+            index = build_search_index.build_state_index(state, groups[state])
+            write_atomic(os.path.join(SEARCH_INDEX_DIR, build_search_index.index_file_name(state)),
+                         build_search_index.dump_index(index))
+            self.index_signatures[state] = signatures[state]
+        for state in removed:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(os.path.join(SEARCH_INDEX_DIR, build_search_index.index_file_name(state)))
+            del self.index_signatures[state]
+
+        write_atomic(os.path.join(SEARCH_INDEX_DIR, 'manifest.json'),
+                     build_search_index.dump_manifest(markets['state'].value_counts().to_dict()))
+        return changed + removed
+
+    def write_neighbors(self, markets: pd.DataFrame) -> bool:
+        """
+        Rewrite seed-neighbors.sql if any market id or location changed. A new or
+        moved market changes the neighbors of markets in other states too, so
+        the whole table is rebuilt (a grid search over all markets is cheap).
+        """
+        signature = hashlib.sha1(markets[['id', 'location']].to_csv(index=False).encode('utf-8')).hexdigest()
+        if signature == self.neighbors_signature:
+            return False
+
+        coordinates = build_neighbors.market_coordinates(markets[['id', 'location']])
+        write_atomic(NEIGHBORS_FILE, build_neighbors.build_neighbors_sql(build_neighbors.build_neighbor_values(coordinates)))
+        self.neighbors_signature = signature
+        return True
+
+    def run_batch(self, paths: List[str]):
+        """Process a batch of files and rewrite the outputs once."""
+        started = time.perf_counter()
+        counts = {}
+        # States of the rows before and after, so moved or removed rows are covered too
+        states = set()
+        for path in paths:
+            states |= self.row_states(path)
+            try:
+                counts[os.path.basename(path)] = self.process_file(path)
+            except Exception as e:
+                # Keep the previous rows for this state; retry when the file changes again
+                self.processed_signatures[path] = file_signature(path)
+                with self.lock:
+                    self.status['last_error'] = f"{os.path.basename(path)}: {e}"
+                print(f"[watch] error processing {os.path.basename(path)}: {e}")
+            states |= self.row_states(path)
+            self.pending.pop(path, None)
+
+        total, index_states, neighbors_rebuilt = self.write_outputs(states)
+        elapsed = time.perf_counter() - started
+
+        with self.lock:
+            self.status['batches'] += 1
+            self.status['markets'] = total
+            self.status['queue_depth'] = len(self.pending)
+            self.status['last_batch'] = {
+                'finished_at': datetime.now().isoformat(timespec='seconds'),
+                'files': counts,
+                'search_index_states': index_states,
+                'neighbors_rebuilt': neighbors_rebuilt,
+                'seconds': round(elapsed, 3),
+            }
+
+        files = ', '.join(f"{name} ({count} rows)" for name, count in counts.items())
+        print(f"[watch] batch {self.status['batches']}: {files} in {elapsed:.2f}s, "
+              f"{total} markets total, search index for {len(index_states)} states, "
+              f"neighbors {'rebuilt' if neighbors_rebuilt else 'unchanged'}, "
+              f"queue depth {len(self.pending)}")
+
+    def run_forever(self):
+        """Build everything once, then poll for changes."""
+        self.scan()
+        initial = sorted(self.pending)
+        if initial:
+            self.run_batch(initial)
+
+        while True:
+            time.sleep(POLL_SECONDS)
+            self.scan()
+            batch = self.ready_batch()
+            if batch:
+                self.run_batch(batch)
+
+    def snapshot(self) -> Dict:
+        with self.lock:
+            return json.loads(json.dumps(self.status))
+
+
+def serve_status(watcher: DatasetWatcher, port: int):
+    """Serve the watcher status as JSON on http://localhost:<port>/ in a background thread."""
+
+    class StatusHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = json.dumps(watcher.snapshot(), indent=2).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # Keep the daemon log to batch lines
+
+    server = ThreadingHTTPServer(('127.0.0.1', port), StatusHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"[watch] status endpoint on http://127.0.0.1:{port}/")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Reprocess scrape files in dataset/ as they are dropped.')
+    parser.add_argument('--status-port', type=int, help='Serve queue depth and batch latency as JSON on this port')
+    args = parser.parse_args()
+
+    watcher = DatasetWatcher()
+    if args.status_port:
+        serve_status(watcher, args.status_port)
+
+    print(f"[watch] watching {INPUT_PATTERN} (debounce {DEBOUNCE_SECONDS:.0f}s)")
+    try:
+        watcher.run_forever()
+    except KeyboardInterrupt:
+        print("\n[watch] stopped")
+
+
+if __name__ == '__main__':
+    main()
@@ -34,6 +34,9 @@ export interface DatabaseRow {
   // JSONB fields (can be string or already parsed object)
   location?: string | { latitude: number; longitude: number; gmaps_link: string } | null;
   schedule?: string | MarketSchedule[] | null;
+
+  // Packed hourly busyness (base64 of 7x24 bytes)
+  crowd_profile?: string | null;
 }
 
 /**
@@ -77,6 +80,7 @@ export function dbRowToMarket(row: DatabaseRow): Market {
     // Parse JSONB back to objects (Supabase may return as objects or strings)
     location: row.location ? (typeof row.location === "string" ? JSON.parse(row.location) : row.location) : undefined,
     schedule: typeof row.schedule === "string" ? JSON.parse(row.schedule) : row.schedule || [],
+    crowd_profile: row.crowd_profile || undefined,
   };
 }
 
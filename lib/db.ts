@@ -4,7 +4,7 @@
  */
 
 import { createClient } from "./supabase";
-import { dbRowToMarket } from "./db-transform";
+import { dbRowToMarket, type DatabaseRow } from "./db-transform";
 import type { Market, Weekday } from "./markets-data";
 import { getMarketOpenStatus } from "./utils";
 
@@ -133,6 +133,46 @@ export async function getMarketById(id: string): Promise<Market | null> {
   return dbRowToMarket(data);
 }
 
+/**
+ * A market near another one, from the precomputed pasar_malam_neighbors table
+ */
+export interface NearbyMarket {
+  market: Market;
+  distance_km: number;
+}
+
+/**
+ * Fetch the nearest active markets of a market, nearest first
+ * Neighbors are precomputed by dataset/build-neighbors.py
+ *
+ * @param id - Market ID
+ * @returns Nearby markets with their distance, or an empty array if none are stored
+ */
+export async function getNearbyMarkets(id: string): Promise<NearbyMarket[]> {
+  const supabase = await createClient();
+  const { data, error } = await supabase
+    .from("pasar_malam_neighbors")
+    .select("rank, distance_km, neighbor:pasar_malams!neighbor_id!inner(*)")
+    .eq("market_id", id)
+    .eq("neighbor.status", "Active")
+    .order("rank");
+
+  if (error) {
+    console.error("Error fetching nearby markets:", error);
+    return [];
+  }
+
+  if (!data) {
+    return [];
+  }
+
+  return data.map((row) => ({
+    market: dbRowToMarket(row.neighbor as unknown as DatabaseRow),
+    // numeric columns are returned as strings
+    distance_km: Number(row.distance_km),
+  }));
+}
+
 /**
  * Check if a market is currently open
  * This is a client-side function due to complex timezone logic
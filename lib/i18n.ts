@@ -116,6 +116,7 @@ export interface Translations {
   browseStateMarkets: string;
   discoverMoreMarkets: string;
   otherMarketsIn: string;
+  nearbyMarkets: string;
   loadingMap: string;
   yourLocation: string;
   viewDetails: string;
@@ -345,6 +346,7 @@ export const translations: Record<string, Translations> = {
     browseStateMarkets: "Browse",
     discoverMoreMarkets: "Discover more night markets in your area.",
     otherMarketsIn: "Other Markets in",
+    nearbyMarkets: "Nearby Markets",
     loadingMap: "Loading map...",
     yourLocation: "Your Location",
     viewDetails: "View Details",
@@ -576,6 +578,7 @@ export const translations: Record<string, Translations> = {
     browseStateMarkets: "Layari",
     discoverMoreMarkets: "Temui lebih banyak pasar malam di kawasan anda.",
     otherMarketsIn: "Pasar Lain di",
+    nearbyMarkets: "Pasar Berdekatan",
     loadingMap: "Memuatkan peta...",
     yourLocation: "Lokasi Anda",
     viewDetails: "Lihat Butiran",
@@ -38,6 +38,8 @@ export interface Market {
     longitude: number;
     gmaps_link: string;
   };
+  // Base64 of 7x24 busyness bytes (Mon-Sun, hour 0-23, 0-100, 255 = unknown), see getCrowdLevel
+  crowd_profile?: string;
 }
 
 export const marketsData: Market[] = [
@@ -0,0 +1,279 @@
+/**
+ * Client-side market search over the per-state trigram index in
+ * public/search-index (built by dataset/build-search-index.py).
+ *
+ * normalizeSearchText(), searchIndexText() and textFingerprint() are ports of
+ * dataset/text_normalize.py; keep them (and normalize_market_search() in the
+ * trgm migration) in sync.
+ */
+
+// Abbreviation / spelling variant -> canonical token
+const TOKEN_VARIANTS: Record<string, string> = {
+  // Abbreviations
+  kg: "kampung",
+  kpg: "kampung",
+  kamp: "kampung",
+  tmn: "taman",
+  jln: "jalan",
+  jl: "jalan",
+  lrg: "lorong",
+  bdr: "bandar",
+  bt: "batu",
+  bkt: "bukit",
+  sg: "sungai",
+  sgi: "sungai",
+  psr: "pasar",
+  pdg: "padang",
+  tg: "tanjung",
+  tj: "tanjung",
+  tjg: "tanjung",
+  tgk: "tengku",
+  ptg: "permatang",
+  pmtg: "permatang",
+  pkn: "pekan",
+  kt: "kuala terengganu",
+  kb: "kota baru",
+  kl: "kuala lumpur",
+  jb: "johor baru",
+  pm: "pasar malam",
+  // Spelling variants (old and new Malay spelling, English names)
+  kampong: "kampung",
+  ayer: "air",
+  seri: "sri",
+  bahru: "baru",
+  bharu: "baru",
+  baharu: "baru",
+  tasek: "tasik",
+  tanjong: "tanjung",
+  sungei: "sungai",
+  malacca: "melaka",
+  penang: "pinang",
+  pasarmalam: "pasar malam",
+};
+
+// Old-spelling digraphs ("Chempaka" -> "Cempaka"), only applied to words of 3+ letters
+const DIGRAPH_MIN_LENGTH = 3;
+const DIGRAPH_VARIANTS: [string, string][] = [
+  ["ch", "c"],
+  ["dj", "j"],
+  ["tj", "c"],
+  ["oe", "u"],
+];
+
+const INDEX_BASE_PATH = "/search-index";
+
+// Searchable market fields, in the order build-search-index.py fingerprints them
+type SearchableMarket = { name?: string | null; address?: string | null; district?: string | null };
+
+export interface SearchIndex {
+  state: string;
+  /** [id, name, district, fingerprint]; the position is the market number used in the postings */
+  markets: [string, string, string, string][];
+  /** Trigram -> market numbers (decoded from the delta-encoded file) */
+  trigrams: Map<string, number[]>;
+}
+
+interface SearchIndexFile {
+  version: number;
+  state: string;
+  markets: [string, string, string, string][];
+  trigrams: Record<string, number[]>;
+}
+
+interface SearchIndexManifest {
+  version: number;
+  states: Record<string, { file: string; markets: number }>;
+}
+
+/**
+ * A parsed query: one entry per typed word, each a list of alternatives
+ * (the folded words, or the word as typed) of which one must match.
+ * "Kg Penan" -> [[["kampung"], ["kg"]], [["penan"]]]
+ */
+export type SearchQuery = string[][][];
+
+function tokenize(text: string): string[] {
+  const folded = text
+    .normalize("NFKD")
+    .replace(/[\u0300-\u036f]/g, "")
+    .toLowerCase();
+  // Keep only alphanumerics; punctuation separates words ("kg.baru" -> "kg baru")
+  return folded.match(/[a-z0-9]+/g) ?? [];
+}
+
+function normalizeToken(token: string): string {
+  const canonical = TOKEN_VARIANTS[token] ?? token;
+  if (canonical.includes(" ") || canonical.length < DIGRAPH_MIN_LENGTH) return canonical;
+  return DIGRAPH_VARIANTS.reduce((word, [from, to]) => word.split(from).join(to), canonical);
+}
+
+/**
+ * Normalize free text for search.
+ * "Kg. Bahru, Jln Chempaka 3" -> "kampung baru jalan cempaka 3"
+ */
+export function normalizeSearchText(text: string | null | undefined): string {
+  if (!text) return "";
+  return tokenize(text).map(normalizeToken).join(" ");
+}
+
+/**
+ * Indexed text: the normalized words followed by the original spelling of
+ * every folded word, so a partly typed word matches either form.
+ * "Kg. Penang" -> "kampung pinang kg penang"
+ */
+export function searchIndexText(text: string | null | undefined): string {
+  if (!text) return "";
+  const tokens = tokenize(text);
+  const normalized = tokens.map(normalizeToken);
+  const originals: string[] = [];
+  tokens.forEach((token, i) => {
+    if (token !== normalized[i] && !originals.includes(token)) originals.push(token);
+  });
+  return normalized.concat(originals).join(" ");
+}
+
+/** 32-bit FNV-1a hash of the code points of a string, as 8 hex digits. */
+export function textFingerprint(text: string): string {
+  let value = 0x811c9dc5;
+  for (const ch of text) {
+    value = Math.imul(value ^ ch.codePointAt(0)!, 0x01000193) >>> 0;
+  }
+  return value.toString(16).padStart(8, "0");
+}
+
+/** Text of a market as indexed by build-search-index.py. */
+export function marketSearchText(market: SearchableMarket): string {
+  return searchIndexText([market.name, market.address, market.district].filter(Boolean).join(" "));
+}
+
+/** Fingerprint of a market's searchable fields, comparable with the index entry. */
+export function marketFingerprint(market: SearchableMarket): string {
+  return textFingerprint([market.name ?? "", market.address ?? "", market.district ?? ""].join("\n"));
+}
+
+/** Split a query into words, each matching its folded form or the word as typed. */
+export function parseSearchQuery(query: string): SearchQuery {
+  return tokenize(query).map((token) => {
+    const folded = normalizeToken(token);
+    return folded === token ? [[token]] : [folded.split(" "), [token]];
+  });
+}
+
+/**
+ * Trigrams a word must contain to start with `prefix`, padded like pg_trgm
+ * but without the trailing space so a partly typed word still matches.
+ * "pas" -> ["  p", " pa", "pas"]
+ */
+function prefixTrigrams(prefix: string): string[] {
+  const padded = `  ${prefix}`;
+  const trigrams: string[] = [];
+  for (let i = 0; i + 3 <= padded.length; i++) trigrams.push(padded.slice(i, i + 3));
+  return trigrams;
+}
+
+let manifestPromise: Promise<SearchIndexManifest> | null = null;
+const indexPromises = new Map<string, Promise<SearchIndex | null>>();
+
+function loadManifest(): Promise<SearchIndexManifest> {
+  if (!manifestPromise) {
+    manifestPromise = fetch(`${INDEX_BASE_PATH}/manifest.json`)
+      .then((res) => (res.ok ? res.json() : { version: 2, states: {} }))
+      .catch(() => {
+        manifestPromise = null;
+        return { version: 2, states: {} };
+      });
+  }
+  return manifestPromise;
+}
+
+function decodeIndex(file: SearchIndexFile): SearchIndex {
+  const trigrams = new Map<string, number[]>();
+  for (const [trigram, deltas] of Object.entries(file.trigrams)) {
+    const positions: number[] = new Array(deltas.length);
+    let position = 0;
+    for (let i = 0; i < deltas.length; i++) {
+      position += deltas[i];
+      positions[i] = position;
+    }
+    trigrams.set(trigram, positions);
+  }
+  return { state: file.state, markets: file.markets, trigrams };
+}
+
+/**
+ * Fetch and decode the search index of one state (cached per state).
+ * Resolves to null if the state has no index.
+ */
+export function loadSearchIndex(state: string): Promise<SearchIndex | null> {
+  let promise = indexPromises.get(state);
+  if (!promise) {
+    promise = loadManifest()
+      .then((manifest) => {
+        const entry = manifest.states[state];
+        if (!entry) return null;
+        return fetch(`${INDEX_BASE_PATH}/${entry.file}`).then((res) =>
+          res.ok ? res.json().then((file: SearchIndexFile) => decodeIndex(file)) : null,
+        );
+      })
+      .catch(() => {
+        indexPromises.delete(state);
+        return null;
+      });
+    indexPromises.set(state, promise);
+  }
+  return promise;
+}
+
+/** Load the indexes of every state listed in the manifest. */
+export async function loadAllSearchIndexes(): Promise<SearchIndex[]> {
+  const manifest = await loadManifest();
+  const indexes = await Promise.all(Object.keys(manifest.states).map(loadSearchIndex));
+  return indexes.filter((index): index is SearchIndex => index !== null);
+}
+
+function intersectPostings(index: SearchIndex, words: string[]): number[] {
+  const postings = Array.from(new Set(words.flatMap(prefixTrigrams))).map(
+    (trigram) => index.trigrams.get(trigram) ?? [],
+  );
+  if (postings.length === 0) return index.markets.map((_, position) => position);
+
+  // Intersect starting from the shortest posting list
+  postings.sort((a, b) => a.length - b.length);
+  let candidates = postings[0];
+  for (let i = 1; i < postings.length && candidates.length > 0; i++) {
+    const other = new Set(postings[i]);
+    candidates = candidates.filter((position) => other.has(position));
+  }
+  return candidates;
+}
+
+/**
+ * Market positions in the index that may match every word of the query.
+ * Trigrams of different words can combine into a false hit, so callers
+ * recheck the (few) candidates with matchesSearchQuery().
+ */
+export function searchIndexPositions(index: SearchIndex, query: SearchQuery): number[] {
+  let result: number[] = [];
+  query.forEach((alternatives, i) => {
+    const previous = new Set(result);
+    const matches = new Set<number>();
+    for (const words of alternatives) {
+      for (const position of intersectPostings(index, words)) {
+        if (i === 0 || previous.has(position)) matches.add(position);
+      }
+    }
+    result = Array.from(matches);
+  });
+  return result;
+}
+
+/**
+ * Whether every query word is the start of a word in the search text
+ * (one alternative per query word has to match).
+ */
+export function matchesSearchQuery(searchText: string, query: SearchQuery): boolean {
+  const words = searchText.split(" ");
+  return query.every((alternatives) =>
+    alternatives.some((queryWords) => queryWords.every((queryWord) => words.some((word) => word.startsWith(queryWord)))),
+  );
+}
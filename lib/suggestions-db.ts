@@ -3,6 +3,14 @@ import type { MarketFormValues } from "@/lib/admin-schema";
 
 export type SuggestionStatus = "pending" | "approved" | "rejected";
 
+export interface DuplicateCandidate {
+  market_id: string;
+  name: string;
+  confidence: number; // 0-1
+  distance_km: number | null;
+  name_similarity: number;
+}
+
 export interface MarketSuggestion {
   id: string;
   type: "new" | "update";
@@ -14,6 +22,8 @@ export interface MarketSuggestion {
   reviewed_by: string | null;
   created_at: string;
   reviewed_at: string | null;
+  duplicate_candidates: DuplicateCandidate[] | null; // set by dataset/match-suggestions.py
+  duplicate_checked_at: string | null;
 }
 
 export async function getSuggestions(status?: SuggestionStatus): Promise<MarketSuggestion[]> {
@@ -126,3 +126,49 @@ export function getMarketOpenStatus(market: Market, now?: Date): OpenStatus {
     minutesUntilNextOpen: bestDeltaMinutes === Infinity ? undefined : bestDeltaMinutes,
   };
 }
+
+// Crowd profile helpers
+// crowd_profile is base64 of 7x24 bytes: day 0=Mon..6=Sun, hour 0-23, popularity 0-100
+// 255 marks hours Google does not report, as opposed to 0 (idle)
+const CROWD_PROFILE_BYTES = 7 * 24;
+const CROWD_UNKNOWN = 255;
+const BUSY_THRESHOLD = 50;
+
+const crowdProfileCache = new Map<string, Uint8Array>();
+
+export function decodeCrowdProfile(profile: string): Uint8Array | null {
+  const cached = crowdProfileCache.get(profile);
+  if (cached) return cached;
+
+  let binary: string;
+  try {
+    binary = atob(profile);
+  } catch {
+    // Malformed base64 (e.g. a hand-edited row): treat as no data instead of breaking the page
+    return null;
+  }
+  if (binary.length !== CROWD_PROFILE_BYTES) return null;
+
+  const bytes = Uint8Array.from(binary, (c) => c.charCodeAt(0));
+  crowdProfileCache.set(profile, bytes);
+  return bytes;
+}
+
+/**
+ * Usual busyness (0-100) of a market at the given time in Malaysia, or null if unknown
+ */
+export function getCrowdLevel(market: Market, now?: Date): number | null {
+  if (!market.crowd_profile) return null;
+  const bytes = decodeCrowdProfile(market.crowd_profile);
+  if (!bytes) return null;
+
+  const localNow = getMalaysiaNow(now);
+  const dayIdx = (localNow.getDay() + 6) % 7; // getDay() is 0=Sun, profile is 0=Mon
+  const level = bytes[dayIdx * 24 + localNow.getHours()];
+  return level === CROWD_UNKNOWN ? null : level;
+}
+
+export function isUsuallyBusyNow(market: Market, now?: Date): boolean {
+  const level = getCrowdLevel(market, now);
+  return level !== null && level >= BUSY_THRESHOLD;
+}
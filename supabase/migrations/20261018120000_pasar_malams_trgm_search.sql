@@ -0,0 +1,108 @@
+-- Trigram search over market name, address and district.
+-- normalize_market_search() mirrors dataset/text_normalize.py so server-side
+-- results match the per-state search index in public/search-index
+-- (accents are not folded here; the dataset has none).
+
+create extension if not exists pg_trgm with schema extensions;
+
+create or replace function public.normalize_market_search(input text)
+returns text
+language sql
+immutable
+parallel safe
+set search_path = ''
+as $$
+  select coalesce(string_agg(
+    case
+      when v.canonical is not null then v.canonical
+      when length(w.word) < 3 then w.word
+      else replace(replace(replace(replace(w.word, 'ch', 'c'), 'dj', 'j'), 'tj', 'c'), 'oe', 'u')
+    end,
+    ' ' order by w.ord
+  ), '')
+  from regexp_split_to_table(lower(coalesce(input, '')), '[^a-z0-9]+') with ordinality as w(word, ord)
+  left join (values
+      ('kg', 'kampung'),
+      ('kpg', 'kampung'),
+      ('kamp', 'kampung'),
+      ('tmn', 'taman'),
+      ('jln', 'jalan'),
+      ('jl', 'jalan'),
+      ('lrg', 'lorong'),
+      ('bdr', 'bandar'),
+      ('bt', 'batu'),
+      ('bkt', 'bukit'),
+      ('sg', 'sungai'),
+      ('sgi', 'sungai'),
+      ('psr', 'pasar'),
+      ('pdg', 'padang'),
+      ('tg', 'tanjung'),
+      ('tj', 'tanjung'),
+      ('tjg', 'tanjung'),
+      ('tgk', 'tengku'),
+      ('ptg', 'permatang'),
+      ('pmtg', 'permatang'),
+      ('pkn', 'pekan'),
+      ('kt', 'kuala terengganu'),
+      ('kb', 'kota baru'),
+      ('kl', 'kuala lumpur'),
+      ('jb', 'johor baru'),
+      ('pm', 'pasar malam'),
+      ('kampong', 'kampung'),
+      ('ayer', 'air'),
+      ('seri', 'sri'),
+      ('bahru', 'baru'),
+      ('bharu', 'baru'),
+      ('baharu', 'baru'),
+      ('tasek', 'tasik'),
+      ('tanjong', 'tanjung'),
+      ('sungei', 'sungai'),
+      ('malacca', 'melaka'),
+      ('penang', 'pinang'),
+      ('pasarmalam', 'pasar malam')
+  ) as v(variant, canonical) on v.variant = w.word
+  where w.word <> '';
+$$;
+
+create or replace function public.market_search_text(name text, address text, district text)
+returns text
+language sql
+immutable
+parallel safe
+set search_path = ''
+as $$
+  -- Normalized words plus the original lowercase text, so a partly typed
+  -- original spelling ("penan") still matches a folded word ("pinang")
+  select public.normalize_market_search(concat_ws(' ', name, address, district))
+    || ' ' || lower(concat_ws(' ', name, address, district));
+$$;
+
+create index idx_pasar_malams_search_trgm
+  on public.pasar_malams
+  using gin (public.market_search_text(name, address, district) extensions.gin_trgm_ops);
+
+-- Typeahead lookup: substring match served by the trigram index, ranked by similarity
+create or replace function public.search_pasar_malams(
+  query text,
+  state_filter text default null,
+  max_results integer default 20
+)
+returns setof public.pasar_malams
+language sql
+stable
+set search_path = public, extensions
+as $$
+  select m.*
+  from public.pasar_malams m
+  where m.status = 'Active'
+    and (state_filter is null or m.state = state_filter)
+    and public.market_search_text(m.name, m.address, m.district)
+      like '%' || public.normalize_market_search(query) || '%'
+  order by similarity(public.market_search_text(m.name, m.address, m.district), public.normalize_market_search(query)) desc,
+    m.name
+  limit max_results;
+$$;
+
+grant execute on function public.normalize_market_search(text) to anon, authenticated, service_role;
+grant execute on function public.market_search_text(text, text, text) to anon, authenticated, service_role;
+grant execute on function public.search_pasar_malams(text, text, integer) to anon, authenticated, service_role;
@@ -0,0 +1,22 @@
+-- Precomputed k nearest markets per market (generated by dataset/build-neighbors.py)
+create table public.pasar_malam_neighbors (
+  market_id    varchar not null references public.pasar_malams(id) on delete cascade,
+  neighbor_id  varchar not null references public.pasar_malams(id) on delete cascade,
+  rank         smallint not null check (rank > 0),
+  distance_km  numeric(8,3) not null,
+  primary key (market_id, rank)
+);
+
+create index on public.pasar_malam_neighbors (neighbor_id);
+
+alter table public.pasar_malam_neighbors enable row level security;
+
+create policy "public read access"
+  on public.pasar_malam_neighbors for select
+  using (true);
+
+create policy "authenticated users can manage neighbors"
+  on public.pasar_malam_neighbors for all
+  to authenticated
+  using (true)
+  with check (true);
@@ -0,0 +1,4 @@
+-- Likely duplicates of "new" suggestions (filled by dataset/match-suggestions.py)
+alter table public.market_suggestions
+  add column duplicate_candidates jsonb,
+  add column duplicate_checked_at timestamptz;
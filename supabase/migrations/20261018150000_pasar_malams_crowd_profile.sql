@@ -0,0 +1,5 @@
+-- Hourly busyness per market from Google popular times (generated by dataset/data-processing.py).
+-- Base64 of 7x24 bytes: Monday-Sunday, hour 0-23, popularity 0-100 (255 = hour not reported).
+alter table public.pasar_malams
+  add column crowd_profile text
+    constraint chk_crowd_profile_length check (crowd_profile is null or length(crowd_profile) = 224);
@@ -0,0 +1,5003 @@
+-- SQL Seed Script for pasar_malam_neighbors table
+-- Generated on 2026-10-18 23:19:43
+-- Total records: 4990
+
+TRUNCATE "public"."pasar_malam_neighbors";
+
+INSERT INTO "public"."pasar_malam_neighbors" (
+    "market_id", "neighbor_id", "rank", "distance_km"
+) VALUES
+
+('night-market-yearns-every-sunday', 'saleng-night-market', 1, 3.607),
+('night-market-yearns-every-sunday', 'pasar-malam-taman-aman-senai-wednesday', 2, 4.278),
+('night-market-yearns-every-sunday', 'pasar-malam-jalan-kenanga-299', 3, 4.446),
+('night-market-yearns-every-sunday', 'pasar-malam-temenggong', 4, 6.986),
+('night-market-yearns-every-sunday', 'pasar-basah-kulai', 5, 7.258),
+('pasar-malam-serom-6', 'bukit-gambir-market', 1, 7.884),
+('pasar-malam-serom-6', 'pasar-tani', 2, 8.411),
+('pasar-malam-serom-6', 'pasar-awam-bukit-pasir-taman-bintang-emas', 3, 10.045),
+('pasar-malam-serom-6', 'pasar-malam-pusat-perniagaan-mas-jaya', 4, 11.506),
+('pasar-malam-serom-6', 'pasar-malam-taman-marin', 5, 11.856),
+('pasar-malam-kampung-batu-china', 'tangkak-market', 1, 1.507),
+('pasar-malam-kampung-batu-china', 'tangkak-morning-market', 2, 2.303),
+('pasar-malam-kampung-batu-china', 'pasar-malam-serom-6', 3, 12.198),
+('pasar-malam-kampung-batu-china', 'bukit-gambir-market', 4, 12.879),
+('pasar-malam-kampung-batu-china', 'pasar-tani', 5, 13.279),
+('pasar-malam-pusat-perniagaan-mas-jaya', 'pasar-malam-taman-marin', 1, 1.304),
+('pasar-malam-pusat-perniagaan-mas-jaya', 'man-man-bo-bing', 2, 1.401),
+('pasar-malam-pusat-perniagaan-mas-jaya', 'pasar-malam-pesta-muar', 3, 2.240),
+('pasar-malam-pusat-perniagaan-mas-jaya', 'jalan-maharani-night-market', 4, 2.539),
+('pasar-malam-pusat-perniagaan-mas-jaya', 'tangkak-vintage-night-market', 5, 2.885),
+('jalan-maharani-night-market', 'tangkak-vintage-night-market', 1, 0.603),
+('jalan-maharani-night-market', 'pasar-tani-stadium-sultan-ibrahim-muar', 2, 1.363),
+('jalan-maharani-night-market', 'pasar-malam-pesta-muar', 3, 1.867),
+('jalan-maharani-night-market', 'pasar-malam-pusat-perniagaan-mas-jaya', 4, 2.539),
+('jalan-maharani-night-market', 'man-man-bo-bing', 5, 3.032),
+('pasar-malam-kampung-pt-jayus', 'pekan-parit-sulong', 1, 9.420),
+('pasar-malam-kampung-pt-jayus', 'pasar-malam-yong-peng-yong-ping-ye-shi', 2, 15.070),
+('pasar-malam-kampung-pt-jayus', 'pasar-malam-taman-kota', 3, 15.081),
+('pasar-malam-kampung-pt-jayus', 'pasar-malam-taman-bukit-pasir', 4, 19.452),
+('pasar-malam-kampung-pt-jayus', 'pasar-malam-panchor', 5, 19.498),
+('pasar-malam-mini-kundang-ulu', 'pasar-malam-parit-medan', 1, 3.331),
+('pasar-malam-mini-kundang-ulu', 'pasar-malam-bandar-universiti-pagoh', 2, 10.659),
+('pasar-malam-mini-kundang-ulu', 'pasar-tani', 3, 12.962),
+('pasar-malam-mini-kundang-ulu', 'bukit-gambir-market', 4, 13.523),
+('pasar-malam-mini-kundang-ulu', 'pasar-malam-serom-6', 5, 20.888),
+('pasar-malam-pesta-muar', 'man-man-bo-bing', 1, 1.738),
+('pasar-malam-pesta-muar', 'jalan-maharani-night-market', 2, 1.867),
+('pasar-malam-pesta-muar', 'pasar-malam-taman-marin', 3, 1.914),
+('pasar-malam-pesta-muar', 'pasar-malam-pusat-perniagaan-mas-jaya', 4, 2.240),
+('pasar-malam-pesta-muar', 'pasar-tani-stadium-sultan-ibrahim-muar', 5, 2.316),
+('pasar-malam-taman-universiti', 'pasar-malam-sri-gading', 1, 5.001),
+('pasar-malam-taman-universiti', 'pasar-malam-parit-raja-darat', 2, 6.317),
+('pasar-malam-taman-universiti', 'pasar-malam-panchor', 3, 9.744),
+('pasar-malam-taman-universiti', 'pasar-malam-olak-batu', 4, 10.232),
+('pasar-malam-taman-universiti', 'pasar-malam-gate-air-senggarang', 5, 11.152),
+('tangkak-vintage-night-market', 'jalan-maharani-night-market', 1, 0.603),
+('tangkak-vintage-night-market', 'pasar-tani-stadium-sultan-ibrahim-muar', 2, 1.502),
+('tangkak-vintage-night-market', 'pasar-malam-pesta-muar', 3, 2.469),
+('tangkak-vintage-night-market', 'pasar-malam-pusat-perniagaan-mas-jaya', 4, 2.885),
+('tangkak-vintage-night-market', 'man-man-bo-bing', 5, 3.553),
+('pasar-malam-bakri-wednesday', 'pasar-awam-bakri', 1, 0.062),
+('pasar-malam-bakri-wednesday', 'ma-po-ba-kou-ye-shi', 2, 0.157),
+('pasar-malam-bakri-wednesday', 'pasar-awam-bukit-pasir-taman-bintang-emas', 3, 5.927),
+('pasar-malam-bakri-wednesday', 'man-man-bo-bing', 4, 7.413),
+('pasar-malam-bakri-wednesday', 'pasar-malam-taman-marin', 5, 7.494),
+('pasar-malam-chaah', 'labis-market', 1, 15.804),
+('pasar-malam-chaah', 'pasar-malam-felcra-bukit-kepong-khamis-malam', 2, 20.884),
+('pasar-malam-chaah', 'pasar-malam-kampung-pt-jayus', 3, 25.334),
+('pasar-malam-chaah', 'pasar-malam-yong-peng-yong-ping-ye-shi', 4, 25.691),
+('pasar-malam-chaah', 'pasar-malam-taman-kota', 5, 25.950),
+('pasar-malam-temenggong', 'pasar-basah-kulai', 1, 1.103),
+('pasar-malam-temenggong', 'tuteri-night-market', 2, 1.947),
+('pasar-malam-temenggong', 'pasar-malam-taman-putri-kulai', 3, 1.951),
+('pasar-malam-temenggong', 'pasar-malam-jalan-kenanga-299', 4, 2.539),
+('pasar-malam-temenggong', 'saleng-night-market', 5, 3.906),
+('pasar-malam-bandar-universiti-pagoh', 'pasar-malam-parit-medan', 1, 9.146),
+('pasar-malam-bandar-universiti-pagoh', 'pasar-tani', 2, 10.592),
+('pasar-malam-bandar-universiti-pagoh', 'pasar-malam-mini-kundang-ulu', 3, 10.659),
+('pasar-malam-bandar-universiti-pagoh', 'bukit-gambir-market', 4, 10.904),
+('pasar-malam-bandar-universiti-pagoh', 'pasar-awam-bukit-pasir-taman-bintang-emas', 5, 11.551),
+('pasar-malam-taman-marin', 'man-man-bo-bing', 1, 0.204),
+('pasar-malam-taman-marin', 'pasar-malam-pusat-perniagaan-mas-jaya', 2, 1.304),
+('pasar-malam-taman-marin', 'pasar-malam-pesta-muar', 3, 1.914),
+('pasar-malam-taman-marin', 'jalan-maharani-night-market', 4, 3.121),
+('pasar-malam-taman-marin', 'tangkak-vintage-night-market', 5, 3.624),
+('pasar-malam-taman-soga', 'batu-pahat-market', 1, 1.482),
+('pasar-malam-taman-soga', 'pasar-melayu-batu-pahat', 2, 1.591),
+('pasar-malam-taman-soga', 'tapak-pasar-malam-peserai', 3, 2.609),
+('pasar-malam-taman-soga', 'pasar-malam-taman-bukit-pasir', 4, 2.809),
+('pasar-malam-taman-soga', 'pasar-malam-taman-ceria', 5, 4.531),
+('pasar-lambak-parit-amat', 'pasar-tani-stadium-sultan-ibrahim-muar', 1, 6.202),
+('pasar-lambak-parit-amat', 'pasar-malam-pesta-muar', 2, 6.543),
+('pasar-lambak-parit-amat', 'jalan-maharani-night-market', 3, 7.320),
+('pasar-lambak-parit-amat', 'tangkak-vintage-night-market', 4, 7.665),
+('pasar-lambak-parit-amat', 'man-man-bo-bing', 5, 7.923),
+('pasar-malam-sri-gading', 'pasar-malam-panchor', 1, 4.889),
+('pasar-malam-sri-gading', 'pasar-malam-taman-universiti', 2, 5.001),
+('pasar-malam-sri-gading', 'pasar-malam-taman-ceria', 3, 7.049),
+('pasar-malam-sri-gading', 'pasar-malam-taman-bukit-pasir', 4, 10.172),
+('pasar-malam-sri-gading', 'pasar-malam-taman-soga', 5, 10.637),
+('saleng-night-market', 'pasar-malam-jalan-kenanga-299', 1, 1.750),
+('saleng-night-market', 'night-market-yearns-every-sunday', 2, 3.607),
+('saleng-night-market', 'pasar-malam-temenggong', 3, 3.906),
+('saleng-night-market', 'pasar-basah-kulai', 4, 4.568),
+('saleng-night-market', 'pasar-malam-taman-aman-senai-wednesday', 5, 4.889),
+('pasar-malam-gate-air-senggarang', 'pasar-malam-taman-universiti', 1, 11.152),
+('pasar-malam-gate-air-senggarang', 'pasar-malam-parit-raja-darat', 2, 11.360),
+('pasar-malam-gate-air-senggarang', 'pasar-malam-sri-gading', 3, 11.544),
+('pasar-malam-gate-air-senggarang', 'pasar-malam-sungai-suloh', 4, 11.758),
+('pasar-malam-gate-air-senggarang', 'pasar-malam-panchor', 5, 14.995),
+('pasar-malam-felcra-bukit-kepong-khamis-malam', 'pasar-malam-tenang', 1, 10.395),
+('pasar-malam-felcra-bukit-kepong-khamis-malam', 'labis-market', 2, 11.950),
+('pasar-malam-felcra-bukit-kepong-khamis-malam', 'pasar-malam-dekat-hospital-segamat', 3, 13.941),
+('pasar-malam-felcra-bukit-kepong-khamis-malam', 'pasar-awam-kampung-abdullah', 4, 16.374),
+('pasar-malam-felcra-bukit-kepong-khamis-malam', 'yongtaufoo-bandar-utama', 5, 17.455),
+('taman-pelangi-indah-night-market', 'taman-desa-tebrau-night-market', 1, 1.278),
+('taman-pelangi-indah-night-market', 'taman-desa-jaya-night-market', 2, 2.600),
+('taman-pelangi-indah-night-market', 'setia-indah-monday-night-market', 3, 2.769),
+('taman-pelangi-indah-night-market', 'pasar-malam', 4, 3.083),
+('taman-pelangi-indah-night-market', 'pasar-ulu-tiram', 5, 3.587),
+('pasar-malam-taman-putri-kulai', 'tuteri-night-market', 1, 0.125),
+('pasar-malam-taman-putri-kulai', 'pasar-malam-temenggong', 2, 1.951),
+('pasar-malam-taman-putri-kulai', 'pasar-basah-kulai', 3, 2.028),
+('pasar-malam-taman-putri-kulai', 'pasar-malam-jalan-kenanga-299', 4, 4.490),
+('pasar-malam-taman-putri-kulai', 'saleng-night-market', 5, 5.790),
+('pasar-malam-pekan-jabi', 'pasar-malam-jabi', 1, 0.742),
+('pasar-malam-pekan-jabi', 'yongtaufoo-bandar-utama', 2, 2.475),
+('pasar-malam-pekan-jabi', 'pasar-malam-taman-yayasan', 3, 3.082),
+('pasar-malam-pekan-jabi', 'pasar-awam-kampung-abdullah', 4, 3.554),
+('pasar-malam-pekan-jabi', 'pasar-malam-dekat-hospital-segamat', 5, 6.164),
+('johor-jaya-tuesday-night-market', 'taman-desa-jaya-night-market', 1, 1.349),
+('johor-jaya-tuesday-night-market', 'taman-desa-harmoni-night-market', 2, 2.411),
+('johor-jaya-tuesday-night-market', 'taman-desa-tebrau-night-market', 3, 2.658),
+('johor-jaya-tuesday-night-market', 'taman-pelangi-indah-night-market', 4, 3.838),
+('johor-jaya-tuesday-night-market', 'setia-indah-monday-night-market', 5, 4.494),
+('kampung-paya-pasar-malam', 'pasar-malam-bandar-kluang', 1, 1.446),
+('kampung-paya-pasar-malam', 'kluang-market', 2, 1.619),
+('kampung-paya-pasar-malam', 'pasar-malam-taman-muhibbah-night-market', 3, 4.218),
+('kampung-paya-pasar-malam', 'pasar-malam-taman-seri-impian', 4, 4.930),
+('kampung-paya-pasar-malam', 'sri-jaya-hawker-center', 5, 19.302),
+('taman-desa-tebrau-night-market', 'taman-pelangi-indah-night-market', 1, 1.278),
+('taman-desa-tebrau-night-market', 'taman-desa-jaya-night-market', 2, 1.594),
+('taman-desa-tebrau-night-market', 'setia-indah-monday-night-market', 3, 2.523),
+('taman-desa-tebrau-night-market', 'johor-jaya-tuesday-night-market', 4, 2.658),
+('taman-desa-tebrau-night-market', 'pasar-malam', 5, 3.208),
+('pasar-malam-kampung-melayu-majidee', 'kampung-bendahara-night-market', 1, 0.748),
+('pasar-malam-kampung-melayu-majidee', 'pandan-night-market', 2, 1.490),
+('pasar-malam-kampung-melayu-majidee', 'ksl-monday-night-market-jalan-seladang', 3, 3.446),
+('pasar-malam-kampung-melayu-majidee', 'taman-desa-harmoni-night-market', 4, 4.694),
+('pasar-malam-kampung-melayu-majidee', 'pasar-malam-setia-tropika', 5, 6.031),
+('setia-indah-monday-night-market', 'pasar-malam', 1, 0.981),
+('setia-indah-monday-night-market', 'taman-desa-tebrau-night-market', 2, 2.523),
+('setia-indah-monday-night-market', 'taman-pelangi-indah-night-market', 3, 2.769),
+('setia-indah-monday-night-market', 'taman-desa-jaya-night-market', 4, 3.921),
+('setia-indah-monday-night-market', 'johor-jaya-tuesday-night-market', 5, 4.494),
+('pasar-malam-jalan-kenanga-299', 'saleng-night-market', 1, 1.750),
+('pasar-malam-jalan-kenanga-299', 'pasar-malam-temenggong', 2, 2.539),
+('pasar-malam-jalan-kenanga-299', 'pasar-basah-kulai', 3, 2.950),
+('pasar-malam-jalan-kenanga-299', 'night-market-yearns-every-sunday', 4, 4.446),
+('pasar-malam-jalan-kenanga-299', 'tuteri-night-market', 5, 4.486),
+('pasar-malam-taman-kota', 'pasar-malam-yong-peng-yong-ping-ye-shi', 1, 0.270),
+('pasar-malam-taman-kota', 'pasar-malam-olak-batu', 2, 9.732),
+('pasar-malam-taman-kota', 'pasar-malam-kampung-pt-jayus', 3, 15.081),
+('pasar-malam-taman-kota', 'pasar-malam-taman-universiti', 4, 17.963),
+('pasar-malam-taman-kota', 'pasar-malam-panchor', 5, 18.079),
+('pasar-malam-panchor', 'pasar-malam-taman-ceria', 1, 2.597),
+('pasar-malam-panchor', 'pasar-malam-sri-gading', 2, 4.889),
+('pasar-malam-panchor', 'pasar-malam-taman-bukit-pasir', 3, 5.688),
+('pasar-malam-panchor', 'pasar-malam-taman-soga', 4, 7.023),
+('pasar-malam-panchor', 'pasar-melayu-batu-pahat', 5, 7.526),
+('pasar-malam-taman-yayasan', 'pasar-malam-jabi', 1, 2.346),
+('pasar-malam-taman-yayasan', 'pasar-malam-pekan-jabi', 2, 3.082),
+('pasar-malam-taman-yayasan', 'yongtaufoo-bandar-utama', 3, 5.443),
+('pasar-malam-taman-yayasan', 'pasar-awam-kampung-abdullah', 4, 6.518),
+('pasar-malam-taman-yayasan', 'pasar-malam-taman-koperasi', 5, 7.852),
+('taman-desa-jaya-night-market', 'johor-jaya-tuesday-night-market', 1, 1.349),
+('taman-desa-jaya-night-market', 'taman-desa-tebrau-night-market', 2, 1.594),
+('taman-desa-jaya-night-market', 'taman-pelangi-indah-night-market', 3, 2.600),
+('taman-desa-jaya-night-market', 'taman-desa-harmoni-night-market', 4, 3.760),
+('taman-desa-jaya-night-market', 'setia-indah-monday-night-market', 5, 3.921),
+('pekan-parit-sulong', 'pasar-malam-kampung-pt-jayus', 1, 9.420),
+('pekan-parit-sulong', 'pasar-malam-taman-bukit-pasir', 2, 13.648),
+('pekan-parit-sulong', 'tapak-pasar-malam-peserai', 3, 14.064),
+('pekan-parit-sulong', 'pasar-melayu-batu-pahat', 4, 14.572),
+('pekan-parit-sulong', 'batu-pahat-market', 5, 14.775),
+('bukit-gambir-market', 'pasar-tani', 1, 0.564),
+('bukit-gambir-market', 'pasar-malam-serom-6', 2, 7.884),
+('bukit-gambir-market', 'pasar-malam-parit-medan', 3, 10.197),
+('bukit-gambir-market', 'pasar-malam-bandar-universiti-pagoh', 4, 10.904),
+('bukit-gambir-market', 'pasar-malam-kampung-batu-china', 5, 12.879),
+('sri-jaya-hawker-center', 'pasar-jumaat-simpang-renggam', 1, 12.174),
+('sri-jaya-hawker-center', 'pasar-malam-taman-seri-impian', 2, 14.393),
+('sri-jaya-hawker-center', 'pasar-malam-estate-23-hari-bulan-setiap-bulan', 3, 16.368),
+('sri-jaya-hawker-center', 'pasar-malam-taman-muhibbah-night-market', 4, 16.747),
+('sri-jaya-hawker-center', 'pasar-malam-peladang', 5, 17.423),
+('pasar-malam-taman-aman-senai-wednesday', 'pasar-malam-utm-selasa', 1, 3.822),
+('pasar-malam-taman-aman-senai-wednesday', 'night-market-yearns-every-sunday', 2, 4.278),
+('pasar-malam-taman-aman-senai-wednesday', 'pasar-malam-taman-teratai', 3, 4.296),
+('pasar-malam-taman-aman-senai-wednesday', 'saleng-night-market', 4, 4.889),
+('pasar-malam-taman-aman-senai-wednesday', 'taman-sri-skudai-night-market-sunday', 5, 4.983),
+('pasar-melayu-batu-pahat', 'batu-pahat-market', 1, 0.248),
+('pasar-melayu-batu-pahat', 'tapak-pasar-malam-peserai', 2, 1.158),
+('pasar-melayu-batu-pahat', 'pasar-malam-taman-soga', 3, 1.591),
+('pasar-melayu-batu-pahat', 'pasar-malam-taman-bukit-pasir', 4, 2.202),
+('pasar-melayu-batu-pahat', 'pasar-malam-taman-ceria', 5, 4.930),
+('pasar-malam-parit-medan', 'pasar-malam-mini-kundang-ulu', 1, 3.331),
+('pasar-malam-parit-medan', 'pasar-malam-bandar-universiti-pagoh', 2, 9.146),
+('pasar-malam-parit-medan', 'pasar-tani', 3, 9.634),
+('pasar-malam-parit-medan', 'bukit-gambir-market', 4, 10.197),
+('pasar-malam-parit-medan', 'pasar-malam-serom-6', 5, 17.647),
+('pasar-malam-taman-muhibbah-night-market', 'pasar-malam-bandar-kluang', 1, 3.542),
+('pasar-malam-taman-muhibbah-night-market', 'pasar-malam-taman-seri-impian', 2, 4.065),
+('pasar-malam-taman-muhibbah-night-market', 'kluang-market', 3, 4.069),
+('pasar-malam-taman-muhibbah-night-market', 'kampung-paya-pasar-malam', 4, 4.218),
+('pasar-malam-taman-muhibbah-night-market', 'sri-jaya-hawker-center', 5, 16.747),
+('pasar-malam-parit-raja-darat', 'pasar-malam-taman-universiti', 1, 6.317),
+('pasar-malam-parit-raja-darat', 'pasar-malam-sri-gading', 2, 11.098),
+('pasar-malam-parit-raja-darat', 'pasar-malam-gate-air-senggarang', 3, 11.360),
+('pasar-malam-parit-raja-darat', 'pasar-malam-olak-batu', 4, 12.289),
+('pasar-malam-parit-raja-darat', 'pasar-malam-estate-23-hari-bulan-setiap-bulan', 5, 15.664),
+('pasar-malam-jabi', 'pasar-malam-pekan-jabi', 1, 0.742),
+('pasar-malam-jabi', 'pasar-malam-taman-yayasan', 2, 2.346),
+('pasar-malam-jabi', 'yongtaufoo-bandar-utama', 3, 3.140),
+('pasar-malam-jabi', 'pasar-awam-kampung-abdullah', 4, 4.222),
+('pasar-malam-jabi', 'pasar-malam-dekat-hospital-segamat', 5, 6.895),
+('pasar-malam-yong-peng-yong-ping-ye-shi', 'pasar-malam-taman-kota', 1, 0.270),
+('pasar-malam-yong-peng-yong-ping-ye-shi', 'pasar-malam-olak-batu', 2, 9.950),
+('pasar-malam-yong-peng-yong-ping-ye-shi', 'pasar-malam-kampung-pt-jayus', 3, 15.070),
+('pasar-malam-yong-peng-yong-ping-ye-shi', 'pasar-malam-taman-universiti', 4, 18.228),
+('pasar-malam-yong-peng-yong-ping-ye-shi', 'pasar-malam-panchor', 5, 18.330),
+('pasar-malam-taman-seri-impian', 'pasar-malam-taman-muhibbah-night-market', 1, 4.065),
+('pasar-malam-taman-seri-impian', 'kampung-paya-pasar-malam', 2, 4.930),
+('pasar-malam-taman-seri-impian', 'pasar-malam-bandar-kluang', 3, 5.487),
+('pasar-malam-taman-seri-impian', 'kluang-market', 4, 6.019),
+('pasar-malam-taman-seri-impian', 'sri-jaya-hawker-center', 5, 14.393),
+('tapak-pasar-malam-peserai', 'batu-pahat-market', 1, 1.154),
+('tapak-pasar-malam-peserai', 'pasar-melayu-batu-pahat', 2, 1.158),
+('tapak-pasar-malam-peserai', 'pasar-malam-taman-soga', 3, 2.609),
+('tapak-pasar-malam-peserai', 'pasar-malam-taman-bukit-pasir', 4, 2.996),
+('tapak-pasar-malam-peserai', 'pasar-malam-taman-ceria', 5, 5.969),
+('pasar-malam-taman-bukit-pasir', 'pasar-melayu-batu-pahat', 1, 2.202),
+('pasar-malam-taman-bukit-pasir', 'batu-pahat-market', 2, 2.427),
+('pasar-malam-taman-bukit-pasir', 'pasar-malam-taman-soga', 3, 2.809),
+('pasar-malam-taman-bukit-pasir', 'tapak-pasar-malam-peserai', 4, 2.996),
+('pasar-malam-taman-bukit-pasir', 'pasar-malam-taman-ceria', 5, 3.156),
+('pasar-malam-sabtu-pulai-indah', 'pasar-malam-taman-teratai', 1, 4.058),
+('pasar-malam-sabtu-pulai-indah', 'taman-universiti-night-market-friday', 2, 4.693),
+('pasar-malam-sabtu-pulai-indah', 'pasar-malam-utm-selasa', 3, 6.217),
+('pasar-malam-sabtu-pulai-indah', 'taman-selesa-jaya-night-market-thursday', 4, 7.606),
+('pasar-malam-sabtu-pulai-indah', 'taman-sri-skudai-night-market-sunday', 5, 7.883),
+('ma-po-ba-kou-ye-shi', 'pasar-awam-bakri', 1, 0.098),
+('ma-po-ba-kou-ye-shi', 'pasar-malam-bakri-wednesday', 2, 0.157),
+('ma-po-ba-kou-ye-shi', 'pasar-awam-bukit-pasir-taman-bintang-emas', 3, 5.998),
+('ma-po-ba-kou-ye-shi', 'man-man-bo-bing', 4, 7.568),
+('ma-po-ba-kou-ye-shi', 'pasar-malam-taman-marin', 5, 7.648),
+('pasar-malam-dekat-hospital-segamat', 'pasar-awam-kampung-abdullah', 1, 2.976),
+('pasar-malam-dekat-hospital-segamat', 'yongtaufoo-bandar-utama', 2, 3.915),
+('pasar-malam-dekat-hospital-segamat', 'pasar-malam-pekan-jabi', 3, 6.164),
+('pasar-malam-dekat-hospital-segamat', 'pasar-malam-jabi', 4, 6.895),
+('pasar-malam-dekat-hospital-segamat', 'pasar-malam-taman-yayasan', 5, 9.241),
+('pasar-malam-olak-batu', 'pasar-malam-taman-kota', 1, 9.732),
+('pasar-malam-olak-batu', 'pasar-malam-yong-peng-yong-ping-ye-shi', 2, 9.950),
+('pasar-malam-olak-batu', 'pasar-malam-taman-universiti', 3, 10.232),
+('pasar-malam-olak-batu', 'pasar-malam-parit-raja-darat', 4, 12.289),
+('pasar-malam-olak-batu', 'pasar-malam-sri-gading', 5, 12.829),
+('taman-sri-skudai-night-market-sunday', 'pasar-malam-utm-selasa', 1, 2.077),
+('taman-sri-skudai-night-market-sunday', 'taman-universiti-night-market-friday', 2, 3.934),
+('taman-sri-skudai-night-market-sunday', 'pasar-malam-taman-aman-senai-wednesday', 3, 4.983),
+('taman-sri-skudai-night-market-sunday', 'pasar-malam-taman-teratai', 4, 5.316),
+('taman-sri-skudai-night-market-sunday', 'taman-munsyi-ibrahim-night-market', 5, 5.323),
+('pasar-ulu-tiram', 'taman-pelangi-indah-night-market', 1, 3.587),
+('pasar-ulu-tiram', 'taman-desa-tebrau-night-market', 2, 4.664),
+('pasar-ulu-tiram', 'taman-desa-jaya-night-market', 3, 5.214),
+('pasar-ulu-tiram', 'pasar-malam', 4, 6.143),
+('pasar-ulu-tiram', 'setia-indah-monday-night-market', 5, 6.174),
+('pasar-malam', 'setia-indah-monday-night-market', 1, 0.981),
+('pasar-malam', 'taman-pelangi-indah-night-market', 2, 3.083),
+('pasar-malam', 'taman-desa-tebrau-night-market', 3, 3.208),
+('pasar-malam', 'taman-desa-jaya-night-market', 4, 4.722),
+('pasar-malam', 'johor-jaya-tuesday-night-market', 5, 5.414),
+('pasar-tani', 'bukit-gambir-market', 1, 0.564),
+('pasar-tani', 'pasar-malam-serom-6', 2, 8.411),
+('pasar-tani', 'pasar-malam-parit-medan', 3, 9.634),
+('pasar-tani', 'pasar-malam-bandar-universiti-pagoh', 4, 10.592),
+('pasar-tani', 'pasar-malam-mini-kundang-ulu', 5, 12.962),
+('pasar-malam-setia-tropika', 'pasar-malam-sabtu-tmn-cempaka-tampoi', 1, 3.210),
+('pasar-malam-setia-tropika', 'taman-dahlia-night-market', 2, 3.963),
+('pasar-malam-setia-tropika', 'taman-munsyi-ibrahim-night-market', 3, 4.091),
+('pasar-malam-setia-tropika', 'pasar-malam-kampung-melayu-majidee', 4, 6.031),
+('pasar-malam-setia-tropika', 'taman-sri-skudai-night-market-sunday', 5, 6.181),
+('pasar-malam-sungai-suloh', 'pasar-malam-taman-soga', 1, 7.058),
+('pasar-malam-sungai-suloh', 'batu-pahat-market', 2, 8.284),
+('pasar-malam-sungai-suloh', 'pasar-melayu-batu-pahat', 3, 8.483),
+('pasar-malam-sungai-suloh', 'tapak-pasar-malam-peserai', 4, 9.098),
+('pasar-malam-sungai-suloh', 'pasar-malam-taman-bukit-pasir', 5, 9.715),
+('pasar-malam-taman-ceria', 'pasar-malam-panchor', 1, 2.597),
+('pasar-malam-taman-ceria', 'pasar-malam-taman-bukit-pasir', 2, 3.156),
+('pasar-malam-taman-ceria', 'pasar-malam-taman-soga', 3, 4.531),
+('pasar-malam-taman-ceria', 'pasar-melayu-batu-pahat', 4, 4.930),
+('pasar-malam-taman-ceria', 'batu-pahat-market', 5, 5.079),
+('pasar-malam-sabtu-tmn-cempaka-tampoi', 'taman-dahlia-night-market', 1, 0.775),
+('pasar-malam-sabtu-tmn-cempaka-tampoi', 'taman-munsyi-ibrahim-night-market', 2, 1.349),
+('pasar-malam-sabtu-tmn-cempaka-tampoi', 'pasar-malam-setia-tropika', 3, 3.210),
+('pasar-malam-sabtu-tmn-cempaka-tampoi', 'pasar-malam-kampung-melayu-majidee', 4, 6.048),
+('pasar-malam-sabtu-tmn-cempaka-tampoi', 'taman-sri-skudai-night-market-sunday', 5, 6.154),
+('pasar-malam-taman-manis', 'tuteri-night-market', 1, 6.696),
+('pasar-malam-taman-manis', 'pasar-malam-taman-putri-kulai', 2, 6.696),
+('pasar-malam-taman-manis', 'pasar-basah-kulai', 3, 8.541),
+('pasar-malam-taman-manis', 'pasar-malam-temenggong', 4, 8.643),
+('pasar-malam-taman-manis', 'pasar-malam-peladang', 5, 10.241),
+('pasar-malam-tenang', 'pasar-malam-felcra-bukit-kepong-khamis-malam', 1, 10.395),
+('pasar-malam-tenang', 'labis-market', 2, 11.304),
+('pasar-malam-tenang', 'pasar-malam-dekat-hospital-segamat', 3, 12.257),
+('pasar-malam-tenang', 'pasar-awam-kampung-abdullah', 4, 15.212),
+('pasar-malam-tenang', 'yongtaufoo-bandar-utama', 5, 16.046),
+('pasar-malam-taman-koperasi', 'pasar-malam-taman-yayasan', 1, 7.852),
+('pasar-malam-taman-koperasi', 'pasar-malam-jabi', 2, 9.997),
+('pasar-malam-taman-koperasi', 'pasar-malam-pekan-jabi', 3, 10.722),
+('pasar-malam-taman-koperasi', 'pasar-malam-gemas', 4, 12.499),
+('pasar-malam-taman-koperasi', 'yongtaufoo-bandar-utama', 5, 12.681),
+('man-man-bo-bing', 'pasar-malam-taman-marin', 1, 0.204),
+('man-man-bo-bing', 'pasar-malam-pusat-perniagaan-mas-jaya', 2, 1.401),
+('man-man-bo-bing', 'pasar-malam-pesta-muar', 3, 1.738),
+('man-man-bo-bing', 'jalan-maharani-night-market', 4, 3.032),
+('man-man-bo-bing', 'tangkak-vintage-night-market', 5, 3.553),
+('pasar-malam-estate-23-hari-bulan-setiap-bulan', 'pasar-jumaat-simpang-renggam', 1, 7.342),
+('pasar-malam-estate-23-hari-bulan-setiap-bulan', 'pasar-malam-parit-raja-darat', 2, 15.664),
+('pasar-malam-estate-23-hari-bulan-setiap-bulan', 'sri-jaya-hawker-center', 3, 16.368),
+('pasar-malam-estate-23-hari-bulan-setiap-bulan', 'pasar-malam-taman-muhibbah-night-market', 4, 20.421),
+('pasar-malam-estate-23-hari-bulan-setiap-bulan', 'pasar-malam-olak-batu', 5, 20.760),
+('pasar-malam-bandar-kluang', 'kluang-market', 1, 0.573),
+('pasar-malam-bandar-kluang', 'kampung-paya-pasar-malam', 2, 1.446),
+('pasar-malam-bandar-kluang', 'pasar-malam-taman-muhibbah-night-market', 3, 3.542),
+('pasar-malam-bandar-kluang', 'pasar-malam-taman-seri-impian', 4, 5.487),
+('pasar-malam-bandar-kluang', 'sri-jaya-hawker-center', 5, 19.619),
+('pasar-tani-bandar-tenggara', 'sri-jaya-hawker-center', 1, 22.951),
+('pasar-tani-bandar-tenggara', 'pasar-malam-taman-manis', 2, 23.625),
+('pasar-tani-bandar-tenggara', 'pasar-basah-kulai', 3, 23.822),
+('pasar-tani-bandar-tenggara', 'pasar-malam-taman-putri-kulai', 4, 24.252),
+('pasar-tani-bandar-tenggara', 'tuteri-night-market', 5, 24.373),
+('pasar-malam-taman-sri-saujana-ss2', 'pasar-ulu-tiram', 1, 8.525),
+('pasar-malam-taman-sri-saujana-ss2', 'pasar-awam-taman-kota-jaya', 2, 8.759),
+('pasar-malam-taman-sri-saujana-ss2', 'bazar-karat-kota-tinggi', 3, 8.830),
+('pasar-malam-taman-sri-saujana-ss2', 'taman-pelangi-indah-night-market', 4, 11.824),
+('pasar-malam-taman-sri-saujana-ss2', 'taman-desa-tebrau-night-market', 5, 13.044),
+('bazar-karat-kota-tinggi', 'pasar-awam-taman-kota-jaya', 1, 1.568),
+('bazar-karat-kota-tinggi', 'pasar-malam-taman-sri-saujana-ss2', 2, 8.830),
+('bazar-karat-kota-tinggi', 'pasar-ulu-tiram', 3, 17.135),
+('bazar-karat-kota-tinggi', 'taman-pelangi-indah-night-market', 4, 20.574),
+('bazar-karat-kota-tinggi', 'taman-desa-tebrau-night-market', 5, 21.759),
+('tangkak-morning-market', 'tangkak-market', 1, 0.811),
+('tangkak-morning-market', 'pasar-malam-kampung-batu-china', 2, 2.303),
+('tangkak-morning-market', 'pasar-malam-serom-6', 3, 12.295),
+('tangkak-morning-market', 'car-boot-salerisda-jasin', 4, 12.601),
+('tangkak-morning-market', 'pasar-malam-taman-maju-rabu', 5, 13.190),
+('pasar-awam-jementah', 'pasar-malam-taman-koperasi', 1, 15.633),
+('pasar-awam-jementah', 'pasar-malam-taman-yayasan', 2, 17.916),
+('pasar-awam-jementah', 'pasar-malam-jabi', 3, 18.160),
+('pasar-awam-jementah', 'yongtaufoo-bandar-utama', 4, 18.161),
+('pasar-awam-jementah', 'pasar-awam-kampung-abdullah', 5, 18.267),
+('pasar-malam-peladang', 'pasar-malam-taman-manis', 1, 10.241),
+('pasar-malam-peladang', 'pasar-jumaat-simpang-renggam', 2, 15.503),
+('pasar-malam-peladang', 'pasar-malam-taman-putri-kulai', 3, 16.883),
+('pasar-malam-peladang', 'tuteri-night-market', 4, 16.894),
+('pasar-malam-peladang', 'sri-jaya-hawker-center', 5, 17.423),
+('taman-munsyi-ibrahim-night-market', 'taman-dahlia-night-market', 1, 0.937),
+('taman-munsyi-ibrahim-night-market', 'pasar-malam-sabtu-tmn-cempaka-tampoi', 2, 1.349),
+('taman-munsyi-ibrahim-night-market', 'pasar-malam-setia-tropika', 3, 4.091),
+('taman-munsyi-ibrahim-night-market', 'taman-sri-skudai-night-market-sunday', 4, 5.323),
+('taman-munsyi-ibrahim-night-market', 'taman-selesa-jaya-night-market-thursday', 5, 5.958),
+('taman-universiti-night-market-friday', 'pasar-malam-utm-selasa', 1, 3.344),
+('taman-universiti-night-market-friday', 'taman-selesa-jaya-night-market-thursday', 2, 3.482),
+('taman-universiti-night-market-friday', 'taman-sri-skudai-night-market-sunday', 3, 3.934),
+('taman-universiti-night-market-friday', 'pasar-malam-taman-teratai', 4, 4.406),
+('taman-universiti-night-market-friday', 'pasar-malam-sabtu-pulai-indah', 5, 4.693),
+('tangkak-market', 'tangkak-morning-market', 1, 0.811),
+('tangkak-market', 'pasar-malam-kampung-batu-china', 2, 1.507),
+('tangkak-market', 'pasar-malam-serom-6', 3, 12.088),
+('tangkak-market', 'car-boot-salerisda-jasin', 4, 13.236),
+('tangkak-market', 'bukit-gambir-market', 5, 13.668),
+('tuteri-night-market', 'pasar-malam-taman-putri-kulai', 1, 0.125),
+('tuteri-night-market', 'pasar-malam-temenggong', 2, 1.947),
+('tuteri-night-market', 'pasar-basah-kulai', 3, 2.091),
+('tuteri-night-market', 'pasar-malam-jalan-kenanga-299', 4, 4.486),
+('tuteri-night-market', 'saleng-night-market', 5, 5.757),
+('pasar-awam-bakri', 'pasar-malam-bakri-wednesday', 1, 0.062),
+('pasar-awam-bakri', 'ma-po-ba-kou-ye-shi', 2, 0.098),
+('pasar-awam-bakri', 'pasar-awam-bukit-pasir-taman-bintang-emas', 3, 5.940),
+('pasar-awam-bakri', 'man-man-bo-bing', 4, 7.470),
+('pasar-awam-bakri', 'pasar-malam-taman-marin', 5, 7.551),
+('pasar-tani-stadium-sultan-ibrahim-muar', 'jalan-maharani-night-market', 1, 1.363),
+('pasar-tani-stadium-sultan-ibrahim-muar', 'tangkak-vintage-night-market', 2, 1.502),
+('pasar-tani-stadium-sultan-ibrahim-muar', 'pasar-malam-pesta-muar', 3, 2.316),
+('pasar-tani-stadium-sultan-ibrahim-muar', 'pasar-malam-pusat-perniagaan-mas-jaya', 4, 3.773),
+('pasar-tani-stadium-sultan-ibrahim-muar', 'man-man-bo-bing', 5, 3.923),
+('pasar-malam-taman-teratai', 'pasar-malam-utm-selasa', 1, 3.247),
+('pasar-malam-taman-teratai', 'pasar-malam-sabtu-pulai-indah', 2, 4.058),
+('pasar-malam-taman-teratai', 'pasar-malam-taman-aman-senai-wednesday', 3, 4.296),
+('pasar-malam-taman-teratai', 'taman-universiti-night-market-friday', 4, 4.406),
+('pasar-malam-taman-teratai', 'taman-sri-skudai-night-market-sunday', 5, 5.316),
+('pasar-malam-utm-selasa', 'taman-sri-skudai-night-market-sunday', 1, 2.077),
+('pasar-malam-utm-selasa', 'pasar-malam-taman-teratai', 2, 3.247),
+('pasar-malam-utm-selasa', 'taman-universiti-night-market-friday', 3, 3.344),
+('pasar-malam-utm-selasa', 'pasar-malam-taman-aman-senai-wednesday', 4, 3.822),
+('pasar-malam-utm-selasa', 'taman-selesa-jaya-night-market-thursday', 5, 6.014),
+('kampung-bendahara-night-market', 'pasar-malam-kampung-melayu-majidee', 1, 0.748),
+('kampung-bendahara-night-market', 'pandan-night-market', 2, 1.505),
+('kampung-bendahara-night-market', 'ksl-monday-night-market-jalan-seladang', 3, 3.102),
+('kampung-bendahara-night-market', 'taman-desa-harmoni-night-market', 4, 4.066),
+('kampung-bendahara-night-market', 'johor-jaya-tuesday-night-market', 5, 5.616),
+('pasar-awam-taman-kota-jaya', 'bazar-karat-kota-tinggi', 1, 1.568),
+('pasar-awam-taman-kota-jaya', 'pasar-malam-taman-sri-saujana-ss2', 2, 8.759),
+('pasar-awam-taman-kota-jaya', 'pasar-ulu-tiram', 3, 17.241),
+('pasar-awam-taman-kota-jaya', 'taman-pelangi-indah-night-market', 4, 20.584),
+('pasar-awam-taman-kota-jaya', 'taman-desa-tebrau-night-market', 5, 21.800),
+('taman-dahlia-night-market', 'pasar-malam-sabtu-tmn-cempaka-tampoi', 1, 0.775),
+('taman-dahlia-night-market', 'taman-munsyi-ibrahim-night-market', 2, 0.937),
+('taman-dahlia-night-market', 'pasar-malam-setia-tropika', 3, 3.963),
+('taman-dahlia-night-market', 'taman-sri-skudai-night-market-sunday', 4, 6.193),
+('taman-dahlia-night-market', 'pasar-malam-kampung-melayu-majidee', 5, 6.481),
+('yongtaufoo-bandar-utama', 'pasar-awam-kampung-abdullah', 1, 1.082),
+('yongtaufoo-bandar-utama', 'pasar-malam-pekan-jabi', 2, 2.475),
+('yongtaufoo-bandar-utama', 'pasar-malam-jabi', 3, 3.140),
+('yongtaufoo-bandar-utama', 'pasar-malam-dekat-hospital-segamat', 4, 3.915),
+('yongtaufoo-bandar-utama', 'pasar-malam-taman-yayasan', 5, 5.443),
+('pasar-awam-bukit-pasir-taman-bintang-emas', 'pasar-malam-bakri-wednesday', 1, 5.927),
+('pasar-awam-bukit-pasir-taman-bintang-emas', 'pasar-awam-bakri', 2, 5.940),
+('pasar-awam-bukit-pasir-taman-bintang-emas', 'ma-po-ba-kou-ye-shi', 3, 5.998),
+('pasar-awam-bukit-pasir-taman-bintang-emas', 'pasar-malam-taman-marin', 4, 6.176),
+('pasar-awam-bukit-pasir-taman-bintang-emas', 'man-man-bo-bing', 5, 6.269),
+('labis-market', 'pasar-malam-tenang', 1, 11.304),
+('labis-market', 'pasar-malam-felcra-bukit-kepong-khamis-malam', 2, 11.950),
+('labis-market', 'pasar-malam-chaah', 3, 15.804),
+('labis-market', 'pasar-malam-dekat-hospital-segamat', 4, 22.289),
+('labis-market', 'pasar-awam-kampung-abdullah', 5, 25.221),
+('ksl-monday-night-market-jalan-seladang', 'kampung-bendahara-night-market', 1, 3.102),
+('ksl-monday-night-market-jalan-seladang', 'pasar-malam-kampung-melayu-majidee', 2, 3.446),
+('ksl-monday-night-market-jalan-seladang', 'pandan-night-market', 3, 4.601),
+('ksl-monday-night-market-jalan-seladang', 'taman-desa-harmoni-night-market', 4, 5.687),
+('ksl-monday-night-market-jalan-seladang', 'pasar-malam-sabtu-tmn-cempaka-tampoi', 5, 7.708),
+('taman-desa-harmoni-night-market', 'johor-jaya-tuesday-night-market', 1, 2.411),
+('taman-desa-harmoni-night-market', 'taman-desa-jaya-night-market', 2, 3.760),
+('taman-desa-harmoni-night-market', 'pandan-night-market', 3, 3.820),
+('taman-desa-harmoni-night-market', 'kampung-bendahara-night-market', 4, 4.066),
+('taman-desa-harmoni-night-market', 'pasar-malam-kampung-melayu-majidee', 5, 4.694),
+('taman-selesa-jaya-night-market-thursday', 'taman-universiti-night-market-friday', 1, 3.482),
+('taman-selesa-jaya-night-market-thursday', 'taman-sri-skudai-night-market-sunday', 2, 5.329),
+('taman-selesa-jaya-night-market-thursday', 'taman-munsyi-ibrahim-night-market', 3, 5.958),
+('taman-selesa-jaya-night-market-thursday', 'pasar-malam-utm-selasa', 4, 6.014),
+('taman-selesa-jaya-night-market-thursday', 'taman-dahlia-night-market', 5, 6.767),
+('pasar-jumaat-simpang-renggam', 'pasar-malam-estate-23-hari-bulan-setiap-bulan', 1, 7.342),
+('pasar-jumaat-simpang-renggam', 'sri-jaya-hawker-center', 2, 12.174),
+('pasar-jumaat-simpang-renggam', 'pasar-malam-peladang', 3, 15.503),
+('pasar-jumaat-simpang-renggam', 'pasar-malam-taman-seri-impian', 4, 22.193),
+('pasar-jumaat-simpang-renggam', 'pasar-malam-taman-muhibbah-night-market', 5, 22.472),
+('kluang-market', 'pasar-malam-bandar-kluang', 1, 0.573),
+('kluang-market', 'kampung-paya-pasar-malam', 2, 1.619),
+('kluang-market', 'pasar-malam-taman-muhibbah-night-market', 3, 4.069),
+('kluang-market', 'pasar-malam-taman-seri-impian', 4, 6.019),
+('kluang-market', 'sri-jaya-hawker-center', 5, 20.187),
+('pandan-night-market', 'pasar-malam-kampung-melayu-majidee', 1, 1.490),
+('pandan-night-market', 'kampung-bendahara-night-market', 2, 1.505),
+('pandan-night-market', 'taman-desa-harmoni-night-market', 3, 3.820),
+('pandan-night-market', 'ksl-monday-night-market-jalan-seladang', 4, 4.601),
+('pandan-night-market', 'johor-jaya-tuesday-night-market', 5, 4.734),
+('batu-pahat-market', 'pasar-melayu-batu-pahat', 1, 0.248),
+('batu-pahat-market', 'tapak-pasar-malam-peserai', 2, 1.154),
+('batu-pahat-market', 'pasar-malam-taman-soga', 3, 1.482),
+('batu-pahat-market', 'pasar-malam-taman-bukit-pasir', 4, 2.427),
+('batu-pahat-market', 'pasar-malam-taman-ceria', 5, 5.079),
+('pasar-basah-kulai', 'pasar-malam-temenggong', 1, 1.103),
+('pasar-basah-kulai', 'pasar-malam-taman-putri-kulai', 2, 2.028),
+('pasar-basah-kulai', 'tuteri-night-market', 3, 2.091),
+('pasar-basah-kulai', 'pasar-malam-jalan-kenanga-299', 4, 2.950),
+('pasar-basah-kulai', 'saleng-night-market', 5, 4.568),
+('pasar-awam-kampung-abdullah', 'yongtaufoo-bandar-utama', 1, 1.082),
+('pasar-awam-kampung-abdullah', 'pasar-malam-dekat-hospital-segamat', 2, 2.976),
+('pasar-awam-kampung-abdullah', 'pasar-malam-pekan-jabi', 3, 3.554),
+('pasar-awam-kampung-abdullah', 'pasar-malam-jabi', 4, 4.222),
+('pasar-awam-kampung-abdullah', 'pasar-malam-taman-yayasan', 5, 6.518),
+('pasar-malam-sungai-lalang', 'kedai-kraf-mughesyen', 1, 3.363),
+('pasar-malam-sungai-lalang', 'pasar-taman-ria', 2, 6.194),
+('pasar-malam-sungai-lalang', 'pasar-malam-taman-ria-jaya', 3, 6.614),
+('pasar-malam-sungai-lalang', 'bebawal-street-pasar-kampung', 4, 8.129),
+('pasar-malam-sungai-lalang', 'pasar-malam-taman-kelisa', 5, 8.419),
+('pasar-malam-kg-kelang-lama', 'pasar-karat-kilang-lama', 1, 0.117),
+('pasar-malam-kg-kelang-lama', 'pekan-hari-kulim', 2, 2.031),
+('pasar-malam-kg-kelang-lama', 'pasar-malam-taman-selasih', 3, 3.006),
+('pasar-malam-kg-kelang-lama', 'panjang-jagung', 4, 3.270),
+('pasar-malam-kg-kelang-lama', 'pasar-malam-taman-lobak-isnin', 5, 4.100),
+('uptown-sungai-petani', 'pasar-tani-stesen-teksi', 1, 0.219),
+('uptown-sungai-petani', 'riverfront-city-night-market', 2, 0.930),
+('uptown-sungai-petani', 'pasar-malam-taman-arked', 3, 2.409),
+('uptown-sungai-petani', 'pasar-taman-ria', 4, 3.126),
+('uptown-sungai-petani', 'pasar-malam-taman-keladi', 5, 3.408),
+('riverfront-city-night-market', 'uptown-sungai-petani', 1, 0.930),
+('riverfront-city-night-market', 'pasar-tani-stesen-teksi', 2, 1.105),
+('riverfront-city-night-market', 'pasar-malam-taman-arked', 3, 1.934),
+('riverfront-city-night-market', 'bebawal-street-pasar-kampung', 4, 3.679),
+('riverfront-city-night-market', 'pasar-taman-ria', 5, 3.838),
+('pasar-malam-taman-kempas', 'pasar-malam-taman-keladi', 1, 3.699),
+('pasar-malam-taman-kempas', 'pasar-malam-taman-arked', 2, 3.967),
+('pasar-malam-taman-kempas', 'pasar-malam-pinang-tunggal', 3, 4.766),
+('pasar-malam-taman-kempas', 'pasar-malam-tikam-batu', 4, 4.818),
+('pasar-malam-taman-kempas', 'pasar-tani-stesen-teksi', 5, 5.500),
+('pasar-malam-taman-arked', 'riverfront-city-night-market', 1, 1.934),
+('pasar-malam-taman-arked', 'uptown-sungai-petani', 2, 2.409),
+('pasar-malam-taman-arked', 'pasar-tani-stesen-teksi', 3, 2.418),
+('pasar-malam-taman-arked', 'pasar-malam-taman-keladi', 4, 3.672),
+('pasar-malam-taman-arked', 'pasar-malam-taman-kempas', 5, 3.967),
+('pasar-malam-taman-lobak-isnin', 'pasar-karat-kilang-lama', 1, 3.985),
+('pasar-malam-taman-lobak-isnin', 'pasar-malam-kg-kelang-lama', 2, 4.100),
+('pasar-malam-taman-lobak-isnin', 'pasar-malam-taman-selasih', 3, 5.149),
+('pasar-malam-taman-lobak-isnin', 'panjang-jagung', 4, 5.363),
+('pasar-malam-taman-lobak-isnin', 'pekan-hari-kulim', 5, 5.702),
+('pasar-malam-kuala-kedah', 'pasar-malam-taman-bersatu', 1, 1.613),
+('pasar-malam-kuala-kedah', 'cion-hahaha-enterprise', 2, 1.680),
+('pasar-malam-kuala-kedah', 'kacang-kuda-pedas', 3, 1.684),
+('pasar-malam-kuala-kedah', 'pasar-malam-taman-mergong-jaya-fasa-1', 4, 6.080),
+('pasar-malam-kuala-kedah', 'pasar-malam-jalan-pegawai', 5, 6.756),
+('pasar-malam-tikam-batu', 'pasar-malam-taman-kempas', 1, 4.818),
+('pasar-malam-tikam-batu', 'pasar-malam-taman-arked', 2, 5.534),
+('pasar-malam-tikam-batu', 'riverfront-city-night-market', 3, 7.367),
+('pasar-malam-tikam-batu', 'pasar-malam-taman-keladi', 4, 7.867),
+('pasar-malam-tikam-batu', 'pasar-malam-pekan-kepala-batas', 5, 7.925),
+('pasar-malam-selama-kedah-hari-khamis', 'pasar-malam-selama-hari-sabtu', 1, 0.739),
+('pasar-malam-selama-kedah-hari-khamis', 'pasar-malam-serdang-hari-isnin', 2, 8.141),
+('pasar-malam-selama-kedah-hari-khamis', 'pasar-pagi-sabtu-mahang', 3, 10.425),
+('pasar-malam-selama-kedah-hari-khamis', 'bukit-bertam-nightmarket-tuesday', 4, 11.885),
+('pasar-malam-selama-kedah-hari-khamis', 'pasar-malam-sungai-duri', 5, 17.031),
+('pasar-malam-jumaat-junjong', 'pasar-awam-junjong', 1, 0.092),
+('pasar-malam-jumaat-junjong', 'pasar-malam-isnin-taman-pekatra-indah', 2, 3.637),
+('pasar-malam-jumaat-junjong', 'pasar-malam-sabtu-bandar-tasek-mutiara-fasa-1', 3, 4.755),
+('pasar-malam-jumaat-junjong', 'pasar-malam-khamis-bandar-tasek-mutiara', 4, 4.771),
+('pasar-malam-jumaat-junjong', 'pasar-malam-machang-bubok', 5, 5.618),
+('pasar-malam-langgar', 'pasar-basah-souq-hutan-kampung', 1, 4.147),
+('pasar-malam-langgar', 'pasar-malam-taman-derga-jaya', 2, 4.989),
+('pasar-malam-langgar', 'bundle-pasar-malam-taman-nuri-petang-jumaat', 3, 5.187),
+('pasar-malam-langgar', 'pasar-malam-telok-wanjah', 4, 6.154),
+('pasar-malam-langgar', 'pasar-malam-kepala-batas-alor-setar', 5, 7.055),
+('pasar-malam-pekan-kepala-batas', 'pasar-malam-permatang-sintok', 1, 2.364),
+('pasar-malam-pekan-kepala-batas', 'pasar-malam-kg-banggol', 2, 4.470),
+('pasar-malam-pekan-kepala-batas', 'pasar-malam-penaga', 3, 5.288),
+('pasar-malam-pekan-kepala-batas', 'pasar-malam-tikam-batu', 4, 7.925),
+('pasar-malam-pekan-kepala-batas', 'pasar-karat-tasek-gelugor', 5, 7.986),
+('pasar-malam-taman-kelisa', 'tapak-pasar-malam-bpj', 1, 4.157),
+('pasar-malam-taman-kelisa', 'pasar-malam-taman-ria-jaya', 2, 4.948),
+('pasar-malam-taman-kelisa', 'pasar-malam-taman-keladi', 3, 6.358),
+('pasar-malam-taman-kelisa', 'pasar-taman-ria', 4, 6.459),
+('pasar-malam-taman-kelisa', 'pasar-tani-stesen-teksi', 5, 7.825),
+('pasar-malam-taman-selasih', 'panjang-jagung', 1, 0.271),
+('pasar-malam-taman-selasih', 'pekan-hari-kulim', 2, 2.039),
+('pasar-malam-taman-selasih', 'pasar-karat-kilang-lama', 3, 2.991),
+('pasar-malam-taman-selasih', 'pasar-malam-kg-kelang-lama', 4, 3.006),
+('pasar-malam-taman-selasih', 'pasar-malam-taman-lobak-isnin', 5, 5.149),
+('pasar-malam-taman-aman', 'pekan-nat-pasar-pagi-ahad-anak-bukit', 1, 0.882),
+('pasar-malam-taman-aman', 'pekan-nat-pasar-pagi-gunung-keriang', 2, 3.288),
+('pasar-malam-taman-aman', 'pasar-tani-taman-wira', 3, 4.614),
+('pasar-malam-taman-aman', 'pasar-basah-souq-hutan-kampung', 4, 4.616),
+('pasar-malam-taman-aman', 'pasar-malam-kepala-batas-alor-setar', 5, 5.727),
+('bundle-pasar-malam-taman-nuri-petang-jumaat', 'pasar-malam-telok-wanjah', 1, 1.285),
+('bundle-pasar-malam-taman-nuri-petang-jumaat', 'pasar-malam-taman-derga-jaya', 2, 1.611),
+('bundle-pasar-malam-taman-nuri-petang-jumaat', 'pasar-malam-pekan-rabu', 3, 2.756),
+('bundle-pasar-malam-taman-nuri-petang-jumaat', 'pasar-malam-jalan-pegawai', 4, 3.650),
+('bundle-pasar-malam-taman-nuri-petang-jumaat', 'pasar-tani-taman-wira', 5, 4.053),
+('tapak-pasar-malam-bpj', 'pasar-malam-taman-keladi', 1, 3.052),
+('tapak-pasar-malam-bpj', 'pasar-malam-taman-kelisa', 2, 4.157),
+('tapak-pasar-malam-bpj', 'pasar-malam-taman-ria-jaya', 3, 4.933),
+('tapak-pasar-malam-bpj', 'pasar-malam-taman-kempas', 4, 5.737),
+('tapak-pasar-malam-bpj', 'pasar-tani-stesen-teksi', 5, 5.839),
+('pasar-malam-kuala-muda', 'pasar-malam-penaga', 1, 7.390),
+('pasar-malam-kuala-muda', 'pasar-malam-permatang-sintok', 2, 10.688),
+('pasar-malam-kuala-muda', 'pasar-malam-tikam-batu', 3, 11.165),
+('pasar-malam-kuala-muda', 'pasar-malam-pekan-kepala-batas', 4, 12.196),
+('pasar-malam-kuala-muda', 'tapak-pasar-malam-tanjung-tokong', 5, 14.509),
+('pasar-malam-jalan-pegawai', 'pasar-malam-pekan-rabu', 1, 1.014),
+('pasar-malam-jalan-pegawai', 'pasar-malam-telok-wanjah', 2, 2.899),
+('pasar-malam-jalan-pegawai', 'pasar-malam-tandop', 3, 3.077),
+('pasar-malam-jalan-pegawai', 'bundle-pasar-malam-taman-nuri-petang-jumaat', 4, 3.650),
+('pasar-malam-jalan-pegawai', 'pasar-tani-taman-wira', 5, 3.690),
+('pasar-malam-taman-mergong-jaya-fasa-1', 'pasar-tani-taman-wira', 1, 2.630),
+('pasar-malam-taman-mergong-jaya-fasa-1', 'pasar-malam-pekan-rabu', 2, 4.281),
+('pasar-malam-taman-mergong-jaya-fasa-1', 'pasar-malam-jalan-pegawai', 3, 4.339),
+('pasar-malam-taman-mergong-jaya-fasa-1', 'pasar-malam-telok-wanjah', 4, 5.036),
+('pasar-malam-taman-mergong-jaya-fasa-1', 'pekan-nat-pasar-pagi-gunung-keriang', 5, 5.485),
+('kimberley-street-food-night-market', 'pasar-malam-lebuh-keng-kwee', 1, 0.217),
+('kimberley-street-food-night-market', 'pasar-chowrasta-market', 2, 0.250),
+('kimberley-street-food-night-market', 'plaza-ramadan-prangin-mall', 3, 0.258),
+('kimberley-street-food-night-market', 'campbell-street-market', 4, 0.332),
+('kimberley-street-food-night-market', 'chulia-street-hawker-food', 5, 0.443),
+('pasar-karat-kilang-lama', 'pasar-malam-kg-kelang-lama', 1, 0.117),
+('pasar-karat-kilang-lama', 'pekan-hari-kulim', 2, 2.099),
+('pasar-karat-kilang-lama', 'pasar-malam-taman-selasih', 3, 2.991),
+('pasar-karat-kilang-lama', 'panjang-jagung', 4, 3.257),
+('pasar-karat-kilang-lama', 'pasar-malam-taman-lobak-isnin', 5, 3.985),
+('pasar-malam-taman-ria-jaya', 'pasar-taman-ria', 1, 1.583),
+('pasar-malam-taman-ria-jaya', 'pasar-tani-stesen-teksi', 2, 3.473),
+('pasar-malam-taman-ria-jaya', 'uptown-sungai-petani', 3, 3.577),
+('pasar-malam-taman-ria-jaya', 'pasar-malam-taman-keladi', 4, 4.193),
+('pasar-malam-taman-ria-jaya', 'riverfront-city-night-market', 5, 4.467),
+('pasar-malam-tandop', 'pasar-malam-jalan-pegawai', 1, 3.077),
+('pasar-malam-tandop', 'pasar-malam-pekan-rabu', 2, 3.912),
+('pasar-malam-tandop', 'pasar-malam-telok-wanjah', 3, 5.515),
+('pasar-malam-tandop', 'pasar-malam-taman-derga-jaya', 4, 5.594),
+('pasar-malam-tandop', 'bundle-pasar-malam-taman-nuri-petang-jumaat', 5, 5.721),
+('night-market-on-friday-pasar-malam-van-praagh', 'perak-road-wet-market-da-lu-hou-wan-shan', 1, 0.316),
+('night-market-on-friday-pasar-malam-van-praagh', 'pasar-tps-jalan-perak', 2, 0.329),
+('night-market-on-friday-pasar-malam-van-praagh', 'jelutong-market', 3, 0.800),
+('night-market-on-friday-pasar-malam-van-praagh', 'pasar-awam-balai-rakyat-batu-lanchang', 4, 1.110),
+('night-market-on-friday-pasar-malam-van-praagh', 'pasar-malam-di-tempat-letak-kereta-bersebelahan-kompleks-batu-lanchang', 5, 1.117),
+('pasar-malam-taman-ria-mesra-2', 'kedai-kraf-mughesyen', 1, 10.189),
+('pasar-malam-taman-ria-mesra-2', 'pasar-malam-pekan-guar-cempedak', 2, 10.964),
+('pasar-malam-taman-ria-mesra-2', 'pasar-malam-sungai-lalang', 3, 11.704),
+('pasar-malam-taman-ria-mesra-2', 'tapak-pasar-malam-jeneri-sik', 4, 15.637),
+('pasar-malam-taman-ria-mesra-2', 'pasar-taman-ria', 5, 17.476),
+('pasar-malam-telok-wanjah', 'bundle-pasar-malam-taman-nuri-petang-jumaat', 1, 1.285),
+('pasar-malam-telok-wanjah', 'pasar-malam-pekan-rabu', 2, 1.892),
+('pasar-malam-telok-wanjah', 'pasar-tani-taman-wira', 3, 2.805),
+('pasar-malam-telok-wanjah', 'pasar-malam-taman-derga-jaya', 4, 2.809),
+('pasar-malam-telok-wanjah', 'pasar-malam-jalan-pegawai', 5, 2.899),
+('pasar-malam-pekan-guar-cempedak', 'pasar-malam-sungai-yan', 1, 8.562),
+('pasar-malam-pekan-guar-cempedak', 'pasar-malam-taman-ria-mesra-2', 2, 10.964),
+('pasar-malam-pekan-guar-cempedak', 'mabah-kdh89', 3, 12.157),
+('pasar-malam-pekan-guar-cempedak', 'pasar-pekan-pendang', 4, 15.318),
+('pasar-malam-pekan-guar-cempedak', 'kedai-kraf-mughesyen', 5, 15.677),
+('pasar-malam-kepala-batas-alor-setar', 'pasar-malam-bandar-darulaman', 1, 3.575),
+('pasar-malam-kepala-batas-alor-setar', 'pasar-basah-souq-hutan-kampung', 2, 4.255),
+('pasar-malam-kepala-batas-alor-setar', 'pekan-nat-pasar-pagi-ahad-anak-bukit', 3, 5.155),
+('pasar-malam-kepala-batas-alor-setar', 'taman-sri-aman-night-market', 4, 5.549),
+('pasar-malam-kepala-batas-alor-setar', 'pasar-malam-taman-aman', 5, 5.727),
+('pasar-malam-serdang-hari-isnin', 'pasar-malam-selama-kedah-hari-khamis', 1, 8.141),
+('pasar-malam-serdang-hari-isnin', 'pasar-malam-selama-hari-sabtu', 2, 8.365),
+('pasar-malam-serdang-hari-isnin', 'pasar-malam-sungai-duri', 3, 9.031),
+('pasar-malam-serdang-hari-isnin', 'pasar-malam-taman-seruling-emas', 4, 11.752),
+('pasar-malam-serdang-hari-isnin', 'pasar-malam-sungai-bakap', 5, 12.374),
+('macallum-street-night-market', 'mat-toh-yau-dessert-at-macallum-night-market', 1, 0.248),
+('macallum-street-night-market', 'plaza-ramadan-prangin-mall', 2, 1.075),
+('macallum-street-night-market', 'kimberley-street-food-night-market', 3, 1.207),
+('macallum-street-night-market', 'campbell-street-market', 4, 1.241),
+('macallum-street-night-market', 'pasar-malam-lebuh-keng-kwee', 5, 1.333),
+('sungai-dua-night-market', 'pasar-malam-sungai-dua', 1, 0.029),
+('sungai-dua-night-market', 'wednesday-night-market', 2, 1.212),
+('sungai-dua-night-market', 'street-market-pasar-malam', 3, 1.228),
+('sungai-dua-night-market', 'pantai-jerejak-night-market', 4, 1.285),
+('sungai-dua-night-market', 'pasar-malam-batu-uban', 5, 1.404),
+('pasar-malam-sungai-ara', 'friday-night-market', 1, 0.170),
+('pasar-malam-sungai-ara', 'pasar-malam-bukit-gedung', 2, 1.404),
+('pasar-malam-sungai-ara', 'pasar-malam-relau', 3, 1.507),
+('pasar-malam-sungai-ara', 'sites-morning-market-and-night-market-council', 4, 1.597),
+('pasar-malam-sungai-ara', 'pasar-malam-bayan-baru', 5, 1.911),
+('pasar-nat-pekan-naka', 'pasar-malam-kubur-panjang', 1, 14.399),
+('pasar-nat-pekan-naka', 'pasar-malam-pokok-sena-kedundung', 2, 18.634),
+('pasar-nat-pekan-naka', 'pasar-pokok-sena', 3, 18.823),
+('pasar-nat-pekan-naka', 'pasar-malam-langgar', 4, 26.164),
+('pasar-nat-pekan-naka', 'tapak-pasar-malam-jeneri-sik', 5, 26.202),
+('pasar-malam-sabtu-bandar-tasek-mutiara-fasa-1', 'pasar-malam-khamis-bandar-tasek-mutiara', 1, 0.030),
+('pasar-malam-sabtu-bandar-tasek-mutiara-fasa-1', 'pasar-malam-isnin-taman-pekatra-indah', 2, 1.291),
+('pasar-malam-sabtu-bandar-tasek-mutiara-fasa-1', 'pasar-malam-ahad-taman-kasawari-simpang-ampat', 3, 2.475),
+('pasar-malam-sabtu-bandar-tasek-mutiara-fasa-1', 'pasar-malam-taman-perwira-indah', 4, 2.483),
+('pasar-malam-sabtu-bandar-tasek-mutiara-fasa-1', 'pasar-malam-permatang-tinggi', 5, 2.831),
+('pasar-malam-bukit-selambau', 'pasar-malam-taman-kelisa', 1, 9.962),
+('pasar-malam-bukit-selambau', 'pasar-malam-sungai-lalang', 2, 11.382),
+('pasar-malam-bukit-selambau', 'pasar-malam-taman-ria-jaya', 3, 13.566),
+('pasar-malam-bukit-selambau', 'tapak-pasar-malam-bpj', 4, 14.047),
+('pasar-malam-bukit-selambau', 'kedai-kraf-mughesyen', 5, 14.481),
+('pasar-malam-uptown-bandar-perda', 'gerbang-malam-perda', 1, 1.001),
+('pasar-malam-uptown-bandar-perda', 'pasar-malam-sabtu-pasar-ramadhan', 2, 1.281),
+('pasar-malam-uptown-bandar-perda', 'pasar-malam-jalan-pauh-indah-1-polytech-perai-sabtu', 3, 1.302),
+('pasar-malam-uptown-bandar-perda', 'pasar-malam-bazar-perdana-perda-isnin', 4, 1.593),
+('pasar-malam-uptown-bandar-perda', 'ls-pasar-malam-taman-desa-damai', 5, 1.895),
+('farlim-wednesday-night-market', 'wednesday-penang-night-market', 1, 0.061),
+('farlim-wednesday-night-market', 'pasar-farlim-pusat-makanan', 2, 0.700),
+('farlim-wednesday-night-market', 'pasar-malam-desa-permata-paya-terubong', 3, 0.806),
+('farlim-wednesday-night-market', 'mat-to-you-dessert-at-paya-terubong-night-market', 4, 0.826),
+('farlim-wednesday-night-market', 'pasar-malam-kampong-melayu', 5, 1.103),
+('pasar-malam-khamis-bandar-tasek-mutiara', 'pasar-malam-sabtu-bandar-tasek-mutiara-fasa-1', 1, 0.030),
+('pasar-malam-khamis-bandar-tasek-mutiara', 'pasar-malam-isnin-taman-pekatra-indah', 2, 1.294),
+('pasar-malam-khamis-bandar-tasek-mutiara', 'pasar-malam-ahad-taman-kasawari-simpang-ampat', 3, 2.466),
+('pasar-malam-khamis-bandar-tasek-mutiara', 'pasar-malam-taman-perwira-indah', 4, 2.498),
+('pasar-malam-khamis-bandar-tasek-mutiara', 'pasar-malam-permatang-tinggi', 5, 2.848),
+('pasar-malam-desa-permata-paya-terubong', 'mat-to-you-dessert-at-paya-terubong-night-market', 1, 0.053),
+('pasar-malam-desa-permata-paya-terubong', 'wednesday-penang-night-market', 2, 0.783),
+('pasar-malam-desa-permata-paya-terubong', 'farlim-wednesday-night-market', 3, 0.806),
+('pasar-malam-desa-permata-paya-terubong', 'ayer-itam-night-market', 4, 0.925),
+('pasar-malam-desa-permata-paya-terubong', 'pasar-malam-kampong-melayu', 5, 1.167),
+('pasar-malam-bandar-darulaman', 'taman-sri-aman-night-market', 1, 1.977),
+('pasar-malam-bandar-darulaman', 'pasar-malam-pekan-jitra-pj2', 2, 2.563),
+('pasar-malam-bandar-darulaman', 'pasar-malam-kepala-batas-alor-setar', 3, 3.575),
+('pasar-malam-bandar-darulaman', 'pasar-malam-taman-suria', 4, 4.513),
+('pasar-malam-bandar-darulaman', 'pasar-basah-souq-hutan-kampung', 5, 7.829),
+('pasar-malam-batu-feringghi', 'lydia-henna', 1, 0.241),
+('pasar-malam-batu-feringghi', 'tanjung-bungah-night-market-tuesday', 2, 4.169),
+('pasar-malam-batu-feringghi', 'tapak-pasar-malam-teluk-bahang-isnin', 3, 4.294),
+('pasar-malam-batu-feringghi', 'teluk-bahang-market-pasar-teluk-bahangteluk-phaang-cntai', 4, 4.306),
+('pasar-malam-batu-feringghi', 'tapak-pasar-malam-tanjung-tokong', 5, 6.590),
+('pasar-malam-taman-keladi', 'tapak-pasar-malam-bpj', 1, 3.052),
+('pasar-malam-taman-keladi', 'pasar-tani-stesen-teksi', 2, 3.195),
+('pasar-malam-taman-keladi', 'uptown-sungai-petani', 3, 3.408),
+('pasar-malam-taman-keladi', 'pasar-malam-taman-arked', 4, 3.672),
+('pasar-malam-taman-keladi', 'pasar-malam-taman-kempas', 5, 3.699),
+('pasar-malam-kampong-melayu', 'pasar-malam-desa-mawar-farlim-jalan-thean-teik', 1, 0.550),
+('pasar-malam-kampong-melayu', 'pasar-malam-desa-mawar', 2, 0.576),
+('pasar-malam-kampong-melayu', 'pasar-farlim-pusat-makanan', 3, 0.794),
+('pasar-malam-kampong-melayu', 'ayer-itam-night-market', 4, 0.827),
+('pasar-malam-kampong-melayu', 'farlim-wednesday-night-market', 5, 1.103),
+('pasar-karat-tasek-gelugor', 'pokok-tampang-night-market', 1, 0.232),
+('pasar-karat-tasek-gelugor', 'tasek-gelugor-night-market', 2, 0.585),
+('pasar-karat-tasek-gelugor', 'pasar-malam-kg-banggol', 3, 4.387),
+('pasar-karat-tasek-gelugor', 'pasar-malam-kampung-selamat', 4, 4.773),
+('pasar-karat-tasek-gelugor', 'pasar-malam-guar-perahu-hari-sabtu', 5, 6.439),
+('pasar-malam-kubur-panjang', 'pasar-malam-pokok-sena-kedundung', 1, 10.315),
+('pasar-malam-kubur-panjang', 'pasar-pokok-sena', 2, 11.079),
+('pasar-malam-kubur-panjang', 'pasar-pekan-pendang', 3, 13.204),
+('pasar-malam-kubur-panjang', 'pasar-nat-pekan-naka', 4, 14.399),
+('pasar-malam-kubur-panjang', 'pasar-malam-langgar', 5, 14.798),
+('pasar-malam-pokok-sena-kedundung', 'pasar-pokok-sena', 1, 0.859),
+('pasar-malam-pokok-sena-kedundung', 'pasar-malam-langgar', 2, 7.952),
+('pasar-malam-pokok-sena-kedundung', 'pasar-malam-kubur-panjang', 3, 10.315),
+('pasar-malam-pokok-sena-kedundung', 'pasar-basah-souq-hutan-kampung', 4, 10.985),
+('pasar-malam-pokok-sena-kedundung', 'pasar-malam-kepala-batas-alor-setar', 5, 11.012),
+('ayer-itam-night-market', 'pasar-malam-kampong-melayu', 1, 0.827),
+('ayer-itam-night-market', 'mat-to-you-dessert-at-paya-terubong-night-market', 2, 0.871),
+('ayer-itam-night-market', 'pasar-malam-desa-permata-paya-terubong', 3, 0.925),
+('ayer-itam-night-market', 'pasar-malam-desa-mawar-farlim-jalan-thean-teik', 4, 1.353),
+('ayer-itam-night-market', 'pasar-malam-desa-mawar', 5, 1.358),
+('pasar-malam-taman-derga-jaya', 'bundle-pasar-malam-taman-nuri-petang-jumaat', 1, 1.611),
+('pasar-malam-taman-derga-jaya', 'pasar-malam-telok-wanjah', 2, 2.809),
+('pasar-malam-taman-derga-jaya', 'pasar-malam-pekan-rabu', 3, 3.731),
+('pasar-malam-taman-derga-jaya', 'pasar-malam-jalan-pegawai', 4, 4.381),
+('pasar-malam-taman-derga-jaya', 'pasar-malam-langgar', 5, 4.989),
+('mat-to-you-dessert-at-paya-terubong-night-market', 'pasar-malam-desa-permata-paya-terubong', 1, 0.053),
+('mat-to-you-dessert-at-paya-terubong-night-market', 'wednesday-penang-night-market', 2, 0.807),
+('mat-to-you-dessert-at-paya-terubong-night-market', 'farlim-wednesday-night-market', 3, 0.826),
+('mat-to-you-dessert-at-paya-terubong-night-market', 'ayer-itam-night-market', 4, 0.871),
+('mat-to-you-dessert-at-paya-terubong-night-market', 'pasar-malam-kampong-melayu', 5, 1.130),
+('pasar-malam-penantihari-isnin', 'pasar-malam-kubang-semang', 1, 0.629),
+('pasar-malam-penantihari-isnin', 'pasar-malam-kg-tok-elong-selasa', 2, 2.249),
+('pasar-malam-penantihari-isnin', 'pasar-malamminihari-rabu-taman-guar-perahu', 3, 2.587),
+('pasar-malam-penantihari-isnin', 'pasar-malam-guar-perahu-hari-sabtu', 4, 2.644),
+('pasar-malam-penantihari-isnin', 'pasar-malam-bazar-perdana-perda-isnin', 5, 5.058),
+('pasar-malam-jalan-mohd-saad', 'pasar-malam-bagan-ajam', 1, 1.937),
+('pasar-malam-jalan-mohd-saad', 'pasar-malam-taman-bagan', 2, 2.044),
+('pasar-malam-jalan-mohd-saad', 'pasar-malam-kampung-sg-nyior', 3, 2.797),
+('pasar-malam-jalan-mohd-saad', 'ampang-jajar-night-market', 4, 3.615),
+('pasar-malam-jalan-mohd-saad', 'pasar-malam-perai-taman-inderawasih', 5, 3.973),
+('taman-sri-aman-night-market', 'pasar-malam-pekan-jitra-pj2', 1, 1.296),
+('taman-sri-aman-night-market', 'pasar-malam-bandar-darulaman', 2, 1.977),
+('taman-sri-aman-night-market', 'pasar-malam-taman-suria', 3, 3.115),
+('taman-sri-aman-night-market', 'pasar-malam-kepala-batas-alor-setar', 4, 5.549),
+('taman-sri-aman-night-market', 'pasar-basah-souq-hutan-kampung', 5, 9.801),
+('pasar-malam-jalan-pauh-indah-1-polytech-perai-sabtu', 'pasar-malam-sabtu-pasar-ramadhan', 1, 0.179),
+('pasar-malam-jalan-pauh-indah-1-polytech-perai-sabtu', 'pasar-malam-uptown-bandar-perda', 2, 1.302),
+('pasar-malam-jalan-pauh-indah-1-polytech-perai-sabtu', 'pasar-malam-taman-sutera', 3, 1.332),
+('pasar-malam-jalan-pauh-indah-1-polytech-perai-sabtu', 'pasar-malam-mpkk', 4, 1.336),
+('pasar-malam-jalan-pauh-indah-1-polytech-perai-sabtu', 'pasar-malam-khamis-tok-kandu', 5, 1.857),
+('pasar-malam-taman-bersatu', 'cion-hahaha-enterprise', 1, 0.439),
+('pasar-malam-taman-bersatu', 'kacang-kuda-pedas', 2, 0.446),
+('pasar-malam-taman-bersatu', 'pasar-malam-kuala-kedah', 3, 1.613),
+('pasar-malam-taman-bersatu', 'pasar-malam-tandop', 4, 6.069),
+('pasar-malam-taman-bersatu', 'pasar-malam-jalan-pegawai', 5, 6.763),
+('tapak-pasar-pagi-padang-serai', 'pasar-pagi-padang-serai', 1, 0.964),
+('tapak-pasar-pagi-padang-serai', 'nazdhia-mart', 2, 1.520),
+('tapak-pasar-pagi-padang-serai', 'pasar-malam-kampung-selamat', 3, 3.141),
+('tapak-pasar-pagi-padang-serai', 'pasar-malam-pinang-tunggal', 4, 6.889),
+('tapak-pasar-pagi-padang-serai', 'tasek-gelugor-night-market', 5, 7.337),
+('pasar-malam-seberang-jaya', 'pasar-malam-perai-taman-inderawasih', 1, 1.421),
+('pasar-malam-seberang-jaya', 'pasar-malam-taman-sutera', 2, 1.462),
+('pasar-malam-seberang-jaya', 'pasar-malam-khamis-tok-kandu', 3, 1.500),
+('pasar-malam-seberang-jaya', 'pasar-malam-mpkk', 4, 1.725),
+('pasar-malam-seberang-jaya', 'ampang-jajar-night-market', 5, 2.292),
+('pasar-malam-taman-tun-sardon', 'sungai-dua-night-market', 1, 2.233),
+('pasar-malam-taman-tun-sardon', 'pasar-malam-sungai-dua', 2, 2.237),
+('pasar-malam-taman-tun-sardon', 'supper-at-batu-lanchang-food-truck-party', 3, 2.283),
+('pasar-malam-taman-tun-sardon', 'pasar-malam-di-tempat-letak-kereta-bersebelahan-kompleks-batu-lanchang', 4, 2.356),
+('pasar-malam-taman-tun-sardon', 'pasar-awam-balai-rakyat-batu-lanchang', 5, 2.394),
+('pasar-malam-desa-mawar', 'pasar-malam-desa-mawar-farlim-jalan-thean-teik', 1, 0.081),
+('pasar-malam-desa-mawar', 'pasar-malam-kampong-melayu', 2, 0.576),
+('pasar-malam-desa-mawar', 'pasar-farlim-pusat-makanan', 3, 0.869),
+('pasar-malam-desa-mawar', 'ayer-itam-night-market', 4, 1.358),
+('pasar-malam-desa-mawar', 'farlim-wednesday-night-market', 5, 1.451),
+('pasar-malam-sungai-yan', 'pasar-malam-pekan-guar-cempedak', 1, 8.562),
+('pasar-malam-sungai-yan', 'mabah-kdh89', 2, 14.578),
+('pasar-malam-sungai-yan', 'pasar-tani-tmn-lembah-bujang-utama', 3, 15.001),
+('pasar-malam-sungai-yan', 'kedai-kraf-mughesyen', 4, 17.509),
+('pasar-malam-sungai-yan', 'pasar-malam-taman-ria-mesra-2', 5, 17.554),
+('pasar-minggu-nat-sabtu-isnin-pasar-malam-selasa-sungai-korok', 'pekan-nat-pasar-pagi-sungai-korok', 1, 0.036),
+('pasar-minggu-nat-sabtu-isnin-pasar-malam-selasa-sungai-korok', 'pekan-nat-pasar-pagi-gunung-keriang', 2, 5.170),
+('pasar-minggu-nat-sabtu-isnin-pasar-malam-selasa-sungai-korok', 'pasar-malam-taman-aman', 3, 7.220),
+('pasar-minggu-nat-sabtu-isnin-pasar-malam-selasa-sungai-korok', 'pekan-nat-pasar-pagi-ahad-anak-bukit', 4, 8.013),
+('pasar-minggu-nat-sabtu-isnin-pasar-malam-selasa-sungai-korok', 'pasar-malam-kepala-batas-alor-setar', 5, 10.406),
+('pasar-malam-machang-bubok', 'pasar-malam-taman-seri-janggus-hari-selasa', 1, 1.875),
+('pasar-malam-machang-bubok', 'pasar-malam-taman-permata', 2, 2.805),
+('pasar-malam-machang-bubok', 'pasar-malam-kota-permai-sabtu', 3, 4.927),
+('pasar-malam-machang-bubok', 'pasar-malam-permatang-tinggi', 4, 5.358),
+('pasar-malam-machang-bubok', 'panjang-jagung', 5, 5.523),
+('night-market-site', 'pasar-balik-pulau', 1, 0.067),
+('night-market-site', 'pasar-malam-masjid-daerah-barat-daya', 2, 2.403),
+('night-market-site', 'pasar-malam-relau', 3, 4.550),
+('night-market-site', 'pasar-malam-sungai-ara', 4, 4.763),
+('night-market-site', 'tapak-pasar-malam-wayton', 5, 4.832),
+('pasar-malam-pekan-rabu', 'pasar-malam-jalan-pegawai', 1, 1.014),
+('pasar-malam-pekan-rabu', 'pasar-malam-telok-wanjah', 2, 1.892),
+('pasar-malam-pekan-rabu', 'bundle-pasar-malam-taman-nuri-petang-jumaat', 3, 2.756),
+('pasar-malam-pekan-rabu', 'pasar-tani-taman-wira', 4, 3.026),
+('pasar-malam-pekan-rabu', 'pasar-malam-taman-derga-jaya', 5, 3.731),
+('pokok-tampang-night-market', 'pasar-karat-tasek-gelugor', 1, 0.232),
+('pokok-tampang-night-market', 'tasek-gelugor-night-market', 2, 0.362),
+('pokok-tampang-night-market', 'pasar-malam-kg-banggol', 3, 4.574),
+('pokok-tampang-night-market', 'pasar-malam-kampung-selamat', 4, 4.711),
+('pokok-tampang-night-market', 'pasar-malam-guar-perahu-hari-sabtu', 5, 6.374),
+('pasar-malam-lebuh-keng-kwee', 'pasar-chowrasta-market', 1, 0.134),
+('pasar-malam-lebuh-keng-kwee', 'kimberley-street-food-night-market', 2, 0.217),
+('pasar-malam-lebuh-keng-kwee', 'plaza-ramadan-prangin-mall', 3, 0.266),
+('pasar-malam-lebuh-keng-kwee', 'campbell-street-market', 4, 0.531),
+('pasar-malam-lebuh-keng-kwee', 'new-lane-street-foodstalls', 5, 0.540),
+('pasar-malam-penaga', 'pasar-malam-permatang-sintok', 1, 3.362),
+('pasar-malam-penaga', 'pasar-malam-pekan-kepala-batas', 2, 5.288),
+('pasar-malam-penaga', 'pasar-malam-kuala-muda', 3, 7.390),
+('pasar-malam-penaga', 'pasar-malam-tikam-batu', 4, 8.903),
+('pasar-malam-penaga', 'pasar-malam-kg-banggol', 5, 9.411),
+('pekan-nat-pasar-pagi-gunung-keriang', 'pasar-malam-taman-aman', 1, 3.288),
+('pekan-nat-pasar-pagi-gunung-keriang', 'pekan-nat-pasar-pagi-ahad-anak-bukit', 2, 4.153),
+('pekan-nat-pasar-pagi-gunung-keriang', 'pasar-minggu-nat-sabtu-isnin-pasar-malam-selasa-sungai-korok', 3, 5.170),
+('pekan-nat-pasar-pagi-gunung-keriang', 'pekan-nat-pasar-pagi-sungai-korok', 4, 5.201),
+('pekan-nat-pasar-pagi-gunung-keriang', 'pasar-malam-taman-mergong-jaya-fasa-1', 5, 5.485),
+('pasar-malam-kg-tok-elong-selasa', 'pasar-malam-kubang-semang', 1, 1.676),
+('pasar-malam-kg-tok-elong-selasa', 'pasar-malam-penantihari-isnin', 2, 2.249),
+('pasar-malam-kg-tok-elong-selasa', 'pasar-malam-bazar-perdana-perda-isnin', 3, 3.440),
+('pasar-malam-kg-tok-elong-selasa', 'monday-night-market-zhen-zhu-shi-ye-shi', 4, 3.531),
+('pasar-malam-kg-tok-elong-selasa', 'nan-mei-yuan-ye-shi-pasar-malam-rambai-sri-rambai-sungai-rambai', 5, 3.538),
+('pasar-malam-permatang-sintok', 'pasar-malam-pekan-kepala-batas', 1, 2.364),
+('pasar-malam-permatang-sintok', 'pasar-malam-penaga', 2, 3.362),
+('pasar-malam-permatang-sintok', 'pasar-malam-kg-banggol', 3, 6.067),
+('pasar-malam-permatang-sintok', 'pasar-malam-bagan-ajam', 4, 7.984),
+('pasar-malam-permatang-sintok', 'pasar-malam-desa-murni', 5, 8.762),
+('pasar-malam-relau', 'pasar-malam-sungai-ara', 1, 1.507),
+('pasar-malam-relau', 'pasar-malam-bayan-baru', 2, 1.655),
+('pasar-malam-relau', 'friday-night-market', 3, 1.673),
+('pasar-malam-relau', 'pasar-malam-bukit-gedung', 4, 2.374),
+('pasar-malam-relau', 'sites-morning-market-and-night-market-council', 5, 2.415),
+('pasar-malam-desa-mawar-farlim-jalan-thean-teik', 'pasar-malam-desa-mawar', 1, 0.081),
+('pasar-malam-desa-mawar-farlim-jalan-thean-teik', 'pasar-malam-kampong-melayu', 2, 0.550),
+('pasar-malam-desa-mawar-farlim-jalan-thean-teik', 'pasar-farlim-pusat-makanan', 3, 0.788),
+('pasar-malam-desa-mawar-farlim-jalan-thean-teik', 'ayer-itam-night-market', 4, 1.353),
+('pasar-malam-desa-mawar-farlim-jalan-thean-teik', 'farlim-wednesday-night-market', 5, 1.378),
+('pasar-malam-rabu-bandar-baharu', 'pasar-malam-pekan-lama-parit-buntar', 1, 0.298),
+('pasar-malam-rabu-bandar-baharu', 'pasar-malam-nibong-tebal', 2, 5.435),
+('pasar-malam-rabu-bandar-baharu', 'pasar-malam-taman-seruling-emas', 3, 9.201),
+('pasar-malam-rabu-bandar-baharu', 'pasar-malam-sungai-duri', 4, 9.668),
+('pasar-malam-rabu-bandar-baharu', 'pasar-malam-sungai-bakap', 5, 9.717),
+('cion-hahaha-enterprise', 'kacang-kuda-pedas', 1, 0.008),
+('cion-hahaha-enterprise', 'pasar-malam-taman-bersatu', 2, 0.439),
+('cion-hahaha-enterprise', 'pasar-malam-kuala-kedah', 3, 1.680),
+('cion-hahaha-enterprise', 'pasar-malam-tandop', 4, 6.481),
+('cion-hahaha-enterprise', 'pasar-malam-jalan-pegawai', 5, 7.200),
+('pasar-malam-taman-bagan', 'pasar-malam-kampung-sg-nyior', 1, 1.134),
+('pasar-malam-taman-bagan', 'pasar-malam-perai-taman-inderawasih', 2, 1.935),
+('pasar-malam-taman-bagan', 'pasar-malam-jalan-mohd-saad', 3, 2.044),
+('pasar-malam-taman-bagan', 'pasar-malam-seberang-jaya', 4, 2.703),
+('pasar-malam-taman-bagan', 'ampang-jajar-night-market', 5, 2.830),
+('tasek-gelugor-night-market', 'pokok-tampang-night-market', 1, 0.362),
+('tasek-gelugor-night-market', 'pasar-karat-tasek-gelugor', 2, 0.585),
+('tasek-gelugor-night-market', 'pasar-malam-kampung-selamat', 3, 4.518),
+('tasek-gelugor-night-market', 'pasar-malam-kg-banggol', 4, 4.923),
+('tasek-gelugor-night-market', 'nazdhia-mart', 5, 6.165),
+('tapak-pasar-malam-jeneri-sik', 'pasar-tani-sik', 1, 14.264),
+('tapak-pasar-malam-jeneri-sik', 'pasar-basah-pekan-sik', 2, 14.271),
+('tapak-pasar-malam-jeneri-sik', 'pasar-malam-taman-ria-mesra-2', 3, 15.637),
+('tapak-pasar-malam-jeneri-sik', 'pasar-pekan-pendang', 4, 21.645),
+('tapak-pasar-malam-jeneri-sik', 'pasar-malam-pekan-guar-cempedak', 5, 22.221),
+('kacang-kuda-pedas', 'cion-hahaha-enterprise', 1, 0.008),
+('kacang-kuda-pedas', 'pasar-malam-taman-bersatu', 2, 0.446),
+('kacang-kuda-pedas', 'pasar-malam-kuala-kedah', 3, 1.684),
+('kacang-kuda-pedas', 'pasar-malam-tandop', 4, 6.487),
+('kacang-kuda-pedas', 'pasar-malam-jalan-pegawai', 5, 7.207),
+('kedai-kraf-mughesyen', 'pasar-malam-sungai-lalang', 1, 3.363),
+('kedai-kraf-mughesyen', 'pasar-taman-ria', 2, 7.457),
+('kedai-kraf-mughesyen', 'bebawal-street-pasar-kampung', 3, 7.613),
+('kedai-kraf-mughesyen', 'pasar-malam-taman-ria-jaya', 4, 8.464),
+('kedai-kraf-mughesyen', 'pasar-tani-tmn-lembah-bujang-utama', 5, 9.059),
+('pasar-pokok-sena', 'pasar-malam-pokok-sena-kedundung', 1, 0.859),
+('pasar-pokok-sena', 'pasar-malam-langgar', 2, 8.159),
+('pasar-pokok-sena', 'pasar-malam-kepala-batas-alor-setar', 3, 10.625),
+('pasar-pokok-sena', 'pasar-basah-souq-hutan-kampung', 4, 10.922),
+('pasar-pokok-sena', 'pasar-malam-kubur-panjang', 5, 11.079),
+('pekan-nat-pasar-pagi-sungai-korok', 'pasar-minggu-nat-sabtu-isnin-pasar-malam-selasa-sungai-korok', 1, 0.036),
+('pekan-nat-pasar-pagi-sungai-korok', 'pekan-nat-pasar-pagi-gunung-keriang', 2, 5.201),
+('pekan-nat-pasar-pagi-sungai-korok', 'pasar-malam-taman-aman', 3, 7.242),
+('pekan-nat-pasar-pagi-sungai-korok', 'pekan-nat-pasar-pagi-ahad-anak-bukit', 4, 8.033),
+('pekan-nat-pasar-pagi-sungai-korok', 'pasar-malam-kepala-batas-alor-setar', 5, 10.410),
+('pekan-ahad', 'farmers-market-supply', 1, 0.018),
+('pekan-ahad', 'pasar-pagi-kupang', 2, 9.016),
+('pekan-ahad', 'pasar-basah-pekan-sik', 3, 25.066),
+('pekan-ahad', 'pasar-tani-sik', 4, 25.073),
+('pekan-ahad', 'pasar-malam-bukit-selambau', 5, 31.547),
+('pasar-pagi-padang-serai', 'nazdhia-mart', 1, 0.628),
+('pasar-pagi-padang-serai', 'tapak-pasar-pagi-padang-serai', 2, 0.964),
+('pasar-pagi-padang-serai', 'pasar-malam-kampung-selamat', 3, 2.946),
+('pasar-pagi-padang-serai', 'tasek-gelugor-night-market', 4, 6.750),
+('pasar-pagi-padang-serai', 'pokok-tampang-night-market', 5, 7.032),
+('pasar-basah-pekan-sik', 'pasar-tani-sik', 1, 0.008),
+('pasar-basah-pekan-sik', 'tapak-pasar-malam-jeneri-sik', 2, 14.271),
+('pasar-basah-pekan-sik', 'pasar-malam-bukit-selambau', 3, 19.188),
+('pasar-basah-pekan-sik', 'pasar-malam-taman-ria-mesra-2', 4, 22.138),
+('pasar-basah-pekan-sik', 'pasar-pagi-kupang', 5, 23.413),
+('pasar-malam-pinang-tunggal', 'pasar-malam-taman-kempas', 1, 4.766),
+('pasar-malam-pinang-tunggal', 'pasar-malam-kampung-selamat', 2, 5.271),
+('pasar-malam-pinang-tunggal', 'tapak-pasar-pagi-padang-serai', 3, 6.889),
+('pasar-malam-pinang-tunggal', 'pasar-malam-taman-keladi', 4, 7.110),
+('pasar-malam-pinang-tunggal', 'tapak-pasar-malam-bpj', 5, 7.140),
+('pasar-basah-souq-hutan-kampung', 'pekan-nat-pasar-pagi-ahad-anak-bukit', 1, 3.734),
+('pasar-basah-souq-hutan-kampung', 'pasar-malam-langgar', 2, 4.147),
+('pasar-basah-souq-hutan-kampung', 'pasar-malam-kepala-batas-alor-setar', 3, 4.255),
+('pasar-basah-souq-hutan-kampung', 'pasar-malam-taman-aman', 4, 4.616),
+('pasar-basah-souq-hutan-kampung', 'bundle-pasar-malam-taman-nuri-petang-jumaat', 5, 5.024),
+('pasar-tani-stesen-teksi', 'uptown-sungai-petani', 1, 0.219),
+('pasar-tani-stesen-teksi', 'riverfront-city-night-market', 2, 1.105),
+('pasar-tani-stesen-teksi', 'pasar-malam-taman-arked', 3, 2.418),
+('pasar-tani-stesen-teksi', 'pasar-taman-ria', 4, 3.120),
+('pasar-tani-stesen-teksi', 'pasar-malam-taman-keladi', 5, 3.195),
+('pasar-tani-taman-wira', 'pasar-malam-taman-mergong-jaya-fasa-1', 1, 2.630),
+('pasar-tani-taman-wira', 'pasar-malam-telok-wanjah', 2, 2.805),
+('pasar-tani-taman-wira', 'pasar-malam-pekan-rabu', 3, 3.026),
+('pasar-tani-taman-wira', 'pasar-malam-jalan-pegawai', 4, 3.690),
+('pasar-tani-taman-wira', 'bundle-pasar-malam-taman-nuri-petang-jumaat', 5, 4.053),
+('pasar-malam-pekan-jitra-pj2', 'taman-sri-aman-night-market', 1, 1.296),
+('pasar-malam-pekan-jitra-pj2', 'pasar-malam-taman-suria', 2, 1.976),
+('pasar-malam-pekan-jitra-pj2', 'pasar-malam-bandar-darulaman', 3, 2.563),
+('pasar-malam-pekan-jitra-pj2', 'pasar-malam-kepala-batas-alor-setar', 4, 5.983),
+('pasar-malam-pekan-jitra-pj2', 'pekan-nat-pasar-pagi-ahad-anak-bukit', 5, 9.891),
+('pasar-tani-sik', 'pasar-basah-pekan-sik', 1, 0.008),
+('pasar-tani-sik', 'tapak-pasar-malam-jeneri-sik', 2, 14.264),
+('pasar-tani-sik', 'pasar-malam-bukit-selambau', 3, 19.186),
+('pasar-tani-sik', 'pasar-malam-taman-ria-mesra-2', 4, 22.131),
+('pasar-tani-sik', 'pasar-pagi-kupang', 5, 23.419),
+('pekan-nat-pasar-pagi-ahad-anak-bukit', 'pasar-malam-taman-aman', 1, 0.882),
+('pekan-nat-pasar-pagi-ahad-anak-bukit', 'pasar-basah-souq-hutan-kampung', 2, 3.734),
+('pekan-nat-pasar-pagi-ahad-anak-bukit', 'pekan-nat-pasar-pagi-gunung-keriang', 3, 4.153),
+('pekan-nat-pasar-pagi-ahad-anak-bukit', 'pasar-tani-taman-wira', 4, 4.473),
+('pekan-nat-pasar-pagi-ahad-anak-bukit', 'pasar-malam-kepala-batas-alor-setar', 5, 5.155),
+('pasar-awam-junjong', 'pasar-malam-jumaat-junjong', 1, 0.092),
+('pasar-awam-junjong', 'pasar-malam-isnin-taman-pekatra-indah', 2, 3.632),
+('pasar-awam-junjong', 'pasar-malam-sabtu-bandar-tasek-mutiara-fasa-1', 3, 4.735),
+('pasar-awam-junjong', 'pasar-malam-khamis-bandar-tasek-mutiara', 4, 4.751),
+('pasar-awam-junjong', 'pasar-malam-machang-bubok', 5, 5.525),
+('pasar-taman-ria', 'pasar-malam-taman-ria-jaya', 1, 1.583),
+('pasar-taman-ria', 'pasar-tani-stesen-teksi', 2, 3.120),
+('pasar-taman-ria', 'uptown-sungai-petani', 3, 3.126),
+('pasar-taman-ria', 'riverfront-city-night-market', 4, 3.838),
+('pasar-taman-ria', 'bebawal-street-pasar-kampung', 5, 4.046),
+('nazdhia-mart', 'pasar-pagi-padang-serai', 1, 0.628),
+('nazdhia-mart', 'tapak-pasar-pagi-padang-serai', 2, 1.520),
+('nazdhia-mart', 'pasar-malam-kampung-selamat', 3, 2.607),
+('nazdhia-mart', 'tasek-gelugor-night-market', 4, 6.165),
+('nazdhia-mart', 'pokok-tampang-night-market', 5, 6.455),
+('pasar-malam-kampung-selamat', 'nazdhia-mart', 1, 2.607),
+('pasar-malam-kampung-selamat', 'pasar-pagi-padang-serai', 2, 2.946),
+('pasar-malam-kampung-selamat', 'tapak-pasar-pagi-padang-serai', 3, 3.141),
+('pasar-malam-kampung-selamat', 'tasek-gelugor-night-market', 4, 4.518),
+('pasar-malam-kampung-selamat', 'pokok-tampang-night-market', 5, 4.711),
+('panjang-jagung', 'pasar-malam-taman-selasih', 1, 0.271),
+('panjang-jagung', 'pekan-hari-kulim', 2, 2.201),
+('panjang-jagung', 'pasar-karat-kilang-lama', 3, 3.257),
+('panjang-jagung', 'pasar-malam-kg-kelang-lama', 4, 3.270),
+('panjang-jagung', 'pasar-malam-taman-lobak-isnin', 5, 5.363),
+('pasar-tani-tmn-lembah-bujang-utama', 'bebawal-street-pasar-kampung', 1, 4.891),
+('pasar-tani-tmn-lembah-bujang-utama', 'riverfront-city-night-market', 2, 8.018),
+('pasar-tani-tmn-lembah-bujang-utama', 'uptown-sungai-petani', 3, 8.578),
+('pasar-tani-tmn-lembah-bujang-utama', 'pasar-tani-stesen-teksi', 4, 8.795),
+('pasar-tani-tmn-lembah-bujang-utama', 'pasar-taman-ria', 5, 8.833),
+('bebawal-street-pasar-kampung', 'riverfront-city-night-market', 1, 3.679),
+('bebawal-street-pasar-kampung', 'uptown-sungai-petani', 2, 3.955),
+('bebawal-street-pasar-kampung', 'pasar-taman-ria', 3, 4.046),
+('bebawal-street-pasar-kampung', 'pasar-tani-stesen-teksi', 4, 4.155),
+('bebawal-street-pasar-kampung', 'pasar-tani-tmn-lembah-bujang-utama', 5, 4.891),
+('pasar-malam-taman-suria', 'pasar-malam-pekan-jitra-pj2', 1, 1.976),
+('pasar-malam-taman-suria', 'taman-sri-aman-night-market', 2, 3.115),
+('pasar-malam-taman-suria', 'pasar-malam-bandar-darulaman', 3, 4.513),
+('pasar-malam-taman-suria', 'pasar-malam-kepala-batas-alor-setar', 4, 7.784),
+('pasar-malam-taman-suria', 'pekan-nat-pasar-pagi-sungai-korok', 5, 10.560),
+('pasar-malam-isnin-taman-pekatra-indah', 'pasar-malam-sabtu-bandar-tasek-mutiara-fasa-1', 1, 1.291),
+('pasar-malam-isnin-taman-pekatra-indah', 'pasar-malam-khamis-bandar-tasek-mutiara', 2, 1.294),
+('pasar-malam-isnin-taman-pekatra-indah', 'pasar-malam-taman-perwira-indah', 3, 3.619),
+('pasar-malam-isnin-taman-pekatra-indah', 'pasar-awam-junjong', 4, 3.632),
+('pasar-malam-isnin-taman-pekatra-indah', 'pasar-malam-jumaat-junjong', 5, 3.637),
+('pasar-pagi-sabtu-mahang', 'bukit-bertam-nightmarket-tuesday', 1, 3.056),
+('pasar-pagi-sabtu-mahang', 'pasar-malam-selama-kedah-hari-khamis', 2, 10.425),
+('pasar-pagi-sabtu-mahang', 'pasar-malam-selama-hari-sabtu', 3, 10.860),
+('pasar-pagi-sabtu-mahang', 'pasar-malam-serdang-hari-isnin', 4, 16.877),
+('pasar-pagi-sabtu-mahang', 'pasar-malam-kg-kelang-lama', 5, 18.908),
+('mabah-kdh89', 'pasar-pekan-pendang', 1, 9.110),
+('mabah-kdh89', 'pasar-malam-pekan-guar-cempedak', 2, 12.157),
+('mabah-kdh89', 'pasar-malam-sungai-yan', 3, 14.578),
+('mabah-kdh89', 'pasar-malam-tandop', 4, 14.997),
+('mabah-kdh89', 'pasar-malam-taman-derga-jaya', 5, 17.750),
+('pasar-pagi-kupang', 'pekan-ahad', 1, 9.016),
+('pasar-pagi-kupang', 'farmers-market-supply', 2, 9.027),
+('pasar-pagi-kupang', 'pasar-basah-pekan-sik', 3, 23.413),
+('pasar-pagi-kupang', 'pasar-tani-sik', 4, 23.419),
+('pasar-pagi-kupang', 'pasar-malam-bukit-selambau', 5, 24.332),
+('farmers-market-supply', 'pekan-ahad', 1, 0.018),
+('farmers-market-supply', 'pasar-pagi-kupang', 2, 9.027),
+('farmers-market-supply', 'pasar-basah-pekan-sik', 3, 25.057),
+('farmers-market-supply', 'pasar-tani-sik', 4, 25.064),
+('farmers-market-supply', 'pasar-malam-bukit-selambau', 5, 31.549),
+('pekan-hari-kulim', 'pasar-malam-kg-kelang-lama', 1, 2.031),
+('pekan-hari-kulim', 'pasar-malam-taman-selasih', 2, 2.039),
+('pekan-hari-kulim', 'pasar-karat-kilang-lama', 3, 2.099),
+('pekan-hari-kulim', 'panjang-jagung', 4, 2.201),
+('pekan-hari-kulim', 'pasar-malam-taman-lobak-isnin', 5, 5.702),
+('pasar-malam-taman-perwira-indah', 'pasar-malam-permatang-tinggi', 1, 0.434),
+('pasar-malam-taman-perwira-indah', 'pasar-malam-ahad-taman-kasawari-simpang-ampat', 2, 1.984),
+('pasar-malam-taman-perwira-indah', 'pasar-malam-sabtu-bandar-tasek-mutiara-fasa-1', 3, 2.483),
+('pasar-malam-taman-perwira-indah', 'pasar-malam-khamis-bandar-tasek-mutiara', 4, 2.498),
+('pasar-malam-taman-perwira-indah', 'pasar-malam-isnin-taman-merak', 5, 3.211),
+('pasar-pekan-pendang', 'mabah-kdh89', 1, 9.110),
+('pasar-pekan-pendang', 'pasar-malam-kubur-panjang', 2, 13.204),
+('pasar-pekan-pendang', 'pasar-malam-pekan-guar-cempedak', 3, 15.318),
+('pasar-pekan-pendang', 'pasar-malam-taman-derga-jaya', 4, 15.668),
+('pasar-pekan-pendang', 'pasar-malam-tandop', 5, 15.995),
+('labuan-walk', 'labuan-weekly-market', 1, 0.084),
+('labuan-walk', 'utc-labuan-central-market', 2, 0.718),
+('labuan-walk', 'medan-selera-pasar-sentral', 3, 0.859),
+('labuan-walk', 'pasar-tamu-lawas', 4, 49.710),
+('labuan-walk', 'medan-niaga-lawas-night-market', 5, 49.850),
+('utc-labuan-central-market', 'medan-selera-pasar-sentral', 1, 0.150),
+('utc-labuan-central-market', 'labuan-weekly-market', 2, 0.709),
+('utc-labuan-central-market', 'labuan-walk', 3, 0.718),
+('utc-labuan-central-market', 'pasar-tamu-lawas', 4, 50.328),
+('utc-labuan-central-market', 'medan-niaga-lawas-night-market', 5, 50.467),
+('labuan-weekly-market', 'labuan-walk', 1, 0.084),
+('labuan-weekly-market', 'utc-labuan-central-market', 2, 0.709),
+('labuan-weekly-market', 'medan-selera-pasar-sentral', 3, 0.844),
+('labuan-weekly-market', 'pasar-tamu-lawas', 4, 49.680),
+('labuan-weekly-market', 'medan-niaga-lawas-night-market', 5, 49.820),
+('medan-selera-pasar-sentral', 'utc-labuan-central-market', 1, 0.150),
+('medan-selera-pasar-sentral', 'labuan-weekly-market', 2, 0.844),
+('medan-selera-pasar-sentral', 'labuan-walk', 3, 0.859),
+('medan-selera-pasar-sentral', 'pasar-tamu-lawas', 4, 50.419),
+('medan-selera-pasar-sentral', 'medan-niaga-lawas-night-market', 5, 50.558),
+('pasar-malam-melaka-baru', 'kipmall-melaka', 1, 0.675),
+('pasar-malam-melaka-baru', 'pasar-malam-pantai-peringgit', 2, 1.629),
+('pasar-malam-melaka-baru', 'monday-pasar-malam-bukit-beruang', 3, 1.933),
+('pasar-malam-melaka-baru', 'wednesday-pasar-malam-bukit-beruang', 4, 1.941),
+('pasar-malam-melaka-baru', 'uptown-teja-night-market', 5, 2.150),
+('thursday-pasar-malam-ayer-molek', 'pasar-tani-ayer-molek-melaka', 1, 0.082),
+('thursday-pasar-malam-ayer-molek', 'tuesday-pasar-malam-duyong', 2, 0.730),
+('thursday-pasar-malam-ayer-molek', 'friday-pasar-malam-merak-mas', 3, 3.522),
+('thursday-pasar-malam-ayer-molek', 'wednesday-pasar-malam-semabok', 4, 4.328),
+('thursday-pasar-malam-ayer-molek', 'saturday-pasar-malam-bukit-baru', 5, 4.626),
+('friday-pasar-malam-malim-jaya', 'malim-market', 1, 0.130),
+('friday-pasar-malam-malim-jaya', 'malim-night-market-food-street', 2, 0.195),
+('friday-pasar-malam-malim-jaya', 'pasar-mini-malam-jaya', 3, 0.718),
+('friday-pasar-malam-malim-jaya', 'asam-pedas-pasar-borong-bt-berendam', 4, 1.533),
+('friday-pasar-malam-malim-jaya', 'gerbang-malam-pasar-borong', 5, 1.591),
+('carbooth-pantai-klebang', 'klebang-night-market', 1, 0.680),
+('carbooth-pantai-klebang', 'monday-pasar-malam-tanjung-kling', 2, 1.828),
+('carbooth-pantai-klebang', 'sunday-pasar-malam-pantai-puteri', 3, 4.790),
+('carbooth-pantai-klebang', 'pasar-mini-malam-jaya', 4, 5.107),
+('carbooth-pantai-klebang', 'malim-night-market-food-street', 5, 5.352),
+('saturday-pasar-malam-bukit-baru', 'thursday-pasar-malam', 1, 0.763),
+('saturday-pasar-malam-bukit-baru', 'monday-pasar-malam-bukit-baru', 2, 1.108),
+('saturday-pasar-malam-bukit-baru', 'pasaraya-megamart-bukit-baru', 3, 1.228),
+('saturday-pasar-malam-bukit-baru', 'friday-pasar-malam-merak-mas', 4, 1.705),
+('saturday-pasar-malam-bukit-baru', 'monday-pasar-malam-bukit-beruang', 5, 2.268),
+('pasar-malam-tangga-batu-jumaat', 'sunday-pasar-malam-pantai-puteri', 1, 2.566),
+('pasar-malam-tangga-batu-jumaat', 'monday-pasar-malam-tanjung-kling', 2, 4.275),
+('pasar-malam-tangga-batu-jumaat', 'carbooth-pantai-klebang', 3, 5.743),
+('pasar-malam-tangga-batu-jumaat', 'klebang-night-market', 4, 6.348),
+('pasar-malam-tangga-batu-jumaat', 'saturday-pasar-malam-cheng-hari-sabtu', 5, 7.335),
+('monday-pasar-malam-tanjung-kling', 'carbooth-pantai-klebang', 1, 1.828),
+('monday-pasar-malam-tanjung-kling', 'klebang-night-market', 2, 2.507),
+('monday-pasar-malam-tanjung-kling', 'sunday-pasar-malam-pantai-puteri', 3, 2.972),
+('monday-pasar-malam-tanjung-kling', 'pasar-malam-tangga-batu-jumaat', 4, 4.275),
+('monday-pasar-malam-tanjung-kling', 'pasar-mini-malam-jaya', 5, 6.707),
+('wednesday-pasar-malam-bukit-beruang', 'monday-pasar-malam-bukit-beruang', 1, 0.183),
+('wednesday-pasar-malam-bukit-beruang', 'pasar-bukit-beruang', 2, 0.294),
+('wednesday-pasar-malam-bukit-beruang', 'pasar-malam-melaka-baru', 3, 1.941),
+('wednesday-pasar-malam-bukit-beruang', 'pasar-basah-ayer-keroh', 4, 2.134),
+('wednesday-pasar-malam-bukit-beruang', 'saturday-pasar-malam-bukit-baru', 5, 2.450),
+('gerbang-malam-pasar-borong', 'asam-pedas-pasar-borong-bt-berendam', 1, 0.072),
+('gerbang-malam-pasar-borong', 'friday-pasar-malam-malim-jaya', 2, 1.591),
+('gerbang-malam-pasar-borong', 'malim-market', 3, 1.698),
+('gerbang-malam-pasar-borong', 'malim-night-market-food-street', 4, 1.782),
+('gerbang-malam-pasar-borong', 'pasar-mini-malam-jaya', 5, 2.289),
+('monday-pasar-malam-bukit-baru', 'pasaraya-megamart-bukit-baru', 1, 0.124),
+('monday-pasar-malam-bukit-baru', 'thursday-pasar-malam', 2, 0.430),
+('monday-pasar-malam-bukit-baru', 'saturday-pasar-malam-bukit-baru', 3, 1.108),
+('monday-pasar-malam-bukit-baru', 'pasar-ramadhan-2021-semabok-perdana', 4, 1.471),
+('monday-pasar-malam-bukit-baru', 'pasar-malam-pantai-peringgit', 5, 2.073),
+('tuesday-pasar-malam-ujong-pasir', 'wednesday-pasar-malam-semabok', 1, 1.026),
+('tuesday-pasar-malam-ujong-pasir', 'sunday-pasar-malam-bandar-hilir', 2, 1.532),
+('tuesday-pasar-malam-ujong-pasir', 'pasar-ramadhan-2021-semabok-perdana', 3, 1.713),
+('tuesday-pasar-malam-ujong-pasir', 'street-market-pantai-eye-on-melaka', 4, 2.448),
+('tuesday-pasar-malam-ujong-pasir', 'dataran-pahlawan-melaka-megamall', 5, 2.635),
+('monday-pasar-malam-bukit-beruang', 'wednesday-pasar-malam-bukit-beruang', 1, 0.183),
+('monday-pasar-malam-bukit-beruang', 'pasar-bukit-beruang', 2, 0.272),
+('monday-pasar-malam-bukit-beruang', 'pasar-malam-melaka-baru', 3, 1.933),
+('monday-pasar-malam-bukit-beruang', 'pasar-basah-ayer-keroh', 4, 2.124),
+('monday-pasar-malam-bukit-beruang', 'saturday-pasar-malam-bukit-baru', 5, 2.268),
+('tuesday-pasar-malam-duyong', 'pasar-tani-ayer-molek-melaka', 1, 0.683),
+('tuesday-pasar-malam-duyong', 'thursday-pasar-malam-ayer-molek', 2, 0.730),
+('tuesday-pasar-malam-duyong', 'friday-pasar-malam-merak-mas', 3, 3.661),
+('tuesday-pasar-malam-duyong', 'wednesday-pasar-malam-semabok', 4, 3.752),
+('tuesday-pasar-malam-duyong', 'pasar-ramadhan-2021-semabok-perdana', 5, 4.324),
+('saturday-pasar-malam-cheng-hari-sabtu', 'monday-pasar-malam-taman-sri-krubong', 1, 2.341),
+('saturday-pasar-malam-cheng-hari-sabtu', 'tapak-2-pasar-malam-pata-rumput-perdana', 2, 2.878),
+('saturday-pasar-malam-cheng-hari-sabtu', 'asam-pedas-pasar-borong-bt-berendam', 3, 3.274),
+('saturday-pasar-malam-cheng-hari-sabtu', 'gerbang-malam-pasar-borong', 4, 3.310),
+('saturday-pasar-malam-cheng-hari-sabtu', 'friday-pasar-malam-malim-jaya', 5, 3.787),
+('uptown-teja-night-market', 'roti-daging-taman-cempaka', 1, 0.108),
+('uptown-teja-night-market', 'pasar-malam-pantai-peringgit', 2, 0.669),
+('uptown-teja-night-market', 'kipmall-melaka', 3, 1.674),
+('uptown-teja-night-market', 'pasar-malam-melaka-baru', 4, 2.150),
+('uptown-teja-night-market', 'jonker-street-night-market-street-food', 5, 2.398),
+('friday-pasar-malam-telok-emas', 'monday-pasar-malam-telok-emas', 1, 1.899),
+('friday-pasar-malam-telok-emas', 'taufufah-by-jamak-soy-specialist', 2, 1.957),
+('friday-pasar-malam-telok-emas', 'tuesday-pasar-malam-duyong', 3, 4.385),
+('friday-pasar-malam-telok-emas', 'pasar-tani-ayer-molek-melaka', 4, 4.549),
+('friday-pasar-malam-telok-emas', 'thursday-pasar-malam-ayer-molek', 5, 4.629),
+('wednesday-pasar-malam-semabok', 'tuesday-pasar-malam-ujong-pasir', 1, 1.026),
+('wednesday-pasar-malam-semabok', 'pasar-ramadhan-2021-semabok-perdana', 2, 1.055),
+('wednesday-pasar-malam-semabok', 'sunday-pasar-malam-bandar-hilir', 3, 2.080),
+('wednesday-pasar-malam-semabok', 'pasaraya-megamart-bukit-baru', 4, 2.331),
+('wednesday-pasar-malam-semabok', 'monday-pasar-malam-bukit-baru', 5, 2.425),
+('machap-umboopasar-malam', 'alor-gajah-market', 1, 7.287),
+('machap-umboopasar-malam', 'wednesday-pasar-malam-durian-tunggal', 2, 7.775),
+('machap-umboopasar-malam', 'pasar-malam-rumbia', 3, 9.739),
+('machap-umboopasar-malam', 'pasar-malam-bandar-satelit-sebang', 4, 9.938),
+('machap-umboopasar-malam', 'night-market-rembia', 5, 10.577),
+('alor-gajah-market', 'pasar-malam-rumbia', 1, 5.912),
+('alor-gajah-market', 'machap-umboopasar-malam', 2, 7.287),
+('alor-gajah-market', 'night-market-rembia', 3, 8.113),
+('alor-gajah-market', 'pasar-malam-bandar-satelit-sebang', 4, 9.511),
+('alor-gajah-market', 'tapak-2-pasar-malam-pata-rumput-perdana', 5, 9.650),
+('saturday-pasar-malam-kota-laksamana', 'jonker-avenue-satay-jonker-walk-muslim', 1, 0.357),
+('saturday-pasar-malam-kota-laksamana', 'chen-jia-xie-rou-bao-crab-burger-jonker-street-ji-chang-jie', 2, 0.363),
+('saturday-pasar-malam-kota-laksamana', 'dong-chuan-bo-bing-ji-chang-jie-sushi-popiah-jonker-walk', 3, 0.365),
+('saturday-pasar-malam-kota-laksamana', 'jonker-street-night-market-street-food', 4, 0.375),
+('saturday-pasar-malam-kota-laksamana', 'jonker-walk-melaka', 5, 0.462),
+('pasar-malam-taman-maju-rabu', 'car-boot-salerisda-jasin', 1, 1.357),
+('pasar-malam-taman-maju-rabu', 'tangkak-morning-market', 2, 13.190),
+('pasar-malam-taman-maju-rabu', 'tangkak-market', 3, 13.868),
+('pasar-malam-taman-maju-rabu', 'merlimau-night-market', 4, 14.568),
+('pasar-malam-taman-maju-rabu', 'pasar-malam-kampung-batu-china', 5, 14.957),
+('friday-pasar-malam-merak-mas', 'saturday-pasar-malam-bukit-baru', 1, 1.705),
+('friday-pasar-malam-merak-mas', 'thursday-pasar-malam', 2, 2.252),
+('friday-pasar-malam-merak-mas', 'pasar-basah-ayer-keroh', 3, 2.407),
+('friday-pasar-malam-merak-mas', 'monday-pasar-malam-bukit-baru', 4, 2.678),
+('friday-pasar-malam-merak-mas', 'pasar-bukit-beruang', 5, 2.710),
+('sunday-pasar-malam-bandar-hilir', 'dataran-pahlawan-melaka-megamall', 1, 1.134),
+('sunday-pasar-malam-bandar-hilir', 'uptown-pahlawan-walk-banda-hilir', 2, 1.288),
+('sunday-pasar-malam-bandar-hilir', 'lorongvape-enterprise', 3, 1.313),
+('sunday-pasar-malam-bandar-hilir', 'uptown-banda-hilir-melaka', 4, 1.397),
+('sunday-pasar-malam-bandar-hilir', 'street-market-pantai-eye-on-melaka', 5, 1.419),
+('wednesday-pasar-malam-durian-tunggal', 'monday-pasar-malam-taman-sri-krubong', 1, 6.619),
+('wednesday-pasar-malam-durian-tunggal', 'pasar-basah-ayer-keroh', 2, 7.135),
+('wednesday-pasar-malam-durian-tunggal', 'night-market-rembia', 3, 7.167),
+('wednesday-pasar-malam-durian-tunggal', 'tapak-2-pasar-malam-pata-rumput-perdana', 4, 7.744),
+('wednesday-pasar-malam-durian-tunggal', 'pasar-bukit-beruang', 5, 7.747),
+('sunday-pasar-malam-pantai-puteri', 'pasar-malam-tangga-batu-jumaat', 1, 2.566),
+('sunday-pasar-malam-pantai-puteri', 'monday-pasar-malam-tanjung-kling', 2, 2.972),
+('sunday-pasar-malam-pantai-puteri', 'carbooth-pantai-klebang', 3, 4.790),
+('sunday-pasar-malam-pantai-puteri', 'klebang-night-market', 4, 5.469),
+('sunday-pasar-malam-pantai-puteri', 'saturday-pasar-malam-cheng-hari-sabtu', 5, 8.674),
+('night-market-rembia', 'tapak-2-pasar-malam-pata-rumput-perdana', 1, 1.590),
+('night-market-rembia', 'pasar-malam-rumbia', 2, 2.401),
+('night-market-rembia', 'monday-pasar-malam-taman-sri-krubong', 3, 4.043),
+('night-market-rembia', 'saturday-pasar-malam-cheng-hari-sabtu', 4, 4.443),
+('night-market-rembia', 'gerbang-malam-pasar-borong', 5, 6.769),
+('tapak-2-pasar-malam-pata-rumput-perdana', 'night-market-rembia', 1, 1.590),
+('tapak-2-pasar-malam-pata-rumput-perdana', 'saturday-pasar-malam-cheng-hari-sabtu', 2, 2.878),
+('tapak-2-pasar-malam-pata-rumput-perdana', 'monday-pasar-malam-taman-sri-krubong', 3, 3.000),
+('tapak-2-pasar-malam-pata-rumput-perdana', 'pasar-malam-rumbia', 4, 3.803),
+('tapak-2-pasar-malam-pata-rumput-perdana', 'asam-pedas-pasar-borong-bt-berendam', 5, 5.498),
+('klebang-night-market', 'carbooth-pantai-klebang', 1, 0.680),
+('klebang-night-market', 'monday-pasar-malam-tanjung-kling', 2, 2.507),
+('klebang-night-market', 'pasar-mini-malam-jaya', 3, 4.571),
+('klebang-night-market', 'malim-night-market-food-street', 4, 4.859),
+('klebang-night-market', 'malim-market', 5, 4.992),
+('pasar-malam-rumbia', 'night-market-rembia', 1, 2.401),
+('pasar-malam-rumbia', 'tapak-2-pasar-malam-pata-rumput-perdana', 2, 3.803),
+('pasar-malam-rumbia', 'alor-gajah-market', 3, 5.912),
+('pasar-malam-rumbia', 'monday-pasar-malam-taman-sri-krubong', 4, 6.442),
+('pasar-malam-rumbia', 'saturday-pasar-malam-cheng-hari-sabtu', 5, 6.661),
+('monday-pasar-malam-tanjung-bidara', 'pasar-malam-pengkalan-balak', 1, 3.478),
+('monday-pasar-malam-tanjung-bidara', 'pasar-malam-masjid-tanah', 2, 6.081),
+('monday-pasar-malam-tanjung-bidara', 'pasar-malam-tangga-batu-jumaat', 3, 8.989),
+('monday-pasar-malam-tanjung-bidara', 'sunday-pasar-malam-pantai-puteri', 4, 10.403),
+('monday-pasar-malam-tanjung-bidara', 'monday-pasar-malam-tanjung-kling', 5, 13.087),
+('thursday-pasar-malam', 'monday-pasar-malam-bukit-baru', 1, 0.430),
+('thursday-pasar-malam', 'pasaraya-megamart-bukit-baru', 2, 0.526),
+('thursday-pasar-malam', 'saturday-pasar-malam-bukit-baru', 3, 0.763),
+('thursday-pasar-malam', 'pasar-ramadhan-2021-semabok-perdana', 4, 1.666),
+('thursday-pasar-malam', 'friday-pasar-malam-merak-mas', 5, 2.252),
+('lorongvape-enterprise', 'lao-zi-hao-fried-carrot-cake-and-fried-oyster-with-egg', 1, 0.192),
+('lorongvape-enterprise', 'vegetarian-stinky-fried-tofu-jonker-walk-night-market-su-shi-chou-dou-fu-ma-liu-jia-wen-hua-jie-ye-shi', 2, 0.248),
+('lorongvape-enterprise', 'bao-hao-he-bao-hao-he-jonker', 3, 0.270),
+('lorongvape-enterprise', 'jonker-walk-melaka', 4, 0.331),
+('lorongvape-enterprise', 'dong-chuan-bo-bing-ji-chang-jie-sushi-popiah-jonker-walk', 5, 0.473),
+('malim-night-market-food-street', 'malim-market', 1, 0.146),
+('malim-night-market-food-street', 'friday-pasar-malam-malim-jaya', 2, 0.195),
+('malim-night-market-food-street', 'pasar-mini-malam-jaya', 3, 0.556),
+('malim-night-market-food-street', 'asam-pedas-pasar-borong-bt-berendam', 4, 1.723),
+('malim-night-market-food-street', 'gerbang-malam-pasar-borong', 5, 1.782),
+('pasar-malam-masjid-tanah', 'pasar-malam-pengkalan-balak', 1, 3.966),
+('pasar-malam-masjid-tanah', 'monday-pasar-malam-tanjung-bidara', 2, 6.081),
+('pasar-malam-masjid-tanah', 'pasar-malam-rumbia', 3, 10.974),
+('pasar-malam-masjid-tanah', 'pasar-malam-tangga-batu-jumaat', 4, 11.548),
+('pasar-malam-masjid-tanah', 'alor-gajah-market', 5, 11.600),
+('merlimau-night-market', 'pasar-malam-bukit-serkam', 1, 5.396),
+('merlimau-night-market', 'friday-pasar-malam-telok-emas', 2, 10.608),
+('merlimau-night-market', 'monday-pasar-malam-telok-emas', 3, 12.095),
+('merlimau-night-market', 'taufufah-by-jamak-soy-specialist', 4, 12.166),
+('merlimau-night-market', 'pasar-tani-ayer-molek-melaka', 5, 13.642),
+('monday-pasar-malam-telok-emas', 'taufufah-by-jamak-soy-specialist', 1, 0.071),
+('monday-pasar-malam-telok-emas', 'friday-pasar-malam-telok-emas', 2, 1.899),
+('monday-pasar-malam-telok-emas', 'tuesday-pasar-malam-duyong', 3, 4.771),
+('monday-pasar-malam-telok-emas', 'pasar-tani-ayer-molek-melaka', 4, 5.176),
+('monday-pasar-malam-telok-emas', 'thursday-pasar-malam-ayer-molek', 5, 5.257),
+('street-market-pantai-eye-on-melaka', 'dataran-pahlawan-melaka-megamall', 1, 1.113),
+('street-market-pantai-eye-on-melaka', 'uptown-pahlawan-walk-banda-hilir', 2, 1.167),
+('street-market-pantai-eye-on-melaka', 'uptown-banda-hilir-melaka', 3, 1.234),
+('street-market-pantai-eye-on-melaka', 'uptown-pahlawan-walk', 4, 1.346),
+('street-market-pantai-eye-on-melaka', 'sunday-pasar-malam-bandar-hilir', 5, 1.419),
+('uptown-pahlawan-walk', 'uptown-banda-hilir-melaka', 1, 0.149),
+('uptown-pahlawan-walk', 'uptown-pahlawan-walk-banda-hilir', 2, 0.261),
+('uptown-pahlawan-walk', 'dataran-pahlawan-melaka-megamall', 3, 0.412),
+('uptown-pahlawan-walk', 'vegetarian-stinky-fried-tofu-jonker-walk-night-market-su-shi-chou-dou-fu-ma-liu-jia-wen-hua-jie-ye-shi', 4, 0.528),
+('uptown-pahlawan-walk', 'bao-hao-he-bao-hao-he-jonker', 5, 0.562),
+('pasar-ramadhan-2021-semabok-perdana', 'wednesday-pasar-malam-semabok', 1, 1.055),
+('pasar-ramadhan-2021-semabok-perdana', 'pasaraya-megamart-bukit-baru', 2, 1.360),
+('pasar-ramadhan-2021-semabok-perdana', 'monday-pasar-malam-bukit-baru', 3, 1.471),
+('pasar-ramadhan-2021-semabok-perdana', 'thursday-pasar-malam', 4, 1.666),
+('pasar-ramadhan-2021-semabok-perdana', 'tuesday-pasar-malam-ujong-pasir', 5, 1.713),
+('monday-pasar-malam-taman-sri-krubong', 'saturday-pasar-malam-cheng-hari-sabtu', 1, 2.341),
+('monday-pasar-malam-taman-sri-krubong', 'gerbang-malam-pasar-borong', 2, 2.795),
+('monday-pasar-malam-taman-sri-krubong', 'asam-pedas-pasar-borong-bt-berendam', 3, 2.812),
+('monday-pasar-malam-taman-sri-krubong', 'tapak-2-pasar-malam-pata-rumput-perdana', 4, 3.000),
+('monday-pasar-malam-taman-sri-krubong', 'night-market-rembia', 5, 4.043),
+('malim-market', 'friday-pasar-malam-malim-jaya', 1, 0.130),
+('malim-market', 'malim-night-market-food-street', 2, 0.146),
+('malim-market', 'pasar-mini-malam-jaya', 3, 0.597),
+('malim-market', 'asam-pedas-pasar-borong-bt-berendam', 4, 1.642),
+('malim-market', 'gerbang-malam-pasar-borong', 5, 1.698),
+('chen-jia-xie-rou-bao-crab-burger-jonker-street-ji-chang-jie', 'jonker-avenue-satay-jonker-walk-muslim', 1, 0.008),
+('chen-jia-xie-rou-bao-crab-burger-jonker-street-ji-chang-jie', 'dong-chuan-bo-bing-ji-chang-jie-sushi-popiah-jonker-walk', 2, 0.009),
+('chen-jia-xie-rou-bao-crab-burger-jonker-street-ji-chang-jie', 'jonker-street-night-market-street-food', 3, 0.064),
+('chen-jia-xie-rou-bao-crab-burger-jonker-street-ji-chang-jie', 'jonker-walk-melaka', 4, 0.187),
+('chen-jia-xie-rou-bao-crab-burger-jonker-street-ji-chang-jie', 'bao-hao-he-bao-hao-he-jonker', 5, 0.279),
+('roti-daging-taman-cempaka', 'uptown-teja-night-market', 1, 0.108),
+('roti-daging-taman-cempaka', 'pasar-malam-pantai-peringgit', 2, 0.704),
+('roti-daging-taman-cempaka', 'kipmall-melaka', 3, 1.770),
+('roti-daging-taman-cempaka', 'pasar-malam-melaka-baru', 4, 2.231),
+('roti-daging-taman-cempaka', 'jonker-street-night-market-street-food', 5, 2.310),
+('jonker-street-night-market-street-food', 'chen-jia-xie-rou-bao-crab-burger-jonker-street-ji-chang-jie', 1, 0.064),
+('jonker-street-night-market-street-food', 'jonker-avenue-satay-jonker-walk-muslim', 2, 0.070),
+('jonker-street-night-market-street-food', 'dong-chuan-bo-bing-ji-chang-jie-sushi-popiah-jonker-walk', 3, 0.073),
+('jonker-street-night-market-street-food', 'jonker-walk-melaka', 4, 0.247),
+('jonker-street-night-market-street-food', 'lao-zi-hao-fried-carrot-cake-and-fried-oyster-with-egg', 5, 0.328),
+('lao-zi-hao-fried-carrot-cake-and-fried-oyster-with-egg', 'bao-hao-he-bao-hao-he-jonker', 1, 0.157),
+('lao-zi-hao-fried-carrot-cake-and-fried-oyster-with-egg', 'jonker-walk-melaka', 2, 0.168),
+('lao-zi-hao-fried-carrot-cake-and-fried-oyster-with-egg', 'vegetarian-stinky-fried-tofu-jonker-walk-night-market-su-shi-chou-dou-fu-ma-liu-jia-wen-hua-jie-ye-shi', 3, 0.183),
+('lao-zi-hao-fried-carrot-cake-and-fried-oyster-with-egg', 'lorongvape-enterprise', 4, 0.192),
+('lao-zi-hao-fried-carrot-cake-and-fried-oyster-with-egg', 'dong-chuan-bo-bing-ji-chang-jie-sushi-popiah-jonker-walk', 5, 0.283),
+('vegetarian-stinky-fried-tofu-jonker-walk-night-market-su-shi-chou-dou-fu-ma-liu-jia-wen-hua-jie-ye-shi', 'bao-hao-he-bao-hao-he-jonker', 1, 0.060),
+('vegetarian-stinky-fried-tofu-jonker-walk-night-market-su-shi-chou-dou-fu-ma-liu-jia-wen-hua-jie-ye-shi', 'jonker-walk-melaka', 2, 0.151),
+('vegetarian-stinky-fried-tofu-jonker-walk-night-market-su-shi-chou-dou-fu-ma-liu-jia-wen-hua-jie-ye-shi', 'lao-zi-hao-fried-carrot-cake-and-fried-oyster-with-egg', 3, 0.183),
+('vegetarian-stinky-fried-tofu-jonker-walk-night-market-su-shi-chou-dou-fu-ma-liu-jia-wen-hua-jie-ye-shi', 'lorongvape-enterprise', 4, 0.248),
+('vegetarian-stinky-fried-tofu-jonker-walk-night-market-su-shi-chou-dou-fu-ma-liu-jia-wen-hua-jie-ye-shi', 'dong-chuan-bo-bing-ji-chang-jie-sushi-popiah-jonker-walk', 5, 0.329),
+('jonker-avenue-satay-jonker-walk-muslim', 'chen-jia-xie-rou-bao-crab-burger-jonker-street-ji-chang-jie', 1, 0.008),
+('jonker-avenue-satay-jonker-walk-muslim', 'dong-chuan-bo-bing-ji-chang-jie-sushi-popiah-jonker-walk', 2, 0.009),
+('jonker-avenue-satay-jonker-walk-muslim', 'jonker-street-night-market-street-food', 3, 0.070),
+('jonker-avenue-satay-jonker-walk-muslim', 'jonker-walk-melaka', 4, 0.185),
+('jonker-avenue-satay-jonker-walk-muslim', 'bao-hao-he-bao-hao-he-jonker', 5, 0.276),
+('bao-hao-he-bao-hao-he-jonker', 'vegetarian-stinky-fried-tofu-jonker-walk-night-market-su-shi-chou-dou-fu-ma-liu-jia-wen-hua-jie-ye-shi', 1, 0.060),
+('bao-hao-he-bao-hao-he-jonker', 'jonker-walk-melaka', 2, 0.092),
+('bao-hao-he-bao-hao-he-jonker', 'lao-zi-hao-fried-carrot-cake-and-fried-oyster-with-egg', 3, 0.157),
+('bao-hao-he-bao-hao-he-jonker', 'dong-chuan-bo-bing-ji-chang-jie-sushi-popiah-jonker-walk', 4, 0.269),
+('bao-hao-he-bao-hao-he-jonker', 'lorongvape-enterprise', 5, 0.270),
+('dong-chuan-bo-bing-ji-chang-jie-sushi-popiah-jonker-walk', 'jonker-avenue-satay-jonker-walk-muslim', 1, 0.009),
+('dong-chuan-bo-bing-ji-chang-jie-sushi-popiah-jonker-walk', 'chen-jia-xie-rou-bao-crab-burger-jonker-street-ji-chang-jie', 2, 0.009),
+('dong-chuan-bo-bing-ji-chang-jie-sushi-popiah-jonker-walk', 'jonker-street-night-market-street-food', 3, 0.073),
+('dong-chuan-bo-bing-ji-chang-jie-sushi-popiah-jonker-walk', 'jonker-walk-melaka', 4, 0.178),
+('dong-chuan-bo-bing-ji-chang-jie-sushi-popiah-jonker-walk', 'bao-hao-he-bao-hao-he-jonker', 5, 0.269),
+('pasar-bukit-beruang', 'monday-pasar-malam-bukit-beruang', 1, 0.272),
+('pasar-bukit-beruang', 'wednesday-pasar-malam-bukit-beruang', 2, 0.294),
+('pasar-bukit-beruang', 'pasar-basah-ayer-keroh', 3, 1.860),
+('pasar-bukit-beruang', 'pasar-malam-melaka-baru', 4, 2.200),
+('pasar-bukit-beruang', 'saturday-pasar-malam-bukit-baru', 5, 2.364),
+('pasar-basah-ayer-keroh', 'pasar-bukit-beruang', 1, 1.860),
+('pasar-basah-ayer-keroh', 'monday-pasar-malam-bukit-beruang', 2, 2.124),
+('pasar-basah-ayer-keroh', 'wednesday-pasar-malam-bukit-beruang', 3, 2.134),
+('pasar-basah-ayer-keroh', 'friday-pasar-malam-merak-mas', 4, 2.407),
+('pasar-basah-ayer-keroh', 'saturday-pasar-malam-bukit-baru', 5, 3.222),
+('kipmall-melaka', 'pasar-malam-melaka-baru', 1, 0.675),
+('kipmall-melaka', 'pasar-malam-pantai-peringgit', 2, 1.315),
+('kipmall-melaka', 'uptown-teja-night-market', 3, 1.674),
+('kipmall-melaka', 'roti-daging-taman-cempaka', 4, 1.770),
+('kipmall-melaka', 'malim-market', 5, 1.954),
+('pasar-malam-pantai-peringgit', 'uptown-teja-night-market', 1, 0.669),
+('pasar-malam-pantai-peringgit', 'roti-daging-taman-cempaka', 2, 0.704),
+('pasar-malam-pantai-peringgit', 'kipmall-melaka', 3, 1.315),
+('pasar-malam-pantai-peringgit', 'pasar-malam-melaka-baru', 4, 1.629),
+('pasar-malam-pantai-peringgit', 'monday-pasar-malam-bukit-baru', 5, 2.073),
+('pasar-mini-malam-jaya', 'malim-night-market-food-street', 1, 0.556),
+('pasar-mini-malam-jaya', 'malim-market', 2, 0.597),
+('pasar-mini-malam-jaya', 'friday-pasar-malam-malim-jaya', 3, 0.718),
+('pasar-mini-malam-jaya', 'kipmall-melaka', 4, 2.036),
+('pasar-mini-malam-jaya', 'asam-pedas-pasar-borong-bt-berendam', 5, 2.235),
+('pasar-malam-bandar-satelit-sebang', 'pasar-malam-tampin', 1, 1.882),
+('pasar-malam-bandar-satelit-sebang', 'pasar-malam-taman-indah', 2, 2.013),
+('pasar-malam-bandar-satelit-sebang', 'alor-gajah-market', 3, 9.511),
+('pasar-malam-bandar-satelit-sebang', 'machap-umboopasar-malam', 4, 9.938),
+('pasar-malam-bandar-satelit-sebang', 'pasar-malam-air-mawang', 5, 10.402),
+('uptown-banda-hilir-melaka', 'uptown-pahlawan-walk-banda-hilir', 1, 0.112),
+('uptown-banda-hilir-melaka', 'uptown-pahlawan-walk', 2, 0.149),
+('uptown-banda-hilir-melaka', 'dataran-pahlawan-melaka-megamall', 3, 0.266),
+('uptown-banda-hilir-melaka', 'vegetarian-stinky-fried-tofu-jonker-walk-night-market-su-shi-chou-dou-fu-ma-liu-jia-wen-hua-jie-ye-shi', 4, 0.555),
+('uptown-banda-hilir-melaka', 'bao-hao-he-bao-hao-he-jonker', 5, 0.600),
+('uptown-pahlawan-walk-banda-hilir', 'uptown-banda-hilir-melaka', 1, 0.112),
+('uptown-pahlawan-walk-banda-hilir', 'dataran-pahlawan-melaka-megamall', 2, 0.155),
+('uptown-pahlawan-walk-banda-hilir', 'uptown-pahlawan-walk', 3, 0.261),
+('uptown-pahlawan-walk-banda-hilir', 'vegetarian-stinky-fried-tofu-jonker-walk-night-market-su-shi-chou-dou-fu-ma-liu-jia-wen-hua-jie-ye-shi', 4, 0.585),
+('uptown-pahlawan-walk-banda-hilir', 'bao-hao-he-bao-hao-he-jonker', 5, 0.637),
+('pasar-tani-ayer-molek-melaka', 'thursday-pasar-malam-ayer-molek', 1, 0.082),
+('pasar-tani-ayer-molek-melaka', 'tuesday-pasar-malam-duyong', 2, 0.683),
+('pasar-tani-ayer-molek-melaka', 'friday-pasar-malam-merak-mas', 3, 3.592),
+('pasar-tani-ayer-molek-melaka', 'wednesday-pasar-malam-semabok', 4, 4.325),
+('pasar-tani-ayer-molek-melaka', 'friday-pasar-malam-telok-emas', 5, 4.549),
+('dataran-pahlawan-melaka-megamall', 'uptown-pahlawan-walk-banda-hilir', 1, 0.155),
+('dataran-pahlawan-melaka-megamall', 'uptown-banda-hilir-melaka', 2, 0.266),
+('dataran-pahlawan-melaka-megamall', 'uptown-pahlawan-walk', 3, 0.412),
+('dataran-pahlawan-melaka-megamall', 'vegetarian-stinky-fried-tofu-jonker-walk-night-market-su-shi-chou-dou-fu-ma-liu-jia-wen-hua-jie-ye-shi', 4, 0.632),
+('dataran-pahlawan-melaka-megamall', 'bao-hao-he-bao-hao-he-jonker', 5, 0.689),
+('pasar-malam-pengkalan-balak', 'monday-pasar-malam-tanjung-bidara', 1, 3.478),
+('pasar-malam-pengkalan-balak', 'pasar-malam-masjid-tanah', 2, 3.966),
+('pasar-malam-pengkalan-balak', 'pasar-malam-tangga-batu-jumaat', 3, 11.747),
+('pasar-malam-pengkalan-balak', 'sunday-pasar-malam-pantai-puteri', 4, 13.501),
+('pasar-malam-pengkalan-balak', 'pasar-malam-rumbia', 5, 14.192),
+('asam-pedas-pasar-borong-bt-berendam', 'gerbang-malam-pasar-borong', 1, 0.072),
+('asam-pedas-pasar-borong-bt-berendam', 'friday-pasar-malam-malim-jaya', 2, 1.533),
+('asam-pedas-pasar-borong-bt-berendam', 'malim-market', 3, 1.642),
+('asam-pedas-pasar-borong-bt-berendam', 'malim-night-market-food-street', 4, 1.723),
+('asam-pedas-pasar-borong-bt-berendam', 'pasar-mini-malam-jaya', 5, 2.235),
+('jonker-walk-melaka', 'bao-hao-he-bao-hao-he-jonker', 1, 0.092),
+('jonker-walk-melaka', 'vegetarian-stinky-fried-tofu-jonker-walk-night-market-su-shi-chou-dou-fu-ma-liu-jia-wen-hua-jie-ye-shi', 2, 0.151),
+('jonker-walk-melaka', 'lao-zi-hao-fried-carrot-cake-and-fried-oyster-with-egg', 3, 0.168),
+('jonker-walk-melaka', 'dong-chuan-bo-bing-ji-chang-jie-sushi-popiah-jonker-walk', 4, 0.178),
+('jonker-walk-melaka', 'jonker-avenue-satay-jonker-walk-muslim', 5, 0.185),
+('taufufah-by-jamak-soy-specialist', 'monday-pasar-malam-telok-emas', 1, 0.071),
+('taufufah-by-jamak-soy-specialist', 'friday-pasar-malam-telok-emas', 2, 1.957),
+('taufufah-by-jamak-soy-specialist', 'tuesday-pasar-malam-duyong', 3, 4.757),
+('taufufah-by-jamak-soy-specialist', 'pasar-tani-ayer-molek-melaka', 4, 5.170),
+('taufufah-by-jamak-soy-specialist', 'thursday-pasar-malam-ayer-molek', 5, 5.251),
+('pasar-malam-bukit-serkam', 'merlimau-night-market', 1, 5.396),
+('pasar-malam-bukit-serkam', 'friday-pasar-malam-telok-emas', 2, 6.183),
+('pasar-malam-bukit-serkam', 'monday-pasar-malam-telok-emas', 3, 7.233),
+('pasar-malam-bukit-serkam', 'taufufah-by-jamak-soy-specialist', 4, 7.301),
+('pasar-malam-bukit-serkam', 'pasar-tani-ayer-molek-melaka', 5, 10.253),
+('pasaraya-megamart-bukit-baru', 'monday-pasar-malam-bukit-baru', 1, 0.124),
+('pasaraya-megamart-bukit-baru', 'thursday-pasar-malam', 2, 0.526),
+('pasaraya-megamart-bukit-baru', 'saturday-pasar-malam-bukit-baru', 3, 1.228),
+('pasaraya-megamart-bukit-baru', 'pasar-ramadhan-2021-semabok-perdana', 4, 1.360),
+('pasaraya-megamart-bukit-baru', 'pasar-malam-pantai-peringgit', 5, 2.080),
+('car-boot-salerisda-jasin', 'pasar-malam-taman-maju-rabu', 1, 1.357),
+('car-boot-salerisda-jasin', 'tangkak-morning-market', 2, 12.601),
+('car-boot-salerisda-jasin', 'tangkak-market', 3, 13.236),
+('car-boot-salerisda-jasin', 'pasar-malam-kampung-batu-china', 4, 14.235),
+('car-boot-salerisda-jasin', 'merlimau-night-market', 5, 15.467),
+('pasar-malam-tampin', 'pasar-malam-bandar-satelit-sebang', 1, 1.882),
+('pasar-malam-tampin', 'pasar-malam-taman-indah', 2, 2.159),
+('pasar-malam-tampin', 'pasar-malam-air-mawang', 3, 9.598),
+('pasar-malam-tampin', 'alor-gajah-market', 4, 10.455),
+('pasar-malam-tampin', 'machap-umboopasar-malam', 5, 11.717),
+('friday-night-market-pasar-malam', 'pasar-malam-desa-cempaka', 1, 0.057),
+('friday-night-market-pasar-malam', 'friday-market-pasar-malam', 2, 0.532),
+('friday-night-market-pasar-malam', 'ayam-gunting-pasar-malam-putra-point-bandar-baru-nilai-hari-isnin', 3, 2.512),
+('friday-night-market-pasar-malam', 'pasar-malam-putra-nilai', 4, 2.690),
+('friday-night-market-pasar-malam', 'dstreetmall-night-market', 5, 3.297),
+('pasar-malam-pasir-panjang', 'pasar-malam-batu-4', 1, 11.678),
+('pasar-malam-pasir-panjang', 'sunday-pasar-malam', 2, 17.576),
+('pasar-malam-pasir-panjang', 'pasar-malam-lukut', 3, 18.018),
+('pasar-malam-pasir-panjang', 'pasar-tani-lukut-econsave', 4, 18.351),
+('pasar-malam-pasir-panjang', 'pasar-malam-pengkalan-balak', 5, 21.202),
+('pasar-malam-batu-4', 'pasar-tani-lukut-econsave', 1, 7.221),
+('pasar-malam-batu-4', 'pasar-malam-lukut', 2, 7.404),
+('pasar-malam-batu-4', 'pasar-malam-pasir-panjang', 3, 11.678),
+('pasar-malam-batu-4', 'sunday-pasar-malam', 4, 16.465),
+('pasar-malam-batu-4', 'pasar-malam-bukit-pelandok', 5, 17.907),
+('pasar-malam-seremban-selatan', 'pasar-malam-senawang-perdana', 1, 2.052),
+('pasar-malam-seremban-selatan', 'pasar-malam-senawang-jaya', 2, 2.903),
+('pasar-malam-seremban-selatan', 'pasar-malam-taman-sri-mawar', 3, 3.474),
+('pasar-malam-seremban-selatan', 'za-bundle', 4, 4.181),
+('pasar-malam-seremban-selatan', 'pasar-malam-rasah-jaya', 5, 4.706),
+('pasar-malam-taman-semarak', 'air-balang-paling-win', 1, 0.293),
+('pasar-malam-taman-semarak', 'banana-shop-gembox-nilai', 2, 2.083),
+('pasar-malam-taman-semarak', 'cendolurve-gembox-nilai', 3, 2.269),
+('pasar-malam-taman-semarak', 'pasar-malam-putra-nilai', 4, 2.442),
+('pasar-malam-taman-semarak', 'ayam-gunting-pasar-malam-putra-point-bandar-baru-nilai-hari-isnin', 5, 2.896),
+('pasar-malam-kuala-pilah', 'pasar-malam-juasseh', 1, 9.373),
+('pasar-malam-kuala-pilah', 'pasar-malam-dangi', 2, 14.354),
+('pasar-malam-kuala-pilah', 'pasar-malam-air-mawang', 3, 20.343),
+('pasar-malam-kuala-pilah', 'pasar-malam-bahau-saturday-night-market', 4, 20.532),
+('pasar-malam-kuala-pilah', 'tapak-pasar-malam-pekan-rembau', 5, 22.180),
+('pasar-malam-senawang-jaya', 'za-bundle', 1, 1.329),
+('pasar-malam-senawang-jaya', 'pasar-malam-taman-sri-mawar', 2, 1.626),
+('pasar-malam-senawang-jaya', 'pasar-malam-seremban-selatan', 3, 2.903),
+('pasar-malam-senawang-jaya', 'pasar-tani-kekal-paroi', 4, 3.734),
+('pasar-malam-senawang-jaya', 'paroi-night-market', 5, 4.072),
+('pasar-malam-gadong', 'pasar-malam-tiara-sendayan', 1, 2.123),
+('pasar-malam-gadong', 'kayaball-station', 2, 2.199),
+('pasar-malam-gadong', 'ayam-gunting-pasar-malam-metro-park-sendayan', 3, 2.210),
+('pasar-malam-gadong', 'cbsxpark-bandar-sri-sendayan', 4, 4.217),
+('pasar-malam-gadong', 'pasar-lambak-the-plazo-s2-heights', 5, 5.454),
+('pasar-malam-lobak-night-market', 'seremban-street-food', 1, 0.772),
+('pasar-malam-lobak-night-market', 'temple-street-night-market', 2, 1.450),
+('pasar-malam-lobak-night-market', 'kechik-putu-mayam', 3, 3.288),
+('pasar-malam-lobak-night-market', 'pasar-malam-ampangan', 4, 3.447),
+('pasar-malam-lobak-night-market', 'taman-blossom-night-market', 5, 4.093),
+('pasar-malam-seremban-2', 'xing-qi-liu-ye-shi', 1, 0.173),
+('pasar-malam-seremban-2', 's2-heights-pasar-malam', 2, 3.228),
+('pasar-malam-seremban-2', 'pasar-lambak-the-plazo-s2-heights', 3, 3.409),
+('pasar-malam-seremban-2', 'pasar-malam-iringan-bayu', 4, 3.750),
+('pasar-malam-seremban-2', 'pasar-malam-medan-nusari', 5, 4.069),
+('pasar-malam-taman-indah', 'pasar-malam-bandar-satelit-sebang', 1, 2.013),
+('pasar-malam-taman-indah', 'pasar-malam-tampin', 2, 2.159),
+('pasar-malam-taman-indah', 'pasar-malam-air-mawang', 3, 8.409),
+('pasar-malam-taman-indah', 'machap-umboopasar-malam', 4, 11.417),
+('pasar-malam-taman-indah', 'alor-gajah-market', 5, 11.522),
+('tapak-pasar-malam-gemencheh', 'tapak-pasar-malam-jelai', 1, 13.648),
+('tapak-pasar-malam-gemencheh', 'pasar-malam-dangi', 2, 15.215),
+('tapak-pasar-malam-gemencheh', 'pasar-malam-air-mawang', 3, 17.907),
+('tapak-pasar-malam-gemencheh', 'pasar-malam-taman-indah', 4, 20.723),
+('tapak-pasar-malam-gemencheh', 'pasar-malam-gemas', 5, 21.990),
+('pasar-malam-kampung-lbj', 'pasar-malam-mercato', 1, 3.710),
+('pasar-malam-kampung-lbj', 'minee-pankek-bandar-enstek', 2, 3.712),
+('pasar-malam-kampung-lbj', 'pasar-malam-marcatocars-boostbdr-enstek', 3, 3.827),
+('pasar-malam-kampung-lbj', 'pasar-malam-tiara-sendayan', 4, 4.088),
+('pasar-malam-kampung-lbj', 'pasar-malam-labu-batu-10', 5, 5.451),
+('sunday-pasar-malam', 'taman-angsa-mas-night-market', 1, 8.265),
+('sunday-pasar-malam', 'pasar-malam-senawang-perdana', 2, 9.231),
+('sunday-pasar-malam', 'pasar-malam-seremban-selatan', 3, 9.612),
+('sunday-pasar-malam', 'pasar-malam-rasah-jaya', 4, 10.141),
+('sunday-pasar-malam', 'pasar-malam-iringan-bayu', 5, 10.497),
+('pasar-malam-chembong', 'bazar-ramadhan-rembau-pasar-malam-rembau', 1, 3.084),
+('pasar-malam-chembong', 'tapak-pasar-malam-pekan-rembau', 2, 3.117),
+('pasar-malam-chembong', 'pasar-malam-senawang-perdana', 3, 9.299),
+('pasar-malam-chembong', 'pasar-malam-seremban-selatan', 4, 11.350),
+('pasar-malam-chembong', 'sunday-pasar-malam', 5, 12.696),
+('pasar-malam-bahau-saturday-night-market', 'pasar-malam-juasseh', 1, 11.534),
+('pasar-malam-bahau-saturday-night-market', 'pasar-malam-kuala-pilah', 2, 20.532),
+('pasar-malam-bahau-saturday-night-market', 'pasar-malam-dangi', 3, 20.732),
+('pasar-malam-bahau-saturday-night-market', 'tapak-pasar-malam-jelai', 4, 20.891),
+('pasar-malam-bahau-saturday-night-market', 'tapak-pasar-malam-gemencheh', 5, 29.803),
+('pasar-malam-senawang-perdana', 'pasar-malam-seremban-selatan', 1, 2.052),
+('pasar-malam-senawang-perdana', 'pasar-malam-senawang-jaya', 2, 4.385),
+('pasar-malam-senawang-perdana', 'pasar-malam-taman-sri-mawar', 3, 5.365),
+('pasar-malam-senawang-perdana', 'za-bundle', 4, 5.712),
+('pasar-malam-senawang-perdana', 'pasar-malam-rasah-jaya', 5, 6.630),
+('pasar-malam-desa-cempaka', 'friday-night-market-pasar-malam', 1, 0.057),
+('pasar-malam-desa-cempaka', 'friday-market-pasar-malam', 2, 0.476),
+('pasar-malam-desa-cempaka', 'ayam-gunting-pasar-malam-putra-point-bandar-baru-nilai-hari-isnin', 3, 2.460),
+('pasar-malam-desa-cempaka', 'pasar-malam-putra-nilai', 4, 2.634),
+('pasar-malam-desa-cempaka', 'cendolurve-gembox-nilai', 5, 3.248),
+('friday-market-pasar-malam', 'pasar-malam-desa-cempaka', 1, 0.476),
+('friday-market-pasar-malam', 'friday-night-market-pasar-malam', 2, 0.532),
+('friday-market-pasar-malam', 'ayam-gunting-pasar-malam-putra-point-bandar-baru-nilai-hari-isnin', 3, 2.068),
+('friday-market-pasar-malam', 'pasar-malam-putra-nilai', 4, 2.192),
+('friday-market-pasar-malam', 'cendolurve-gembox-nilai', 5, 2.837),
+('pasar-malam-bukit-pelandok', 'pasar-malam-taman-murni-isnin', 1, 5.230),
+('pasar-malam-bukit-pelandok', 'pasar-malam-sabtu', 2, 5.366),
+('pasar-malam-bukit-pelandok', 'pasar-malam-sungai-pelek', 3, 8.434),
+('pasar-malam-bukit-pelandok', 'pasar-malam-kampung-lbj', 4, 9.737),
+('pasar-malam-bukit-pelandok', 'pasar-malam-tiara-sendayan', 5, 9.740),
+('xing-qi-liu-ye-shi', 'pasar-malam-seremban-2', 1, 0.173),
+('xing-qi-liu-ye-shi', 's2-heights-pasar-malam', 2, 3.178),
+('xing-qi-liu-ye-shi', 'pasar-lambak-the-plazo-s2-heights', 3, 3.354),
+('xing-qi-liu-ye-shi', 'pasar-malam-iringan-bayu', 4, 3.650),
+('xing-qi-liu-ye-shi', 'pasar-malam-medan-nusari', 5, 3.910),
+('ayam-gunting-pasar-malam-metro-park-sendayan', 'kayaball-station', 1, 0.191),
+('ayam-gunting-pasar-malam-metro-park-sendayan', 'cbsxpark-bandar-sri-sendayan', 2, 2.013),
+('ayam-gunting-pasar-malam-metro-park-sendayan', 'pasar-malam-gadong', 3, 2.210),
+('ayam-gunting-pasar-malam-metro-park-sendayan', 'pasar-malam-tiara-sendayan', 4, 3.861),
+('ayam-gunting-pasar-malam-metro-park-sendayan', 'pasar-lambak-the-plazo-s2-heights', 5, 4.323),
+('pasar-tani-kekal-paroi', 'za-bundle', 1, 3.315),
+('pasar-tani-kekal-paroi', 'pasar-malam-senawang-jaya', 2, 3.734),
+('pasar-tani-kekal-paroi', 'paroi-night-market', 3, 3.952),
+('pasar-tani-kekal-paroi', 'pasar-malam-taman-sri-mawar', 4, 4.876),
+('pasar-tani-kekal-paroi', 'pasar-malam-ampangan', 5, 5.674),
+('pasar-malam-rasah-jaya', 'night-market-taman-rasah-jaya', 1, 0.919),
+('pasar-malam-rasah-jaya', 'taman-blossom-night-market', 2, 2.556),
+('pasar-malam-rasah-jaya', 'pasar-malam-taman-sri-mawar', 3, 3.807),
+('pasar-malam-rasah-jaya', 'taman-angsa-mas-night-market', 4, 4.112),
+('pasar-malam-rasah-jaya', 'pasar-malam-seremban-selatan', 5, 4.706),
+('pasar-malam-taman-sri-mawar', 'za-bundle', 1, 1.601),
+('pasar-malam-taman-sri-mawar', 'pasar-malam-senawang-jaya', 2, 1.626),
+('pasar-malam-taman-sri-mawar', 'taman-blossom-night-market', 3, 3.137),
+('pasar-malam-taman-sri-mawar', 'pasar-malam-seremban-selatan', 4, 3.474),
+('pasar-malam-taman-sri-mawar', 'pasar-malam-ampangan', 5, 3.690),
+('pasar-malam-gemas', 'pasar-malam-taman-koperasi', 1, 12.499),
+('pasar-malam-gemas', 'tapak-pasar-malam-jelai', 2, 15.571),
+('pasar-malam-gemas', 'pasar-awam-jementah', 3, 18.472),
+('pasar-malam-gemas', 'pasar-malam-taman-yayasan', 4, 20.331),
+('pasar-malam-gemas', 'tapak-pasar-malam-gemencheh', 5, 21.990),
+('s2-heights-pasar-malam', 'pasar-lambak-the-plazo-s2-heights', 1, 0.205),
+('s2-heights-pasar-malam', 'pasar-malam-bandar-ainsdale', 2, 2.174),
+('s2-heights-pasar-malam', 'xing-qi-liu-ye-shi', 3, 3.178),
+('s2-heights-pasar-malam', 'pasar-malam-seremban-2', 4, 3.228),
+('s2-heights-pasar-malam', 'kayaball-station', 5, 4.287),
+('paroi-night-market', 'pasar-malam-ampangan', 1, 1.853),
+('paroi-night-market', 'kechik-putu-mayam', 2, 2.009),
+('paroi-night-market', 'pasar-malam-desa-kiara-sikamat', 3, 2.729),
+('paroi-night-market', 'za-bundle', 4, 2.743),
+('paroi-night-market', 'pasar-malam-taman-sri-mawar', 5, 3.711),
+('pasar-malam-bts-rabu', 'pasar-malam-bandar-tasik-kesuma', 1, 6.473),
+('pasar-malam-bts-rabu', 'pasar-malam-ahad-taman-pelangi-semenyih', 2, 8.460),
+('pasar-malam-bts-rabu', 'pasar-malam-sabtusaturday-night-street-market', 3, 10.678),
+('pasar-malam-bts-rabu', 'air-balang-paling-win', 4, 12.816),
+('pasar-malam-bts-rabu', 'pasar-malam-bangla-mbs-buta-kayu', 5, 13.056),
+('taman-blossom-night-market', 'night-market-taman-rasah-jaya', 1, 1.833),
+('taman-blossom-night-market', 'pasar-malam-rasah-jaya', 2, 2.556),
+('taman-blossom-night-market', 'pasar-malam-taman-sri-mawar', 3, 3.137),
+('taman-blossom-night-market', 'kechik-putu-mayam', 4, 3.472),
+('taman-blossom-night-market', 'pasar-malam-ampangan', 5, 3.537),
+('pasar-malam-tiara-sendayan', 'pasar-malam-gadong', 1, 2.123),
+('pasar-malam-tiara-sendayan', 'ayam-gunting-pasar-malam-metro-park-sendayan', 2, 3.861),
+('pasar-malam-tiara-sendayan', 'kayaball-station', 3, 3.933),
+('pasar-malam-tiara-sendayan', 'pasar-malam-kampung-lbj', 4, 4.088),
+('pasar-malam-tiara-sendayan', 'cbsxpark-bandar-sri-sendayan', 5, 5.663),
+('night-market-taman-rasah-jaya', 'pasar-malam-rasah-jaya', 1, 0.919),
+('night-market-taman-rasah-jaya', 'taman-blossom-night-market', 2, 1.833),
+('night-market-taman-rasah-jaya', 'pasar-malam-taman-sri-mawar', 3, 3.856),
+('night-market-taman-rasah-jaya', 'pasar-malam-seremban-2', 4, 4.141),
+('night-market-taman-rasah-jaya', 'xing-qi-liu-ye-shi', 5, 4.300),
+('pasar-malam-bandar-ainsdale', 'pasar-lambak-the-plazo-s2-heights', 1, 2.083),
+('pasar-malam-bandar-ainsdale', 's2-heights-pasar-malam', 2, 2.174),
+('pasar-malam-bandar-ainsdale', 'temple-street-night-market', 3, 4.438),
+('pasar-malam-bandar-ainsdale', 'pasar-malam-lobak-night-market', 4, 5.134),
+('pasar-malam-bandar-ainsdale', 'xing-qi-liu-ye-shi', 5, 5.186),
+('pasar-tani-lukut-econsave', 'pasar-malam-lukut', 1, 1.419),
+('pasar-tani-lukut-econsave', 'pasar-malam-batu-4', 2, 7.221),
+('pasar-tani-lukut-econsave', 'pasar-malam-bukit-pelandok', 3, 10.869),
+('pasar-tani-lukut-econsave', 'pasar-malam-medan-nusari', 4, 12.955),
+('pasar-tani-lukut-econsave', 'pasar-malam-iringan-bayu', 5, 13.406),
+('pasar-malam-lukut', 'pasar-tani-lukut-econsave', 1, 1.419),
+('pasar-malam-lukut', 'pasar-malam-batu-4', 2, 7.404),
+('pasar-malam-lukut', 'pasar-malam-bukit-pelandok', 3, 11.313),
+('pasar-malam-lukut', 'pasar-malam-medan-nusari', 4, 11.825),
+('pasar-malam-lukut', 'pasar-malam-iringan-bayu', 5, 12.147),
+('taman-angsa-mas-night-market', 'pasar-malam-iringan-bayu', 1, 2.961),
+('taman-angsa-mas-night-market', 'pasar-malam-rasah-jaya', 2, 4.112),
+('taman-angsa-mas-night-market', 'night-market-taman-rasah-jaya', 3, 4.442),
+('taman-angsa-mas-night-market', 'pasar-malam-seremban-2', 4, 4.507),
+('taman-angsa-mas-night-market', 'xing-qi-liu-ye-shi', 5, 4.524),
+('cbsxpark-bandar-sri-sendayan', 'ayam-gunting-pasar-malam-metro-park-sendayan', 1, 2.013),
+('cbsxpark-bandar-sri-sendayan', 'kayaball-station', 2, 2.061),
+('cbsxpark-bandar-sri-sendayan', 'pasar-malam-medan-nusari', 3, 2.500),
+('cbsxpark-bandar-sri-sendayan', 'pasar-malam-gadong', 4, 4.217),
+('cbsxpark-bandar-sri-sendayan', 'pasar-lambak-the-plazo-s2-heights', 5, 4.348),
+('pasar-kuala-klawang-jelebu-negeri-sembilan', 'pasar-malam-bts-rabu', 1, 18.590),
+('pasar-kuala-klawang-jelebu-negeri-sembilan', 'pasar-malam-bandar-tasik-kesuma', 2, 23.271),
+('pasar-kuala-klawang-jelebu-negeri-sembilan', 'pasar-malam-ahad-taman-pelangi-semenyih', 3, 23.752),
+('pasar-kuala-klawang-jelebu-negeri-sembilan', 'pasar-malam-simpang-durian', 4, 23.856),
+('pasar-kuala-klawang-jelebu-negeri-sembilan', 'pasar-malam-desa-kiara-sikamat', 5, 24.356),
+('pasar-malam-mercato', 'pasar-malam-marcatocars-boostbdr-enstek', 1, 0.143),
+('pasar-malam-mercato', 'minee-pankek-bandar-enstek', 2, 0.165),
+('pasar-malam-mercato', 'pasar-malam-kuarters-klia-nilai', 3, 2.696),
+('pasar-malam-mercato', 'dstreetmall-night-market', 4, 3.159),
+('pasar-malam-mercato', 'pasar-malam-kampung-lbj', 5, 3.710),
+('pasar-malam-medan-nusari', 'pasar-malam-iringan-bayu', 1, 2.165),
+('pasar-malam-medan-nusari', 'cbsxpark-bandar-sri-sendayan', 2, 2.500),
+('pasar-malam-medan-nusari', 'xing-qi-liu-ye-shi', 3, 3.910),
+('pasar-malam-medan-nusari', 'pasar-malam-seremban-2', 4, 4.069),
+('pasar-malam-medan-nusari', 'ayam-gunting-pasar-malam-metro-park-sendayan', 5, 4.511),
+('pasar-malam-dangi', 'pasar-malam-air-mawang', 1, 12.253),
+('pasar-malam-dangi', 'pasar-malam-kuala-pilah', 2, 14.354),
+('pasar-malam-dangi', 'tapak-pasar-malam-gemencheh', 3, 15.215),
+('pasar-malam-dangi', 'pasar-malam-juasseh', 4, 16.079),
+('pasar-malam-dangi', 'tapak-pasar-malam-jelai', 5, 18.363),
+('pasar-malam-desa-kiara-sikamat', 'pasar-malam-ampangan', 1, 2.722),
+('pasar-malam-desa-kiara-sikamat', 'paroi-night-market', 2, 2.729),
+('pasar-malam-desa-kiara-sikamat', 'kechik-putu-mayam', 3, 2.746),
+('pasar-malam-desa-kiara-sikamat', 'seremban-street-food', 4, 3.872),
+('pasar-malam-desa-kiara-sikamat', 'pasar-malam-lobak-night-market', 5, 4.406),
+('temple-street-night-market', 'pasar-malam-lobak-night-market', 1, 1.450),
+('temple-street-night-market', 'seremban-street-food', 2, 2.138),
+('temple-street-night-market', 'pasar-malam-bandar-ainsdale', 3, 4.438),
+('temple-street-night-market', 'kechik-putu-mayam', 4, 4.527),
+('temple-street-night-market', 'pasar-malam-ampangan', 5, 4.679),
+('pasar-malam-kemayan', 'pasar-malam-triang-lama', 1, 13.324),
+('pasar-malam-kemayan', 'pasar-malam-simpang-durian', 2, 16.505),
+('pasar-malam-kemayan', 'pasar-malam-kerayong', 3, 18.160),
+('pasar-malam-kemayan', 'pasar-malam-simpang-pelangai', 4, 19.268),
+('pasar-malam-kemayan', 'pasar-malam-felda-sebertak', 5, 29.722),
+('pasar-malam-juasseh', 'pasar-malam-kuala-pilah', 1, 9.373),
+('pasar-malam-juasseh', 'pasar-malam-bahau-saturday-night-market', 2, 11.534),
+('pasar-malam-juasseh', 'pasar-malam-dangi', 3, 16.079),
+('pasar-malam-juasseh', 'tapak-pasar-malam-jelai', 4, 26.010),
+('pasar-malam-juasseh', 'pasar-malam-air-mawang', 5, 26.192),
+('pasar-malam-sungai-pelek', 'pasar-malam-sabtu', 1, 3.997),
+('pasar-malam-sungai-pelek', 'pasar-malam-taman-murni-isnin', 2, 7.812),
+('pasar-malam-sungai-pelek', 'pasar-malam-bukit-pelandok', 3, 8.434),
+('pasar-malam-sungai-pelek', 'pasar-malam-mercato', 4, 13.100),
+('pasar-malam-sungai-pelek', 'pasar-malam-marcatocars-boostbdr-enstek', 5, 13.196),
+('dstreetmall-night-market', 'pasar-malam-kuarters-klia-nilai', 1, 0.536),
+('dstreetmall-night-market', 'pasar-malam-marcatocars-boostbdr-enstek', 2, 3.017),
+('dstreetmall-night-market', 'minee-pankek-bandar-enstek', 3, 3.057),
+('dstreetmall-night-market', 'pasar-malam-mercato', 4, 3.159),
+('dstreetmall-night-market', 'friday-night-market-pasar-malam', 5, 3.297),
+('pasar-malam-ampangan', 'kechik-putu-mayam', 1, 0.160),
+('pasar-malam-ampangan', 'paroi-night-market', 2, 1.853),
+('pasar-malam-ampangan', 'seremban-street-food', 3, 2.677),
+('pasar-malam-ampangan', 'pasar-malam-desa-kiara-sikamat', 4, 2.722),
+('pasar-malam-ampangan', 'pasar-malam-lobak-night-market', 5, 3.447),
+('pasar-malam-putra-nilai', 'ayam-gunting-pasar-malam-putra-point-bandar-baru-nilai-hari-isnin', 1, 0.546),
+('pasar-malam-putra-nilai', 'cendolurve-gembox-nilai', 2, 0.750),
+('pasar-malam-putra-nilai', 'banana-shop-gembox-nilai', 3, 0.768),
+('pasar-malam-putra-nilai', 'friday-market-pasar-malam', 4, 2.192),
+('pasar-malam-putra-nilai', 'pasar-malam-taman-semarak', 5, 2.442),
+('ayam-gunting-pasar-malam-putra-point-bandar-baru-nilai-hari-isnin', 'pasar-malam-putra-nilai', 1, 0.546),
+('ayam-gunting-pasar-malam-putra-point-bandar-baru-nilai-hari-isnin', 'cendolurve-gembox-nilai', 2, 0.804),
+('ayam-gunting-pasar-malam-putra-point-bandar-baru-nilai-hari-isnin', 'banana-shop-gembox-nilai', 3, 0.934),
+('ayam-gunting-pasar-malam-putra-point-bandar-baru-nilai-hari-isnin', 'friday-market-pasar-malam', 4, 2.068),
+('ayam-gunting-pasar-malam-putra-point-bandar-baru-nilai-hari-isnin', 'pasar-malam-desa-cempaka', 5, 2.460),
+('pasar-lambak-the-plazo-s2-heights', 's2-heights-pasar-malam', 1, 0.205),
+('pasar-lambak-the-plazo-s2-heights', 'pasar-malam-bandar-ainsdale', 2, 2.083),
+('pasar-lambak-the-plazo-s2-heights', 'xing-qi-liu-ye-shi', 3, 3.354),
+('pasar-lambak-the-plazo-s2-heights', 'pasar-malam-seremban-2', 4, 3.409),
+('pasar-lambak-the-plazo-s2-heights', 'kayaball-station', 5, 4.150),
+('pasar-malam-simpang-durian', 'pasar-malam-simpang-pelangai', 1, 9.159),
+('pasar-malam-simpang-durian', 'pasar-malam-kemayan', 2, 16.505),
+('pasar-malam-simpang-durian', 'pasar-kuala-klawang-jelebu-negeri-sembilan', 3, 23.856),
+('pasar-malam-simpang-durian', 'pasar-malam-triang-lama', 4, 27.048),
+('pasar-malam-simpang-durian', 'pasar-malam-kerayong', 5, 32.524),
+('bazar-ramadhan-rembau-pasar-malam-rembau', 'tapak-pasar-malam-pekan-rembau', 1, 0.034),
+('bazar-ramadhan-rembau-pasar-malam-rembau', 'pasar-malam-chembong', 2, 3.084),
+('bazar-ramadhan-rembau-pasar-malam-rembau', 'pasar-malam-senawang-perdana', 3, 12.379),
+('bazar-ramadhan-rembau-pasar-malam-rembau', 'pasar-malam-seremban-selatan', 4, 14.431),
+('bazar-ramadhan-rembau-pasar-malam-rembau', 'sunday-pasar-malam', 5, 14.883),
+('pasar-malam-kuarters-klia-nilai', 'dstreetmall-night-market', 1, 0.536),
+('pasar-malam-kuarters-klia-nilai', 'pasar-malam-marcatocars-boostbdr-enstek', 2, 2.553),
+('pasar-malam-kuarters-klia-nilai', 'minee-pankek-bandar-enstek', 3, 2.607),
+('pasar-malam-kuarters-klia-nilai', 'pasar-malam-mercato', 4, 2.696),
+('pasar-malam-kuarters-klia-nilai', 'friday-night-market-pasar-malam', 5, 3.817),
+('tapak-pasar-malam-pekan-rembau', 'bazar-ramadhan-rembau-pasar-malam-rembau', 1, 0.034),
+('tapak-pasar-malam-pekan-rembau', 'pasar-malam-chembong', 2, 3.117),
+('tapak-pasar-malam-pekan-rembau', 'pasar-malam-senawang-perdana', 3, 12.413),
+('tapak-pasar-malam-pekan-rembau', 'pasar-malam-seremban-selatan', 4, 14.465),
+('tapak-pasar-malam-pekan-rembau', 'sunday-pasar-malam', 5, 14.912),
+('pasar-malam-uptown-cheras-sri-permaisuri', 'pasar-malam-sri-petaling-new', 1, 3.931),
+('pasar-malam-uptown-cheras-sri-permaisuri', 'pasar-malam-taman-segar', 2, 4.232),
+('pasar-malam-uptown-cheras-sri-permaisuri', 'pasar-malam-pandan-jaya', 3, 5.199),
+('pasar-malam-uptown-cheras-sri-permaisuri', 'pasar-malam-taman-tun-perak-cheras', 4, 7.001),
+('pasar-malam-uptown-cheras-sri-permaisuri', 'pasar-malam-lrt-kg-baru', 5, 7.177),
+('minee-pankek-bandar-enstek', 'pasar-malam-marcatocars-boostbdr-enstek', 1, 0.143),
+('minee-pankek-bandar-enstek', 'pasar-malam-mercato', 2, 0.165),
+('minee-pankek-bandar-enstek', 'pasar-malam-kuarters-klia-nilai', 3, 2.607),
+('minee-pankek-bandar-enstek', 'dstreetmall-night-market', 4, 3.057),
+('minee-pankek-bandar-enstek', 'pasar-malam-kampung-lbj', 5, 3.712),
+('pasar-malam-labu-batu-10', 'pasar-malam-kampung-lbj', 1, 5.451),
+('pasar-malam-labu-batu-10', 'minee-pankek-bandar-enstek', 2, 6.074),
+('pasar-malam-labu-batu-10', 'pasar-malam-gadong', 3, 6.104),
+('pasar-malam-labu-batu-10', 'pasar-malam-tiara-sendayan', 4, 6.175),
+('pasar-malam-labu-batu-10', 'pasar-malam-marcatocars-boostbdr-enstek', 5, 6.204),
+('pasar-malam-bandar-tasik-kesuma', 'pasar-malam-ahad-taman-pelangi-semenyih', 1, 2.514),
+('pasar-malam-bandar-tasik-kesuma', 'pasar-malam-sabtusaturday-night-street-market', 2, 4.600),
+('pasar-malam-bandar-tasik-kesuma', 'pasar-malam-bts-rabu', 3, 6.473),
+('pasar-malam-bandar-tasik-kesuma', 'pasar-malam-bandar-teknologi-kajang-thursday', 4, 7.902),
+('pasar-malam-bandar-tasik-kesuma', 'pasar-malam-bandar-teknologi-kajang-isnin', 5, 8.004),
+('pasar-malam-presint-14-putrajaya', 'pasar-pagi-pasar-malam-presint-16-putrajaya', 1, 2.505),
+('pasar-malam-presint-14-putrajaya', 'pasar-malam-persiaran-usahawan', 2, 3.351),
+('pasar-malam-presint-14-putrajaya', 'pasar-malam-bandar-baru-bangi', 3, 3.683),
+('pasar-malam-presint-14-putrajaya', 'pasar-presint-8', 4, 4.755),
+('pasar-malam-presint-14-putrajaya', 'pasar-malam-seksyen-7-bangi', 5, 6.071),
+('pasar-malam-kampung-tasek-tambahan', 'pasar-malam-pandan-jaya', 1, 3.253),
+('pasar-malam-kampung-tasek-tambahan', 'pasar-malam-nanding', 2, 4.850),
+('pasar-malam-kampung-tasek-tambahan', 'pasar-malam-taman-segar', 3, 4.995),
+('pasar-malam-kampung-tasek-tambahan', 'pasar-malam-keramat-permai', 4, 6.600),
+('pasar-malam-kampung-tasek-tambahan', 'pasar-malam-taman-tun-perak-cheras', 5, 7.021),
+('pasar-malam-kota-warisan', 'pasar-malam-taman-seroja', 1, 2.493),
+('pasar-malam-kota-warisan', 'pasar-malam-taman-dengkil', 2, 4.526),
+('pasar-malam-kota-warisan', 'pasar-malam-taman-dengkil-jaya', 3, 6.759),
+('pasar-malam-kota-warisan', 'friday-night-market-pasar-malam', 4, 7.614),
+('pasar-malam-kota-warisan', 'pasar-malam-desa-cempaka', 5, 7.658),
+('za-bundle', 'pasar-malam-senawang-jaya', 1, 1.329),
+('za-bundle', 'pasar-malam-taman-sri-mawar', 2, 1.601),
+('za-bundle', 'paroi-night-market', 3, 2.743),
+('za-bundle', 'pasar-tani-kekal-paroi', 4, 3.315),
+('za-bundle', 'pasar-malam-ampangan', 5, 3.516),
+('seremban-street-food', 'pasar-malam-lobak-night-market', 1, 0.772),
+('seremban-street-food', 'temple-street-night-market', 2, 2.138),
+('seremban-street-food', 'kechik-putu-mayam', 3, 2.519),
+('seremban-street-food', 'pasar-malam-ampangan', 4, 2.677),
+('seremban-street-food', 'taman-blossom-night-market', 5, 3.654),
+('pasar-malam-desaria', 'pasar-malam-bangla-mbs-buta-kayu', 1, 0.370),
+('pasar-malam-desaria', 'pasar-malam-bandar-seri-putra', 2, 2.336),
+('pasar-malam-desaria', 'cendolurve-gembox-nilai', 3, 4.618),
+('pasar-malam-desaria', 'banana-shop-gembox-nilai', 4, 4.685),
+('pasar-malam-desaria', 'ayam-gunting-pasar-malam-putra-point-bandar-baru-nilai-hari-isnin', 5, 5.079),
+('pasar-malam-taman-seroja', 'pasar-malam-kota-warisan', 1, 2.493),
+('pasar-malam-taman-seroja', 'friday-night-market-pasar-malam', 2, 5.415),
+('pasar-malam-taman-seroja', 'pasar-malam-desa-cempaka', 3, 5.452),
+('pasar-malam-taman-seroja', 'friday-market-pasar-malam', 4, 5.829),
+('pasar-malam-taman-seroja', 'pasar-malam-taman-dengkil', 5, 6.310),
+('pasar-malam-iringan-bayu', 'pasar-malam-medan-nusari', 1, 2.165),
+('pasar-malam-iringan-bayu', 'taman-angsa-mas-night-market', 2, 2.961),
+('pasar-malam-iringan-bayu', 'xing-qi-liu-ye-shi', 3, 3.650),
+('pasar-malam-iringan-bayu', 'pasar-malam-seremban-2', 4, 3.750),
+('pasar-malam-iringan-bayu', 'cbsxpark-bandar-sri-sendayan', 5, 4.577),
+('pasar-malam-air-mawang', 'pasar-malam-taman-indah', 1, 8.409),
+('pasar-malam-air-mawang', 'pasar-malam-tampin', 2, 9.598),
+('pasar-malam-air-mawang', 'pasar-malam-bandar-satelit-sebang', 3, 10.402),
+('pasar-malam-air-mawang', 'pasar-malam-dangi', 4, 12.253),
+('pasar-malam-air-mawang', 'tapak-pasar-malam-gemencheh', 5, 17.907),
+('pasar-malam-taman-murni-isnin', 'pasar-malam-bukit-pelandok', 1, 5.230),
+('pasar-malam-taman-murni-isnin', 'pasar-malam-kampung-lbj', 2, 5.693),
+('pasar-malam-taman-murni-isnin', 'pasar-malam-mercato', 3, 7.003),
+('pasar-malam-taman-murni-isnin', 'minee-pankek-bandar-enstek', 4, 7.137),
+('pasar-malam-taman-murni-isnin', 'pasar-malam-marcatocars-boostbdr-enstek', 5, 7.139),
+('pasar-malam-felda-sebertak', 'pasar-malam-kerayong', 1, 16.474),
+('pasar-malam-felda-sebertak', 'pasar-malam-triang-lama', 2, 21.083),
+('pasar-malam-felda-sebertak', 'pasar-malam-kerinau-paya-pulai-temerloh-sabtu', 3, 27.480),
+('pasar-malam-felda-sebertak', 'pasar-karat-temerloh', 4, 28.917),
+('pasar-malam-felda-sebertak', 'pasar-malam-temerloh', 5, 29.301),
+('pasar-malam-taman-segar', 'pasar-malam-taman-tun-perak-cheras', 1, 3.232),
+('pasar-malam-taman-segar', 'pasar-malam-uptown-cheras-sri-permaisuri', 2, 4.232),
+('pasar-malam-taman-segar', 'pasar-malam-kampung-tasek-tambahan', 3, 4.995),
+('pasar-malam-taman-segar', 'pasar-malam-pandan-jaya', 4, 5.033),
+('pasar-malam-taman-segar', 'pasar-malam-taman-cheras-perdana', 5, 5.603),
+('pasar-malam-bangla-mbs-buta-kayu', 'pasar-malam-desaria', 1, 0.370),
+('pasar-malam-bangla-mbs-buta-kayu', 'pasar-malam-bandar-seri-putra', 2, 2.601),
+('pasar-malam-bangla-mbs-buta-kayu', 'cendolurve-gembox-nilai', 3, 4.458),
+('pasar-malam-bangla-mbs-buta-kayu', 'banana-shop-gembox-nilai', 4, 4.511),
+('pasar-malam-bangla-mbs-buta-kayu', 'ayam-gunting-pasar-malam-putra-point-bandar-baru-nilai-hari-isnin', 5, 4.965),
+('pasar-malam-ahad-taman-pelangi-semenyih', 'pasar-malam-sabtusaturday-night-street-market', 1, 2.223),
+('pasar-malam-ahad-taman-pelangi-semenyih', 'pasar-malam-bandar-tasik-kesuma', 2, 2.514),
+('pasar-malam-ahad-taman-pelangi-semenyih', 'pasar-malam-bandar-teknologi-kajang-thursday', 3, 5.608),
+('pasar-malam-ahad-taman-pelangi-semenyih', 'pasar-malam-bandar-teknologi-kajang-isnin', 4, 5.645),
+('pasar-malam-ahad-taman-pelangi-semenyih', 'pasar-malam-taman-jasmin', 5, 7.683),
+('tapak-pasar-malam-jelai', 'tapak-pasar-malam-gemencheh', 1, 13.648),
+('tapak-pasar-malam-jelai', 'pasar-malam-gemas', 2, 15.571),
+('tapak-pasar-malam-jelai', 'pasar-malam-dangi', 3, 18.363),
+('tapak-pasar-malam-jelai', 'pasar-malam-bahau-saturday-night-market', 4, 20.891),
+('tapak-pasar-malam-jelai', 'pasar-malam-juasseh', 5, 26.010),
+('pasar-malam-taman-dengkil', 'pasar-malam-taman-dengkil-jaya', 1, 2.252),
+('pasar-malam-taman-dengkil', 'pasar-malam-kota-warisan', 2, 4.526),
+('pasar-malam-taman-dengkil', 'parking-pasar-malam-putrajaya', 3, 5.775),
+('pasar-malam-taman-dengkil', 'pasar-malam-putrajaya-selasa-jumaat', 4, 5.796),
+('pasar-malam-taman-dengkil', 'pasar-tani-kekal-putrajaya', 5, 5.823),
+('pasar-malam-kg-bukit-changgang', 'pasar-malam-taman-dengkil', 1, 6.584),
+('pasar-malam-kg-bukit-changgang', 'pasar-malam-taman-dengkil-jaya', 2, 6.869),
+('pasar-malam-kg-bukit-changgang', 'pasar-malam-kota-warisan', 3, 8.700),
+('pasar-malam-kg-bukit-changgang', 'parking-pasar-malam-putrajaya', 4, 10.640),
+('pasar-malam-kg-bukit-changgang', 'pasar-malam-putrajaya-selasa-jumaat', 5, 10.642),
+('tapak-pasar-malam-jalan-kampung-lombong', 'pasar-malam-bukit-naga', 1, 4.743),
+('tapak-pasar-malam-jalan-kampung-lombong', 'pasar-malam-bandar-saujana-putra', 2, 8.168),
+('tapak-pasar-malam-jalan-kampung-lombong', 'pasar-malam-jenjarom', 3, 8.753),
+('tapak-pasar-malam-jalan-kampung-lombong', 'pasar-malam-taman-putra-perdana-ahad-selasa', 4, 11.288),
+('tapak-pasar-malam-jalan-kampung-lombong', 'pasar-malam-kampung-bandar', 5, 14.444),
+('kechik-putu-mayam', 'pasar-malam-ampangan', 1, 0.160),
+('kechik-putu-mayam', 'paroi-night-market', 2, 2.009),
+('kechik-putu-mayam', 'seremban-street-food', 3, 2.519),
+('kechik-putu-mayam', 'pasar-malam-desa-kiara-sikamat', 4, 2.746),
+('kechik-putu-mayam', 'pasar-malam-lobak-night-market', 5, 3.288),
+('pasar-malam-sabtusaturday-night-street-market', 'pasar-malam-ahad-taman-pelangi-semenyih', 1, 2.223),
+('pasar-malam-sabtusaturday-night-street-market', 'pasar-malam-bandar-teknologi-kajang-thursday', 2, 3.385),
+('pasar-malam-sabtusaturday-night-street-market', 'pasar-malam-bandar-teknologi-kajang-isnin', 3, 3.428),
+('pasar-malam-sabtusaturday-night-street-market', 'pasar-malam-bandar-tasik-kesuma', 4, 4.600),
+('pasar-malam-sabtusaturday-night-street-market', 'pasar-malam-taman-jasmin', 5, 5.479),
+('pasar-malam-taman-dengkil-jaya', 'pasar-malam-taman-dengkil', 1, 2.252),
+('pasar-malam-taman-dengkil-jaya', 'parking-pasar-malam-putrajaya', 2, 4.019),
+('pasar-malam-taman-dengkil-jaya', 'pasar-malam-putrajaya-selasa-jumaat', 3, 4.030),
+('pasar-malam-taman-dengkil-jaya', 'pasar-tani-kekal-putrajaya', 4, 4.061),
+('pasar-malam-taman-dengkil-jaya', 'pasar-malam-kota-warisan', 5, 6.759),
+('kayaball-station', 'ayam-gunting-pasar-malam-metro-park-sendayan', 1, 0.191),
+('kayaball-station', 'cbsxpark-bandar-sri-sendayan', 2, 2.061),
+('kayaball-station', 'pasar-malam-gadong', 3, 2.199),
+('kayaball-station', 'pasar-malam-tiara-sendayan', 4, 3.933),
+('kayaball-station', 'pasar-lambak-the-plazo-s2-heights', 5, 4.150),
+('pasar-malam-marcatocars-boostbdr-enstek', 'minee-pankek-bandar-enstek', 1, 0.143),
+('pasar-malam-marcatocars-boostbdr-enstek', 'pasar-malam-mercato', 2, 0.143),
+('pasar-malam-marcatocars-boostbdr-enstek', 'pasar-malam-kuarters-klia-nilai', 3, 2.553),
+('pasar-malam-marcatocars-boostbdr-enstek', 'dstreetmall-night-market', 4, 3.017),
+('pasar-malam-marcatocars-boostbdr-enstek', 'pasar-malam-kampung-lbj', 5, 3.827),
+('pasar-malam-selasa', 'pasar-malam-sungai-pelek', 1, 13.621),
+('pasar-malam-selasa', 'pasar-malam-sabtu', 2, 16.568),
+('pasar-malam-selasa', 'pasar-malam-kg-bukit-changgang', 3, 19.810),
+('pasar-malam-selasa', 'pasar-malam-taman-murni-isnin', 4, 21.145),
+('pasar-malam-selasa', 'pasar-malam-bukit-pelandok', 5, 21.805),
+('pasar-malam-bandar-teknologi-kajang-thursday', 'pasar-malam-bandar-teknologi-kajang-isnin', 1, 0.467),
+('pasar-malam-bandar-teknologi-kajang-thursday', 'pasar-malam-taman-jasmin', 2, 2.244),
+('pasar-malam-bandar-teknologi-kajang-thursday', 'pasar-malam-sabtusaturday-night-street-market', 3, 3.385),
+('pasar-malam-bandar-teknologi-kajang-thursday', 'pasar-malam-seksyen-7-bangi', 4, 5.060),
+('pasar-malam-bandar-teknologi-kajang-thursday', 'pasar-malam-ahad-taman-pelangi-semenyih', 5, 5.608),
+('pasar-malam-sri-serdang-jumaat-isnin', 'pasar-malam-sri-petaling-new', 1, 6.364),
+('pasar-malam-sri-serdang-jumaat-isnin', 'pasar-malam-taman-cheras-perdana', 2, 7.035),
+('pasar-malam-sri-serdang-jumaat-isnin', 'pasar-malam-taman-tun-perak-cheras', 3, 7.260),
+('pasar-malam-sri-serdang-jumaat-isnin', 'pasar-malam-persiaran-usahawan', 4, 7.698),
+('pasar-malam-sri-serdang-jumaat-isnin', 'pasar-malam-presint-14-putrajaya', 5, 7.700),
+('pasar-malam-bukit-naga', 'tapak-pasar-malam-jalan-kampung-lombong', 1, 4.743),
+('pasar-malam-bukit-naga', 'pasar-malam-jalan-haji-musran', 2, 11.431),
+('pasar-malam-bukit-naga', 'pasar-malam-bandar-saujana-putra', 3, 11.884),
+('pasar-malam-bukit-naga', 'pasar-malam-jenjarom', 4, 13.264),
+('pasar-malam-bukit-naga', 'pasar-malam-taman-putra-perdana-ahad-selasa', 5, 14.504),
+('pasar-malam-bandar-seri-putra', 'pasar-malam-desaria', 1, 2.336),
+('pasar-malam-bandar-seri-putra', 'pasar-malam-bangla-mbs-buta-kayu', 2, 2.601),
+('pasar-malam-bandar-seri-putra', 'cendolurve-gembox-nilai', 3, 6.904),
+('pasar-malam-bandar-seri-putra', 'banana-shop-gembox-nilai', 4, 6.984),
+('pasar-malam-bandar-seri-putra', 'ayam-gunting-pasar-malam-putra-point-bandar-baru-nilai-hari-isnin', 5, 7.293),
+('pasar-malam-jenjarom', 'tapak-pasar-malam-jalan-kampung-lombong', 1, 8.753),
+('pasar-malam-jenjarom', 'pasar-malam-kampung-bandar', 2, 8.843),
+('pasar-malam-jenjarom', 'pasar-malam-bandar-saujana-putra', 3, 9.735),
+('pasar-malam-jenjarom', 'pasar-malam-taman-putra-perdana-ahad-selasa', 4, 12.759),
+('pasar-malam-jenjarom', 'pasar-malam-bukit-naga', 5, 13.264),
+('pasar-malam-persiaran-usahawan', 'pasar-malam-bandar-baru-bangi', 1, 1.414),
+('pasar-malam-persiaran-usahawan', 'pasar-malam-seksyen-7-bangi', 2, 2.723),
+('pasar-malam-persiaran-usahawan', 'pasar-malam-presint-14-putrajaya', 3, 3.351),
+('pasar-malam-persiaran-usahawan', 'pasar-pagi-pasar-malam-presint-16-putrajaya', 4, 5.776),
+('pasar-malam-persiaran-usahawan', 'pasar-malam-taman-jasmin', 5, 7.354),
+('pasar-malam-bandar-baru-bangi', 'pasar-malam-persiaran-usahawan', 1, 1.414),
+('pasar-malam-bandar-baru-bangi', 'pasar-malam-seksyen-7-bangi', 2, 2.942),
+('pasar-malam-bandar-baru-bangi', 'pasar-malam-presint-14-putrajaya', 3, 3.683),
+('pasar-malam-bandar-baru-bangi', 'pasar-pagi-pasar-malam-presint-16-putrajaya', 4, 5.798),
+('pasar-malam-bandar-baru-bangi', 'pasar-malam-bandar-teknologi-kajang-thursday', 5, 7.276),
+('cendolurve-gembox-nilai', 'banana-shop-gembox-nilai', 1, 0.188),
+('cendolurve-gembox-nilai', 'pasar-malam-putra-nilai', 2, 0.750),
+('cendolurve-gembox-nilai', 'ayam-gunting-pasar-malam-putra-point-bandar-baru-nilai-hari-isnin', 3, 0.804),
+('cendolurve-gembox-nilai', 'pasar-malam-taman-semarak', 4, 2.269),
+('cendolurve-gembox-nilai', 'air-balang-paling-win', 5, 2.426),
+('pasar-malam-bandar-saujana-putra', 'pasar-malam-taman-putra-perdana-ahad-selasa', 1, 3.383),
+('pasar-malam-bandar-saujana-putra', 'tapak-pasar-malam-jalan-kampung-lombong', 2, 8.168),
+('pasar-malam-bandar-saujana-putra', 'pasar-malam-jenjarom', 3, 9.735),
+('pasar-malam-bandar-saujana-putra', 'pasar-presint-8', 4, 10.788),
+('pasar-malam-bandar-saujana-putra', 'pasar-malam-putrajaya-selasa-jumaat', 5, 11.007),
+('pasar-malam-bandar-teknologi-kajang-isnin', 'pasar-malam-bandar-teknologi-kajang-thursday', 1, 0.467),
+('pasar-malam-bandar-teknologi-kajang-isnin', 'pasar-malam-taman-jasmin', 2, 2.062),
+('pasar-malam-bandar-teknologi-kajang-isnin', 'pasar-malam-sabtusaturday-night-street-market', 3, 3.428),
+('pasar-malam-bandar-teknologi-kajang-isnin', 'pasar-malam-seksyen-7-bangi', 4, 5.358),
+('pasar-malam-bandar-teknologi-kajang-isnin', 'pasar-malam-ahad-taman-pelangi-semenyih', 5, 5.645),
+('pasar-malam-nanding', 'pasar-malam-kampung-tasek-tambahan', 1, 4.850),
+('pasar-malam-nanding', 'pasar-malam-taman-tun-perak-cheras', 2, 6.865),
+('pasar-malam-nanding', 'pasar-malam-taman-segar', 3, 7.107),
+('pasar-malam-nanding', 'pasar-malam-taman-cheras-perdana', 4, 7.574),
+('pasar-malam-nanding', 'pasar-malam-pandan-jaya', 5, 8.028),
+('pasar-malam-taman-cheras-perdana', 'pasar-malam-taman-tun-perak-cheras', 1, 2.371),
+('pasar-malam-taman-cheras-perdana', 'pasar-malam-taman-segar', 2, 5.603),
+('pasar-malam-taman-cheras-perdana', 'pasar-malam-sri-serdang-jumaat-isnin', 3, 7.035),
+('pasar-malam-taman-cheras-perdana', 'pasar-malam-nanding', 4, 7.574),
+('pasar-malam-taman-cheras-perdana', 'pasar-malam-taman-jasmin', 5, 8.521),
+('pasar-malam-pandan-jaya', 'pasar-malam-kampung-tasek-tambahan', 1, 3.253),
+('pasar-malam-pandan-jaya', 'pasar-malam-keramat-permai', 2, 4.748),
+('pasar-malam-pandan-jaya', 'pasar-malam-taman-segar', 3, 5.033),
+('pasar-malam-pandan-jaya', 'pasar-malam-uptown-cheras-sri-permaisuri', 4, 5.199),
+('pasar-malam-pandan-jaya', 'pasar-malam-lrt-kg-baru', 5, 5.216),
+('air-balang-paling-win', 'pasar-malam-taman-semarak', 1, 0.293),
+('air-balang-paling-win', 'banana-shop-gembox-nilai', 2, 2.243),
+('air-balang-paling-win', 'cendolurve-gembox-nilai', 3, 2.426),
+('air-balang-paling-win', 'pasar-malam-putra-nilai', 4, 2.665),
+('air-balang-paling-win', 'ayam-gunting-pasar-malam-putra-point-bandar-baru-nilai-hari-isnin', 5, 3.094),
+('pasar-malam-taman-putra-perdana-ahad-selasa', 'pasar-malam-bandar-saujana-putra', 1, 3.383),
+('pasar-malam-taman-putra-perdana-ahad-selasa', 'pasar-presint-8', 2, 7.442),
+('pasar-malam-taman-putra-perdana-ahad-selasa', 'pasar-tani-kekal-putrajaya', 3, 8.107),
+('pasar-malam-taman-putra-perdana-ahad-selasa', 'pasar-malam-putrajaya-selasa-jumaat', 4, 8.107),
+('pasar-malam-taman-putra-perdana-ahad-selasa', 'parking-pasar-malam-putrajaya', 5, 8.143),
+('pasar-malam-sabtu', 'pasar-malam-sungai-pelek', 1, 3.997),
+('pasar-malam-sabtu', 'pasar-malam-bukit-pelandok', 2, 5.366),
+('pasar-malam-sabtu', 'pasar-malam-taman-murni-isnin', 3, 7.283),
+('pasar-malam-sabtu', 'pasar-malam-kampung-lbj', 4, 12.955),
+('pasar-malam-sabtu', 'pasar-malam-mercato', 5, 13.939),
+('pasar-malam-seksyen-7-bangi', 'pasar-malam-persiaran-usahawan', 1, 2.723),
+('pasar-malam-seksyen-7-bangi', 'pasar-malam-bandar-baru-bangi', 2, 2.942),
+('pasar-malam-seksyen-7-bangi', 'pasar-malam-taman-jasmin', 3, 4.635),
+('pasar-malam-seksyen-7-bangi', 'pasar-malam-bandar-teknologi-kajang-thursday', 4, 5.060),
+('pasar-malam-seksyen-7-bangi', 'pasar-malam-bandar-teknologi-kajang-isnin', 5, 5.358),
+('pasar-malam-taman-jasmin', 'pasar-malam-bandar-teknologi-kajang-isnin', 1, 2.062),
+('pasar-malam-taman-jasmin', 'pasar-malam-bandar-teknologi-kajang-thursday', 2, 2.244),
+('pasar-malam-taman-jasmin', 'pasar-malam-seksyen-7-bangi', 3, 4.635),
+('pasar-malam-taman-jasmin', 'pasar-malam-sabtusaturday-night-street-market', 4, 5.479),
+('pasar-malam-taman-jasmin', 'pasar-malam-persiaran-usahawan', 5, 7.354),
+('pasar-malam-taman-tun-perak-cheras', 'pasar-malam-taman-cheras-perdana', 1, 2.371),
+('pasar-malam-taman-tun-perak-cheras', 'pasar-malam-taman-segar', 2, 3.232),
+('pasar-malam-taman-tun-perak-cheras', 'pasar-malam-nanding', 3, 6.865),
+('pasar-malam-taman-tun-perak-cheras', 'pasar-malam-uptown-cheras-sri-permaisuri', 4, 7.001),
+('pasar-malam-taman-tun-perak-cheras', 'pasar-malam-kampung-tasek-tambahan', 5, 7.021),
+('banana-shop-gembox-nilai', 'cendolurve-gembox-nilai', 1, 0.188),
+('banana-shop-gembox-nilai', 'pasar-malam-putra-nilai', 2, 0.768),
+('banana-shop-gembox-nilai', 'ayam-gunting-pasar-malam-putra-point-bandar-baru-nilai-hari-isnin', 3, 0.934),
+('banana-shop-gembox-nilai', 'pasar-malam-taman-semarak', 4, 2.083),
+('banana-shop-gembox-nilai', 'air-balang-paling-win', 5, 2.243),
+('tapak-pasar-malam-jerantut', 'jerantut-night-market', 1, 0.257),
+('tapak-pasar-malam-jerantut', 'tapak-pasar-malam-jerantut-feri', 2, 7.288),
+('tapak-pasar-malam-jerantut', 'pasar-malam-jengka-8', 3, 16.432),
+('tapak-pasar-malam-jerantut', 'tapak-pasar-malam-k-krau', 4, 25.358),
+('tapak-pasar-malam-jerantut', 'pasar-tani-kekal-bandar-tun-abdul-razak-jengka', 5, 28.146),
+('cameron-night-market', 'famous-night-market', 1, 0.012),
+('cameron-night-market', 'pasar-malam-cameron-highlands', 2, 0.076),
+('cameron-night-market', 'central-night-market', 3, 2.058),
+('cameron-night-market', 'pasar-malam-kea-farm', 4, 4.164),
+('cameron-night-market', 'simpang-pulai-pasar', 5, 27.715),
+('pasar-lambak-indera-mahkota', 'pasar-malam-bukit-setongkol', 1, 1.966),
+('pasar-lambak-indera-mahkota', 'pasar-malam-sekilau', 2, 2.439),
+('pasar-lambak-indera-mahkota', 'pasar-street-kuantan', 3, 2.457),
+('pasar-lambak-indera-mahkota', 'pasar-malam-utc-kuantan', 4, 2.537),
+('pasar-lambak-indera-mahkota', 'pasar-tani-utc-kuantan', 5, 2.547),
+('pasar-malam-cameron-highlands', 'famous-night-market', 1, 0.066),
+('pasar-malam-cameron-highlands', 'cameron-night-market', 2, 0.076),
+('pasar-malam-cameron-highlands', 'central-night-market', 3, 2.003),
+('pasar-malam-cameron-highlands', 'pasar-malam-kea-farm', 4, 4.123),
+('pasar-malam-cameron-highlands', 'simpang-pulai-pasar', 5, 27.786),
+('tapak-pasar-malam-mempaga', 'sunday-morning-market-bentong', 1, 6.751),
+('tapak-pasar-malam-mempaga', 'market-bentong', 2, 6.752),
+('tapak-pasar-malam-mempaga', 'bentong-walk', 3, 6.841),
+('tapak-pasar-malam-mempaga', 'pasar-perting', 4, 7.084),
+('tapak-pasar-malam-mempaga', 'pasar-malam-desa-damai', 5, 9.106),
+('pasar-malam-jln-mok-khee-kiang-mentakab', 'pasar-malam-taman-saga', 1, 2.641),
+('pasar-malam-jln-mok-khee-kiang-mentakab', 'pasar-malam-saga-indah', 2, 3.121),
+('pasar-malam-jln-mok-khee-kiang-mentakab', 'pasar-malam-taman-tualang-indah', 3, 4.186),
+('pasar-malam-jln-mok-khee-kiang-mentakab', 'pasar-malam-taman-temerloh-jaya', 4, 6.121),
+('pasar-malam-jln-mok-khee-kiang-mentakab', 'temerloh-night-market', 5, 8.767),
+('pasar-malam-night-market', 'tapak-pasar-malam-nenasi', 1, 52.547),
+('pasar-malam-night-market', 'labis-market', 2, 73.321),
+('pasar-malam-night-market', 'pasar-rabu-muadzam-shah', 3, 73.604),
+('pasar-malam-night-market', 'kampung-paya-pasar-malam', 4, 76.053),
+('pasar-malam-night-market', 'kluang-market', 5, 76.536),
+('assb-night-market', 'pasar-malam-balok-perdana', 1, 5.115),
+('assb-night-market', 'pasar-malam-taman-balok-makmur', 2, 5.676),
+('assb-night-market', 'pasar-malam-balok-permai', 3, 7.519),
+('assb-night-market', 'pasar-malam-bandar-damansara-pkppmk', 4, 11.864),
+('assb-night-market', 'taman-dato-rashid', 5, 13.803),
+('pasar-malam-temerloh', 'pekan-sehari-temerloh', 1, 0.219),
+('pasar-malam-temerloh', 'bazaar-semantan-lurah-semantan-temerloh', 2, 0.230),
+('pasar-malam-temerloh', 'temerloh-night-market', 3, 0.372),
+('pasar-malam-temerloh', 'pasar-karat-temerloh', 4, 0.915),
+('pasar-malam-temerloh', 'pasar-malam-taman-temerloh-jaya', 5, 3.152),
+('pasar-malam-taman-tualang-indah', 'pasar-malam-jln-mok-khee-kiang-mentakab', 1, 4.186),
+('pasar-malam-taman-tualang-indah', 'pasar-malam-taman-temerloh-jaya', 2, 4.238),
+('pasar-malam-taman-tualang-indah', 'pasar-malam-taman-saga', 3, 5.362),
+('pasar-malam-taman-tualang-indah', 'pasar-malam-saga-indah', 4, 5.376),
+('pasar-malam-taman-tualang-indah', 'pasar-karat-temerloh', 5, 6.985),
+('pasar-malam-taman-saga', 'pasar-malam-saga-indah', 1, 0.609),
+('pasar-malam-taman-saga', 'pasar-malam-jln-mok-khee-kiang-mentakab', 2, 2.641),
+('pasar-malam-taman-saga', 'pasar-malam-taman-tualang-indah', 3, 5.362),
+('pasar-malam-taman-saga', 'pasar-malam-taman-temerloh-jaya', 4, 8.419),
+('pasar-malam-taman-saga', 'temerloh-night-market', 5, 11.189),
+('pasar-malam-sungai-isap', 'pasar-malam-bukit-rangin', 1, 1.603),
+('pasar-malam-sungai-isap', 'pasar-malam-cenderawasih', 2, 2.467),
+('pasar-malam-sungai-isap', 'pasar-malam-bkt-rangin-perdana-2', 3, 2.940),
+('pasar-malam-sungai-isap', 'pasar-malam-bukit-setongkol', 4, 3.287),
+('pasar-malam-sungai-isap', 'pasar-malam-indera-mahkota-14', 5, 4.036),
+('pasar-malam-taman-gelora-kuantan', 'carboot-sale-taman-kerang-kuantan', 1, 2.245),
+('pasar-malam-taman-gelora-kuantan', 'popia-nyums-nyums', 2, 2.258),
+('pasar-malam-taman-gelora-kuantan', 'pasar-tani-utc-kuantan', 3, 2.476),
+('pasar-malam-taman-gelora-kuantan', 'pasar-malam-utc-kuantan', 4, 2.488),
+('pasar-malam-taman-gelora-kuantan', 'pasar-street-kuantan', 5, 2.616),
+('pasar-malam-lanchang', 'pasar-malam-saga-indah', 1, 15.483),
+('pasar-malam-lanchang', 'pasar-malam-taman-saga', 2, 15.864),
+('pasar-malam-lanchang', 'pasar-malam-jln-mok-khee-kiang-mentakab', 3, 18.480),
+('pasar-malam-lanchang', 'karak-night-market', 4, 20.140),
+('pasar-malam-lanchang', 'pasar-malam-taman-tualang-indah', 5, 20.194),
+('pasar-malam-sri-jaya', 'pasar-besar-maran', 1, 14.307),
+('pasar-malam-sri-jaya', 'pasar-malam-taman-gambang-damai', 2, 19.785),
+('pasar-malam-sri-jaya', 'pasar-malam-lepar-utara-2', 3, 27.379),
+('pasar-malam-sri-jaya', 'tapak-niaga-pasar-malam-rpsbt-bt-8-lepar', 4, 27.777),
+('pasar-malam-sri-jaya', 'pasar-malam-taman-seri-mahkota', 5, 34.946),
+('pasar-malam-cenderawasih', 'pasar-malam-bukit-setongkol', 1, 0.993),
+('pasar-malam-cenderawasih', 'pasar-malam-sungai-isap', 2, 2.467),
+('pasar-malam-cenderawasih', 'pasar-lambak-indera-mahkota', 3, 2.756),
+('pasar-malam-cenderawasih', 'pasar-street-kuantan', 4, 3.029),
+('pasar-malam-cenderawasih', 'popia-nyums-nyums', 5, 3.079),
+('pasar-malam-balok-permai', 'pasar-malam-balok-perdana', 1, 2.822),
+('pasar-malam-balok-permai', 'pasar-malam-taman-balok-makmur', 2, 3.674),
+('pasar-malam-balok-permai', 'pasar-malam-bandar-damansara-pkppmk', 3, 5.485),
+('pasar-malam-balok-permai', 'taman-dato-rashid', 4, 7.196),
+('pasar-malam-balok-permai', 'pasar-malam-taman-dato-abdul-rashid-salleh-pkppmk', 5, 7.385),
+('pasar-malam-jengka-8', 'tapak-pasar-malam-jerantut-feri', 1, 11.984),
+('pasar-malam-jengka-8', 'pasar-tani-kekal-bandar-tun-abdul-razak-jengka', 2, 13.402),
+('pasar-malam-jengka-8', 'car-boot-sale-bandar-jengka', 3, 13.610),
+('pasar-malam-jengka-8', 'pasar-malam-bandar-tun-razak-jengka', 4, 13.646),
+('pasar-malam-jengka-8', 'tapak-pasar-malam-jerantut', 5, 16.432),
+('pasar-malam-bukit-koman', 'raub-night-bazaar', 1, 2.045),
+('pasar-malam-bukit-koman', 'bazaar-malam-dong-dong-night-bazar', 2, 10.512),
+('pasar-malam-bukit-koman', 'night-market', 3, 17.331),
+('pasar-malam-bukit-koman', 'pasar-malam-dan-pasar-tani-benta', 4, 26.210),
+('pasar-malam-bukit-koman', 'pasar-malam-desa-damai', 5, 27.063),
+('pasar-malam-simpang-pelangai', 'pasar-malam-simpang-durian', 1, 9.159),
+('pasar-malam-simpang-pelangai', 'pasar-malam-kemayan', 2, 19.268),
+('pasar-malam-simpang-pelangai', 'pasar-malam-triang-lama', 3, 25.514),
+('pasar-malam-simpang-pelangai', 'pasar-kuala-klawang-jelebu-negeri-sembilan', 4, 29.349),
+('pasar-malam-simpang-pelangai', 'pasar-malam-kerayong', 5, 30.873),
+('pasar-malam-taman-pandan-perdana-sebelah-tmg-airport', 'dataran-paya-besar-taman-tas-kuantan', 1, 0.808),
+('pasar-malam-taman-pandan-perdana-sebelah-tmg-airport', 'pasar-malam-jaya-gading', 2, 3.071),
+('pasar-malam-taman-pandan-perdana-sebelah-tmg-airport', 'pasar-malam-bkt-rangin-perdana-2', 3, 4.419),
+('pasar-malam-taman-pandan-perdana-sebelah-tmg-airport', 'pasar-tani-inderapura', 4, 4.642),
+('pasar-malam-taman-pandan-perdana-sebelah-tmg-airport', 'pasar-malam-inderapura', 5, 4.679),
+('pasar-malam-dan-pasar-tani-benta', 'bazaar-malam-dong-dong-night-bazar', 1, 15.699),
+('pasar-malam-dan-pasar-tani-benta', 'felda-tersang-night-bazaar', 2, 19.610),
+('pasar-malam-dan-pasar-tani-benta', 'pasar-malam-lipis-selasa', 3, 21.060),
+('pasar-malam-dan-pasar-tani-benta', 'pasar-malam-bukit-koman', 4, 26.210),
+('pasar-malam-dan-pasar-tani-benta', 'raub-night-bazaar', 5, 27.669),
+('pasar-malam-triang-lama', 'pasar-malam-kerayong', 1, 5.498),
+('pasar-malam-triang-lama', 'pasar-malam-kemayan', 2, 13.324),
+('pasar-malam-triang-lama', 'pasar-malam-felda-sebertak', 3, 21.083),
+('pasar-malam-triang-lama', 'pasar-karat-temerloh', 4, 21.764),
+('pasar-malam-triang-lama', 'pasar-malam-temerloh', 5, 22.629),
+('tapak-pasar-malam-nenasi', 'pasar-rabu-muadzam-shah', 1, 39.270),
+('tapak-pasar-malam-nenasi', 'pasar-komuniti-pakarpekan', 2, 43.621),
+('tapak-pasar-malam-nenasi', 'pasar-malam-ahad', 3, 45.873),
+('tapak-pasar-malam-nenasi', 'pasar-malam-tuesday-pasar-karat-saturday-bazar-ramadan-peramu-jaya-3', 4, 51.878),
+('tapak-pasar-malam-nenasi', 'pasar-malam-night-market', 5, 52.547),
+('pasar-malam-indera-mahkota-14', 'pasar-malam-bukit-rangin', 1, 3.500),
+('pasar-malam-indera-mahkota-14', 'pasar-malam-bkt-rangin-perdana-2', 2, 3.602),
+('pasar-malam-indera-mahkota-14', 'pasar-lambak-indera-mahkota', 3, 3.613),
+('pasar-malam-indera-mahkota-14', 'pasar-malam-sungai-isap', 4, 4.036),
+('pasar-malam-indera-mahkota-14', 'pasar-malam-uia-kuantan', 5, 4.214),
+('pasar-malam-jaya-gading', 'dataran-paya-besar-taman-tas-kuantan', 1, 3.053),
+('pasar-malam-jaya-gading', 'pasar-malam-taman-pandan-perdana-sebelah-tmg-airport', 2, 3.071),
+('pasar-malam-jaya-gading', 'pasar-malam-taman-seri-mahkota', 3, 3.944),
+('pasar-malam-jaya-gading', 'pasar-malam-inderapura', 4, 5.536),
+('pasar-malam-jaya-gading', 'pasar-tani-inderapura', 5, 5.540),
+('pasar-malam-indera-sempurna', 'pasar-malam-inderapura', 1, 2.067),
+('pasar-malam-indera-sempurna', 'pasar-tani-inderapura', 2, 2.136),
+('pasar-malam-indera-sempurna', 'pasar-malam-pak-mahat-kempadang-sejahtera', 3, 4.929),
+('pasar-malam-indera-sempurna', 'pasar-malam-kempadang-perdana', 4, 5.544),
+('pasar-malam-indera-sempurna', 'dataran-paya-besar-taman-tas-kuantan', 5, 5.633),
+('pasar-malam-bandar-damansara-pkppmk', 'taman-dato-rashid', 1, 1.944),
+('pasar-malam-bandar-damansara-pkppmk', 'pasar-malam-taman-dato-abdul-rashid-salleh-pkppmk', 2, 1.997),
+('pasar-malam-bandar-damansara-pkppmk', 'pasar-malam-balok-permai', 3, 5.485),
+('pasar-malam-bandar-damansara-pkppmk', 'pasar-malam-uia-kuantan', 4, 6.453),
+('pasar-malam-bandar-damansara-pkppmk', 'pasar-malam-kotasas', 5, 7.382),
+('pasar-malam-sekilau', 'pasar-tani-utc-kuantan', 1, 1.595),
+('pasar-malam-sekilau', 'pasar-malam-utc-kuantan', 2, 1.600),
+('pasar-malam-sekilau', 'pasar-street-kuantan', 3, 1.744),
+('pasar-malam-sekilau', 'carboot-sale-taman-kerang-kuantan', 4, 2.393),
+('pasar-malam-sekilau', 'popia-nyums-nyums', 5, 2.403),
+('temerloh-night-market', 'bazaar-semantan-lurah-semantan-temerloh', 1, 0.158),
+('temerloh-night-market', 'pekan-sehari-temerloh', 2, 0.243),
+('temerloh-night-market', 'pasar-malam-temerloh', 3, 0.372),
+('temerloh-night-market', 'pasar-karat-temerloh', 4, 1.126),
+('temerloh-night-market', 'pasar-malam-taman-temerloh-jaya', 5, 2.857),
+('karak-night-market', 'tapak-pasar-malam-mempaga', 1, 14.107),
+('karak-night-market', 'sunday-morning-market-bentong', 2, 16.289),
+('karak-night-market', 'pasar-perting', 3, 16.340),
+('karak-night-market', 'market-bentong', 4, 16.371),
+('karak-night-market', 'bentong-walk', 5, 16.551),
+('pasar-malam-bukit-rangin', 'pasar-malam-bkt-rangin-perdana-2', 1, 1.337),
+('pasar-malam-bukit-rangin', 'pasar-malam-sungai-isap', 2, 1.603),
+('pasar-malam-bukit-rangin', 'pasar-malam-indera-mahkota-14', 3, 3.500),
+('pasar-malam-bukit-rangin', 'pasar-malam-cenderawasih', 4, 3.925),
+('pasar-malam-bukit-rangin', 'pasar-malam-bukit-setongkol', 5, 4.595),
+('pasar-malam-kerayong', 'pasar-malam-triang-lama', 1, 5.498),
+('pasar-malam-kerayong', 'pasar-malam-felda-sebertak', 2, 16.474),
+('pasar-malam-kerayong', 'pasar-malam-kemayan', 3, 18.160),
+('pasar-malam-kerayong', 'pasar-karat-temerloh', 4, 19.254),
+('pasar-malam-kerayong', 'pasar-malam-temerloh', 5, 20.026),
+('pasar-malam-kempadang-perdana', 'pasar-malam-pak-mahat-kempadang-sejahtera', 1, 2.612),
+('pasar-malam-kempadang-perdana', 'pasar-malam-tmg', 2, 4.675),
+('pasar-malam-kempadang-perdana', 'pasar-malam-indera-sempurna', 3, 5.544),
+('pasar-malam-kempadang-perdana', 'pasar-malam-inderapura', 4, 6.398),
+('pasar-malam-kempadang-perdana', 'pasar-tani-inderapura', 5, 6.414),
+('pekan-sehari-temerloh', 'bazaar-semantan-lurah-semantan-temerloh', 1, 0.097),
+('pekan-sehari-temerloh', 'pasar-malam-temerloh', 2, 0.219),
+('pekan-sehari-temerloh', 'temerloh-night-market', 3, 0.243),
+('pekan-sehari-temerloh', 'pasar-karat-temerloh', 4, 1.117),
+('pekan-sehari-temerloh', 'pasar-malam-taman-temerloh-jaya', 5, 3.099),
+('pasar-malam-taman-impianku', 'pasar-malam-tanjung-pasir', 1, 0.865),
+('pasar-malam-taman-impianku', 'pasar-malam-kotasas', 2, 3.105),
+('pasar-malam-taman-impianku', 'pasar-malam-indera-mahkota-14', 3, 4.519),
+('pasar-malam-taman-impianku', 'pasar-malam-bkt-rangin-perdana-2', 4, 6.655),
+('pasar-malam-taman-impianku', 'pasar-malam-uia-kuantan', 5, 6.659),
+('pasar-malam-inderapura', 'pasar-tani-inderapura', 1, 0.074),
+('pasar-malam-inderapura', 'pasar-malam-indera-sempurna', 2, 2.067),
+('pasar-malam-inderapura', 'dataran-paya-besar-taman-tas-kuantan', 3, 3.880),
+('pasar-malam-inderapura', 'pasar-malam-taman-pandan-perdana-sebelah-tmg-airport', 4, 4.679),
+('pasar-malam-inderapura', 'pasar-malam-pak-mahat-kempadang-sejahtera', 5, 4.893),
+('pasar-malam-jengka-19', 'pasar-malam-kerinau-paya-pulai-temerloh-sabtu', 1, 12.863),
+('pasar-malam-jengka-19', 'pekan-sehari-temerloh', 2, 16.094),
+('pasar-malam-jengka-19', 'bazaar-semantan-lurah-semantan-temerloh', 3, 16.165),
+('pasar-malam-jengka-19', 'temerloh-night-market', 4, 16.194),
+('pasar-malam-jengka-19', 'pasar-malam-temerloh', 5, 16.261),
+('pasar-malam-tanjung-pasir', 'pasar-malam-taman-impianku', 1, 0.865),
+('pasar-malam-tanjung-pasir', 'pasar-malam-kotasas', 2, 3.913),
+('pasar-malam-tanjung-pasir', 'pasar-malam-indera-mahkota-14', 3, 5.133),
+('pasar-malam-tanjung-pasir', 'pasar-malam-bkt-rangin-perdana-2', 4, 6.870),
+('pasar-malam-tanjung-pasir', 'pasar-malam-uia-kuantan', 5, 7.512),
+('pasar-malam-pak-mahat-kempadang-sejahtera', 'pasar-malam-kempadang-perdana', 1, 2.612),
+('pasar-malam-pak-mahat-kempadang-sejahtera', 'pasar-malam-tmg', 2, 2.908),
+('pasar-malam-pak-mahat-kempadang-sejahtera', 'pasar-malam-cenderawasih', 3, 4.732),
+('pasar-malam-pak-mahat-kempadang-sejahtera', 'pasar-tani-inderapura', 4, 4.881),
+('pasar-malam-pak-mahat-kempadang-sejahtera', 'pasar-malam-inderapura', 5, 4.893),
+('tapak-niaga-pasar-malam-rpsbt-bt-8-lepar', 'pasar-malam-taman-gambang-damai', 1, 16.391),
+('tapak-niaga-pasar-malam-rpsbt-bt-8-lepar', 'pasar-malam-taman-seri-mahkota', 2, 21.990),
+('tapak-niaga-pasar-malam-rpsbt-bt-8-lepar', 'pasar-malam-jaya-gading', 3, 24.504),
+('tapak-niaga-pasar-malam-rpsbt-bt-8-lepar', 'pasar-malam-indera-sempurna', 4, 26.720),
+('tapak-niaga-pasar-malam-rpsbt-bt-8-lepar', 'dataran-paya-besar-taman-tas-kuantan', 5, 27.439),
+('pasar-malam-bukit-setongkol', 'pasar-malam-cenderawasih', 1, 0.993),
+('pasar-malam-bukit-setongkol', 'pasar-lambak-indera-mahkota', 2, 1.966),
+('pasar-malam-bukit-setongkol', 'pasar-street-kuantan', 3, 2.120),
+('pasar-malam-bukit-setongkol', 'pasar-malam-utc-kuantan', 4, 2.313),
+('pasar-malam-bukit-setongkol', 'popia-nyums-nyums', 5, 2.320),
+('pasar-malam-taman-gambang-damai', 'pasar-malam-taman-seri-mahkota', 1, 15.243),
+('pasar-malam-taman-gambang-damai', 'tapak-niaga-pasar-malam-rpsbt-bt-8-lepar', 2, 16.391),
+('pasar-malam-taman-gambang-damai', 'pasar-malam-jaya-gading', 3, 19.169),
+('pasar-malam-taman-gambang-damai', 'pasar-malam-sri-jaya', 4, 19.785),
+('pasar-malam-taman-gambang-damai', 'pasar-malam-taman-pandan-perdana-sebelah-tmg-airport', 5, 21.609),
+('tapak-pasar-malam-k-krau', 'pasar-malam-bandar-tun-razak-jengka', 1, 20.938),
+('tapak-pasar-malam-k-krau', 'pasar-tani-kekal-bandar-tun-abdul-razak-jengka', 2, 21.022),
+('tapak-pasar-malam-k-krau', 'car-boot-sale-bandar-jengka', 3, 21.135),
+('tapak-pasar-malam-k-krau', 'pasar-malam-jengka-19', 4, 22.776),
+('tapak-pasar-malam-k-krau', 'pasar-malam-jengka-8', 5, 23.212),
+('night-market', 'pasar-malam-desa-damai', 1, 9.990),
+('night-market', 'bentong-walk', 2, 15.270),
+('night-market', 'raub-night-bazaar', 3, 15.288),
+('night-market', 'market-bentong', 4, 15.407),
+('night-market', 'sunday-morning-market-bentong', 5, 15.500),
+('pasar-rabu-muadzam-shah', 'tapak-pasar-malam-nenasi', 1, 39.270),
+('pasar-rabu-muadzam-shah', 'tapak-niaga-pasar-malam-rpsbt-bt-8-lepar', 2, 56.510),
+('pasar-rabu-muadzam-shah', 'pasar-malam-felda-sebertak', 3, 58.275),
+('pasar-rabu-muadzam-shah', 'pasar-komuniti-pakarpekan', 4, 58.815),
+('pasar-rabu-muadzam-shah', 'pasar-malam-ahad', 5, 60.939),
+('pasar-malam-balok-perdana', 'pasar-malam-taman-balok-makmur', 1, 1.469),
+('pasar-malam-balok-perdana', 'pasar-malam-balok-permai', 2, 2.822),
+('pasar-malam-balok-perdana', 'assb-night-market', 3, 5.115),
+('pasar-malam-balok-perdana', 'pasar-malam-bandar-damansara-pkppmk', 4, 8.149),
+('pasar-malam-balok-perdana', 'taman-dato-rashid', 5, 9.947),
+('raub-night-bazaar', 'pasar-malam-bukit-koman', 1, 2.045),
+('raub-night-bazaar', 'bazaar-malam-dong-dong-night-bazar', 2, 12.033),
+('raub-night-bazaar', 'night-market', 3, 15.288),
+('raub-night-bazaar', 'pasar-malam-desa-damai', 4, 25.040),
+('raub-night-bazaar', 'pasar-malam-dan-pasar-tani-benta', 5, 27.669),
+('pasar-malam-taman-dato-abdul-rashid-salleh-pkppmk', 'taman-dato-rashid', 1, 0.416),
+('pasar-malam-taman-dato-abdul-rashid-salleh-pkppmk', 'pasar-malam-bandar-damansara-pkppmk', 2, 1.997),
+('pasar-malam-taman-dato-abdul-rashid-salleh-pkppmk', 'pasar-malam-uia-kuantan', 3, 4.620),
+('pasar-malam-taman-dato-abdul-rashid-salleh-pkppmk', 'pasar-malam-sekilau', 4, 5.655),
+('pasar-malam-taman-dato-abdul-rashid-salleh-pkppmk', 'pasar-malam-kotasas', 5, 6.480),
+('pasar-malam-tuesday-pasar-karat-saturday-bazar-ramadan-peramu-jaya-3', 'pasar-malam-ahad', 1, 6.145),
+('pasar-malam-tuesday-pasar-karat-saturday-bazar-ramadan-peramu-jaya-3', 'pasar-komuniti-pakarpekan', 2, 8.277),
+('pasar-malam-tuesday-pasar-karat-saturday-bazar-ramadan-peramu-jaya-3', 'pasar-malam-kempadang-perdana', 3, 20.604),
+('pasar-malam-tuesday-pasar-karat-saturday-bazar-ramadan-peramu-jaya-3', 'pasar-malam-indera-sempurna', 4, 22.792),
+('pasar-malam-tuesday-pasar-karat-saturday-bazar-ramadan-peramu-jaya-3', 'pasar-malam-pak-mahat-kempadang-sejahtera', 5, 23.174),
+('pasar-malam-taman-temerloh-jaya', 'temerloh-night-market', 1, 2.857),
+('pasar-malam-taman-temerloh-jaya', 'bazaar-semantan-lurah-semantan-temerloh', 2, 3.007),
+('pasar-malam-taman-temerloh-jaya', 'pekan-sehari-temerloh', 3, 3.099),
+('pasar-malam-taman-temerloh-jaya', 'pasar-karat-temerloh', 4, 3.125),
+('pasar-malam-taman-temerloh-jaya', 'pasar-malam-temerloh', 5, 3.152),
+('pasar-perting', 'sunday-morning-market-bentong', 1, 0.361),
+('pasar-perting', 'market-bentong', 2, 0.408),
+('pasar-perting', 'bentong-walk', 3, 0.466),
+('pasar-perting', 'pasar-malam-desa-damai', 4, 5.939),
+('pasar-perting', 'tapak-pasar-malam-mempaga', 5, 7.084),
+('pasar-malam-lepar-utara-2', 'pasar-malam-sri-jaya', 1, 27.379),
+('pasar-malam-lepar-utara-2', 'car-boot-sale-bandar-jengka', 2, 31.221),
+('pasar-malam-lepar-utara-2', 'pasar-tani-kekal-bandar-tun-abdul-razak-jengka', 3, 31.295),
+('pasar-malam-lepar-utara-2', 'pasar-malam-bandar-tun-razak-jengka', 4, 31.428),
+('pasar-malam-lepar-utara-2', 'pasar-malam-jengka-8', 5, 33.563),
+('pasar-malam-uia-kuantan', 'pasar-lambak-indera-mahkota', 1, 2.665),
+('pasar-malam-uia-kuantan', 'pasar-malam-sekilau', 2, 2.952),
+('pasar-malam-uia-kuantan', 'pasar-malam-utc-kuantan', 3, 4.208),
+('pasar-malam-uia-kuantan', 'pasar-tani-utc-kuantan', 4, 4.211),
+('pasar-malam-uia-kuantan', 'pasar-malam-indera-mahkota-14', 5, 4.214),
+('pasar-malam-kotasas', 'pasar-malam-taman-impianku', 1, 3.105),
+('pasar-malam-kotasas', 'pasar-malam-tanjung-pasir', 2, 3.913),
+('pasar-malam-kotasas', 'pasar-malam-uia-kuantan', 3, 4.414),
+('pasar-malam-kotasas', 'pasar-malam-indera-mahkota-14', 4, 4.630),
+('pasar-malam-kotasas', 'pasar-lambak-indera-mahkota', 5, 6.281),
+('market-bentong', 'sunday-morning-market-bentong', 1, 0.095),
+('market-bentong', 'bentong-walk', 2, 0.180),
+('market-bentong', 'pasar-perting', 3, 0.408),
+('market-bentong', 'pasar-malam-desa-damai', 4, 5.708),
+('market-bentong', 'tapak-pasar-malam-mempaga', 5, 6.752),
+('tapak-pasar-malam-jerantut-feri', 'tapak-pasar-malam-jerantut', 1, 7.288),
+('tapak-pasar-malam-jerantut-feri', 'jerantut-night-market', 2, 7.475),
+('tapak-pasar-malam-jerantut-feri', 'pasar-malam-jengka-8', 3, 11.984),
+('tapak-pasar-malam-jerantut-feri', 'pasar-tani-kekal-bandar-tun-abdul-razak-jengka', 4, 25.163),
+('tapak-pasar-malam-jerantut-feri', 'car-boot-sale-bandar-jengka', 5, 25.380),
+('pasar-tani-inderapura', 'pasar-malam-inderapura', 1, 0.074),
+('pasar-tani-inderapura', 'pasar-malam-indera-sempurna', 2, 2.136),
+('pasar-tani-inderapura', 'dataran-paya-besar-taman-tas-kuantan', 3, 3.844),
+('pasar-tani-inderapura', 'pasar-malam-taman-pandan-perdana-sebelah-tmg-airport', 4, 4.642),
+('pasar-tani-inderapura', 'pasar-malam-pak-mahat-kempadang-sejahtera', 5, 4.881),
+('pasar-malam-taman-balok-makmur', 'pasar-malam-balok-perdana', 1, 1.469),
+('pasar-malam-taman-balok-makmur', 'pasar-malam-balok-permai', 2, 3.674),
+('pasar-malam-taman-balok-makmur', 'assb-night-market', 3, 5.676),
+('pasar-malam-taman-balok-makmur', 'pasar-malam-bandar-damansara-pkppmk', 4, 9.157),
+('pasar-malam-taman-balok-makmur', 'taman-dato-rashid', 5, 10.855),
+('pasar-malam-tmg', 'pasar-malam-pak-mahat-kempadang-sejahtera', 1, 2.908),
+('pasar-malam-tmg', 'pasar-malam-cenderawasih', 2, 3.187),
+('pasar-malam-tmg', 'popia-nyums-nyums', 3, 3.253),
+('pasar-malam-tmg', 'carboot-sale-taman-kerang-kuantan', 4, 3.266),
+('pasar-malam-tmg', 'pasar-malam-bukit-setongkol', 5, 3.439),
+('pasar-malam-kampung-kuantan', 'pasar-malam-jalan-haji-musran', 1, 35.714),
+('pasar-malam-kampung-kuantan', 'kawasan-pasar-malam-setiap-hari', 2, 40.849),
+('pasar-malam-kampung-kuantan', 'pasar-malam-bukit-naga', 3, 45.322),
+('pasar-malam-kampung-kuantan', 'pasar-malam-bandar-baru-sentul', 4, 47.983),
+('pasar-malam-kampung-kuantan', 'pasar-malam-lrt-kg-baru', 5, 49.739),
+('pasar-malam-bandar-baru-sentul', 'pasar-malam-lrt-kg-baru', 1, 2.521),
+('pasar-malam-bandar-baru-sentul', 'pasar-malam-keramat-permai', 2, 4.524),
+('pasar-malam-bandar-baru-sentul', 'pasar-malam-taman-melawati', 3, 6.220),
+('pasar-malam-bandar-baru-sentul', 'pasar-malam-pandan-jaya', 4, 7.530),
+('pasar-malam-bandar-baru-sentul', 'pasar-malam-uptown-cheras-sri-permaisuri', 5, 9.607),
+('dataran-paya-besar-taman-tas-kuantan', 'pasar-malam-taman-pandan-perdana-sebelah-tmg-airport', 1, 0.808),
+('dataran-paya-besar-taman-tas-kuantan', 'pasar-malam-jaya-gading', 2, 3.053),
+('dataran-paya-besar-taman-tas-kuantan', 'pasar-tani-inderapura', 3, 3.844),
+('dataran-paya-besar-taman-tas-kuantan', 'pasar-malam-inderapura', 4, 3.880),
+('dataran-paya-besar-taman-tas-kuantan', 'pasar-malam-bkt-rangin-perdana-2', 5, 4.485),
+('taman-dato-rashid', 'pasar-malam-taman-dato-abdul-rashid-salleh-pkppmk', 1, 0.416),
+('taman-dato-rashid', 'pasar-malam-bandar-damansara-pkppmk', 2, 1.944),
+('taman-dato-rashid', 'pasar-malam-uia-kuantan', 3, 4.903),
+('taman-dato-rashid', 'pasar-malam-sekilau', 4, 5.740),
+('taman-dato-rashid', 'pasar-malam-kotasas', 5, 6.894),
+('pasar-street-kuantan', 'pasar-malam-utc-kuantan', 1, 0.203),
+('pasar-street-kuantan', 'pasar-tani-utc-kuantan', 2, 0.216),
+('pasar-street-kuantan', 'carboot-sale-taman-kerang-kuantan', 3, 0.750),
+('pasar-street-kuantan', 'popia-nyums-nyums', 4, 0.754),
+('pasar-street-kuantan', 'pasar-malam-sekilau', 5, 1.744),
+('pasar-malam-lipis-selasa', 'pasar-malam-dan-pasar-tani-benta', 1, 21.060),
+('pasar-malam-lipis-selasa', 'pasar-malam-benian', 2, 28.647),
+('pasar-malam-lipis-selasa', 'felda-tersang-night-bazaar', 3, 31.097),
+('pasar-malam-lipis-selasa', 'bazaar-malam-dong-dong-night-bazar', 4, 36.753),
+('pasar-malam-lipis-selasa', 'tapak-pasar-malam-jerantut', 5, 43.372),
+('carboot-sale-taman-kerang-kuantan', 'popia-nyums-nyums', 1, 0.016),
+('carboot-sale-taman-kerang-kuantan', 'pasar-street-kuantan', 2, 0.750),
+('carboot-sale-taman-kerang-kuantan', 'pasar-malam-utc-kuantan', 3, 0.816),
+('carboot-sale-taman-kerang-kuantan', 'pasar-tani-utc-kuantan', 4, 0.817),
+('carboot-sale-taman-kerang-kuantan', 'pasar-malam-taman-gelora-kuantan', 5, 2.245),
+('pasar-malam-bkt-rangin-perdana-2', 'pasar-malam-bukit-rangin', 1, 1.337),
+('pasar-malam-bkt-rangin-perdana-2', 'pasar-malam-sungai-isap', 2, 2.940),
+('pasar-malam-bkt-rangin-perdana-2', 'pasar-malam-indera-mahkota-14', 3, 3.602),
+('pasar-malam-bkt-rangin-perdana-2', 'pasar-malam-taman-pandan-perdana-sebelah-tmg-airport', 4, 4.419),
+('pasar-malam-bkt-rangin-perdana-2', 'dataran-paya-besar-taman-tas-kuantan', 5, 4.485),
+('felda-tersang-night-bazaar', 'pasar-malam-benian', 1, 16.320),
+('felda-tersang-night-bazaar', 'pasar-malam-dan-pasar-tani-benta', 2, 19.610),
+('felda-tersang-night-bazaar', 'bazaar-malam-dong-dong-night-bazar', 3, 22.492),
+('felda-tersang-night-bazaar', 'pasar-malam-bukit-koman', 4, 29.468),
+('felda-tersang-night-bazaar', 'pasar-malam-lipis-selasa', 5, 31.097),
+('bazaar-malam-dong-dong-night-bazar', 'pasar-malam-bukit-koman', 1, 10.512),
+('bazaar-malam-dong-dong-night-bazar', 'raub-night-bazaar', 2, 12.033),
+('bazaar-malam-dong-dong-night-bazar', 'pasar-malam-dan-pasar-tani-benta', 3, 15.699),
+('bazaar-malam-dong-dong-night-bazar', 'felda-tersang-night-bazaar', 4, 22.492),
+('bazaar-malam-dong-dong-night-bazar', 'night-market', 5, 25.988),
+('car-boot-sale-bandar-jengka', 'pasar-malam-bandar-tun-razak-jengka', 1, 0.209),
+('car-boot-sale-bandar-jengka', 'pasar-tani-kekal-bandar-tun-abdul-razak-jengka', 2, 0.224),
+('car-boot-sale-bandar-jengka', 'pasar-malam-jengka-8', 3, 13.610),
+('car-boot-sale-bandar-jengka', 'tapak-pasar-malam-k-krau', 4, 21.135),
+('car-boot-sale-bandar-jengka', 'pasar-malam-jengka-19', 5, 23.001),
+('pasar-malam-kerinau-paya-pulai-temerloh-sabtu', 'pekan-sehari-temerloh', 1, 4.712),
+('pasar-malam-kerinau-paya-pulai-temerloh-sabtu', 'pasar-malam-temerloh', 2, 4.751),
+('pasar-malam-kerinau-paya-pulai-temerloh-sabtu', 'bazaar-semantan-lurah-semantan-temerloh', 3, 4.809),
+('pasar-malam-kerinau-paya-pulai-temerloh-sabtu', 'temerloh-night-market', 4, 4.932),
+('pasar-malam-kerinau-paya-pulai-temerloh-sabtu', 'pasar-karat-temerloh', 5, 5.358),
+('pasar-malam-utc-kuantan', 'pasar-tani-utc-kuantan', 1, 0.014),
+('pasar-malam-utc-kuantan', 'pasar-street-kuantan', 2, 0.203),
+('pasar-malam-utc-kuantan', 'carboot-sale-taman-kerang-kuantan', 3, 0.816),
+('pasar-malam-utc-kuantan', 'popia-nyums-nyums', 4, 0.824),
+('pasar-malam-utc-kuantan', 'pasar-malam-sekilau', 5, 1.600),
+('pasar-malam-desa-damai', 'bentong-walk', 1, 5.547),
+('pasar-malam-desa-damai', 'market-bentong', 2, 5.708),
+('pasar-malam-desa-damai', 'sunday-morning-market-bentong', 3, 5.804),
+('pasar-malam-desa-damai', 'pasar-perting', 4, 5.939),
+('pasar-malam-desa-damai', 'tapak-pasar-malam-mempaga', 5, 9.106),
+('pasar-malam-kampung-bandar', 'pasar-malam-jenjarom', 1, 8.843),
+('pasar-malam-kampung-bandar', 'tapak-pasar-malam-jalan-kampung-lombong', 2, 14.444),
+('pasar-malam-kampung-bandar', 'pasar-malam-bukit-naga', 3, 17.466),
+('pasar-malam-kampung-bandar', 'pasar-malam-bandar-saujana-putra', 4, 18.361),
+('pasar-malam-kampung-bandar', 'pasar-malam-kg-bukit-changgang', 5, 21.080),
+('pasar-malam-taman-seri-mahkota', 'pasar-malam-jaya-gading', 1, 3.944),
+('pasar-malam-taman-seri-mahkota', 'pasar-malam-taman-pandan-perdana-sebelah-tmg-airport', 2, 6.491),
+('pasar-malam-taman-seri-mahkota', 'dataran-paya-besar-taman-tas-kuantan', 3, 6.766),
+('pasar-malam-taman-seri-mahkota', 'pasar-malam-inderapura', 4, 9.423),
+('pasar-malam-taman-seri-mahkota', 'pasar-tani-inderapura', 5, 9.434),
+('central-night-market', 'pasar-malam-cameron-highlands', 1, 2.003),
+('central-night-market', 'famous-night-market', 2, 2.046),
+('central-night-market', 'cameron-night-market', 3, 2.058),
+('central-night-market', 'pasar-malam-kea-farm', 4, 4.945),
+('central-night-market', 'simpang-pulai-pasar', 5, 28.626),
+('pasar-malam-bandar-tun-razak-jengka', 'car-boot-sale-bandar-jengka', 1, 0.209),
+('pasar-malam-bandar-tun-razak-jengka', 'pasar-tani-kekal-bandar-tun-abdul-razak-jengka', 2, 0.273),
+('pasar-malam-bandar-tun-razak-jengka', 'pasar-malam-jengka-8', 3, 13.646),
+('pasar-malam-bandar-tun-razak-jengka', 'tapak-pasar-malam-k-krau', 4, 20.938),
+('pasar-malam-bandar-tun-razak-jengka', 'pasar-malam-jengka-19', 5, 22.849),
+('pasar-karat-temerloh', 'pasar-malam-temerloh', 1, 0.915),
+('pasar-karat-temerloh', 'bazaar-semantan-lurah-semantan-temerloh', 2, 1.076),
+('pasar-karat-temerloh', 'pekan-sehari-temerloh', 3, 1.117),
+('pasar-karat-temerloh', 'temerloh-night-market', 4, 1.126),
+('pasar-karat-temerloh', 'pasar-malam-taman-temerloh-jaya', 5, 3.125),
+('famous-night-market', 'cameron-night-market', 1, 0.012),
+('famous-night-market', 'pasar-malam-cameron-highlands', 2, 0.066),
+('famous-night-market', 'central-night-market', 3, 2.046),
+('famous-night-market', 'pasar-malam-kea-farm', 4, 4.164),
+('famous-night-market', 'simpang-pulai-pasar', 5, 27.722),
+('pasar-malam-kea-farm', 'pasar-malam-cameron-highlands', 1, 4.123),
+('pasar-malam-kea-farm', 'famous-night-market', 2, 4.164),
+('pasar-malam-kea-farm', 'cameron-night-market', 3, 4.164),
+('pasar-malam-kea-farm', 'central-night-market', 4, 4.945),
+('pasar-malam-kea-farm', 'simpang-pulai-pasar', 5, 31.254),
+('bazaar-semantan-lurah-semantan-temerloh', 'pekan-sehari-temerloh', 1, 0.097),
+('bazaar-semantan-lurah-semantan-temerloh', 'temerloh-night-market', 2, 0.158),
+('bazaar-semantan-lurah-semantan-temerloh', 'pasar-malam-temerloh', 3, 0.230),
+('bazaar-semantan-lurah-semantan-temerloh', 'pasar-karat-temerloh', 4, 1.076),
+('bazaar-semantan-lurah-semantan-temerloh', 'pasar-malam-taman-temerloh-jaya', 5, 3.007),
+('pasar-besar-maran', 'pasar-malam-sri-jaya', 1, 14.307),
+('pasar-besar-maran', 'pasar-malam-jengka-19', 2, 29.661),
+('pasar-besar-maran', 'car-boot-sale-bandar-jengka', 3, 32.656),
+('pasar-besar-maran', 'pasar-malam-bandar-tun-razak-jengka', 4, 32.709),
+('pasar-besar-maran', 'pasar-malam-taman-gambang-damai', 5, 32.797),
+('pasar-malam-saga-indah', 'pasar-malam-taman-saga', 1, 0.609),
+('pasar-malam-saga-indah', 'pasar-malam-jln-mok-khee-kiang-mentakab', 2, 3.121),
+('pasar-malam-saga-indah', 'pasar-malam-taman-tualang-indah', 3, 5.376),
+('pasar-malam-saga-indah', 'pasar-malam-taman-temerloh-jaya', 4, 8.678),
+('pasar-malam-saga-indah', 'temerloh-night-market', 5, 11.482),
+('pasar-malam-benian', 'felda-tersang-night-bazaar', 1, 16.320),
+('pasar-malam-benian', 'pasar-malam-lipis-selasa', 2, 28.647),
+('pasar-malam-benian', 'pasar-malam-dan-pasar-tani-benta', 3, 29.112),
+('pasar-malam-benian', 'bazaar-malam-dong-dong-night-bazar', 4, 37.607),
+('pasar-malam-benian', 'pasar-malam-bukit-koman', 5, 45.579),
+('sunday-morning-market-bentong', 'market-bentong', 1, 0.095),
+('sunday-morning-market-bentong', 'bentong-walk', 2, 0.267),
+('sunday-morning-market-bentong', 'pasar-perting', 3, 0.361),
+('sunday-morning-market-bentong', 'pasar-malam-desa-damai', 4, 5.804),
+('sunday-morning-market-bentong', 'tapak-pasar-malam-mempaga', 5, 6.751),
+('pasar-komuniti-pakarpekan', 'pasar-malam-ahad', 1, 2.343),
+('pasar-komuniti-pakarpekan', 'pasar-malam-tuesday-pasar-karat-saturday-bazar-ramadan-peramu-jaya-3', 2, 8.277),
+('pasar-komuniti-pakarpekan', 'pasar-malam-kempadang-perdana', 3, 28.825),
+('pasar-komuniti-pakarpekan', 'pasar-malam-indera-sempurna', 4, 30.646),
+('pasar-komuniti-pakarpekan', 'pasar-malam-pak-mahat-kempadang-sejahtera', 5, 31.374),
+('jerantut-night-market', 'tapak-pasar-malam-jerantut', 1, 0.257),
+('jerantut-night-market', 'tapak-pasar-malam-jerantut-feri', 2, 7.475),
+('jerantut-night-market', 'pasar-malam-jengka-8', 3, 16.454),
+('jerantut-night-market', 'tapak-pasar-malam-k-krau', 4, 25.138),
+('jerantut-night-market', 'pasar-tani-kekal-bandar-tun-abdul-razak-jengka', 5, 28.089),
+('pasar-malam-ahad', 'pasar-komuniti-pakarpekan', 1, 2.343),
+('pasar-malam-ahad', 'pasar-malam-tuesday-pasar-karat-saturday-bazar-ramadan-peramu-jaya-3', 2, 6.145),
+('pasar-malam-ahad', 'pasar-malam-kempadang-perdana', 3, 26.749),
+('pasar-malam-ahad', 'pasar-malam-indera-sempurna', 4, 28.800),
+('pasar-malam-ahad', 'pasar-malam-pak-mahat-kempadang-sejahtera', 5, 29.318),
+('pasar-malam-jalan-haji-musran', 'pasar-malam-bukit-naga', 1, 11.431),
+('pasar-malam-jalan-haji-musran', 'tapak-pasar-malam-jalan-kampung-lombong', 2, 15.557),
+('pasar-malam-jalan-haji-musran', 'pasar-malam-jenjarom', 3, 22.441),
+('pasar-malam-jalan-haji-musran', 'pasar-malam-kampung-bandar', 4, 22.609),
+('pasar-malam-jalan-haji-musran', 'pasar-malam-bandar-saujana-putra', 5, 23.298),
+('pasar-malam-r-r-bandar-baru-chendor', 'pasar-minggu-bandar-baharu-bukit-mentok', 1, 7.701),
+('pasar-malam-r-r-bandar-baru-chendor', 'pasar-tani-kekal-chukai', 2, 7.912),
+('pasar-malam-r-r-bandar-baru-chendor', 'pasar-dusun-nyior', 3, 7.951),
+('pasar-malam-r-r-bandar-baru-chendor', 'pasar-binjai', 4, 8.446),
+('pasar-malam-r-r-bandar-baru-chendor', 'padang-astaka', 5, 8.447),
+('pasar-malam-keramat-permai', 'pasar-malam-lrt-kg-baru', 1, 3.748),
+('pasar-malam-keramat-permai', 'pasar-malam-taman-melawati', 2, 3.992),
+('pasar-malam-keramat-permai', 'pasar-malam-bandar-baru-sentul', 3, 4.524),
+('pasar-malam-keramat-permai', 'pasar-malam-pandan-jaya', 4, 4.748),
+('pasar-malam-keramat-permai', 'pasar-malam-kampung-tasek-tambahan', 5, 6.600),
+('popia-nyums-nyums', 'carboot-sale-taman-kerang-kuantan', 1, 0.016),
+('popia-nyums-nyums', 'pasar-street-kuantan', 2, 0.754),
+('popia-nyums-nyums', 'pasar-malam-utc-kuantan', 3, 0.824),
+('popia-nyums-nyums', 'pasar-tani-utc-kuantan', 4, 0.825),
+('popia-nyums-nyums', 'pasar-malam-taman-gelora-kuantan', 5, 2.258),
+('pasar-tani-utc-kuantan', 'pasar-malam-utc-kuantan', 1, 0.014),
+('pasar-tani-utc-kuantan', 'pasar-street-kuantan', 2, 0.216),
+('pasar-tani-utc-kuantan', 'carboot-sale-taman-kerang-kuantan', 3, 0.817),
+('pasar-tani-utc-kuantan', 'popia-nyums-nyums', 4, 0.825),
+('pasar-tani-utc-kuantan', 'pasar-malam-sekilau', 5, 1.595),
+('pasar-malam-lrt-kg-baru', 'pasar-malam-bandar-baru-sentul', 1, 2.521),
+('pasar-malam-lrt-kg-baru', 'pasar-malam-keramat-permai', 2, 3.748),
+('pasar-malam-lrt-kg-baru', 'pasar-malam-pandan-jaya', 3, 5.216),
+('pasar-malam-lrt-kg-baru', 'pasar-malam-taman-melawati', 4, 6.942),
+('pasar-malam-lrt-kg-baru', 'pasar-malam-uptown-cheras-sri-permaisuri', 5, 7.177),
+('bentong-walk', 'market-bentong', 1, 0.180),
+('bentong-walk', 'sunday-morning-market-bentong', 2, 0.267),
+('bentong-walk', 'pasar-perting', 3, 0.466),
+('bentong-walk', 'pasar-malam-desa-damai', 4, 5.547),
+('bentong-walk', 'tapak-pasar-malam-mempaga', 5, 6.841),
+('pasar-malam-chukai', 'padang-astaka', 1, 0.288),
+('pasar-malam-chukai', 'pasar-dusun-nyior', 2, 1.588),
+('pasar-malam-chukai', 'pasar-tani-kekal-chukai', 3, 1.678),
+('pasar-malam-chukai', 'pasar-minggu-bandar-baharu-bukit-mentok', 4, 1.900),
+('pasar-malam-chukai', 'pasar-malam-kuala-kemaman', 5, 2.698),
+('pasar-tani-kekal-bandar-tun-abdul-razak-jengka', 'car-boot-sale-bandar-jengka', 1, 0.224),
+('pasar-tani-kekal-bandar-tun-abdul-razak-jengka', 'pasar-malam-bandar-tun-razak-jengka', 2, 0.273),
+('pasar-tani-kekal-bandar-tun-abdul-razak-jengka', 'pasar-malam-jengka-8', 3, 13.402),
+('pasar-tani-kekal-bandar-tun-abdul-razak-jengka', 'tapak-pasar-malam-k-krau', 4, 21.022),
+('pasar-tani-kekal-bandar-tun-abdul-razak-jengka', 'pasar-malam-jengka-19', 5, 23.118),
+('pasar-malam-taman-melawati', 'pasar-malam-keramat-permai', 1, 3.992),
+('pasar-malam-taman-melawati', 'pasar-malam-bandar-baru-sentul', 2, 6.220),
+('pasar-malam-taman-melawati', 'pasar-malam-lrt-kg-baru', 3, 6.942),
+('pasar-malam-taman-melawati', 'pasar-malam-pandan-jaya', 4, 8.578),
+('pasar-malam-taman-melawati', 'pasar-malam-kampung-tasek-tambahan', 5, 9.668),
+('pasar-malam-sri-petaling-new', 'pasar-malam-uptown-cheras-sri-permaisuri', 1, 3.931),
+('pasar-malam-sri-petaling-new', 'pasar-malam-taman-segar', 2, 6.183),
+('pasar-malam-sri-petaling-new', 'pasar-malam-sri-serdang-jumaat-isnin', 3, 6.364),
+('pasar-malam-sri-petaling-new', 'pasar-malam-taman-tun-perak-cheras', 4, 7.462),
+('pasar-malam-sri-petaling-new', 'pasar-malam-pandan-jaya', 5, 9.019),
+('kawasan-pasar-malam-setiap-hari', 'pasar-perting', 1, 28.290),
+('kawasan-pasar-malam-setiap-hari', 'pasar-malam-desa-damai', 2, 28.471),
+('kawasan-pasar-malam-setiap-hari', 'bentong-walk', 3, 28.505),
+('kawasan-pasar-malam-setiap-hari', 'market-bentong', 4, 28.602),
+('kawasan-pasar-malam-setiap-hari', 'sunday-morning-market-bentong', 5, 28.609),
+('pasar-malam-gunung-rapat', 'night-market-gunung-rapat', 1, 0.080),
+('pasar-malam-gunung-rapat', 'pasar-malam-pekan-razaki', 2, 0.798),
+('pasar-malam-gunung-rapat', 'pasar-malam-taman-rapat-setia-baru', 3, 0.980),
+('pasar-malam-gunung-rapat', 'medan-gopeng-pasar-tani', 4, 1.464),
+('pasar-malam-gunung-rapat', 'pasar-malam-taman-seri-rapat', 5, 2.333),
+('pasar-malam-taman-ipoh-timur', 'pasar-tani-stadium-ipoh', 1, 1.912),
+('pasar-malam-taman-ipoh-timur', 'pasar-malam-bercham-terbesar', 2, 2.007),
+('pasar-malam-taman-ipoh-timur', 'pasar-tambun-tambun-market', 3, 2.448),
+('pasar-malam-taman-ipoh-timur', 'bercham-night-market', 4, 2.510),
+('pasar-malam-taman-ipoh-timur', 'pasar-malam-bercham', 5, 2.571),
+('pasar-malam-taman-bercham-raya', 'pasar-malam-taman-perpaduan', 1, 0.886),
+('pasar-malam-taman-bercham-raya', 'pasar-malam-bercham', 2, 1.529),
+('pasar-malam-taman-bercham-raya', 'bercham-night-market', 3, 1.557),
+('pasar-malam-taman-bercham-raya', 'pasar-malam-bercham-terbesar', 4, 2.122),
+('pasar-malam-taman-bercham-raya', 'pasar-tambun-tambun-market', 5, 3.096),
+('pasar-malam-selama-hari-sabtu', 'pasar-malam-selama-kedah-hari-khamis', 1, 0.739),
+('pasar-malam-selama-hari-sabtu', 'pasar-malam-serdang-hari-isnin', 2, 8.365),
+('pasar-malam-selama-hari-sabtu', 'pasar-pagi-sabtu-mahang', 3, 10.860),
+('pasar-malam-selama-hari-sabtu', 'bukit-bertam-nightmarket-tuesday', 4, 12.165),
+('pasar-malam-selama-hari-sabtu', 'pasar-malam-sungai-duri', 5, 17.333),
+('pasar-malam-kg-gajah', 'pekan-rabu-pasar-malam', 1, 2.503),
+('pasar-malam-kg-gajah', 'pasar-pagi-chenderong-balai', 2, 16.649),
+('pasar-malam-kg-gajah', 'pasar-malam-jumaat-bbsap', 3, 18.716),
+('pasar-malam-kg-gajah', 'pasar-malam-mingguan-bbsap', 4, 18.814),
+('pasar-malam-kg-gajah', 'pasar-awam-bota-kanan', 5, 19.707),
+('yi-bao-di-yi-hua-yuan-ye-shi-first-garden-night-bazaar-pasar-malam-taman-pertama', '1st-garden-friday-night-market', 1, 0.146),
+('yi-bao-di-yi-hua-yuan-ye-shi-first-garden-night-bazaar-pasar-malam-taman-pertama', 'pasar-malam-silibin', 2, 1.519),
+('yi-bao-di-yi-hua-yuan-ye-shi-first-garden-night-bazaar-pasar-malam-taman-pertama', 'pasar-awam-falim', 3, 1.899),
+('yi-bao-di-yi-hua-yuan-ye-shi-first-garden-night-bazaar-pasar-malam-taman-pertama', 'pasar-malam-silibin-utara', 4, 1.927),
+('yi-bao-di-yi-hua-yuan-ye-shi-first-garden-night-bazaar-pasar-malam-taman-pertama', 'pasar-karat-ipoh', 5, 2.803),
+('bukit-bertam-nightmarket-tuesday', 'pasar-pagi-sabtu-mahang', 1, 3.056),
+('bukit-bertam-nightmarket-tuesday', 'pasar-malam-selama-kedah-hari-khamis', 2, 11.885),
+('bukit-bertam-nightmarket-tuesday', 'pasar-malam-selama-hari-sabtu', 3, 12.165),
+('bukit-bertam-nightmarket-tuesday', 'pasar-malam-serdang-hari-isnin', 4, 19.091),
+('bukit-bertam-nightmarket-tuesday', 'pasar-malam-kg-kelang-lama', 5, 21.772),
+('pasar-malam-taman-perpaduan', 'pasar-malam-taman-bercham-raya', 1, 0.886),
+('pasar-malam-taman-perpaduan', 'pasar-malam-bercham', 2, 2.415),
+('pasar-malam-taman-perpaduan', 'bercham-night-market', 3, 2.442),
+('pasar-malam-taman-perpaduan', 'pasar-malam-bercham-terbesar', 4, 3.002),
+('pasar-malam-taman-perpaduan', 'pasar-tambun-tambun-market', 5, 3.469),
+('gerbang-malam-ipoh', 'toddscent', 1, 0.084),
+('gerbang-malam-ipoh', 'gerbang-malam-lou-wong-entrance', 2, 0.119),
+('gerbang-malam-ipoh', 'weekend-night-market', 3, 0.144),
+('gerbang-malam-ipoh', 'pasar-karat-ipoh', 4, 0.349),
+('gerbang-malam-ipoh', 'pasar-tani-stadium-ipoh', 5, 2.690),
+('pasar-malam-taman-kaya', 'pasar-malam-air-kuning', 1, 1.840),
+('pasar-malam-taman-kaya', 'pasar-malam-batu-2-12', 2, 1.944),
+('pasar-malam-taman-kaya', 'pasar-malam-taman-raja-idris-pokok-asam', 3, 2.801),
+('pasar-malam-taman-kaya', 'pasar-changkat-jering', 4, 2.900),
+('pasar-malam-taman-kaya', 'pasar-minggu-changkat-jering', 5, 2.936),
+('pasar-malam-taman-pengkalan-jaya-thursday-chinese', 'sppk-wet-market-morning', 1, 0.065),
+('pasar-malam-taman-pengkalan-jaya-thursday-chinese', 'pasar-malam-sppk-tuesday-melayu', 2, 0.096),
+('pasar-malam-taman-pengkalan-jaya-thursday-chinese', 'station-18-pasar-malam', 3, 1.734),
+('pasar-malam-taman-pengkalan-jaya-thursday-chinese', 'pasar-malam-desa-aman-ahad-melayu', 4, 2.461),
+('pasar-malam-taman-pengkalan-jaya-thursday-chinese', 'pasar-malam-taman-seri-rapat', 5, 3.174),
+('pasar-malam-silibin', 'pasar-malam-silibin-utara', 1, 0.436),
+('pasar-malam-silibin', '1st-garden-friday-night-market', 2, 1.438),
+('pasar-malam-silibin', 'yi-bao-di-yi-hua-yuan-ye-shi-first-garden-night-bazaar-pasar-malam-taman-pertama', 3, 1.519),
+('pasar-malam-silibin', 'pasar-karat-ipoh', 4, 3.374),
+('pasar-malam-silibin', 'pasar-awam-falim', 5, 3.388),
+('pasar-malam-taman-rapat-setia-baru', 'night-market-gunung-rapat', 1, 0.907),
+('pasar-malam-taman-rapat-setia-baru', 'pasar-malam-gunung-rapat', 2, 0.980),
+('pasar-malam-taman-rapat-setia-baru', 'pasar-malam-pekan-razaki', 3, 1.724),
+('pasar-malam-taman-rapat-setia-baru', 'medan-gopeng-pasar-tani', 4, 2.141),
+('pasar-malam-taman-rapat-setia-baru', 'pasar-malam-taman-seri-rapat', 5, 2.722),
+('pasar-malam-sungai-siput', 'pasar-malam-kg-jalong', 1, 6.197),
+('pasar-malam-sungai-siput', 'pasar-malam-chemor', 2, 11.657),
+('pasar-malam-sungai-siput', 'chemor-market', 3, 11.680),
+('pasar-malam-sungai-siput', 'pasar-malam-meru-permai-ipoh-perak-rabu', 4, 15.902),
+('pasar-malam-sungai-siput', 'pasar-minggu-setiap-jumaat', 5, 17.117),
+('pasar-malam-meru-permai-ipoh-perak-rabu', 'pasar-mini-alameen', 1, 2.072),
+('pasar-malam-meru-permai-ipoh-perak-rabu', 'pasar-malam-tasek-damai', 2, 3.480),
+('pasar-malam-meru-permai-ipoh-perak-rabu', 'pasar-malam-chemor', 3, 5.963),
+('pasar-malam-meru-permai-ipoh-perak-rabu', 'chemor-market', 4, 6.523),
+('pasar-malam-meru-permai-ipoh-perak-rabu', 'pasar-malam-bercham-terbesar', 5, 7.000),
+('pasar-malam-simpang', 'pasar-malam-batu-2-12', 1, 2.249),
+('pasar-malam-simpang', 'pasar-malam-taman-kaya', 2, 2.945),
+('pasar-malam-simpang', 'pasar-malam-aulong', 3, 3.550),
+('pasar-malam-simpang', 'pasar-malam-air-kuning', 4, 4.139),
+('pasar-malam-simpang', 'pasar-malam-taman-raja-idris-pokok-asam', 5, 4.513),
+('pasar-malam-tanjung-piandang', 'pasar-malam-kuala-kurau', 1, 8.212),
+('pasar-malam-tanjung-piandang', 'pasar-malam-pekan-lama-parit-buntar', 2, 13.345),
+('pasar-malam-tanjung-piandang', 'pasar-malam-rabu-bandar-baharu', 3, 13.638),
+('pasar-malam-tanjung-piandang', 'pasar-malam-nibong-tebal', 4, 15.171),
+('pasar-malam-tanjung-piandang', 'pasar-malam-bagan-serai', 5, 18.613),
+('pasar-malam-seri-iskandar', 'pasar-awam-bota-kanan', 1, 10.213),
+('pasar-malam-seri-iskandar', 'pasar-malam-tanjung-tualang', 2, 10.258),
+('pasar-malam-seri-iskandar', 'pasar-malam-selasa-batu-gajah', 3, 14.380),
+('pasar-malam-seri-iskandar', 'pasar-sehari-batu-gajah', 4, 15.179),
+('pasar-malam-seri-iskandar', 'pasar-malam-taman-saujana', 5, 15.640),
+('pasar-malam-padang-tembak', 'pasar-malam-jumaat-bukit-permata-lumut-perak', 1, 1.371),
+('pasar-malam-padang-tembak', 'pasar-basah-tldm-lumut-perak', 2, 1.620),
+('pasar-malam-padang-tembak', 'pasar-malam-kdsk', 3, 4.101),
+('pasar-malam-padang-tembak', 'pasar-malam-khamis-updated-2025', 4, 4.495),
+('pasar-malam-padang-tembak', 'persalam-night-market', 5, 4.912),
+('pasar-malam-jumaat-bukit-permata-lumut-perak', 'pasar-malam-padang-tembak', 1, 1.371),
+('pasar-malam-jumaat-bukit-permata-lumut-perak', 'pasar-basah-tldm-lumut-perak', 2, 2.847),
+('pasar-malam-jumaat-bukit-permata-lumut-perak', 'pasar-malam-kdsk', 3, 3.211),
+('pasar-malam-jumaat-bukit-permata-lumut-perak', 'pasar-malam-khamis-updated-2025', 4, 3.290),
+('pasar-malam-jumaat-bukit-permata-lumut-perak', 'persalam-night-market', 5, 3.543),
+('pasar-malam-jumaat-simpang-pulai', 'simpang-pulai-pasar', 1, 0.867),
+('pasar-malam-jumaat-simpang-pulai', 'bandar-cyber-night-market', 2, 1.690),
+('pasar-malam-jumaat-simpang-pulai', 'pasar-malam-lapangan-siber', 3, 1.694),
+('pasar-malam-jumaat-simpang-pulai', 'pasar-malam-botani', 4, 1.695),
+('pasar-malam-jumaat-simpang-pulai', 'pasar-malam-bandar-pulai-jaya', 5, 1.849),
+('pasar-malam-tasek-damai', 'pasar-malam-meru-permai-ipoh-perak-rabu', 1, 3.480),
+('pasar-malam-tasek-damai', 'pasar-malam-bercham-terbesar', 2, 3.538),
+('pasar-malam-tasek-damai', 'pasar-mini-alameen', 3, 3.664),
+('pasar-malam-tasek-damai', 'pasar-malam-bercham', 4, 3.786),
+('pasar-malam-tasek-damai', 'bercham-night-market', 5, 3.800),
+('pasar-malam-sungai-tinggi', 'pasar-malam-selasa-taman-bintang-wei-xing-yuan-bai-er-shi', 1, 16.062),
+('pasar-malam-sungai-tinggi', 'pantai-remis-market', 2, 16.867),
+('pasar-malam-sungai-tinggi', 'pasar-malam-ahad-batu-9', 3, 19.314),
+('pasar-malam-sungai-tinggi', 'pasar-sari-jumaat-isnin-weekly-market', 4, 22.311),
+('pasar-malam-sungai-tinggi', 'pasar-malan-simpang-tiga-changkat-jering', 5, 22.422),
+('pasar-hari-selasa-sabtu-alor-pongsu', 'pasar-malam-bagan-serai', 1, 6.775),
+('pasar-hari-selasa-sabtu-alor-pongsu', 'pasar-hari-rabu-simpang-empatsemanggol', 2, 11.722),
+('pasar-hari-selasa-sabtu-alor-pongsu', 'pasar-malam-simpang-tiga', 3, 13.657),
+('pasar-hari-selasa-sabtu-alor-pongsu', 'pasar-malam-rabu-bandar-baharu', 4, 13.784),
+('pasar-hari-selasa-sabtu-alor-pongsu', 'pasar-malam-pekan-lama-parit-buntar', 5, 13.943),
+('pasar-malam-pekan-lama-parit-buntar', 'pasar-malam-rabu-bandar-baharu', 1, 0.298),
+('pasar-malam-pekan-lama-parit-buntar', 'pasar-malam-nibong-tebal', 2, 5.420),
+('pasar-malam-pekan-lama-parit-buntar', 'pasar-malam-taman-seruling-emas', 3, 9.333),
+('pasar-malam-pekan-lama-parit-buntar', 'pasar-malam-sungai-bakap', 4, 9.829),
+('pasar-malam-pekan-lama-parit-buntar', 'pasar-malam-sungai-duri', 5, 9.869),
+('tapak-pasar-malam-batu-gajah-perdana', 'pasar-malam-taman-saujana', 1, 0.996),
+('tapak-pasar-malam-batu-gajah-perdana', 'pasar-malam-selasa-batu-gajah', 2, 3.931),
+('tapak-pasar-malam-batu-gajah-perdana', 'pasar-sehari-batu-gajah', 3, 4.049),
+('tapak-pasar-malam-batu-gajah-perdana', 'lahat-baru-night-market', 4, 5.215),
+('tapak-pasar-malam-batu-gajah-perdana', 'night-market-waterfront-city', 5, 5.389),
+('pasar-malam-desa-aman-ahad-melayu', 'station-18-pasar-malam', 1, 0.785),
+('pasar-malam-desa-aman-ahad-melayu', 'lahat-baru-night-market', 2, 2.206),
+('pasar-malam-desa-aman-ahad-melayu', 'pasar-malam-taman-pengkalan-jaya-thursday-chinese', 3, 2.461),
+('pasar-malam-desa-aman-ahad-melayu', 'sppk-wet-market-morning', 4, 2.516),
+('pasar-malam-desa-aman-ahad-melayu', 'pasar-malam-sppk-tuesday-melayu', 5, 2.526),
+('pasar-malam-kdsk', 'pasar-malam-khamis-updated-2025', 1, 1.385),
+('pasar-malam-kdsk', 'chocotainer-seri-manjung-perak', 2, 2.086),
+('pasar-malam-kdsk', 'pasar-malam-jumaat-bukit-permata-lumut-perak', 3, 3.211),
+('pasar-malam-kdsk', 'persalam-night-market', 4, 3.478),
+('pasar-malam-kdsk', 'pasar-malam-padang-tembak', 5, 4.101),
+('pasar-malam-chemor', 'chemor-market', 1, 0.678),
+('pasar-malam-chemor', 'pasar-malam-meru-permai-ipoh-perak-rabu', 2, 5.963),
+('pasar-malam-chemor', 'pasar-malam-tasek-damai', 3, 7.385),
+('pasar-malam-chemor', 'pasar-mini-alameen', 4, 8.034),
+('pasar-malam-chemor', 'pasar-malam-bercham', 5, 9.376),
+('pasar-malam-rabu-bandar-baru', 'pasar-malam-isnin', 1, 1.529),
+('pasar-malam-rabu-bandar-baru', 'pasar-awam-malim-nawar', 2, 4.106),
+('pasar-malam-rabu-bandar-baru', 'pasar-malam-mambang-di-awan-khamis', 3, 6.389),
+('pasar-malam-rabu-bandar-baru', 'pasar-malam-tanjung-tualang', 4, 9.016),
+('pasar-malam-rabu-bandar-baru', 'pasar-awam-tapah', 5, 18.143),
+('pasar-malam-taman-seri-rapat', 'medan-gopeng-pasar-tani', 1, 1.050),
+('pasar-malam-taman-seri-rapat', 'bandar-cyber-night-market', 2, 2.235),
+('pasar-malam-taman-seri-rapat', 'pasar-malam-lapangan-siber', 3, 2.254),
+('pasar-malam-taman-seri-rapat', 'pasar-malam-botani', 4, 2.272),
+('pasar-malam-taman-seri-rapat', 'night-market-gunung-rapat', 5, 2.318),
+('pasar-malam-selasa-batu-gajah', 'pasar-sehari-batu-gajah', 1, 0.872),
+('pasar-malam-selasa-batu-gajah', 'pasar-malam-taman-saujana', 2, 2.946),
+('pasar-malam-selasa-batu-gajah', 'tapak-pasar-malam-batu-gajah-perdana', 3, 3.931),
+('pasar-malam-selasa-batu-gajah', 'lahat-baru-night-market', 4, 7.865),
+('pasar-malam-selasa-batu-gajah', 'pasar-malam-desa-aman-ahad-melayu', 5, 8.189),
+('pasar-malam-taman-rasi', 'pasar-awam-falim', 1, 2.484),
+('pasar-malam-taman-rasi', 'yi-bao-di-yi-hua-yuan-ye-shi-first-garden-night-bazaar-pasar-malam-taman-pertama', 2, 3.162),
+('pasar-malam-taman-rasi', '1st-garden-friday-night-market', 3, 3.302),
+('pasar-malam-taman-rasi', 'night-market-waterfront-city', 4, 3.339),
+('pasar-malam-taman-rasi', 'lahat-baru-night-market', 5, 3.718),
+('pasar-malam-bercham', 'bercham-night-market', 1, 0.064),
+('pasar-malam-bercham', 'pasar-malam-bercham-terbesar', 2, 0.638),
+('pasar-malam-bercham', 'pasar-malam-taman-bercham-raya', 3, 1.529),
+('pasar-malam-bercham', 'pasar-malam-taman-perpaduan', 4, 2.415),
+('pasar-malam-bercham', 'pasar-malam-taman-ipoh-timur', 5, 2.571),
+('pasar-malam-aulong', 'pasar-malambazar-ramadhan', 1, 1.825),
+('pasar-malam-aulong', 'pasar-malam-batu-2-12', 2, 2.527),
+('pasar-malam-aulong', 'cross-street-bazaar-taiping', 3, 2.709),
+('pasar-malam-aulong', 'pasar-malam-taman-raja-idris-pokok-asam', 4, 3.471),
+('pasar-malam-aulong', 'pasar-malam-simpang', 5, 3.550),
+('pasar-malam-pekan-razaki', 'pasar-malam-gunung-rapat', 1, 0.798),
+('pasar-malam-pekan-razaki', 'night-market-gunung-rapat', 2, 0.878),
+('pasar-malam-pekan-razaki', 'medan-gopeng-pasar-tani', 3, 1.634),
+('pasar-malam-pekan-razaki', 'pasar-malam-taman-rapat-setia-baru', 4, 1.724),
+('pasar-malam-pekan-razaki', 'pasar-malam-taman-seri-rapat', 5, 2.662),
+('pasar-malam-bandar-pulai-jaya', 'simpang-pulai-pasar', 1, 1.043),
+('pasar-malam-bandar-pulai-jaya', 'pasar-malam-jumaat-simpang-pulai', 2, 1.849),
+('pasar-malam-bandar-pulai-jaya', 'pasar-malam-botani', 3, 2.929),
+('pasar-malam-bandar-pulai-jaya', 'pasar-malam-lapangan-siber', 4, 2.941),
+('pasar-malam-bandar-pulai-jaya', 'bandar-cyber-night-market', 5, 2.953),
+('pasar-malam-ahad-batu-9', 'pasar-malan-simpang-tiga-changkat-jering', 1, 3.160),
+('pasar-malam-ahad-batu-9', 'pasar-minggu-changkat-jering', 2, 3.252),
+('pasar-malam-ahad-batu-9', 'pasar-changkat-jering', 3, 3.281),
+('pasar-malam-ahad-batu-9', 'pasar-malam-taman-kaya', 4, 6.167),
+('pasar-malam-ahad-batu-9', 'pasar-malam-air-kuning', 5, 7.499),
+('pasar-malambazar-ramadhan', 'pasar-malam-aulong', 1, 1.825),
+('pasar-malambazar-ramadhan', 'pasar-malam-taman-mewah', 2, 2.387),
+('pasar-malambazar-ramadhan', 'pasar-kamunting', 3, 2.794),
+('pasar-malambazar-ramadhan', 'cross-street-bazaar-taiping', 4, 2.938),
+('pasar-malambazar-ramadhan', 'pasar-malam-bukit-jana-kamunting', 5, 3.188),
+('pasar-malam-kuala-kurau', 'pasar-malam-tanjung-piandang', 1, 8.212),
+('pasar-malam-kuala-kurau', 'pasar-malam-bagan-serai', 2, 11.903),
+('pasar-malam-kuala-kurau', 'pasar-malam-pekan-lama-parit-buntar', 3, 13.979),
+('pasar-malam-kuala-kurau', 'pasar-malam-rabu-bandar-baharu', 4, 14.190),
+('pasar-malam-kuala-kurau', 'pasar-hari-selasa-sabtu-alor-pongsu', 5, 17.500),
+('pekan-rabu-pasar-malam', 'pasar-malam-kg-gajah', 1, 2.503),
+('pekan-rabu-pasar-malam', 'pasar-malam-jumaat-bbsap', 2, 17.288),
+('pekan-rabu-pasar-malam', 'pasar-malam-mingguan-bbsap', 3, 17.375),
+('pekan-rabu-pasar-malam', 'pasar-pagi-chenderong-balai', 4, 17.880),
+('pekan-rabu-pasar-malam', 'pasar-tani-kekal-lekir', 5, 18.125),
+('pasar-malam-kg-jalong', 'pasar-malam-sungai-siput', 1, 6.197),
+('pasar-malam-kg-jalong', 'chemor-market', 2, 12.362),
+('pasar-malam-kg-jalong', 'pasar-malam-chemor', 3, 12.675),
+('pasar-malam-kg-jalong', 'pasar-malam-meru-permai-ipoh-perak-rabu', 4, 18.253),
+('pasar-malam-kg-jalong', 'pasar-malam-tasek-damai', 5, 20.055),
+('pasar-mini-alameen', 'pasar-malam-meru-permai-ipoh-perak-rabu', 1, 2.072),
+('pasar-mini-alameen', 'pasar-malam-tasek-damai', 2, 3.664),
+('pasar-mini-alameen', 'pasar-malam-silibin-utara', 3, 5.290),
+('pasar-mini-alameen', 'pasar-malam-silibin', 4, 5.726),
+('pasar-mini-alameen', 'pasar-tani-stadium-ipoh', 5, 6.588),
+('pasar-malam-taman-mewah', 'pasar-kamunting', 1, 1.047),
+('pasar-malam-taman-mewah', 'pasar-malambazar-ramadhan', 2, 2.387),
+('pasar-malam-taman-mewah', 'pasar-malam-bukit-jana-kamunting', 3, 2.438),
+('pasar-malam-taman-mewah', 'pasar-malam-aulong', 4, 4.149),
+('pasar-malam-taman-mewah', 'pasar-malam-taman-berkat-taiping-ahad', 5, 4.391),
+('pasar-malam-jumaat-bbsap', 'pasar-malam-mingguan-bbsap', 1, 0.131),
+('pasar-malam-jumaat-bbsap', 'pasar-malam-persalam', 2, 6.931),
+('pasar-malam-jumaat-bbsap', 'pasar-malam-sitiawan', 3, 8.935),
+('pasar-malam-jumaat-bbsap', 'bazar-ramadan-astaka-sitiawan', 4, 9.190),
+('pasar-malam-jumaat-bbsap', 'tapak-pasar-malam-kampung-acheh-sitiawan', 5, 9.991),
+('1st-garden-friday-night-market', 'yi-bao-di-yi-hua-yuan-ye-shi-first-garden-night-bazaar-pasar-malam-taman-pertama', 1, 0.146),
+('1st-garden-friday-night-market', 'pasar-malam-silibin', 2, 1.438),
+('1st-garden-friday-night-market', 'pasar-malam-silibin-utara', 3, 1.834),
+('1st-garden-friday-night-market', 'pasar-awam-falim', 4, 1.955),
+('1st-garden-friday-night-market', 'pasar-karat-ipoh', 5, 2.700),
+('pasar-malan-simpang-tiga-changkat-jering', 'pasar-minggu-changkat-jering', 1, 0.097),
+('pasar-malan-simpang-tiga-changkat-jering', 'pasar-changkat-jering', 2, 0.121),
+('pasar-malan-simpang-tiga-changkat-jering', 'pasar-malam-taman-kaya', 3, 3.021),
+('pasar-malan-simpang-tiga-changkat-jering', 'pasar-malam-ahad-batu-9', 4, 3.160),
+('pasar-malan-simpang-tiga-changkat-jering', 'pasar-malam-air-kuning', 5, 4.511),
+('pasar-malam-sppk-tuesday-melayu', 'pasar-malam-taman-pengkalan-jaya-thursday-chinese', 1, 0.096),
+('pasar-malam-sppk-tuesday-melayu', 'sppk-wet-market-morning', 2, 0.107),
+('pasar-malam-sppk-tuesday-melayu', 'station-18-pasar-malam', 3, 1.809),
+('pasar-malam-sppk-tuesday-melayu', 'pasar-malam-desa-aman-ahad-melayu', 4, 2.526),
+('pasar-malam-sppk-tuesday-melayu', 'pasar-malam-taman-seri-rapat', 5, 3.147),
+('bercham-night-market', 'pasar-malam-bercham', 1, 0.064),
+('bercham-night-market', 'pasar-malam-bercham-terbesar', 2, 0.590),
+('bercham-night-market', 'pasar-malam-taman-bercham-raya', 3, 1.557),
+('bercham-night-market', 'pasar-malam-taman-perpaduan', 4, 2.442),
+('bercham-night-market', 'pasar-malam-taman-ipoh-timur', 5, 2.510),
+('pasar-malam-taman-saujana', 'tapak-pasar-malam-batu-gajah-perdana', 1, 0.996),
+('pasar-malam-taman-saujana', 'pasar-malam-selasa-batu-gajah', 2, 2.946),
+('pasar-malam-taman-saujana', 'pasar-sehari-batu-gajah', 3, 3.132),
+('pasar-malam-taman-saujana', 'lahat-baru-night-market', 4, 5.851),
+('pasar-malam-taman-saujana', 'night-market-waterfront-city', 5, 6.103),
+('pasar-malam-bercham-terbesar', 'bercham-night-market', 1, 0.590),
+('pasar-malam-bercham-terbesar', 'pasar-malam-bercham', 2, 0.638),
+('pasar-malam-bercham-terbesar', 'pasar-malam-taman-ipoh-timur', 3, 2.007),
+('pasar-malam-bercham-terbesar', 'pasar-malam-taman-bercham-raya', 4, 2.122),
+('pasar-malam-bercham-terbesar', 'pasar-tambun-tambun-market', 5, 2.920),
+('station-18-pasar-malam', 'pasar-malam-desa-aman-ahad-melayu', 1, 0.785),
+('station-18-pasar-malam', 'pasar-malam-taman-pengkalan-jaya-thursday-chinese', 2, 1.734),
+('station-18-pasar-malam', 'sppk-wet-market-morning', 3, 1.783),
+('station-18-pasar-malam', 'pasar-malam-sppk-tuesday-melayu', 4, 1.809),
+('station-18-pasar-malam', 'lahat-baru-night-market', 5, 2.934),
+('pasar-malam-botani', 'pasar-malam-lapangan-siber', 1, 0.022),
+('pasar-malam-botani', 'bandar-cyber-night-market', 2, 0.048),
+('pasar-malam-botani', 'pasar-malam-jumaat-simpang-pulai', 3, 1.695),
+('pasar-malam-botani', 'pasar-malam-taman-seri-rapat', 4, 2.272),
+('pasar-malam-botani', 'simpang-pulai-pasar', 5, 2.324),
+('weekend-night-market', 'gerbang-malam-ipoh', 1, 0.144),
+('weekend-night-market', 'toddscent', 2, 0.193),
+('weekend-night-market', 'gerbang-malam-lou-wong-entrance', 3, 0.216),
+('weekend-night-market', 'pasar-karat-ipoh', 4, 0.475),
+('weekend-night-market', 'pasar-tani-stadium-ipoh', 5, 2.616),
+('pasar-malam-bukit-jana-kamunting', 'pasar-kamunting', 1, 1.487),
+('pasar-malam-bukit-jana-kamunting', 'pasar-malam-taman-mewah', 2, 2.438),
+('pasar-malam-bukit-jana-kamunting', 'pasar-malambazar-ramadhan', 3, 3.188),
+('pasar-malam-bukit-jana-kamunting', 'cross-street-bazaar-taiping', 4, 4.189),
+('pasar-malam-bukit-jana-kamunting', 'pasar-malam-aulong', 5, 4.861),
+('persalam-night-market', 'chocotainer-seri-manjung-perak', 1, 1.716),
+('persalam-night-market', 'pasar-malam-khamis-updated-2025', 2, 2.192),
+('persalam-night-market', 'bazar-ramadan-astaka-sitiawan', 3, 3.056),
+('persalam-night-market', 'pasar-malam-sitiawan', 4, 3.396),
+('persalam-night-market', 'tapak-pasar-malam-kampung-acheh-sitiawan', 5, 3.436),
+('tapak-pasar-malam-sauk', 'pasar-terpanjang-kuala-kangsar-selasa-petang-dan-ahad-pagi', 1, 17.834),
+('tapak-pasar-malam-sauk', 'pasar-minggu-setiap-jumaat', 2, 18.473),
+('tapak-pasar-malam-sauk', 'pasar-malam-bukit-jana-kamunting', 3, 21.018),
+('tapak-pasar-malam-sauk', 'cross-street-bazaar-taiping', 4, 21.917),
+('tapak-pasar-malam-sauk', 'pasar-kamunting', 5, 22.399),
+('pasar-malam-air-kuning', 'pasar-malam-taman-raja-idris-pokok-asam', 1, 1.117),
+('pasar-malam-air-kuning', 'pasar-malam-taman-kaya', 2, 1.840),
+('pasar-malam-air-kuning', 'pasar-malam-batu-2-12', 3, 2.121),
+('pasar-malam-air-kuning', 'cross-street-bazaar-taiping', 4, 3.544),
+('pasar-malam-air-kuning', 'pasar-malam-aulong', 5, 4.062),
+('tapak-pasar-malam-kampung-acheh-sitiawan', 'bazar-ramadan-astaka-sitiawan', 1, 2.139),
+('tapak-pasar-malam-kampung-acheh-sitiawan', 'pasar-malam-sitiawan', 2, 3.147),
+('tapak-pasar-malam-kampung-acheh-sitiawan', 'persalam-night-market', 3, 3.436),
+('tapak-pasar-malam-kampung-acheh-sitiawan', 'chocotainer-seri-manjung-perak', 4, 4.842),
+('tapak-pasar-malam-kampung-acheh-sitiawan', 'pasar-malam-khamis-updated-2025', 5, 5.482),
+('pasar-malam-lapangan-siber', 'pasar-malam-botani', 1, 0.022),
+('pasar-malam-lapangan-siber', 'bandar-cyber-night-market', 2, 0.026),
+('pasar-malam-lapangan-siber', 'pasar-malam-jumaat-simpang-pulai', 3, 1.694),
+('pasar-malam-lapangan-siber', 'pasar-malam-taman-seri-rapat', 4, 2.254),
+('pasar-malam-lapangan-siber', 'simpang-pulai-pasar', 5, 2.330),
+('pasar-malam-bidor-rabu', 'pasar-malam-selasa-sungkai', 1, 10.338),
+('pasar-malam-bidor-rabu', 'pasar-tani-masjid-daerah-tapah', 2, 11.881),
+('pasar-malam-bidor-rabu', 'pasar-tani-tapah', 3, 13.673),
+('pasar-malam-bidor-rabu', 'pasar-awam-tapah', 4, 13.695),
+('pasar-malam-bidor-rabu', 'pasar-pagi-chenderong-balai', 5, 22.644),
+('pasar-tambun-tambun-market', 'pasar-malam-taman-ipoh-timur', 1, 2.448),
+('pasar-tambun-tambun-market', 'pasar-malam-bercham-terbesar', 2, 2.920),
+('pasar-tambun-tambun-market', 'bercham-night-market', 3, 2.960),
+('pasar-tambun-tambun-market', 'pasar-malam-bercham', 4, 3.012),
+('pasar-tambun-tambun-market', 'pasar-malam-taman-bercham-raya', 5, 3.096),
+('pasar-minggu-setiap-jumaat', 'pasar-terpanjang-kuala-kangsar-selasa-petang-dan-ahad-pagi', 1, 4.895),
+('pasar-minggu-setiap-jumaat', 'pasar-malam-sungai-siput', 2, 17.117),
+('pasar-minggu-setiap-jumaat', 'tapak-pasar-malam-sauk', 3, 18.473),
+('pasar-minggu-setiap-jumaat', 'pasar-malam-meru-permai-ipoh-perak-rabu', 4, 18.878),
+('pasar-minggu-setiap-jumaat', 'pasar-mini-alameen', 5, 18.909),
+('toddscent', 'gerbang-malam-ipoh', 1, 0.084),
+('toddscent', 'gerbang-malam-lou-wong-entrance', 2, 0.190),
+('toddscent', 'weekend-night-market', 3, 0.193),
+('toddscent', 'pasar-karat-ipoh', 4, 0.282),
+('toddscent', 'pasar-tani-stadium-ipoh', 5, 2.643),
+('pasar-awam-falim', 'yi-bao-di-yi-hua-yuan-ye-shi-first-garden-night-bazaar-pasar-malam-taman-pertama', 1, 1.899),
+('pasar-awam-falim', '1st-garden-friday-night-market', 2, 1.955),
+('pasar-awam-falim', 'pasar-malam-taman-rasi', 3, 2.484),
+('pasar-awam-falim', 'gerbang-malam-lou-wong-entrance', 4, 2.610),
+('pasar-awam-falim', 'pasar-karat-ipoh', 5, 2.692),
+('pasar-minggu-changkat-jering', 'pasar-changkat-jering', 1, 0.053),
+('pasar-minggu-changkat-jering', 'pasar-malan-simpang-tiga-changkat-jering', 2, 0.097),
+('pasar-minggu-changkat-jering', 'pasar-malam-taman-kaya', 3, 2.936),
+('pasar-minggu-changkat-jering', 'pasar-malam-ahad-batu-9', 4, 3.252),
+('pasar-minggu-changkat-jering', 'pasar-malam-air-kuning', 5, 4.443),
+('lahat-baru-night-market', 'night-market-waterfront-city', 1, 0.629),
+('lahat-baru-night-market', 'pasar-malam-desa-aman-ahad-melayu', 2, 2.206),
+('lahat-baru-night-market', 'station-18-pasar-malam', 3, 2.934),
+('lahat-baru-night-market', 'pasar-malam-taman-rasi', 4, 3.718),
+('lahat-baru-night-market', 'pasar-malam-taman-pengkalan-jaya-thursday-chinese', 5, 4.332),
+('simpang-pulai-pasar', 'pasar-malam-jumaat-simpang-pulai', 1, 0.867),
+('simpang-pulai-pasar', 'pasar-malam-bandar-pulai-jaya', 2, 1.043),
+('simpang-pulai-pasar', 'pasar-malam-botani', 3, 2.324),
+('simpang-pulai-pasar', 'pasar-malam-lapangan-siber', 4, 2.330),
+('simpang-pulai-pasar', 'bandar-cyber-night-market', 5, 2.334),
+('bandar-cyber-night-market', 'pasar-malam-lapangan-siber', 1, 0.026),
+('bandar-cyber-night-market', 'pasar-malam-botani', 2, 0.048),
+('bandar-cyber-night-market', 'pasar-malam-jumaat-simpang-pulai', 3, 1.690),
+('bandar-cyber-night-market', 'pasar-malam-taman-seri-rapat', 4, 2.235),
+('bandar-cyber-night-market', 'simpang-pulai-pasar', 5, 2.334),
+('pasar-malam-tanjung-tualang', 'pasar-malam-isnin', 1, 7.545),
+('pasar-malam-tanjung-tualang', 'pasar-awam-malim-nawar', 2, 7.873),
+('pasar-malam-tanjung-tualang', 'pasar-malam-rabu-bandar-baru', 3, 9.016),
+('pasar-malam-tanjung-tualang', 'pasar-malam-seri-iskandar', 4, 10.258),
+('pasar-malam-tanjung-tualang', 'pasar-malam-mambang-di-awan-khamis', 5, 11.612),
+('pasar-malam-batu-2-12', 'pasar-malam-taman-kaya', 1, 1.944),
+('pasar-malam-batu-2-12', 'pasar-malam-air-kuning', 2, 2.121),
+('pasar-malam-batu-2-12', 'pasar-malam-simpang', 3, 2.249),
+('pasar-malam-batu-2-12', 'pasar-malam-taman-raja-idris-pokok-asam', 4, 2.276),
+('pasar-malam-batu-2-12', 'pasar-malam-aulong', 5, 2.527),
+('pasar-pagi-chenderong-balai', 'pasar-malam-kg-gajah', 1, 16.649),
+('pasar-pagi-chenderong-balai', 'pekan-rabu-pasar-malam', 2, 17.880),
+('pasar-pagi-chenderong-balai', 'pasar-malam-mambang-di-awan-khamis', 3, 17.922),
+('pasar-pagi-chenderong-balai', 'pasar-tani-masjid-daerah-tapah', 4, 21.824),
+('pasar-pagi-chenderong-balai', 'pasar-tani-tapah', 5, 22.051),
+('pasar-karat-ipoh', 'toddscent', 1, 0.282),
+('pasar-karat-ipoh', 'gerbang-malam-ipoh', 2, 0.349),
+('pasar-karat-ipoh', 'gerbang-malam-lou-wong-entrance', 3, 0.396),
+('pasar-karat-ipoh', 'weekend-night-market', 4, 0.475),
+('pasar-karat-ipoh', 'pasar-awam-falim', 5, 2.692),
+('pasar-malam-sitiawan', 'bazar-ramadan-astaka-sitiawan', 1, 1.008),
+('pasar-malam-sitiawan', 'tapak-pasar-malam-kampung-acheh-sitiawan', 2, 3.147),
+('pasar-malam-sitiawan', 'persalam-night-market', 3, 3.396),
+('pasar-malam-sitiawan', 'chocotainer-seri-manjung-perak', 4, 3.603),
+('pasar-malam-sitiawan', 'pasar-malam-khamis-updated-2025', 5, 4.301),
+('pasar-malam-mingguan-bbsap', 'pasar-malam-jumaat-bbsap', 1, 0.131),
+('pasar-malam-mingguan-bbsap', 'pasar-malam-persalam', 2, 6.803),
+('pasar-malam-mingguan-bbsap', 'pasar-malam-sitiawan', 3, 8.813),
+('pasar-malam-mingguan-bbsap', 'bazar-ramadan-astaka-sitiawan', 4, 9.074),
+('pasar-malam-mingguan-bbsap', 'tapak-pasar-malam-kampung-acheh-sitiawan', 5, 9.890),
+('medan-gopeng-pasar-tani', 'pasar-malam-taman-seri-rapat', 1, 1.050),
+('medan-gopeng-pasar-tani', 'pasar-malam-gunung-rapat', 2, 1.464),
+('medan-gopeng-pasar-tani', 'night-market-gunung-rapat', 3, 1.476),
+('medan-gopeng-pasar-tani', 'pasar-malam-pekan-razaki', 4, 1.634),
+('medan-gopeng-pasar-tani', 'pasar-malam-taman-rapat-setia-baru', 5, 2.141),
+('pasar-malam-persalam', 'pasar-malam-sitiawan', 1, 4.892),
+('pasar-malam-persalam', 'bazar-ramadan-astaka-sitiawan', 2, 5.801),
+('pasar-malam-persalam', 'pasar-malam-mingguan-bbsap', 3, 6.803),
+('pasar-malam-persalam', 'pasar-malam-jumaat-bbsap', 4, 6.931),
+('pasar-malam-persalam', 'chocotainer-seri-manjung-perak', 5, 7.307),
+('pasar-malam-silibin-utara', 'pasar-malam-silibin', 1, 0.436),
+('pasar-malam-silibin-utara', '1st-garden-friday-night-market', 2, 1.834),
+('pasar-malam-silibin-utara', 'yi-bao-di-yi-hua-yuan-ye-shi-first-garden-night-bazaar-pasar-malam-taman-pertama', 3, 1.927),
+('pasar-malam-silibin-utara', 'pasar-karat-ipoh', 4, 3.486),
+('pasar-malam-silibin-utara', 'pasar-awam-falim', 5, 3.766),
+('pasar-malam-isnin', 'pasar-malam-rabu-bandar-baru', 1, 1.529),
+('pasar-malam-isnin', 'pasar-awam-malim-nawar', 2, 4.000),
+('pasar-malam-isnin', 'pasar-malam-mambang-di-awan-khamis', 3, 6.355),
+('pasar-malam-isnin', 'pasar-malam-tanjung-tualang', 4, 7.545),
+('pasar-malam-isnin', 'pasar-malam-seri-iskandar', 5, 17.567),
+('night-market-waterfront-city', 'lahat-baru-night-market', 1, 0.629),
+('night-market-waterfront-city', 'pasar-malam-desa-aman-ahad-melayu', 2, 2.720),
+('night-market-waterfront-city', 'pasar-malam-taman-rasi', 3, 3.339),
+('night-market-waterfront-city', 'station-18-pasar-malam', 4, 3.401),
+('night-market-waterfront-city', 'pasar-malam-taman-pengkalan-jaya-thursday-chinese', 5, 4.654),
+('pasar-malam-simpang-tiga', 'pasar-hari-rabu-simpang-empatsemanggol', 1, 2.010),
+('pasar-malam-simpang-tiga', 'pasar-malam-taman-berkat-taiping-ahad', 2, 9.570),
+('pasar-malam-simpang-tiga', 'pasar-malam-taman-mewah', 3, 10.066),
+('pasar-malam-simpang-tiga', 'pasar-kamunting', 4, 10.702),
+('pasar-malam-simpang-tiga', 'pasar-malambazar-ramadhan', 5, 11.827),
+('pasar-kamunting', 'pasar-malam-taman-mewah', 1, 1.047),
+('pasar-kamunting', 'pasar-malam-bukit-jana-kamunting', 2, 1.487),
+('pasar-kamunting', 'pasar-malambazar-ramadhan', 3, 2.794),
+('pasar-kamunting', 'pasar-malam-aulong', 4, 4.619),
+('pasar-kamunting', 'cross-street-bazaar-taiping', 5, 4.808),
+('pasar-sari-jumaat-isnin-weekly-market', 'pasar-malam-taman-rasi', 1, 18.128),
+('pasar-sari-jumaat-isnin-weekly-market', 'night-market-waterfront-city', 2, 18.511),
+('pasar-sari-jumaat-isnin-weekly-market', 'lahat-baru-night-market', 3, 19.100),
+('pasar-sari-jumaat-isnin-weekly-market', 'tapak-pasar-malam-batu-gajah-perdana', 4, 19.119),
+('pasar-sari-jumaat-isnin-weekly-market', 'pasar-malam-silibin', 5, 19.416),
+('sppk-wet-market-morning', 'pasar-malam-taman-pengkalan-jaya-thursday-chinese', 1, 0.065),
+('sppk-wet-market-morning', 'pasar-malam-sppk-tuesday-melayu', 2, 0.107),
+('sppk-wet-market-morning', 'station-18-pasar-malam', 3, 1.783),
+('sppk-wet-market-morning', 'pasar-malam-desa-aman-ahad-melayu', 4, 2.516),
+('sppk-wet-market-morning', 'pasar-malam-taman-seri-rapat', 5, 3.110),
+('pasar-malam-taman-raja-idris-pokok-asam', 'pasar-malam-air-kuning', 1, 1.117),
+('pasar-malam-taman-raja-idris-pokok-asam', 'pasar-malam-batu-2-12', 2, 2.276),
+('pasar-malam-taman-raja-idris-pokok-asam', 'cross-street-bazaar-taiping', 3, 2.453),
+('pasar-malam-taman-raja-idris-pokok-asam', 'pasar-malam-taman-kaya', 4, 2.801),
+('pasar-malam-taman-raja-idris-pokok-asam', 'pasar-malam-aulong', 5, 3.471),
+('pasar-malam-taman-berkat-taiping-ahad', 'pasar-malam-aulong', 1, 3.863),
+('pasar-malam-taman-berkat-taiping-ahad', 'pasar-malambazar-ramadhan', 2, 3.905),
+('pasar-malam-taman-berkat-taiping-ahad', 'pasar-malam-taman-mewah', 3, 4.391),
+('pasar-malam-taman-berkat-taiping-ahad', 'pasar-malam-simpang', 4, 4.747),
+('pasar-malam-taman-berkat-taiping-ahad', 'pasar-kamunting', 5, 5.406),
+('night-market-gunung-rapat', 'pasar-malam-gunung-rapat', 1, 0.080),
+('night-market-gunung-rapat', 'pasar-malam-pekan-razaki', 2, 0.878),
+('night-market-gunung-rapat', 'pasar-malam-taman-rapat-setia-baru', 3, 0.907),
+('night-market-gunung-rapat', 'medan-gopeng-pasar-tani', 4, 1.476),
+('night-market-gunung-rapat', 'pasar-malam-taman-seri-rapat', 5, 2.318),
+('cross-street-bazaar-taiping', 'pasar-malam-taman-raja-idris-pokok-asam', 1, 2.453),
+('cross-street-bazaar-taiping', 'pasar-malam-aulong', 2, 2.709),
+('cross-street-bazaar-taiping', 'pasar-malambazar-ramadhan', 3, 2.938),
+('cross-street-bazaar-taiping', 'pasar-malam-air-kuning', 4, 3.544),
+('cross-street-bazaar-taiping', 'pasar-malam-batu-2-12', 5, 3.560),
+('pasar-awam-bota-kanan', 'pasar-malam-seri-iskandar', 1, 10.213),
+('pasar-awam-bota-kanan', 'pasar-malam-jumaat-bbsap', 2, 18.230),
+('pasar-awam-bota-kanan', 'pasar-malam-mingguan-bbsap', 3, 18.351),
+('pasar-awam-bota-kanan', 'pasar-malam-kg-gajah', 4, 19.707),
+('pasar-awam-bota-kanan', 'pasar-malam-tanjung-tualang', 5, 19.840),
+('pasar-tani-tapah', 'pasar-awam-tapah', 1, 0.034),
+('pasar-tani-tapah', 'pasar-tani-masjid-daerah-tapah', 2, 1.803),
+('pasar-tani-tapah', 'pasar-malam-bidor-rabu', 3, 13.673),
+('pasar-tani-tapah', 'pasar-malam-mambang-di-awan-khamis', 4, 13.843),
+('pasar-tani-tapah', 'pasar-malam-rabu-bandar-baru', 5, 18.145),
+('pasar-awam-tapah', 'pasar-tani-tapah', 1, 0.034),
+('pasar-awam-tapah', 'pasar-tani-masjid-daerah-tapah', 2, 1.822),
+('pasar-awam-tapah', 'pasar-malam-bidor-rabu', 3, 13.695),
+('pasar-awam-tapah', 'pasar-malam-mambang-di-awan-khamis', 4, 13.851),
+('pasar-awam-tapah', 'pasar-malam-rabu-bandar-baru', 5, 18.143),
+('bazar-ramadan-astaka-sitiawan', 'pasar-malam-sitiawan', 1, 1.008),
+('bazar-ramadan-astaka-sitiawan', 'tapak-pasar-malam-kampung-acheh-sitiawan', 2, 2.139),
+('bazar-ramadan-astaka-sitiawan', 'persalam-night-market', 3, 3.056),
+('bazar-ramadan-astaka-sitiawan', 'chocotainer-seri-manjung-perak', 4, 3.745),
+('bazar-ramadan-astaka-sitiawan', 'pasar-malam-khamis-updated-2025', 5, 4.457),
+('pasar-malam-mambang-di-awan-khamis', 'pasar-malam-isnin', 1, 6.355),
+('pasar-malam-mambang-di-awan-khamis', 'pasar-malam-rabu-bandar-baru', 2, 6.389),
+('pasar-malam-mambang-di-awan-khamis', 'pasar-awam-malim-nawar', 3, 10.296),
+('pasar-malam-mambang-di-awan-khamis', 'pasar-malam-tanjung-tualang', 4, 11.612),
+('pasar-malam-mambang-di-awan-khamis', 'pasar-tani-tapah', 5, 13.843),
+('chemor-market', 'pasar-malam-chemor', 1, 0.678),
+('chemor-market', 'pasar-malam-meru-permai-ipoh-perak-rabu', 2, 6.523),
+('chemor-market', 'pasar-malam-tasek-damai', 3, 7.708),
+('chemor-market', 'pasar-mini-alameen', 4, 8.587),
+('chemor-market', 'pasar-malam-bercham', 5, 9.446),
+('pasar-hari-rabu-simpang-empatsemanggol', 'pasar-malam-simpang-tiga', 1, 2.010),
+('pasar-hari-rabu-simpang-empatsemanggol', 'pasar-malam-taman-berkat-taiping-ahad', 2, 11.571),
+('pasar-hari-rabu-simpang-empatsemanggol', 'pasar-malam-bagan-serai', 3, 11.721),
+('pasar-hari-rabu-simpang-empatsemanggol', 'pasar-hari-selasa-sabtu-alor-pongsu', 4, 11.722),
+('pasar-hari-rabu-simpang-empatsemanggol', 'pasar-malam-taman-mewah', 5, 11.976),
+('pasar-tani-stadium-ipoh', 'pasar-malam-taman-ipoh-timur', 1, 1.912),
+('pasar-tani-stadium-ipoh', 'weekend-night-market', 2, 2.616),
+('pasar-tani-stadium-ipoh', 'toddscent', 3, 2.643),
+('pasar-tani-stadium-ipoh', 'gerbang-malam-ipoh', 4, 2.690),
+('pasar-tani-stadium-ipoh', 'pasar-karat-ipoh', 5, 2.699),
+('pasar-malam-khamis-updated-2025', 'chocotainer-seri-manjung-perak', 1, 0.713),
+('pasar-malam-khamis-updated-2025', 'pasar-malam-kdsk', 2, 1.385),
+('pasar-malam-khamis-updated-2025', 'persalam-night-market', 3, 2.192),
+('pasar-malam-khamis-updated-2025', 'pasar-malam-jumaat-bukit-permata-lumut-perak', 4, 3.290),
+('pasar-malam-khamis-updated-2025', 'pasar-malam-sitiawan', 5, 4.301),
+('pasar-basah-tldm-lumut-perak', 'pasar-malam-padang-tembak', 1, 1.620),
+('pasar-basah-tldm-lumut-perak', 'pasar-malam-jumaat-bukit-permata-lumut-perak', 2, 2.847),
+('pasar-basah-tldm-lumut-perak', 'pasar-malam-kdsk', 3, 5.715),
+('pasar-basah-tldm-lumut-perak', 'pasar-malam-khamis-updated-2025', 4, 6.090),
+('pasar-basah-tldm-lumut-perak', 'persalam-night-market', 5, 6.264),
+('pasar-sehari-batu-gajah', 'pasar-malam-selasa-batu-gajah', 1, 0.872),
+('pasar-sehari-batu-gajah', 'pasar-malam-taman-saujana', 2, 3.132),
+('pasar-sehari-batu-gajah', 'tapak-pasar-malam-batu-gajah-perdana', 3, 4.049),
+('pasar-sehari-batu-gajah', 'lahat-baru-night-market', 4, 7.408),
+('pasar-sehari-batu-gajah', 'pasar-malam-desa-aman-ahad-melayu', 5, 7.542),
+('pasar-tani-kekal-lekir', 'pasar-malam-persalam', 1, 7.532),
+('pasar-tani-kekal-lekir', 'pasar-malam-mingguan-bbsap', 2, 10.802),
+('pasar-tani-kekal-lekir', 'pasar-malam-jumaat-bbsap', 3, 10.876),
+('pasar-tani-kekal-lekir', 'pasar-malam-sitiawan', 4, 12.334),
+('pasar-tani-kekal-lekir', 'bazar-ramadan-astaka-sitiawan', 5, 13.288),
+('gerbang-malam-lou-wong-entrance', 'gerbang-malam-ipoh', 1, 0.119),
+('gerbang-malam-lou-wong-entrance', 'toddscent', 2, 0.190),
+('gerbang-malam-lou-wong-entrance', 'weekend-night-market', 3, 0.216),
+('gerbang-malam-lou-wong-entrance', 'pasar-karat-ipoh', 4, 0.396),
+('gerbang-malam-lou-wong-entrance', 'pasar-awam-falim', 5, 2.610),
+('pantai-remis-market', 'pasar-malam-selasa-taman-bintang-wei-xing-yuan-bai-er-shi', 1, 1.781),
+('pantai-remis-market', 'pasar-malam-sungai-tinggi', 2, 16.867),
+('pantai-remis-market', 'tapak-pasar-malam-kampung-acheh-sitiawan', 3, 24.633),
+('pantai-remis-market', 'pasar-basah-tldm-lumut-perak', 4, 25.865),
+('pantai-remis-market', 'persalam-night-market', 5, 26.493),
+('pasar-malam-bagan-serai', 'pasar-hari-selasa-sabtu-alor-pongsu', 1, 6.775),
+('pasar-malam-bagan-serai', 'pasar-hari-rabu-simpang-empatsemanggol', 2, 11.721),
+('pasar-malam-bagan-serai', 'pasar-malam-kuala-kurau', 3, 11.903),
+('pasar-malam-bagan-serai', 'pasar-malam-simpang-tiga', 4, 13.659),
+('pasar-malam-bagan-serai', 'pasar-malam-rabu-bandar-baharu', 5, 14.235),
+('chocotainer-seri-manjung-perak', 'pasar-malam-khamis-updated-2025', 1, 0.713),
+('chocotainer-seri-manjung-perak', 'persalam-night-market', 2, 1.716),
+('chocotainer-seri-manjung-perak', 'pasar-malam-kdsk', 3, 2.086),
+('chocotainer-seri-manjung-perak', 'pasar-malam-sitiawan', 4, 3.603),
+('chocotainer-seri-manjung-perak', 'pasar-malam-jumaat-bukit-permata-lumut-perak', 5, 3.683),
+('pasar-changkat-jering', 'pasar-minggu-changkat-jering', 1, 0.053),
+('pasar-changkat-jering', 'pasar-malan-simpang-tiga-changkat-jering', 2, 0.121),
+('pasar-changkat-jering', 'pasar-malam-taman-kaya', 3, 2.900),
+('pasar-changkat-jering', 'pasar-malam-ahad-batu-9', 4, 3.281),
+('pasar-changkat-jering', 'pasar-malam-air-kuning', 5, 4.397),
+('pasar-tani-masjid-daerah-tapah', 'pasar-tani-tapah', 1, 1.803),
+('pasar-tani-masjid-daerah-tapah', 'pasar-awam-tapah', 2, 1.822),
+('pasar-tani-masjid-daerah-tapah', 'pasar-malam-bidor-rabu', 3, 11.881),
+('pasar-tani-masjid-daerah-tapah', 'pasar-malam-mambang-di-awan-khamis', 4, 15.166),
+('pasar-tani-masjid-daerah-tapah', 'pasar-malam-rabu-bandar-baru', 5, 19.753),
+('pasar-awam-malim-nawar', 'pasar-malam-isnin', 1, 4.000),
+('pasar-awam-malim-nawar', 'pasar-malam-rabu-bandar-baru', 2, 4.106),
+('pasar-awam-malim-nawar', 'pasar-malam-tanjung-tualang', 3, 7.873),
+('pasar-awam-malim-nawar', 'pasar-malam-mambang-di-awan-khamis', 4, 10.296),
+('pasar-awam-malim-nawar', 'pasar-sehari-batu-gajah', 5, 15.143),
+('pasar-malam-selasa-taman-bintang-wei-xing-yuan-bai-er-shi', 'pantai-remis-market', 1, 1.781),
+('pasar-malam-selasa-taman-bintang-wei-xing-yuan-bai-er-shi', 'pasar-malam-sungai-tinggi', 2, 16.062),
+('pasar-malam-selasa-taman-bintang-wei-xing-yuan-bai-er-shi', 'tapak-pasar-malam-kampung-acheh-sitiawan', 3, 24.419),
+('pasar-malam-selasa-taman-bintang-wei-xing-yuan-bai-er-shi', 'pasar-basah-tldm-lumut-perak', 4, 26.268),
+('pasar-malam-selasa-taman-bintang-wei-xing-yuan-bai-er-shi', 'persalam-night-market', 5, 26.476),
+('tapak-pasar-malam-gerik', 'pekan-ahad', 1, 36.034),
+('tapak-pasar-malam-gerik', 'farmers-market-supply', 2, 36.046),
+('tapak-pasar-malam-gerik', 'pasar-pagi-kupang', 3, 38.740),
+('tapak-pasar-malam-gerik', 'bukit-bertam-nightmarket-tuesday', 4, 43.990),
+('tapak-pasar-malam-gerik', 'pasar-pagi-sabtu-mahang', 5, 46.893),
+('pasar-malam-selasa-sungkai', 'pasar-malam-bidor-rabu', 1, 10.338),
+('pasar-malam-selasa-sungkai', 'pasar-tani-masjid-daerah-tapah', 2, 22.208),
+('pasar-malam-selasa-sungkai', 'pasar-tani-tapah', 3, 24.004),
+('pasar-malam-selasa-sungkai', 'pasar-awam-tapah', 4, 24.025),
+('pasar-malam-selasa-sungkai', 'pasar-pagi-chenderong-balai', 5, 28.326),
+('pasar-terpanjang-kuala-kangsar-selasa-petang-dan-ahad-pagi', 'pasar-minggu-setiap-jumaat', 1, 4.895),
+('pasar-terpanjang-kuala-kangsar-selasa-petang-dan-ahad-pagi', 'tapak-pasar-malam-sauk', 2, 17.834),
+('pasar-terpanjang-kuala-kangsar-selasa-petang-dan-ahad-pagi', 'pasar-malam-air-kuning', 3, 18.181),
+('pasar-terpanjang-kuala-kangsar-selasa-petang-dan-ahad-pagi', 'pasar-malam-taman-raja-idris-pokok-asam', 4, 18.199),
+('pasar-terpanjang-kuala-kangsar-selasa-petang-dan-ahad-pagi', 'cross-street-bazaar-taiping', 5, 19.075),
+('pasar-malam-bayan-baru', 'sites-morning-market-and-night-market-council', 1, 1.392),
+('pasar-malam-bayan-baru', 'pasar-malam-bukit-gedung', 2, 1.543),
+('pasar-malam-bayan-baru', 'pasar-malam-relau', 3, 1.655),
+('pasar-malam-bayan-baru', 'uptown-queensbay-rsm', 4, 1.815),
+('pasar-malam-bayan-baru', 'street-market-pasar-malam', 5, 1.853),
+('teluk-kumbar-weekly-night-market', 'pasar-malam-sungai-batu', 1, 1.316),
+('teluk-kumbar-weekly-night-market', 'pasar-malam-jalan-mahkamah', 2, 3.561),
+('teluk-kumbar-weekly-night-market', 'uptown-ramadan-bayan-lepas', 3, 3.561),
+('teluk-kumbar-weekly-night-market', 'pasar-malam-permatang-damar-laut', 4, 4.448),
+('teluk-kumbar-weekly-night-market', 'pasar-malam-batu-maung-tuesday-indrive', 5, 5.181),
+('pasar-malam-sungai-batu', 'teluk-kumbar-weekly-night-market', 1, 1.316),
+('pasar-malam-sungai-batu', 'uptown-ramadan-bayan-lepas', 2, 2.963),
+('pasar-malam-sungai-batu', 'pasar-malam-jalan-mahkamah', 3, 2.963),
+('pasar-malam-sungai-batu', 'pasar-malam-permatang-damar-laut', 4, 3.221),
+('pasar-malam-sungai-batu', 'pasar-malam-batu-maung-tuesday-indrive', 5, 4.114),
+('pasar-malam-jalan-mahkamah', 'uptown-ramadan-bayan-lepas', 1, 0.001),
+('pasar-malam-jalan-mahkamah', 'pasar-batu-maung', 2, 1.856),
+('pasar-malam-jalan-mahkamah', 'pasar-malam-batu-maung-tuesday-indrive', 3, 2.293),
+('pasar-malam-jalan-mahkamah', 'batu-maung-tuesday-night-market', 4, 2.494),
+('pasar-malam-jalan-mahkamah', 'pasar-malam-permatang-damar-laut', 5, 2.562),
+('friday-night-market', 'pasar-malam-sungai-ara', 1, 0.170),
+('friday-night-market', 'pasar-malam-bukit-gedung', 2, 1.319),
+('friday-night-market', 'sites-morning-market-and-night-market-council', 3, 1.530),
+('friday-night-market', 'pasar-malam-relau', 4, 1.673),
+('friday-night-market', 'pasar-malam-bayan-baru', 5, 1.975),
+('ampang-jajar-night-market', 'pasar-malam-seberang-jaya', 1, 2.292),
+('ampang-jajar-night-market', 'pasar-malam-khamis-tok-kandu', 2, 2.361),
+('ampang-jajar-night-market', 'pasar-malam-taman-bagan', 3, 2.830),
+('ampang-jajar-night-market', 'pasar-malam-mpkk', 4, 2.881),
+('ampang-jajar-night-market', 'pasar-malam-perai-taman-inderawasih', 5, 3.115),
+('pasar-malam-permatang-damar-laut', 'pasar-malam-batu-maung-tuesday-indrive', 1, 1.338),
+('pasar-malam-permatang-damar-laut', 'batu-maung-tuesday-night-market', 2, 1.733),
+('pasar-malam-permatang-damar-laut', 'pasar-batu-maung', 3, 2.551),
+('pasar-malam-permatang-damar-laut', 'uptown-ramadan-bayan-lepas', 4, 2.561),
+('pasar-malam-permatang-damar-laut', 'pasar-malam-jalan-mahkamah', 5, 2.562),
+('wednesday-night-market', 'street-market-pasar-malam', 1, 0.017),
+('wednesday-night-market', 'pantai-jerejak-night-market', 2, 0.076),
+('wednesday-night-market', 'pasar-malam-batu-uban', 3, 0.198),
+('wednesday-night-market', 'sungai-dua-night-market', 4, 1.212),
+('wednesday-night-market', 'pasar-malam-sungai-dua', 5, 1.233),
+('pasar-malam-kampung-sg-nyior', 'pasar-malam-taman-bagan', 1, 1.134),
+('pasar-malam-kampung-sg-nyior', 'pasar-malam-perai-taman-inderawasih', 2, 1.798),
+('pasar-malam-kampung-sg-nyior', 'pasar-malam-jalan-mohd-saad', 3, 2.797),
+('pasar-malam-kampung-sg-nyior', 'pasar-malam-seberang-jaya', 4, 3.041),
+('pasar-malam-kampung-sg-nyior', 'ampang-jajar-night-market', 5, 3.815),
+('tanjung-bungah-night-market-tuesday', 'tapak-pasar-malam-tanjung-tokong', 1, 2.421),
+('tanjung-bungah-night-market-tuesday', 'gurney-drive-hawker-center', 2, 3.791),
+('tanjung-bungah-night-market-tuesday', 'lydia-henna', 3, 3.985),
+('tanjung-bungah-night-market-tuesday', 'pasar-malam-batu-feringghi', 4, 4.169),
+('tanjung-bungah-night-market-tuesday', 'pasar-basah-pulau-tikus', 5, 4.835),
+('pasar-malam-di-tempat-letak-kereta-bersebelahan-kompleks-batu-lanchang', 'pasar-awam-balai-rakyat-batu-lanchang', 1, 0.046),
+('pasar-malam-di-tempat-letak-kereta-bersebelahan-kompleks-batu-lanchang', 'supper-at-batu-lanchang-food-truck-party', 2, 0.073),
+('pasar-malam-di-tempat-letak-kereta-bersebelahan-kompleks-batu-lanchang', 'jelutong-market', 3, 0.651),
+('pasar-malam-di-tempat-letak-kereta-bersebelahan-kompleks-batu-lanchang', 'night-market-on-friday-pasar-malam-van-praagh', 4, 1.117),
+('pasar-malam-di-tempat-letak-kereta-bersebelahan-kompleks-batu-lanchang', 'perak-road-wet-market-da-lu-hou-wan-shan', 5, 1.388),
+('pantai-jerejak-night-market', 'street-market-pasar-malam', 1, 0.063),
+('pantai-jerejak-night-market', 'wednesday-night-market', 2, 0.076),
+('pantai-jerejak-night-market', 'pasar-malam-batu-uban', 3, 0.122),
+('pantai-jerejak-night-market', 'sungai-dua-night-market', 4, 1.285),
+('pantai-jerejak-night-market', 'pasar-malam-sungai-dua', 5, 1.306),
+('pasar-malam-batu-maung-tuesday-indrive', 'batu-maung-tuesday-night-market', 1, 0.414),
+('pasar-malam-batu-maung-tuesday-indrive', 'pasar-malam-permatang-damar-laut', 2, 1.338),
+('pasar-malam-batu-maung-tuesday-indrive', 'pasar-batu-maung', 3, 1.380),
+('pasar-malam-batu-maung-tuesday-indrive', 'uptown-ramadan-bayan-lepas', 4, 2.292),
+('pasar-malam-batu-maung-tuesday-indrive', 'pasar-malam-jalan-mahkamah', 5, 2.293),
+('pasar-malam-sungai-pinang-balik-pulau', 'night-market-site', 1, 5.609),
+('pasar-malam-sungai-pinang-balik-pulau', 'pasar-balik-pulau', 2, 5.665),
+('pasar-malam-sungai-pinang-balik-pulau', 'pasar-malam-masjid-daerah-barat-daya', 3, 6.132),
+('pasar-malam-sungai-pinang-balik-pulau', 'teluk-bahang-market-pasar-teluk-bahangteluk-phaang-cntai', 4, 7.095),
+('pasar-malam-sungai-pinang-balik-pulau', 'tapak-pasar-malam-teluk-bahang-isnin', 5, 7.115),
+('pasar-malam-sungai-dua', 'sungai-dua-night-market', 1, 0.029),
+('pasar-malam-sungai-dua', 'wednesday-night-market', 2, 1.233),
+('pasar-malam-sungai-dua', 'street-market-pasar-malam', 3, 1.249),
+('pasar-malam-sungai-dua', 'pantai-jerejak-night-market', 4, 1.306),
+('pasar-malam-sungai-dua', 'pasar-malam-batu-uban', 5, 1.425),
+('wednesday-penang-night-market', 'farlim-wednesday-night-market', 1, 0.061),
+('wednesday-penang-night-market', 'pasar-farlim-pusat-makanan', 2, 0.760),
+('wednesday-penang-night-market', 'pasar-malam-desa-permata-paya-terubong', 3, 0.783),
+('wednesday-penang-night-market', 'mat-to-you-dessert-at-paya-terubong-night-market', 4, 0.807),
+('wednesday-penang-night-market', 'pasar-malam-kampong-melayu', 5, 1.150),
+('mat-toh-yau-dessert-at-macallum-night-market', 'macallum-street-night-market', 1, 0.248),
+('mat-toh-yau-dessert-at-macallum-night-market', 'plaza-ramadan-prangin-mall', 2, 0.993),
+('mat-toh-yau-dessert-at-macallum-night-market', 'kimberley-street-food-night-market', 3, 1.170),
+('mat-toh-yau-dessert-at-macallum-night-market', 'new-lane-street-foodstalls', 4, 1.200),
+('mat-toh-yau-dessert-at-macallum-night-market', 'pasar-malam-lebuh-keng-kwee', 5, 1.259),
+('street-market-pasar-malam', 'wednesday-night-market', 1, 0.017),
+('street-market-pasar-malam', 'pantai-jerejak-night-market', 2, 0.063),
+('street-market-pasar-malam', 'pasar-malam-batu-uban', 3, 0.184),
+('street-market-pasar-malam', 'sungai-dua-night-market', 4, 1.228),
+('street-market-pasar-malam', 'pasar-malam-sungai-dua', 5, 1.249),
+('supper-at-batu-lanchang-food-truck-party', 'pasar-malam-di-tempat-letak-kereta-bersebelahan-kompleks-batu-lanchang', 1, 0.073),
+('supper-at-batu-lanchang-food-truck-party', 'pasar-awam-balai-rakyat-batu-lanchang', 2, 0.113),
+('supper-at-batu-lanchang-food-truck-party', 'jelutong-market', 3, 0.656),
+('supper-at-batu-lanchang-food-truck-party', 'night-market-on-friday-pasar-malam-van-praagh', 4, 1.170),
+('supper-at-batu-lanchang-food-truck-party', 'perak-road-wet-market-da-lu-hou-wan-shan', 5, 1.446),
+('pasar-malam-taman-sutera', 'pasar-malam-mpkk', 1, 1.111),
+('pasar-malam-taman-sutera', 'pasar-malam-sabtu-pasar-ramadhan', 2, 1.325),
+('pasar-malam-taman-sutera', 'pasar-malam-jalan-pauh-indah-1-polytech-perai-sabtu', 3, 1.332),
+('pasar-malam-taman-sutera', 'pasar-malam-khamis-tok-kandu', 4, 1.403),
+('pasar-malam-taman-sutera', 'pasar-malam-seberang-jaya', 5, 1.462),
+('pasar-malam-perai-taman-inderawasih', 'pasar-malam-seberang-jaya', 1, 1.421),
+('pasar-malam-perai-taman-inderawasih', 'pasar-malam-kampung-sg-nyior', 2, 1.798),
+('pasar-malam-perai-taman-inderawasih', 'pasar-malam-taman-bagan', 3, 1.935),
+('pasar-malam-perai-taman-inderawasih', 'pasar-malam-taman-sutera', 4, 2.470),
+('pasar-malam-perai-taman-inderawasih', 'pasar-malam-khamis-tok-kandu', 5, 2.918),
+('pasar-malam-khamis-tok-kandu', 'pasar-malam-mpkk', 1, 0.521),
+('pasar-malam-khamis-tok-kandu', 'pasar-malam-taman-sutera', 2, 1.403),
+('pasar-malam-khamis-tok-kandu', 'pasar-malam-seberang-jaya', 3, 1.500),
+('pasar-malam-khamis-tok-kandu', 'pasar-malam-jalan-pauh-indah-1-polytech-perai-sabtu', 4, 1.857),
+('pasar-malam-khamis-tok-kandu', 'pasar-malam-sabtu-pasar-ramadhan', 5, 1.983),
+('pasar-malam-batu-uban', 'pantai-jerejak-night-market', 1, 0.122),
+('pasar-malam-batu-uban', 'street-market-pasar-malam', 2, 0.184),
+('pasar-malam-batu-uban', 'wednesday-night-market', 3, 0.198),
+('pasar-malam-batu-uban', 'uptown-queensbay-rsm', 4, 1.263),
+('pasar-malam-batu-uban', 'sungai-dua-night-market', 5, 1.404),
+('pasar-malam-bukit-gedung', 'sites-morning-market-and-night-market-council', 1, 0.268),
+('pasar-malam-bukit-gedung', 'friday-night-market', 2, 1.319),
+('pasar-malam-bukit-gedung', 'pasar-malam-sungai-ara', 3, 1.404),
+('pasar-malam-bukit-gedung', 'pasar-malam-bayan-baru', 4, 1.543),
+('pasar-malam-bukit-gedung', 'pasar-malam-relau', 5, 2.374),
+('pasar-malam-permatang-tinggi', 'pasar-malam-taman-perwira-indah', 1, 0.434),
+('pasar-malam-permatang-tinggi', 'pasar-malam-ahad-taman-kasawari-simpang-ampat', 2, 2.380),
+('pasar-malam-permatang-tinggi', 'pasar-malam-sabtu-bandar-tasek-mutiara-fasa-1', 3, 2.831),
+('pasar-malam-permatang-tinggi', 'pasar-malam-khamis-bandar-tasek-mutiara', 4, 2.848),
+('pasar-malam-permatang-tinggi', 'pasar-malam-isnin-taman-merak', 5, 3.576),
+('tapak-pasar-malam-tanjung-tokong', 'gurney-drive-hawker-center', 1, 2.120),
+('tapak-pasar-malam-tanjung-tokong', 'tanjung-bungah-night-market-tuesday', 2, 2.421),
+('tapak-pasar-malam-tanjung-tokong', 'pasar-basah-pulau-tikus', 3, 3.248),
+('tapak-pasar-malam-tanjung-tokong', 'road-walk', 4, 5.293),
+('tapak-pasar-malam-tanjung-tokong', 'lorong-kulit-flea-market', 5, 5.295),
+('pasar-malam-jalan-pengkalan', 'pasar-malam-kawasan-perniagaan-sungai-rambai', 1, 1.898),
+('pasar-malam-jalan-pengkalan', 'ls-pasar-malam-taman-desa-damai', 2, 1.922),
+('pasar-malam-jalan-pengkalan', 'monday-night-market-zhen-zhu-shi-ye-shi', 3, 2.164),
+('pasar-malam-jalan-pengkalan', 'nan-mei-yuan-ye-shi-pasar-malam-rambai-sri-rambai-sungai-rambai', 4, 2.170),
+('pasar-malam-jalan-pengkalan', 'gerbang-malam-perda', 5, 2.248),
+('pasar-malam-bagan-ajam', 'pasar-malam-jalan-mohd-saad', 1, 1.937),
+('pasar-malam-bagan-ajam', 'pasar-malam-taman-bagan', 2, 3.971),
+('pasar-malam-bagan-ajam', 'pasar-malam-kampung-sg-nyior', 3, 4.708),
+('pasar-malam-bagan-ajam', 'ampang-jajar-night-market', 4, 4.893),
+('pasar-malam-bagan-ajam', 'pasar-malam-desa-murni', 5, 5.521),
+('pasar-malam-batu-kawan', 'pasar-malam-isnin-taman-merak', 1, 3.779),
+('pasar-malam-batu-kawan', 'pasar-malam-ahad-taman-kasawari-simpang-ampat', 2, 4.581),
+('pasar-malam-batu-kawan', 'pasar-malam-jumaat-taman-tangling', 3, 4.925),
+('pasar-malam-batu-kawan', 'pasar-malam-kampung-tersusun', 4, 4.946),
+('pasar-malam-batu-kawan', 'pasar-malam-taman-delima', 5, 4.947),
+('pasar-malam-kg-banggol', 'pasar-karat-tasek-gelugor', 1, 4.387),
+('pasar-malam-kg-banggol', 'pasar-malam-pekan-kepala-batas', 2, 4.470),
+('pasar-malam-kg-banggol', 'pokok-tampang-night-market', 3, 4.574),
+('pasar-malam-kg-banggol', 'tasek-gelugor-night-market', 4, 4.923),
+('pasar-malam-kg-banggol', 'pasar-malam-desa-murni', 5, 5.621),
+('pasar-chowrasta-market', 'pasar-malam-lebuh-keng-kwee', 1, 0.134),
+('pasar-chowrasta-market', 'kimberley-street-food-night-market', 2, 0.250),
+('pasar-chowrasta-market', 'plaza-ramadan-prangin-mall', 3, 0.389),
+('pasar-chowrasta-market', 'campbell-street-market', 4, 0.500),
+('pasar-chowrasta-market', 'chulia-street-hawker-food', 5, 0.551),
+('road-walk', 'lorong-kulit-flea-market', 1, 0.039),
+('road-walk', 'perak-road-wet-market-da-lu-hou-wan-shan', 2, 1.399),
+('road-walk', 'pasar-tps-jalan-perak', 3, 1.403),
+('road-walk', 'new-lane-street-foodstalls', 4, 1.439),
+('road-walk', 'night-market-on-friday-pasar-malam-van-praagh', 5, 1.707),
+('pasar-malam-ye-shi-xing-qi-san-wed', 'pasar-malam-kampung-tersusun', 1, 0.145),
+('pasar-malam-ye-shi-xing-qi-san-wed', 'pasar-malam-taman-delima', 2, 0.533),
+('pasar-malam-ye-shi-xing-qi-san-wed', 'pasar-malam-juru', 3, 2.134),
+('pasar-malam-ye-shi-xing-qi-san-wed', 'pasar-malam-kota-permai-sabtu', 4, 3.034),
+('pasar-malam-ye-shi-xing-qi-san-wed', 'pasar-malam-jalan-pengkalan', 5, 3.505),
+('pasar-farlim-pusat-makanan', 'farlim-wednesday-night-market', 1, 0.700),
+('pasar-farlim-pusat-makanan', 'wednesday-penang-night-market', 2, 0.760),
+('pasar-farlim-pusat-makanan', 'pasar-malam-desa-mawar-farlim-jalan-thean-teik', 3, 0.788),
+('pasar-farlim-pusat-makanan', 'pasar-malam-kampong-melayu', 4, 0.794),
+('pasar-farlim-pusat-makanan', 'pasar-malam-desa-mawar', 5, 0.869),
+('tapak-pasar-malam-wayton', 'wednesday-penang-night-market', 1, 1.783),
+('tapak-pasar-malam-wayton', 'farlim-wednesday-night-market', 2, 1.831),
+('tapak-pasar-malam-wayton', 'pasar-malam-desa-permata-paya-terubong', 3, 2.167),
+('tapak-pasar-malam-wayton', 'mat-to-you-dessert-at-paya-terubong-night-market', 4, 2.218),
+('tapak-pasar-malam-wayton', 'pasar-farlim-pusat-makanan', 5, 2.391),
+('lorong-kulit-flea-market', 'road-walk', 1, 0.039),
+('lorong-kulit-flea-market', 'perak-road-wet-market-da-lu-hou-wan-shan', 2, 1.392),
+('lorong-kulit-flea-market', 'pasar-tps-jalan-perak', 3, 1.397),
+('lorong-kulit-flea-market', 'new-lane-street-foodstalls', 4, 1.478),
+('lorong-kulit-flea-market', 'night-market-on-friday-pasar-malam-van-praagh', 5, 1.698),
+('pasar-malam-kampung-tersusun', 'pasar-malam-ye-shi-xing-qi-san-wed', 1, 0.145),
+('pasar-malam-kampung-tersusun', 'pasar-malam-taman-delima', 2, 0.404),
+('pasar-malam-kampung-tersusun', 'pasar-malam-juru', 3, 2.000),
+('pasar-malam-kampung-tersusun', 'pasar-malam-kota-permai-sabtu', 4, 3.167),
+('pasar-malam-kampung-tersusun', 'pasar-malam-jalan-pengkalan', 5, 3.538),
+('pasar-malam-nibong-tebal', 'pasar-malam-taman-seruling-emas', 1, 5.226),
+('pasar-malam-nibong-tebal', 'pasar-malam-sungai-bakap', 2, 5.362),
+('pasar-malam-nibong-tebal', 'pasar-malam-pekan-lama-parit-buntar', 3, 5.420),
+('pasar-malam-nibong-tebal', 'pasar-malam-rabu-bandar-baharu', 4, 5.435),
+('pasar-malam-nibong-tebal', 'pasar-malam-sungai-duri', 5, 7.086),
+('pasar-malam-guar-perahu-hari-sabtu', 'pasar-malamminihari-rabu-taman-guar-perahu', 1, 0.529),
+('pasar-malam-guar-perahu-hari-sabtu', 'pasar-malam-penantihari-isnin', 2, 2.644),
+('pasar-malam-guar-perahu-hari-sabtu', 'pasar-malam-kubang-semang', 3, 3.273),
+('pasar-malam-guar-perahu-hari-sabtu', 'pasar-malam-desa-murni', 4, 4.657),
+('pasar-malam-guar-perahu-hari-sabtu', 'pasar-malam-kg-tok-elong-selasa', 5, 4.834),
+('pasar-malam-masjid-daerah-barat-daya', 'night-market-site', 1, 2.403),
+('pasar-malam-masjid-daerah-barat-daya', 'pasar-balik-pulau', 2, 2.441),
+('pasar-malam-masjid-daerah-barat-daya', 'teluk-kumbar-weekly-night-market', 3, 5.273),
+('pasar-malam-masjid-daerah-barat-daya', 'pasar-malam-sungai-ara', 4, 5.857),
+('pasar-malam-masjid-daerah-barat-daya', 'friday-night-market', 5, 5.882),
+('pasar-malam-taman-permata', 'pasar-malam-taman-seri-janggus-hari-selasa', 1, 1.631),
+('pasar-malam-taman-permata', 'pasar-malam-kota-permai-sabtu', 2, 2.122),
+('pasar-malam-taman-permata', 'pasar-malam-machang-bubok', 3, 2.805),
+('pasar-malam-taman-permata', 'nan-mei-yuan-ye-shi-pasar-malam-rambai-sri-rambai-sungai-rambai', 4, 3.811),
+('pasar-malam-taman-permata', 'monday-night-market-zhen-zhu-shi-ye-shi', 5, 3.840),
+('pasar-malam-desa-murni', 'ampang-jajar-night-market', 1, 3.620),
+('pasar-malam-desa-murni', 'pasar-malam-guar-perahu-hari-sabtu', 2, 4.657),
+('pasar-malam-desa-murni', 'pasar-malamminihari-rabu-taman-guar-perahu', 3, 5.170),
+('pasar-malam-desa-murni', 'pasar-malam-penantihari-isnin', 4, 5.238),
+('pasar-malam-desa-murni', 'pasar-malam-khamis-tok-kandu', 5, 5.364),
+('pasar-malam-mpkk', 'pasar-malam-khamis-tok-kandu', 1, 0.521),
+('pasar-malam-mpkk', 'pasar-malam-taman-sutera', 2, 1.111),
+('pasar-malam-mpkk', 'pasar-malam-jalan-pauh-indah-1-polytech-perai-sabtu', 3, 1.336),
+('pasar-malam-mpkk', 'pasar-malam-sabtu-pasar-ramadhan', 4, 1.464),
+('pasar-malam-mpkk', 'pasar-malam-seberang-jaya', 5, 1.725),
+('pasar-malam-kubang-semang', 'pasar-malam-penantihari-isnin', 1, 0.629),
+('pasar-malam-kubang-semang', 'pasar-malam-kg-tok-elong-selasa', 2, 1.676),
+('pasar-malam-kubang-semang', 'pasar-malamminihari-rabu-taman-guar-perahu', 3, 3.211),
+('pasar-malam-kubang-semang', 'pasar-malam-guar-perahu-hari-sabtu', 4, 3.273),
+('pasar-malam-kubang-semang', 'pasar-malam-bazar-perdana-perda-isnin', 5, 4.448),
+('ls-pasar-malam-taman-desa-damai', 'pasar-malam-bazar-perdana-perda-isnin', 1, 0.672),
+('ls-pasar-malam-taman-desa-damai', 'pasar-malam-kawasan-perniagaan-sungai-rambai', 2, 0.899),
+('ls-pasar-malam-taman-desa-damai', 'monday-night-market-zhen-zhu-shi-ye-shi', 3, 0.924),
+('ls-pasar-malam-taman-desa-damai', 'nan-mei-yuan-ye-shi-pasar-malam-rambai-sri-rambai-sungai-rambai', 4, 0.952),
+('ls-pasar-malam-taman-desa-damai', 'gerbang-malam-perda', 5, 0.967),
+('gurney-drive-hawker-center', 'pasar-basah-pulau-tikus', 1, 1.138),
+('gurney-drive-hawker-center', 'tapak-pasar-malam-tanjung-tokong', 2, 2.120),
+('gurney-drive-hawker-center', 'road-walk', 3, 3.172),
+('gurney-drive-hawker-center', 'lorong-kulit-flea-market', 4, 3.175),
+('gurney-drive-hawker-center', 'new-lane-street-foodstalls', 5, 3.445),
+('pasar-malam-perkampungan-valdor', 'pasar-malam-sungai-bakap', 1, 2.681),
+('pasar-malam-perkampungan-valdor', 'pasar-malam-jumaat-taman-tangling', 2, 3.308),
+('pasar-malam-perkampungan-valdor', 'pasar-malam-taman-seruling-emas', 3, 3.454),
+('pasar-malam-perkampungan-valdor', 'pasar-malam-isnin-taman-merak', 4, 4.428),
+('pasar-malam-perkampungan-valdor', 'pasar-malam-khamis-bandar-tasek-mutiara', 5, 4.922),
+('pasar-malam-juru', 'pasar-malam-taman-delima', 1, 1.601),
+('pasar-malam-juru', 'pasar-malam-kampung-tersusun', 2, 2.000),
+('pasar-malam-juru', 'pasar-malam-ye-shi-xing-qi-san-wed', 3, 2.134),
+('pasar-malam-juru', 'pasar-malam-jalan-pengkalan', 4, 3.764),
+('pasar-malam-juru', 'pasar-malam-kota-permai-sabtu', 5, 4.755),
+('uptown-queensbay-rsm', 'pasar-malam-batu-uban', 1, 1.263),
+('uptown-queensbay-rsm', 'pantai-jerejak-night-market', 2, 1.371),
+('uptown-queensbay-rsm', 'street-market-pasar-malam', 3, 1.422),
+('uptown-queensbay-rsm', 'wednesday-night-market', 4, 1.439),
+('uptown-queensbay-rsm', 'pasar-malam-bayan-baru', 5, 1.815),
+('pasar-malam-sabtu-pasar-ramadhan', 'pasar-malam-jalan-pauh-indah-1-polytech-perai-sabtu', 1, 0.179),
+('pasar-malam-sabtu-pasar-ramadhan', 'pasar-malam-uptown-bandar-perda', 2, 1.281),
+('pasar-malam-sabtu-pasar-ramadhan', 'pasar-malam-taman-sutera', 3, 1.325),
+('pasar-malam-sabtu-pasar-ramadhan', 'pasar-malam-mpkk', 4, 1.464),
+('pasar-malam-sabtu-pasar-ramadhan', 'pasar-malam-khamis-tok-kandu', 5, 1.983),
+('pasar-malam-bazar-perdana-perda-isnin', 'gerbang-malam-perda', 1, 0.601),
+('pasar-malam-bazar-perdana-perda-isnin', 'ls-pasar-malam-taman-desa-damai', 2, 0.672),
+('pasar-malam-bazar-perdana-perda-isnin', 'monday-night-market-zhen-zhu-shi-ye-shi', 3, 1.470),
+('pasar-malam-bazar-perdana-perda-isnin', 'nan-mei-yuan-ye-shi-pasar-malam-rambai-sri-rambai-sungai-rambai', 4, 1.499),
+('pasar-malam-bazar-perdana-perda-isnin', 'pasar-malam-kawasan-perniagaan-sungai-rambai', 5, 1.521),
+('batu-maung-tuesday-night-market', 'pasar-malam-batu-maung-tuesday-indrive', 1, 0.414),
+('batu-maung-tuesday-night-market', 'pasar-batu-maung', 2, 1.231),
+('batu-maung-tuesday-night-market', 'pasar-malam-permatang-damar-laut', 3, 1.733),
+('batu-maung-tuesday-night-market', 'uptown-ramadan-bayan-lepas', 4, 2.493),
+('batu-maung-tuesday-night-market', 'pasar-malam-jalan-mahkamah', 5, 2.494),
+('pasar-malam-isnin-taman-merak', 'pasar-malam-jumaat-taman-tangling', 1, 1.248),
+('pasar-malam-isnin-taman-merak', 'pasar-malam-ahad-taman-kasawari-simpang-ampat', 2, 1.276),
+('pasar-malam-isnin-taman-merak', 'pasar-malam-taman-perwira-indah', 3, 3.211),
+('pasar-malam-isnin-taman-merak', 'pasar-malam-khamis-bandar-tasek-mutiara', 4, 3.465),
+('pasar-malam-isnin-taman-merak', 'pasar-malam-sabtu-bandar-tasek-mutiara-fasa-1', 5, 3.482),
+('pasar-malam-jumaat-taman-tangling', 'pasar-malam-isnin-taman-merak', 1, 1.248),
+('pasar-malam-jumaat-taman-tangling', 'pasar-malam-ahad-taman-kasawari-simpang-ampat', 2, 1.706),
+('pasar-malam-jumaat-taman-tangling', 'pasar-malam-khamis-bandar-tasek-mutiara', 3, 2.906),
+('pasar-malam-jumaat-taman-tangling', 'pasar-malam-sabtu-bandar-tasek-mutiara-fasa-1', 4, 2.930),
+('pasar-malam-jumaat-taman-tangling', 'pasar-malam-perkampungan-valdor', 5, 3.308),
+('pasar-malam-ahad-taman-kasawari-simpang-ampat', 'pasar-malam-isnin-taman-merak', 1, 1.276),
+('pasar-malam-ahad-taman-kasawari-simpang-ampat', 'pasar-malam-jumaat-taman-tangling', 2, 1.706),
+('pasar-malam-ahad-taman-kasawari-simpang-ampat', 'pasar-malam-taman-perwira-indah', 3, 1.984),
+('pasar-malam-ahad-taman-kasawari-simpang-ampat', 'pasar-malam-permatang-tinggi', 4, 2.380),
+('pasar-malam-ahad-taman-kasawari-simpang-ampat', 'pasar-malam-khamis-bandar-tasek-mutiara', 5, 2.466),
+('chulia-street-hawker-food', 'campbell-street-market', 1, 0.156),
+('chulia-street-hawker-food', 'kimberley-street-food-night-market', 2, 0.443),
+('chulia-street-hawker-food', 'pasar-chowrasta-market', 3, 0.551),
+('chulia-street-hawker-food', 'pasar-malam-lebuh-keng-kwee', 4, 0.614),
+('chulia-street-hawker-food', 'plaza-ramadan-prangin-mall', 5, 0.690),
+('pasar-tps-jalan-perak', 'perak-road-wet-market-da-lu-hou-wan-shan', 1, 0.048),
+('pasar-tps-jalan-perak', 'night-market-on-friday-pasar-malam-van-praagh', 2, 0.329),
+('pasar-tps-jalan-perak', 'jelutong-market', 3, 1.126),
+('pasar-tps-jalan-perak', 'lorong-kulit-flea-market', 4, 1.397),
+('pasar-tps-jalan-perak', 'road-walk', 5, 1.403),
+('pasar-malam-sungai-duri', 'pasar-malam-taman-seruling-emas', 1, 2.743),
+('pasar-malam-sungai-duri', 'pasar-malam-sungai-bakap', 2, 3.450),
+('pasar-malam-sungai-duri', 'pasar-malam-perkampungan-valdor', 3, 5.445),
+('pasar-malam-sungai-duri', 'pasar-malam-nibong-tebal', 4, 7.086),
+('pasar-malam-sungai-duri', 'pasar-malam-jumaat-taman-tangling', 5, 8.630),
+('uptown-ramadan-bayan-lepas', 'pasar-malam-jalan-mahkamah', 1, 0.001),
+('uptown-ramadan-bayan-lepas', 'pasar-batu-maung', 2, 1.855),
+('uptown-ramadan-bayan-lepas', 'pasar-malam-batu-maung-tuesday-indrive', 3, 2.292),
+('uptown-ramadan-bayan-lepas', 'batu-maung-tuesday-night-market', 4, 2.493),
+('uptown-ramadan-bayan-lepas', 'pasar-malam-permatang-damar-laut', 5, 2.561),
+('pasar-malam-sungai-bakap', 'pasar-malam-taman-seruling-emas', 1, 0.841),
+('pasar-malam-sungai-bakap', 'pasar-malam-perkampungan-valdor', 2, 2.681),
+('pasar-malam-sungai-bakap', 'pasar-malam-sungai-duri', 3, 3.450),
+('pasar-malam-sungai-bakap', 'pasar-malam-nibong-tebal', 4, 5.362),
+('pasar-malam-sungai-bakap', 'pasar-malam-jumaat-taman-tangling', 5, 5.959),
+('pasar-malam-kota-permai-sabtu', 'pasar-malam-taman-permata', 1, 2.122),
+('pasar-malam-kota-permai-sabtu', 'pasar-malam-kawasan-perniagaan-sungai-rambai', 2, 2.538),
+('pasar-malam-kota-permai-sabtu', 'nan-mei-yuan-ye-shi-pasar-malam-rambai-sri-rambai-sungai-rambai', 3, 2.631),
+('pasar-malam-kota-permai-sabtu', 'monday-night-market-zhen-zhu-shi-ye-shi', 4, 2.657),
+('pasar-malam-kota-permai-sabtu', 'pasar-malam-jalan-pengkalan', 5, 2.968),
+('pasar-malam-kawasan-perniagaan-sungai-rambai', 'monday-night-market-zhen-zhu-shi-ye-shi', 1, 0.275),
+('pasar-malam-kawasan-perniagaan-sungai-rambai', 'nan-mei-yuan-ye-shi-pasar-malam-rambai-sri-rambai-sungai-rambai', 2, 0.275),
+('pasar-malam-kawasan-perniagaan-sungai-rambai', 'ls-pasar-malam-taman-desa-damai', 3, 0.899),
+('pasar-malam-kawasan-perniagaan-sungai-rambai', 'pasar-malam-bazar-perdana-perda-isnin', 4, 1.521),
+('pasar-malam-kawasan-perniagaan-sungai-rambai', 'gerbang-malam-perda', 5, 1.861),
+('pasar-malam-taman-delima', 'pasar-malam-kampung-tersusun', 1, 0.404),
+('pasar-malam-taman-delima', 'pasar-malam-ye-shi-xing-qi-san-wed', 2, 0.533),
+('pasar-malam-taman-delima', 'pasar-malam-juru', 3, 1.601),
+('pasar-malam-taman-delima', 'pasar-malam-kota-permai-sabtu', 4, 3.413),
+('pasar-malam-taman-delima', 'pasar-malam-jalan-pengkalan', 5, 3.438),
+('new-lane-street-foodstalls', 'plaza-ramadan-prangin-mall', 1, 0.508),
+('new-lane-street-foodstalls', 'pasar-malam-lebuh-keng-kwee', 2, 0.540),
+('new-lane-street-foodstalls', 'pasar-chowrasta-market', 3, 0.649),
+('new-lane-street-foodstalls', 'kimberley-street-food-night-market', 4, 0.705),
+('new-lane-street-foodstalls', 'campbell-street-market', 5, 1.036),
+('pasar-malamminihari-rabu-taman-guar-perahu', 'pasar-malam-guar-perahu-hari-sabtu', 1, 0.529),
+('pasar-malamminihari-rabu-taman-guar-perahu', 'pasar-malam-penantihari-isnin', 2, 2.587),
+('pasar-malamminihari-rabu-taman-guar-perahu', 'pasar-malam-kubang-semang', 3, 3.211),
+('pasar-malamminihari-rabu-taman-guar-perahu', 'pasar-malam-kg-tok-elong-selasa', 4, 4.679),
+('pasar-malamminihari-rabu-taman-guar-perahu', 'pasar-malam-desa-murni', 5, 5.170),
+('plaza-ramadan-prangin-mall', 'kimberley-street-food-night-market', 1, 0.258),
+('plaza-ramadan-prangin-mall', 'pasar-malam-lebuh-keng-kwee', 2, 0.266),
+('plaza-ramadan-prangin-mall', 'pasar-chowrasta-market', 3, 0.389),
+('plaza-ramadan-prangin-mall', 'new-lane-street-foodstalls', 4, 0.508),
+('plaza-ramadan-prangin-mall', 'campbell-street-market', 5, 0.558),
+('lydia-henna', 'pasar-malam-batu-feringghi', 1, 0.241),
+('lydia-henna', 'tanjung-bungah-night-market-tuesday', 2, 3.985),
+('lydia-henna', 'tapak-pasar-malam-teluk-bahang-isnin', 3, 4.535),
+('lydia-henna', 'teluk-bahang-market-pasar-teluk-bahangteluk-phaang-cntai', 4, 4.547),
+('lydia-henna', 'tapak-pasar-malam-tanjung-tokong', 5, 6.404),
+('monday-night-market-zhen-zhu-shi-ye-shi', 'nan-mei-yuan-ye-shi-pasar-malam-rambai-sri-rambai-sungai-rambai', 1, 0.029),
+('monday-night-market-zhen-zhu-shi-ye-shi', 'pasar-malam-kawasan-perniagaan-sungai-rambai', 2, 0.275),
+('monday-night-market-zhen-zhu-shi-ye-shi', 'ls-pasar-malam-taman-desa-damai', 3, 0.924),
+('monday-night-market-zhen-zhu-shi-ye-shi', 'pasar-malam-bazar-perdana-perda-isnin', 4, 1.470),
+('monday-night-market-zhen-zhu-shi-ye-shi', 'gerbang-malam-perda', 5, 1.886),
+('perak-road-wet-market-da-lu-hou-wan-shan', 'pasar-tps-jalan-perak', 1, 0.048),
+('perak-road-wet-market-da-lu-hou-wan-shan', 'night-market-on-friday-pasar-malam-van-praagh', 2, 0.316),
+('perak-road-wet-market-da-lu-hou-wan-shan', 'jelutong-market', 3, 1.116),
+('perak-road-wet-market-da-lu-hou-wan-shan', 'pasar-awam-balai-rakyat-batu-lanchang', 4, 1.375),
+('perak-road-wet-market-da-lu-hou-wan-shan', 'pasar-malam-di-tempat-letak-kereta-bersebelahan-kompleks-batu-lanchang', 5, 1.388),
+('pasar-malam-taman-seri-janggus-hari-selasa', 'pasar-malam-taman-permata', 1, 1.631),
+('pasar-malam-taman-seri-janggus-hari-selasa', 'pasar-malam-machang-bubok', 2, 1.875),
+('pasar-malam-taman-seri-janggus-hari-selasa', 'pasar-malam-kota-permai-sabtu', 3, 3.522),
+('pasar-malam-taman-seri-janggus-hari-selasa', 'pasar-malam-permatang-tinggi', 4, 3.598),
+('pasar-malam-taman-seri-janggus-hari-selasa', 'pasar-malam-taman-perwira-indah', 5, 3.943),
+('pasar-malam-taman-seruling-emas', 'pasar-malam-sungai-bakap', 1, 0.841),
+('pasar-malam-taman-seruling-emas', 'pasar-malam-sungai-duri', 2, 2.743),
+('pasar-malam-taman-seruling-emas', 'pasar-malam-perkampungan-valdor', 3, 3.454),
+('pasar-malam-taman-seruling-emas', 'pasar-malam-nibong-tebal', 4, 5.226),
+('pasar-malam-taman-seruling-emas', 'pasar-malam-jumaat-taman-tangling', 5, 6.755),
+('gerbang-malam-perda', 'pasar-malam-bazar-perdana-perda-isnin', 1, 0.601),
+('gerbang-malam-perda', 'ls-pasar-malam-taman-desa-damai', 2, 0.967),
+('gerbang-malam-perda', 'pasar-malam-uptown-bandar-perda', 3, 1.001),
+('gerbang-malam-perda', 'pasar-malam-kawasan-perniagaan-sungai-rambai', 4, 1.861),
+('gerbang-malam-perda', 'monday-night-market-zhen-zhu-shi-ye-shi', 5, 1.886),
+('teluk-bahang-market-pasar-teluk-bahangteluk-phaang-cntai', 'tapak-pasar-malam-teluk-bahang-isnin', 1, 0.020),
+('teluk-bahang-market-pasar-teluk-bahangteluk-phaang-cntai', 'pasar-malam-batu-feringghi', 2, 4.306),
+('teluk-bahang-market-pasar-teluk-bahangteluk-phaang-cntai', 'lydia-henna', 3, 4.547),
+('teluk-bahang-market-pasar-teluk-bahangteluk-phaang-cntai', 'pasar-malam-sungai-pinang-balik-pulau', 4, 7.095),
+('teluk-bahang-market-pasar-teluk-bahangteluk-phaang-cntai', 'tanjung-bungah-night-market-tuesday', 5, 7.928),
+('pasar-batu-maung', 'batu-maung-tuesday-night-market', 1, 1.231),
+('pasar-batu-maung', 'pasar-malam-batu-maung-tuesday-indrive', 2, 1.380),
+('pasar-batu-maung', 'uptown-ramadan-bayan-lepas', 3, 1.855),
+('pasar-batu-maung', 'pasar-malam-jalan-mahkamah', 4, 1.856),
+('pasar-batu-maung', 'pasar-malam-bukit-gedung', 5, 2.464),
+('nan-mei-yuan-ye-shi-pasar-malam-rambai-sri-rambai-sungai-rambai', 'monday-night-market-zhen-zhu-shi-ye-shi', 1, 0.029),
+('nan-mei-yuan-ye-shi-pasar-malam-rambai-sri-rambai-sungai-rambai', 'pasar-malam-kawasan-perniagaan-sungai-rambai', 2, 0.275),
+('nan-mei-yuan-ye-shi-pasar-malam-rambai-sri-rambai-sungai-rambai', 'ls-pasar-malam-taman-desa-damai', 3, 0.952),
+('nan-mei-yuan-ye-shi-pasar-malam-rambai-sri-rambai-sungai-rambai', 'pasar-malam-bazar-perdana-perda-isnin', 4, 1.499),
+('nan-mei-yuan-ye-shi-pasar-malam-rambai-sri-rambai-sungai-rambai', 'gerbang-malam-perda', 5, 1.914),
+('tapak-pasar-malam-teluk-bahang-isnin', 'teluk-bahang-market-pasar-teluk-bahangteluk-phaang-cntai', 1, 0.020),
+('tapak-pasar-malam-teluk-bahang-isnin', 'pasar-malam-batu-feringghi', 2, 4.294),
+('tapak-pasar-malam-teluk-bahang-isnin', 'lydia-henna', 3, 4.535),
+('tapak-pasar-malam-teluk-bahang-isnin', 'pasar-malam-sungai-pinang-balik-pulau', 4, 7.115),
+('tapak-pasar-malam-teluk-bahang-isnin', 'tanjung-bungah-night-market-tuesday', 5, 7.923),
+('pasar-balik-pulau', 'night-market-site', 1, 0.067),
+('pasar-balik-pulau', 'pasar-malam-masjid-daerah-barat-daya', 2, 2.441),
+('pasar-balik-pulau', 'pasar-malam-relau', 3, 4.482),
+('pasar-balik-pulau', 'pasar-malam-sungai-ara', 4, 4.699),
+('pasar-balik-pulau', 'tapak-pasar-malam-wayton', 5, 4.788),
+('pasar-awam-balai-rakyat-batu-lanchang', 'pasar-malam-di-tempat-letak-kereta-bersebelahan-kompleks-batu-lanchang', 1, 0.046),
+('pasar-awam-balai-rakyat-batu-lanchang', 'supper-at-batu-lanchang-food-truck-party', 2, 0.113),
+('pasar-awam-balai-rakyat-batu-lanchang', 'jelutong-market', 3, 0.678),
+('pasar-awam-balai-rakyat-batu-lanchang', 'night-market-on-friday-pasar-malam-van-praagh', 4, 1.110),
+('pasar-awam-balai-rakyat-batu-lanchang', 'perak-road-wet-market-da-lu-hou-wan-shan', 5, 1.375),
+('campbell-street-market', 'chulia-street-hawker-food', 1, 0.156),
+('campbell-street-market', 'kimberley-street-food-night-market', 2, 0.332),
+('campbell-street-market', 'pasar-chowrasta-market', 3, 0.500),
+('campbell-street-market', 'pasar-malam-lebuh-keng-kwee', 4, 0.531),
+('campbell-street-market', 'plaza-ramadan-prangin-mall', 5, 0.558),
+('sites-morning-market-and-night-market-council', 'pasar-malam-bukit-gedung', 1, 0.268),
+('sites-morning-market-and-night-market-council', 'pasar-malam-bayan-baru', 2, 1.392),
+('sites-morning-market-and-night-market-council', 'friday-night-market', 3, 1.530),
+('sites-morning-market-and-night-market-council', 'pasar-malam-sungai-ara', 4, 1.597),
+('sites-morning-market-and-night-market-council', 'pasar-malam-relau', 5, 2.415),
+('jelutong-market', 'pasar-malam-di-tempat-letak-kereta-bersebelahan-kompleks-batu-lanchang', 1, 0.651),
+('jelutong-market', 'supper-at-batu-lanchang-food-truck-party', 2, 0.656),
+('jelutong-market', 'pasar-awam-balai-rakyat-batu-lanchang', 3, 0.678),
+('jelutong-market', 'night-market-on-friday-pasar-malam-van-praagh', 4, 0.800),
+('jelutong-market', 'perak-road-wet-market-da-lu-hou-wan-shan', 5, 1.116),
+('pasar-basah-pulau-tikus', 'gurney-drive-hawker-center', 1, 1.138),
+('pasar-basah-pulau-tikus', 'road-walk', 2, 2.052),
+('pasar-basah-pulau-tikus', 'lorong-kulit-flea-market', 3, 2.058),
+('pasar-basah-pulau-tikus', 'new-lane-street-foodstalls', 4, 2.377),
+('pasar-basah-pulau-tikus', 'pasar-chowrasta-market', 5, 2.544),
+('parking-pasar-malam-putrajaya', 'pasar-malam-putrajaya-selasa-jumaat', 1, 0.037),
+('parking-pasar-malam-putrajaya', 'pasar-tani-kekal-putrajaya', 2, 0.050),
+('parking-pasar-malam-putrajaya', 'pasar-presint-8', 3, 3.625),
+('parking-pasar-malam-putrajaya', 'pasar-malam-taman-dengkil-jaya', 4, 4.019),
+('parking-pasar-malam-putrajaya', 'pasar-pagi-pasar-malam-presint-16-putrajaya', 5, 4.240),
+('pasar-pagi-pasar-malam-presint-16-putrajaya', 'pasar-malam-presint-14-putrajaya', 1, 2.505),
+('pasar-pagi-pasar-malam-presint-16-putrajaya', 'pasar-presint-8', 2, 2.887),
+('pasar-pagi-pasar-malam-presint-16-putrajaya', 'pasar-tani-kekal-putrajaya', 3, 4.219),
+('pasar-pagi-pasar-malam-presint-16-putrajaya', 'parking-pasar-malam-putrajaya', 4, 4.240),
+('pasar-pagi-pasar-malam-presint-16-putrajaya', 'pasar-malam-putrajaya-selasa-jumaat', 5, 4.249),
+('pasar-tani-kekal-putrajaya', 'pasar-malam-putrajaya-selasa-jumaat', 1, 0.032),
+('pasar-tani-kekal-putrajaya', 'parking-pasar-malam-putrajaya', 2, 0.050),
+('pasar-tani-kekal-putrajaya', 'pasar-presint-8', 3, 3.579),
+('pasar-tani-kekal-putrajaya', 'pasar-malam-taman-dengkil-jaya', 4, 4.061),
+('pasar-tani-kekal-putrajaya', 'pasar-pagi-pasar-malam-presint-16-putrajaya', 5, 4.219),
+('pasar-presint-8', 'pasar-pagi-pasar-malam-presint-16-putrajaya', 1, 2.887),
+('pasar-presint-8', 'pasar-tani-kekal-putrajaya', 2, 3.579),
+('pasar-presint-8', 'pasar-malam-putrajaya-selasa-jumaat', 3, 3.608),
+('pasar-presint-8', 'parking-pasar-malam-putrajaya', 4, 3.625),
+('pasar-presint-8', 'pasar-malam-presint-14-putrajaya', 5, 4.755),
+('pasar-malam-putrajaya-selasa-jumaat', 'pasar-tani-kekal-putrajaya', 1, 0.032),
+('pasar-malam-putrajaya-selasa-jumaat', 'parking-pasar-malam-putrajaya', 2, 0.037),
+('pasar-malam-putrajaya-selasa-jumaat', 'pasar-presint-8', 3, 3.608),
+('pasar-malam-putrajaya-selasa-jumaat', 'pasar-malam-taman-dengkil-jaya', 4, 4.030),
+('pasar-malam-putrajaya-selasa-jumaat', 'pasar-pagi-pasar-malam-presint-16-putrajaya', 5, 4.249),
+('pasar-malam-food-night-market-asia-city', 'pasar-tani-asia-city', 1, 0.006),
+('pasar-malam-food-night-market-asia-city', 'food-truck-zone-kampung-air', 2, 0.261),
+('pasar-malam-food-night-market-asia-city', 'pasar-malam-kampung-air', 3, 0.363),
+('pasar-malam-food-night-market-asia-city', 'kk-night-market-lorong-guamantong-sinsuran-sinsuran-night-market', 4, 0.433),
+('pasar-malam-food-night-market-asia-city', 'pasar-sinsuran-kota-kinabalu', 5, 0.462),
+('kota-kinabalu-city-night-market', 'wawasan-night-market', 1, 0.349),
+('kota-kinabalu-city-night-market', 'dsoang-market', 2, 0.567),
+('kota-kinabalu-city-night-market', 'pasar-tani-asia-city', 3, 0.690),
+('kota-kinabalu-city-night-market', 'pasar-malam-food-night-market-asia-city', 4, 0.696),
+('kota-kinabalu-city-night-market', 'food-truck-zone-kampung-air', 5, 0.955),
+('tanjung-aru-beach-night-market', 'pasar-tanjung-aru', 1, 1.274),
+('tanjung-aru-beach-night-market', 'locomotive-night-market', 2, 1.619),
+('tanjung-aru-beach-night-market', 'pulut-pacik-bayu-aeropod-night-market', 3, 1.619),
+('tanjung-aru-beach-night-market', 'aeropod-night-market', 4, 1.629),
+('tanjung-aru-beach-night-market', 'pasar-tani-sembulan', 5, 2.579),
+('night-food-market', 'anjung-kinabalu-akina-night-market', 1, 0.045),
+('night-food-market', 'pasar-sinsuran-kota-kinabalu', 2, 0.058),
+('night-food-market', 'handicraft-market', 3, 0.070),
+('night-food-market', 'kk-night-market-lorong-guamantong-sinsuran-sinsuran-night-market', 4, 0.094),
+('night-food-market', 'sha-and-hana', 5, 0.136),
+('anjung-kinabalu-akina-night-market', 'pasar-sinsuran-kota-kinabalu', 1, 0.017),
+('anjung-kinabalu-akina-night-market', 'night-food-market', 2, 0.045),
+('anjung-kinabalu-akina-night-market', 'kk-night-market-lorong-guamantong-sinsuran-sinsuran-night-market', 3, 0.077),
+('anjung-kinabalu-akina-night-market', 'handicraft-market', 4, 0.099),
+('anjung-kinabalu-akina-night-market', 'sha-and-hana', 5, 0.169),
+('pasar-malam-inanam-point', 'inanam-town-market', 1, 0.389),
+('pasar-malam-inanam-point', 'taman-kemajuan-likas-market', 2, 2.002),
+('pasar-malam-inanam-point', 'pasar-malam-metro-town', 3, 3.033),
+('pasar-malam-inanam-point', 'pasar-manggatal', 4, 4.107),
+('pasar-malam-inanam-point', 'food-truck-zone-damai', 5, 5.162),
+('ua1-night-market', 'pasar-manggatal', 1, 2.334),
+('ua1-night-market', 'pasar-malam-inanam-point', 2, 5.572),
+('ua1-night-market', 'taman-kemajuan-likas-market', 3, 5.654),
+('ua1-night-market', 'inanam-town-market', 4, 5.864),
+('ua1-night-market', 'pasar-malam-uuc', 5, 6.796),
+('locomotive-night-market', 'pulut-pacik-bayu-aeropod-night-market', 1, 0.006),
+('locomotive-night-market', 'aeropod-night-market', 2, 0.010),
+('locomotive-night-market', 'pasar-tanjung-aru', 3, 0.680),
+('locomotive-night-market', 'pasar-malam-sembulan', 4, 1.566),
+('locomotive-night-market', 'pasar-tani-sembulan', 5, 1.597),
+('handicraft-market', 'night-food-market', 1, 0.070),
+('handicraft-market', 'sha-and-hana', 2, 0.071),
+('handicraft-market', 'kk-night-market-lorong-guamantong-sinsuran-sinsuran-night-market', 3, 0.087),
+('handicraft-market', 'anjung-kinabalu-akina-night-market', 4, 0.099),
+('handicraft-market', 'pasar-sinsuran-kota-kinabalu', 5, 0.115),
+('api-api-night-food-market-gaya-street', 'gaya-street-market', 1, 0.335),
+('api-api-night-food-market-gaya-street', 'pasar-minggu-gaya-street', 2, 0.366),
+('api-api-night-food-market-gaya-street', 'durian-night-market', 3, 0.430),
+('api-api-night-food-market-gaya-street', 'todak-waterfront-hawker-center', 4, 0.442),
+('api-api-night-food-market-gaya-street', 'bawah-jambatan-segama-kota-kinabalu', 5, 0.444),
+('keningau-night-market', 'loi-loi-mini-market-pasar-malam', 1, 0.053),
+('keningau-night-market', 'pasar-malam-keningau', 2, 0.199),
+('keningau-night-market', 'pasar-keningau', 3, 0.285),
+('keningau-night-market', 'pasar-tamu-keningau', 4, 0.482),
+('keningau-night-market', 'bandar-baru-keningau-night-market', 5, 3.181),
+('pasar-malam-kampung-air', 'food-truck-zone-kampung-air', 1, 0.106),
+('pasar-malam-kampung-air', 'pasar-minggu-gaya-street', 2, 0.311),
+('pasar-malam-kampung-air', 'kk-night-market-lorong-guamantong-sinsuran-sinsuran-night-market', 3, 0.338),
+('pasar-malam-kampung-air', 'gaya-street-market', 4, 0.342),
+('pasar-malam-kampung-air', 'pasar-malam-food-night-market-asia-city', 5, 0.363),
+('wawasan-night-market', 'kota-kinabalu-city-night-market', 1, 0.349),
+('wawasan-night-market', 'pasar-tani-asia-city', 2, 0.695),
+('wawasan-night-market', 'pasar-malam-food-night-market-asia-city', 3, 0.700),
+('wawasan-night-market', 'pasar-sinsuran-kota-kinabalu', 4, 0.856),
+('wawasan-night-market', 'dsoang-market', 5, 0.870),
+('aeropod-night-market', 'locomotive-night-market', 1, 0.010),
+('aeropod-night-market', 'pulut-pacik-bayu-aeropod-night-market', 2, 0.011),
+('aeropod-night-market', 'pasar-tanjung-aru', 3, 0.687),
+('aeropod-night-market', 'pasar-malam-sembulan', 4, 1.563),
+('aeropod-night-market', 'pasar-tani-sembulan', 5, 1.594),
+('bayu-night-market', 'pasar-lido', 1, 1.330),
+('bayu-night-market', 'dsoang-market', 2, 1.584),
+('bayu-night-market', 'pasar-malam-sembulan', 3, 1.921),
+('bayu-night-market', 'pasar-tani-sembulan', 4, 1.985),
+('bayu-night-market', 'kota-kinabalu-city-night-market', 5, 2.093),
+('durian-night-market', 'bawah-jambatan-segama-kota-kinabalu', 1, 0.030),
+('durian-night-market', 'todak-waterfront-hawker-center', 2, 0.164),
+('durian-night-market', 'kota-kinabalu-central-market', 3, 0.178),
+('durian-night-market', 'waterfront-seafood-night-market', 4, 0.200),
+('durian-night-market', 'pasar-minggu-gaya-street', 5, 0.212),
+('kk-night-market-lorong-guamantong-sinsuran-sinsuran-night-market', 'anjung-kinabalu-akina-night-market', 1, 0.077),
+('kk-night-market-lorong-guamantong-sinsuran-sinsuran-night-market', 'handicraft-market', 2, 0.087),
+('kk-night-market-lorong-guamantong-sinsuran-sinsuran-night-market', 'pasar-sinsuran-kota-kinabalu', 3, 0.088),
+('kk-night-market-lorong-guamantong-sinsuran-sinsuran-night-market', 'night-food-market', 4, 0.094),
+('kk-night-market-lorong-guamantong-sinsuran-sinsuran-night-market', 'sha-and-hana', 5, 0.148),
+('pasar-malam-medan-selera', 'sandagen-downtown-night-market', 1, 0.522),
+('pasar-malam-medan-selera', 'tapak-pasar-malam-bandar-sandakan', 2, 1.003),
+('pasar-malam-medan-selera', 'sandakan-central-market', 3, 1.169),
+('pasar-malam-medan-selera', 'pasar-kim-fung', 4, 4.078),
+('pasar-malam-medan-selera', 'pasar-malam-bandar-megah', 5, 8.487),
+('night-market-emart', 'pasar-sembang-kinabalu', 1, 0.685),
+('night-market-emart', 'yakking-enterprise', 2, 0.766),
+('night-market-emart', 'pasar-lido', 3, 1.749),
+('night-market-emart', 'koidupan-night-market', 4, 2.080),
+('night-market-emart', 'pulut-pacik-bayu-aeropod-night-market', 5, 2.091),
+('tuaran-night-market', 'satay-nana-tamparuli', 1, 6.089),
+('tuaran-night-market', 'pasar-malam-pekan-tamparuli', 2, 6.310),
+('tuaran-night-market', 'pasar-malam-uuc', 3, 11.119),
+('tuaran-night-market', 'tamu-simpang-rasuna-tenghilan', 4, 15.726),
+('tuaran-night-market', 'ua1-night-market', 5, 17.876),
+('pasar-malam-kota-belud', 'tamu-kota-belud', 1, 0.796),
+('pasar-malam-kota-belud', 'tamu-simpang-rasuna-tenghilan', 2, 13.618),
+('pasar-malam-kota-belud', 'tuaran-night-market', 3, 29.081),
+('pasar-malam-kota-belud', 'satay-nana-tamparuli', 4, 29.291),
+('pasar-malam-kota-belud', 'pasar-malam-pekan-tamparuli', 5, 30.164),
+('pasar-malam-sembulan', 'pasar-tani-sembulan', 1, 0.066),
+('pasar-malam-sembulan', 'dsoang-market', 2, 0.855),
+('pasar-malam-sembulan', 'kota-kinabalu-city-night-market', 3, 1.181),
+('pasar-malam-sembulan', 'wawasan-night-market', 4, 1.286),
+('pasar-malam-sembulan', 'pasar-tanjung-aru', 5, 1.364),
+('gaya-street-market', 'pasar-minggu-gaya-street', 1, 0.031),
+('gaya-street-market', 'durian-night-market', 2, 0.218),
+('gaya-street-market', 'bawah-jambatan-segama-kota-kinabalu', 3, 0.247),
+('gaya-street-market', 'api-api-night-food-market-gaya-street', 4, 0.335),
+('gaya-street-market', 'pasar-malam-kampung-air', 5, 0.342),
+('pasar-sembang-kinabalu', 'night-market-emart', 1, 0.685),
+('pasar-sembang-kinabalu', 'pasar-lido', 2, 1.066),
+('pasar-sembang-kinabalu', 'yakking-enterprise', 3, 1.451),
+('pasar-sembang-kinabalu', 'koidupan-night-market', 4, 1.727),
+('pasar-sembang-kinabalu', 'aeropod-night-market', 5, 2.082),
+('koidupan-night-market', 'pasar-sembang-kinabalu', 1, 1.727),
+('koidupan-night-market', 'pasar-lido', 2, 1.744),
+('koidupan-night-market', 'night-market-emart', 3, 2.080),
+('koidupan-night-market', 'pasar-minggu-dongonggon-penampang', 4, 2.519),
+('koidupan-night-market', 'pasar-sayur-donggongon', 5, 2.629),
+('tapun-eat', 'api-api-night-food-market-gaya-street', 1, 0.743),
+('tapun-eat', 'todak-waterfront-hawker-center', 2, 1.021),
+('tapun-eat', 'gaya-street-market', 3, 1.073),
+('tapun-eat', 'durian-night-market', 4, 1.101),
+('tapun-eat', 'bawah-jambatan-segama-kota-kinabalu', 5, 1.102),
+('bawah-jambatan-segama-kota-kinabalu', 'durian-night-market', 1, 0.030),
+('bawah-jambatan-segama-kota-kinabalu', 'todak-waterfront-hawker-center', 2, 0.140),
+('bawah-jambatan-segama-kota-kinabalu', 'kota-kinabalu-central-market', 3, 0.152),
+('bawah-jambatan-segama-kota-kinabalu', 'waterfront-seafood-night-market', 4, 0.170),
+('bawah-jambatan-segama-kota-kinabalu', 'pasar-minggu-gaya-street', 5, 0.241),
+('pasar-manggatal', 'ua1-night-market', 1, 2.334),
+('pasar-manggatal', 'pasar-malam-inanam-point', 2, 4.107),
+('pasar-manggatal', 'inanam-town-market', 3, 4.288),
+('pasar-manggatal', 'taman-kemajuan-likas-market', 4, 4.983),
+('pasar-manggatal', 'pasar-malam-metro-town', 5, 7.118),
+('waterfront-seafood-night-market', 'kota-kinabalu-central-market', 1, 0.092),
+('waterfront-seafood-night-market', 'todak-waterfront-hawker-center', 2, 0.100),
+('waterfront-seafood-night-market', 'bawah-jambatan-segama-kota-kinabalu', 3, 0.170),
+('waterfront-seafood-night-market', 'durian-night-market', 4, 0.200),
+('waterfront-seafood-night-market', 'sha-and-hana', 5, 0.260),
+('bingkul-night-market', 'pasar-am-beaufort', 1, 2.567),
+('bingkul-night-market', 'tamu-mingguan-beaufort', 2, 2.938),
+('bingkul-night-market', 'pasar-tenom-sabah', 3, 35.568),
+('bingkul-night-market', 'tamu-tenom', 4, 35.662),
+('bingkul-night-market', 'pasar-keningau', 5, 47.683),
+('pasar-malam-metro-town', 'food-truck-zone-damai', 1, 2.281),
+('pasar-malam-metro-town', 'taman-kemajuan-likas-market', 2, 2.912),
+('pasar-malam-metro-town', 'inanam-town-market', 3, 2.947),
+('pasar-malam-metro-town', 'pasar-malam-inanam-point', 4, 3.033),
+('pasar-malam-metro-town', 'api-api-night-food-market-gaya-street', 5, 4.112),
+('tapak-pasar-malam-pekan-tambunan', 'pasar-malam-kg-nambayan', 1, 3.901),
+('tapak-pasar-malam-pekan-tambunan', 'pasar-sayur-donggongon', 2, 39.149),
+('tapak-pasar-malam-pekan-tambunan', 'tamu-kinarut', 3, 39.264),
+('tapak-pasar-malam-pekan-tambunan', 'pasar-minggu-dongonggon-penampang', 4, 39.268),
+('tapak-pasar-malam-pekan-tambunan', 'bandar-baru-keningau-night-market', 5, 40.725),
+('night-market-ua-sulaman', 'edora-mozzarella-cheese', 1, 0.230),
+('night-market-ua-sulaman', 'uptown-malam-sri-putatan', 2, 0.898),
+('night-market-ua-sulaman', 'fadrenandaq-foodbeverage', 3, 2.136),
+('night-market-ua-sulaman', 'yakking-enterprise', 4, 4.162),
+('night-market-ua-sulaman', 'night-market-emart', 5, 4.874),
+('pasar-minggu-gaya-street', 'gaya-street-market', 1, 0.031),
+('pasar-minggu-gaya-street', 'durian-night-market', 2, 0.212),
+('pasar-minggu-gaya-street', 'bawah-jambatan-segama-kota-kinabalu', 3, 0.241),
+('pasar-minggu-gaya-street', 'pasar-malam-kampung-air', 4, 0.311),
+('pasar-minggu-gaya-street', 'todak-waterfront-hawker-center', 5, 0.355),
+('uptown-malam-sri-putatan', 'night-market-ua-sulaman', 1, 0.898),
+('uptown-malam-sri-putatan', 'edora-mozzarella-cheese', 2, 1.057),
+('uptown-malam-sri-putatan', 'fadrenandaq-foodbeverage', 3, 2.553),
+('uptown-malam-sri-putatan', 'yakking-enterprise', 4, 4.515),
+('uptown-malam-sri-putatan', 'night-market-emart', 5, 5.266),
+('pasar-malam-jumaat', 'pasar-malam-batu-5', 1, 2.992),
+('pasar-malam-jumaat', 'pasar-kinabutan', 2, 3.041),
+('pasar-malam-jumaat', 'pasar-malam-greenline-tawau', 3, 6.294),
+('pasar-malam-jumaat', 'pasar-hot-spring', 4, 8.555),
+('pasar-malam-jumaat', 'laksa-mama-cali', 5, 10.183),
+('food-truck-zone-kampung-air', 'pasar-malam-kampung-air', 1, 0.106),
+('food-truck-zone-kampung-air', 'pasar-malam-food-night-market-asia-city', 2, 0.261),
+('food-truck-zone-kampung-air', 'pasar-tani-asia-city', 3, 0.267),
+('food-truck-zone-kampung-air', 'kk-night-market-lorong-guamantong-sinsuran-sinsuran-night-market', 4, 0.352),
+('food-truck-zone-kampung-air', 'pasar-minggu-gaya-street', 5, 0.415),
+('pasar-malam-sejati-walk', 'pasar-malam-bandar-megah', 1, 1.663),
+('pasar-malam-sejati-walk', 'pasar-kim-fung', 2, 4.824),
+('pasar-malam-sejati-walk', 'pasar-malam-medan-selera', 3, 8.747),
+('pasar-malam-sejati-walk', 'sandagen-downtown-night-market', 4, 9.173),
+('pasar-malam-sejati-walk', 'tapak-pasar-malam-bandar-sandakan', 5, 9.417),
+('pulut-pacik-bayu-aeropod-night-market', 'locomotive-night-market', 1, 0.006),
+('pulut-pacik-bayu-aeropod-night-market', 'aeropod-night-market', 2, 0.011),
+('pulut-pacik-bayu-aeropod-night-market', 'pasar-tanjung-aru', 3, 0.684),
+('pulut-pacik-bayu-aeropod-night-market', 'pasar-malam-sembulan', 4, 1.571),
+('pulut-pacik-bayu-aeropod-night-market', 'pasar-tani-sembulan', 5, 1.602),
+('pasar-malam-bandar-megah', 'pasar-malam-sejati-walk', 1, 1.663),
+('pasar-malam-bandar-megah', 'pasar-kim-fung', 2, 4.409),
+('pasar-malam-bandar-megah', 'pasar-malam-medan-selera', 3, 8.487),
+('pasar-malam-bandar-megah', 'sandagen-downtown-night-market', 4, 8.962),
+('pasar-malam-bandar-megah', 'tapak-pasar-malam-bandar-sandakan', 5, 9.283),
+('sandagen-downtown-night-market', 'tapak-pasar-malam-bandar-sandakan', 1, 0.513),
+('sandagen-downtown-night-market', 'pasar-malam-medan-selera', 2, 0.522),
+('sandagen-downtown-night-market', 'sandakan-central-market', 3, 0.673),
+('sandagen-downtown-night-market', 'pasar-kim-fung', 4, 4.558),
+('sandagen-downtown-night-market', 'pasar-malam-bandar-megah', 5, 8.962),
+('bandar-baru-keningau-night-market', 'pasar-tamu-keningau', 1, 2.711),
+('bandar-baru-keningau-night-market', 'pasar-malam-keningau', 2, 2.989),
+('bandar-baru-keningau-night-market', 'loi-loi-mini-market-pasar-malam', 3, 3.180),
+('bandar-baru-keningau-night-market', 'keningau-night-market', 4, 3.181),
+('bandar-baru-keningau-night-market', 'pasar-keningau', 5, 3.325),
+('pasar-malam-uuc', 'ua1-night-market', 1, 6.796),
+('pasar-malam-uuc', 'pasar-manggatal', 2, 8.154),
+('pasar-malam-uuc', 'pasar-malam-pekan-tamparuli', 3, 10.472),
+('pasar-malam-uuc', 'tuaran-night-market', 4, 11.119),
+('pasar-malam-uuc', 'satay-nana-tamparuli', 5, 11.238),
+('kota-kinabalu-central-market', 'waterfront-seafood-night-market', 1, 0.092),
+('kota-kinabalu-central-market', 'bawah-jambatan-segama-kota-kinabalu', 2, 0.152),
+('kota-kinabalu-central-market', 'todak-waterfront-hawker-center', 3, 0.165),
+('kota-kinabalu-central-market', 'sha-and-hana', 4, 0.172),
+('kota-kinabalu-central-market', 'durian-night-market', 5, 0.178),
+('pasar-tani-asia-city', 'pasar-malam-food-night-market-asia-city', 1, 0.006),
+('pasar-tani-asia-city', 'food-truck-zone-kampung-air', 2, 0.267),
+('pasar-tani-asia-city', 'pasar-malam-kampung-air', 3, 0.369),
+('pasar-tani-asia-city', 'kk-night-market-lorong-guamantong-sinsuran-sinsuran-night-market', 4, 0.437),
+('pasar-tani-asia-city', 'pasar-sinsuran-kota-kinabalu', 5, 0.465),
+('pasar-kim-fung', 'pasar-malam-medan-selera', 1, 4.078),
+('pasar-kim-fung', 'pasar-malam-bandar-megah', 2, 4.409),
+('pasar-kim-fung', 'sandagen-downtown-night-market', 3, 4.558),
+('pasar-kim-fung', 'pasar-malam-sejati-walk', 4, 4.824),
+('pasar-kim-fung', 'tapak-pasar-malam-bandar-sandakan', 5, 4.901),
+('inanam-town-market', 'pasar-malam-inanam-point', 1, 0.389),
+('inanam-town-market', 'taman-kemajuan-likas-market', 2, 2.316),
+('inanam-town-market', 'pasar-malam-metro-town', 3, 2.947),
+('inanam-town-market', 'pasar-manggatal', 4, 4.288),
+('inanam-town-market', 'food-truck-zone-damai', 5, 5.146),
+('pasar-hot-spring', 'laksa-mama-cali', 1, 2.035),
+('pasar-hot-spring', 'pasar-semarak', 2, 2.461),
+('pasar-hot-spring', 'pasar-malam-moreh', 3, 3.335),
+('pasar-hot-spring', 'pasar-malam-greenline-tawau', 4, 3.487),
+('pasar-hot-spring', 'pasar-malam-chester-chester-night-market', 5, 4.331),
+('sha-and-hana', 'handicraft-market', 1, 0.071),
+('sha-and-hana', 'night-food-market', 2, 0.136),
+('sha-and-hana', 'kk-night-market-lorong-guamantong-sinsuran-sinsuran-night-market', 3, 0.148),
+('sha-and-hana', 'anjung-kinabalu-akina-night-market', 4, 0.169),
+('sha-and-hana', 'kota-kinabalu-central-market', 5, 0.172),
+('tapak-pasar-malam-bandar-sandakan', 'sandakan-central-market', 1, 0.166),
+('tapak-pasar-malam-bandar-sandakan', 'sandagen-downtown-night-market', 2, 0.513),
+('tapak-pasar-malam-bandar-sandakan', 'pasar-malam-medan-selera', 3, 1.003),
+('tapak-pasar-malam-bandar-sandakan', 'pasar-kim-fung', 4, 4.901),
+('tapak-pasar-malam-bandar-sandakan', 'pasar-malam-bandar-megah', 5, 9.283),
+('pasar-malam-chester-chester-night-market', 'pasar-sayur-malam-tawau-sabah-malaysia', 1, 0.193),
+('pasar-malam-chester-chester-night-market', 'downtown-tawau', 2, 0.298),
+('pasar-malam-chester-chester-night-market', 'pasar-malam-greenline-tawau', 3, 4.053),
+('pasar-malam-chester-chester-night-market', 'pasar-hot-spring', 4, 4.331),
+('pasar-malam-chester-chester-night-market', 'laksa-mama-cali', 5, 5.619),
+('pasar-lido', 'pasar-sembang-kinabalu', 1, 1.066),
+('pasar-lido', 'bayu-night-market', 2, 1.330),
+('pasar-lido', 'koidupan-night-market', 3, 1.744),
+('pasar-lido', 'night-market-emart', 4, 1.749),
+('pasar-lido', 'aeropod-night-market', 5, 2.406),
+('yakking-enterprise', 'night-market-emart', 1, 0.766),
+('yakking-enterprise', 'pasar-sembang-kinabalu', 2, 1.451),
+('yakking-enterprise', 'fadrenandaq-foodbeverage', 3, 2.026),
+('yakking-enterprise', 'pulut-pacik-bayu-aeropod-night-market', 4, 2.319),
+('yakking-enterprise', 'aeropod-night-market', 5, 2.323),
+('kundasang-market', 'street-wet-market', 1, 0.070),
+('kundasang-market', 'dataran-sayur-kundasang', 2, 0.087),
+('kundasang-market', 'pasar-tani-mega-kundasang', 3, 0.136),
+('kundasang-market', 'pasar-sayur-ranau-sabah', 4, 10.505),
+('kundasang-market', 'pasar-besar-ranau-sabah', 5, 10.538),
+('dsoang-market', 'kota-kinabalu-city-night-market', 1, 0.567),
+('dsoang-market', 'pasar-malam-sembulan', 2, 0.855),
+('dsoang-market', 'wawasan-night-market', 3, 0.870),
+('dsoang-market', 'pasar-tani-sembulan', 4, 0.878),
+('dsoang-market', 'pasar-tani-asia-city', 5, 1.186),
+('pasar-malam-kg-nambayan', 'tapak-pasar-malam-pekan-tambunan', 1, 3.901),
+('pasar-malam-kg-nambayan', 'bandar-baru-keningau-night-market', 2, 36.838),
+('pasar-malam-kg-nambayan', 'tamu-kinarut', 3, 38.799),
+('pasar-malam-kg-nambayan', 'pasar-tamu-keningau', 4, 39.476),
+('pasar-malam-kg-nambayan', 'pasar-malam-keningau', 5, 39.732),
+('food-truck-zone-damai', 'bayu-night-market', 1, 2.254),
+('food-truck-zone-damai', 'pasar-malam-metro-town', 2, 2.281),
+('food-truck-zone-damai', 'food-truck-zone-kampung-air', 3, 2.342),
+('food-truck-zone-damai', 'pasar-malam-kampung-air', 4, 2.355),
+('food-truck-zone-damai', 'pasar-minggu-gaya-street', 5, 2.366),
+('taman-kemajuan-likas-market', 'pasar-malam-inanam-point', 1, 2.002),
+('taman-kemajuan-likas-market', 'inanam-town-market', 2, 2.316),
+('taman-kemajuan-likas-market', 'pasar-malam-metro-town', 3, 2.912),
+('taman-kemajuan-likas-market', 'tapun-eat', 4, 4.299),
+('taman-kemajuan-likas-market', 'food-truck-zone-damai', 5, 4.345),
+('pasar-sayur-donggongon', 'pasar-minggu-dongonggon-penampang', 1, 0.139),
+('pasar-sayur-donggongon', 'koidupan-night-market', 2, 2.629),
+('pasar-sayur-donggongon', 'pasar-sembang-kinabalu', 3, 4.284),
+('pasar-sayur-donggongon', 'pasar-lido', 4, 4.340),
+('pasar-sayur-donggongon', 'night-market-emart', 5, 4.440),
+('pasar-malam-moreh', 'pasar-semarak', 1, 0.879),
+('pasar-malam-moreh', 'laksa-mama-cali', 2, 1.303),
+('pasar-malam-moreh', 'pasar-hot-spring', 3, 3.335),
+('pasar-malam-moreh', 'pasar-malam-chester-chester-night-market', 4, 6.700),
+('pasar-malam-moreh', 'pasar-malam-greenline-tawau', 5, 6.820),
+('ranau-tamu-pasar-morning-evening', 'ranau-evening-market', 1, 0.602),
+('ranau-tamu-pasar-morning-evening', 'ranau-night-market-ranau-sabah', 2, 0.613),
+('ranau-tamu-pasar-morning-evening', 'pasar-besar-ranau-sabah', 3, 0.849),
+('ranau-tamu-pasar-morning-evening', 'pasar-sayur-ranau-sabah', 4, 0.893),
+('ranau-tamu-pasar-morning-evening', 'street-wet-market', 5, 10.810),
+('pasar-tenom-sabah', 'tamu-tenom', 1, 0.110),
+('pasar-tenom-sabah', 'tamu-mingguan-beaufort', 2, 33.001),
+('pasar-tenom-sabah', 'pasar-am-beaufort', 3, 33.288),
+('pasar-tenom-sabah', 'pasar-keningau', 4, 33.482),
+('pasar-tenom-sabah', 'loi-loi-mini-market-pasar-malam', 5, 33.608),
+('pasar-malam-keningau', 'loi-loi-mini-market-pasar-malam', 1, 0.192),
+('pasar-malam-keningau', 'keningau-night-market', 2, 0.199),
+('pasar-malam-keningau', 'pasar-tamu-keningau', 3, 0.283),
+('pasar-malam-keningau', 'pasar-keningau', 4, 0.444),
+('pasar-malam-keningau', 'bandar-baru-keningau-night-market', 5, 2.989),
+('tamu-simpang-rasuna-tenghilan', 'pasar-malam-kota-belud', 1, 13.618),
+('tamu-simpang-rasuna-tenghilan', 'tamu-kota-belud', 2, 13.650),
+('tamu-simpang-rasuna-tenghilan', 'tuaran-night-market', 3, 15.726),
+('tamu-simpang-rasuna-tenghilan', 'satay-nana-tamparuli', 4, 15.727),
+('tamu-simpang-rasuna-tenghilan', 'pasar-malam-pekan-tamparuli', 5, 16.601),
+('pasar-tani-mega-kundasang', 'dataran-sayur-kundasang', 1, 0.097),
+('pasar-tani-mega-kundasang', 'kundasang-market', 2, 0.136),
+('pasar-tani-mega-kundasang', 'street-wet-market', 3, 0.205),
+('pasar-tani-mega-kundasang', 'pasar-sayur-ranau-sabah', 4, 10.610),
+('pasar-tani-mega-kundasang', 'pasar-besar-ranau-sabah', 5, 10.642),
+('ranau-evening-market', 'ranau-night-market-ranau-sabah', 1, 0.029),
+('ranau-evening-market', 'pasar-besar-ranau-sabah', 2, 0.248),
+('ranau-evening-market', 'pasar-sayur-ranau-sabah', 3, 0.292),
+('ranau-evening-market', 'ranau-tamu-pasar-morning-evening', 4, 0.602),
+('ranau-evening-market', 'street-wet-market', 5, 10.542),
+('fadrenandaq-foodbeverage', 'yakking-enterprise', 1, 2.026),
+('fadrenandaq-foodbeverage', 'night-market-ua-sulaman', 2, 2.136),
+('fadrenandaq-foodbeverage', 'edora-mozzarella-cheese', 3, 2.273),
+('fadrenandaq-foodbeverage', 'uptown-malam-sri-putatan', 4, 2.553),
+('fadrenandaq-foodbeverage', 'night-market-emart', 5, 2.746),
+('sandakan-central-market', 'tapak-pasar-malam-bandar-sandakan', 1, 0.166),
+('sandakan-central-market', 'sandagen-downtown-night-market', 2, 0.673),
+('sandakan-central-market', 'pasar-malam-medan-selera', 3, 1.169),
+('sandakan-central-market', 'pasar-kim-fung', 4, 5.047),
+('sandakan-central-market', 'pasar-malam-bandar-megah', 5, 9.423),
+('pasar-sayur-malam-tawau-sabah-malaysia', 'downtown-tawau', 1, 0.125),
+('pasar-sayur-malam-tawau-sabah-malaysia', 'pasar-malam-chester-chester-night-market', 2, 0.193),
+('pasar-sayur-malam-tawau-sabah-malaysia', 'pasar-malam-greenline-tawau', 3, 4.163),
+('pasar-sayur-malam-tawau-sabah-malaysia', 'pasar-hot-spring', 4, 4.522),
+('pasar-sayur-malam-tawau-sabah-malaysia', 'laksa-mama-cali', 5, 5.808),
+('pasar-tanjung-aru', 'locomotive-night-market', 1, 0.680),
+('pasar-tanjung-aru', 'pulut-pacik-bayu-aeropod-night-market', 2, 0.684),
+('pasar-tanjung-aru', 'aeropod-night-market', 3, 0.687),
+('pasar-tanjung-aru', 'tanjung-aru-beach-night-market', 4, 1.274),
+('pasar-tanjung-aru', 'pasar-malam-sembulan', 5, 1.364),
+('pasar-am-beaufort', 'tamu-mingguan-beaufort', 1, 0.379),
+('pasar-am-beaufort', 'bingkul-night-market', 2, 2.567),
+('pasar-am-beaufort', 'pasar-tenom-sabah', 3, 33.288),
+('pasar-am-beaufort', 'tamu-tenom', 4, 33.380),
+('pasar-am-beaufort', 'pasar-keningau', 5, 45.251),
+('satay-nana-tamparuli', 'pasar-malam-pekan-tamparuli', 1, 0.874),
+('satay-nana-tamparuli', 'tuaran-night-market', 2, 6.089),
+('satay-nana-tamparuli', 'pasar-malam-uuc', 3, 11.238),
+('satay-nana-tamparuli', 'tamu-simpang-rasuna-tenghilan', 4, 15.727),
+('satay-nana-tamparuli', 'ua1-night-market', 5, 17.669),
+('pasar-melinsung-papar-sabah', 'simpudu-vasai', 1, 5.923),
+('pasar-melinsung-papar-sabah', 'tamu-papar', 2, 5.938),
+('pasar-melinsung-papar-sabah', 'papar-flea-market', 3, 5.998),
+('pasar-melinsung-papar-sabah', 'tamu-ground-thursday-morning-market', 4, 6.077),
+('pasar-melinsung-papar-sabah', 'tamu-kinarut', 5, 10.069),
+('pasar-tani-sembulan', 'pasar-malam-sembulan', 1, 0.066),
+('pasar-tani-sembulan', 'dsoang-market', 2, 0.878),
+('pasar-tani-sembulan', 'kota-kinabalu-city-night-market', 3, 1.172),
+('pasar-tani-sembulan', 'wawasan-night-market', 4, 1.260),
+('pasar-tani-sembulan', 'pasar-tanjung-aru', 5, 1.366),
+('pasar-sinsuran-kota-kinabalu', 'anjung-kinabalu-akina-night-market', 1, 0.017),
+('pasar-sinsuran-kota-kinabalu', 'night-food-market', 2, 0.058),
+('pasar-sinsuran-kota-kinabalu', 'kk-night-market-lorong-guamantong-sinsuran-sinsuran-night-market', 3, 0.088),
+('pasar-sinsuran-kota-kinabalu', 'handicraft-market', 4, 0.115),
+('pasar-sinsuran-kota-kinabalu', 'sha-and-hana', 5, 0.186),
+('street-wet-market', 'kundasang-market', 1, 0.070),
+('street-wet-market', 'dataran-sayur-kundasang', 2, 0.149),
+('street-wet-market', 'pasar-tani-mega-kundasang', 3, 0.205),
+('street-wet-market', 'pasar-sayur-ranau-sabah', 4, 10.444),
+('street-wet-market', 'pasar-besar-ranau-sabah', 5, 10.477),
+('pasar-malam-batu-5', 'pasar-kinabutan', 1, 0.058),
+('pasar-malam-batu-5', 'pasar-malam-jumaat', 2, 2.992),
+('pasar-malam-batu-5', 'pasar-malam-greenline-tawau', 3, 3.664),
+('pasar-malam-batu-5', 'pasar-hot-spring', 4, 6.637),
+('pasar-malam-batu-5', 'pasar-malam-chester-chester-night-market', 5, 7.521),
+('pasar-besar-ranau-sabah', 'pasar-sayur-ranau-sabah', 1, 0.048),
+('pasar-besar-ranau-sabah', 'ranau-night-market-ranau-sabah', 2, 0.244),
+('pasar-besar-ranau-sabah', 'ranau-evening-market', 3, 0.248),
+('pasar-besar-ranau-sabah', 'ranau-tamu-pasar-morning-evening', 4, 0.849),
+('pasar-besar-ranau-sabah', 'street-wet-market', 5, 10.477),
+('pasar-malam-gum-gum', 'pasar-malam-bandar-megah', 1, 13.847),
+('pasar-malam-gum-gum', 'pasar-malam-sejati-walk', 2, 14.603),
+('pasar-malam-gum-gum', 'pasar-kim-fung', 3, 17.856),
+('pasar-malam-gum-gum', 'pasar-malam-medan-selera', 4, 21.732),
+('pasar-malam-gum-gum', 'sandagen-downtown-night-market', 5, 22.249),
+('loi-loi-mini-market-pasar-malam', 'keningau-night-market', 1, 0.053),
+('loi-loi-mini-market-pasar-malam', 'pasar-malam-keningau', 2, 0.192),
+('loi-loi-mini-market-pasar-malam', 'pasar-keningau', 3, 0.332),
+('loi-loi-mini-market-pasar-malam', 'pasar-tamu-keningau', 4, 0.473),
+('loi-loi-mini-market-pasar-malam', 'bandar-baru-keningau-night-market', 5, 3.180),
+('tamu-kinarut', 'edora-mozzarella-cheese', 1, 7.771),
+('tamu-kinarut', 'night-market-ua-sulaman', 2, 7.967),
+('tamu-kinarut', 'uptown-malam-sri-putatan', 3, 8.130),
+('tamu-kinarut', 'fadrenandaq-foodbeverage', 4, 9.947),
+('tamu-kinarut', 'pasar-melinsung-papar-sabah', 5, 10.069),
+('tamu-kota-belud', 'pasar-malam-kota-belud', 1, 0.796),
+('tamu-kota-belud', 'tamu-simpang-rasuna-tenghilan', 2, 13.650),
+('tamu-kota-belud', 'tuaran-night-market', 3, 29.215),
+('tamu-kota-belud', 'satay-nana-tamparuli', 4, 29.260),
+('tamu-kota-belud', 'pasar-malam-pekan-tamparuli', 5, 30.131),
+('tamu-tenom', 'pasar-tenom-sabah', 1, 0.110),
+('tamu-tenom', 'tamu-mingguan-beaufort', 2, 33.093),
+('tamu-tenom', 'pasar-am-beaufort', 3, 33.380),
+('tamu-tenom', 'pasar-keningau', 4, 33.430),
+('tamu-tenom', 'loi-loi-mini-market-pasar-malam', 5, 33.555),
+('simpudu-vasai', 'papar-flea-market', 1, 0.150),
+('simpudu-vasai', 'tamu-ground-thursday-morning-market', 2, 0.156),
+('simpudu-vasai', 'tamu-papar', 3, 0.539),
+('simpudu-vasai', 'pasar-melinsung-papar-sabah', 4, 5.923),
+('simpudu-vasai', 'tamu-kinarut', 5, 15.908),
+('ranau-night-market-ranau-sabah', 'ranau-evening-market', 1, 0.029),
+('ranau-night-market-ranau-sabah', 'pasar-besar-ranau-sabah', 2, 0.244),
+('ranau-night-market-ranau-sabah', 'pasar-sayur-ranau-sabah', 3, 0.285),
+('ranau-night-market-ranau-sabah', 'ranau-tamu-pasar-morning-evening', 4, 0.613),
+('ranau-night-market-ranau-sabah', 'street-wet-market', 5, 10.514),
+('pasar-semarak', 'laksa-mama-cali', 1, 0.450),
+('pasar-semarak', 'pasar-malam-moreh', 2, 0.879),
+('pasar-semarak', 'pasar-hot-spring', 3, 2.461),
+('pasar-semarak', 'pasar-malam-greenline-tawau', 4, 5.943),
+('pasar-semarak', 'pasar-malam-chester-chester-night-market', 5, 6.039),
+('pasar-tamu-keningau', 'pasar-malam-keningau', 1, 0.283),
+('pasar-tamu-keningau', 'loi-loi-mini-market-pasar-malam', 2, 0.473),
+('pasar-tamu-keningau', 'keningau-night-market', 3, 0.482),
+('pasar-tamu-keningau', 'pasar-keningau', 4, 0.700),
+('pasar-tamu-keningau', 'bandar-baru-keningau-night-market', 5, 2.711),
+('laksa-mama-cali', 'pasar-semarak', 1, 0.450),
+('laksa-mama-cali', 'pasar-malam-moreh', 2, 1.303),
+('laksa-mama-cali', 'pasar-hot-spring', 3, 2.035),
+('laksa-mama-cali', 'pasar-malam-greenline-tawau', 4, 5.521),
+('laksa-mama-cali', 'pasar-malam-chester-chester-night-market', 5, 5.619),
+('pasar-malam-pekan-tamparuli', 'satay-nana-tamparuli', 1, 0.874),
+('pasar-malam-pekan-tamparuli', 'tuaran-night-market', 2, 6.310),
+('pasar-malam-pekan-tamparuli', 'pasar-malam-uuc', 3, 10.472),
+('pasar-malam-pekan-tamparuli', 'tamu-simpang-rasuna-tenghilan', 4, 16.601),
+('pasar-malam-pekan-tamparuli', 'ua1-night-market', 5, 16.843),
+('dataran-sayur-kundasang', 'kundasang-market', 1, 0.087),
+('dataran-sayur-kundasang', 'pasar-tani-mega-kundasang', 2, 0.097),
+('dataran-sayur-kundasang', 'street-wet-market', 3, 0.149),
+('dataran-sayur-kundasang', 'pasar-sayur-ranau-sabah', 4, 10.591),
+('dataran-sayur-kundasang', 'pasar-besar-ranau-sabah', 5, 10.624),
+('edora-mozzarella-cheese', 'night-market-ua-sulaman', 1, 0.230),
+('edora-mozzarella-cheese', 'uptown-malam-sri-putatan', 2, 1.057),
+('edora-mozzarella-cheese', 'fadrenandaq-foodbeverage', 3, 2.273),
+('edora-mozzarella-cheese', 'yakking-enterprise', 4, 4.294),
+('edora-mozzarella-cheese', 'night-market-emart', 5, 4.994),
+('pekan-nabalu-weekly-market', 'pasar-tani-mega-kundasang', 1, 13.238),
+('pekan-nabalu-weekly-market', 'dataran-sayur-kundasang', 2, 13.255),
+('pekan-nabalu-weekly-market', 'kundasang-market', 3, 13.341),
+('pekan-nabalu-weekly-market', 'street-wet-market', 4, 13.402),
+('pekan-nabalu-weekly-market', 'pasar-sayur-ranau-sabah', 5, 23.846),
+('papar-flea-market', 'simpudu-vasai', 1, 0.150),
+('papar-flea-market', 'tamu-ground-thursday-morning-market', 2, 0.178),
+('papar-flea-market', 'tamu-papar', 3, 0.416),
+('papar-flea-market', 'pasar-melinsung-papar-sabah', 4, 5.998),
+('papar-flea-market', 'tamu-kinarut', 5, 15.964),
+('pasar-sayur-ranau-sabah', 'pasar-besar-ranau-sabah', 1, 0.048),
+('pasar-sayur-ranau-sabah', 'ranau-night-market-ranau-sabah', 2, 0.285),
+('pasar-sayur-ranau-sabah', 'ranau-evening-market', 3, 0.292),
+('pasar-sayur-ranau-sabah', 'ranau-tamu-pasar-morning-evening', 4, 0.893),
+('pasar-sayur-ranau-sabah', 'street-wet-market', 5, 10.444),
+('todak-waterfront-hawker-center', 'waterfront-seafood-night-market', 1, 0.100),
+('todak-waterfront-hawker-center', 'bawah-jambatan-segama-kota-kinabalu', 2, 0.140),
+('todak-waterfront-hawker-center', 'durian-night-market', 3, 0.164),
+('todak-waterfront-hawker-center', 'kota-kinabalu-central-market', 4, 0.165),
+('todak-waterfront-hawker-center', 'sha-and-hana', 5, 0.336),
+('tamu-mingguan-beaufort', 'pasar-am-beaufort', 1, 0.379),
+('tamu-mingguan-beaufort', 'bingkul-night-market', 2, 2.938),
+('tamu-mingguan-beaufort', 'pasar-tenom-sabah', 3, 33.001),
+('tamu-mingguan-beaufort', 'tamu-tenom', 4, 33.093),
+('tamu-mingguan-beaufort', 'pasar-keningau', 5, 44.875),
+('pasar-keningau', 'keningau-night-market', 1, 0.285),
+('pasar-keningau', 'loi-loi-mini-market-pasar-malam', 2, 0.332),
+('pasar-keningau', 'pasar-malam-keningau', 3, 0.444),
+('pasar-keningau', 'pasar-tamu-keningau', 4, 0.700),
+('pasar-keningau', 'bandar-baru-keningau-night-market', 5, 3.325),
+('tamu-ground-thursday-morning-market', 'simpudu-vasai', 1, 0.156),
+('tamu-ground-thursday-morning-market', 'papar-flea-market', 2, 0.178),
+('tamu-ground-thursday-morning-market', 'tamu-papar', 3, 0.589),
+('tamu-ground-thursday-morning-market', 'pasar-melinsung-papar-sabah', 4, 6.077),
+('tamu-ground-thursday-morning-market', 'tamu-kinarut', 5, 16.064),
+('pasar-kinabutan', 'pasar-malam-batu-5', 1, 0.058),
+('pasar-kinabutan', 'pasar-malam-jumaat', 2, 3.041),
+('pasar-kinabutan', 'pasar-malam-greenline-tawau', 3, 3.644),
+('pasar-kinabutan', 'pasar-hot-spring', 4, 6.638),
+('pasar-kinabutan', 'pasar-malam-chester-chester-night-market', 5, 7.488),
+('pasar-minggu-dongonggon-penampang', 'pasar-sayur-donggongon', 1, 0.139),
+('pasar-minggu-dongonggon-penampang', 'koidupan-night-market', 2, 2.519),
+('pasar-minggu-dongonggon-penampang', 'pasar-sembang-kinabalu', 3, 4.163),
+('pasar-minggu-dongonggon-penampang', 'pasar-lido', 4, 4.239),
+('pasar-minggu-dongonggon-penampang', 'night-market-emart', 5, 4.309),
+('pasar-malam-greenline-tawau', 'pasar-hot-spring', 1, 3.487),
+('pasar-malam-greenline-tawau', 'pasar-kinabutan', 2, 3.644),
+('pasar-malam-greenline-tawau', 'pasar-malam-batu-5', 3, 3.664),
+('pasar-malam-greenline-tawau', 'pasar-malam-chester-chester-night-market', 4, 4.053),
+('pasar-malam-greenline-tawau', 'downtown-tawau', 5, 4.153),
+('tamu-papar', 'papar-flea-market', 1, 0.416),
+('tamu-papar', 'simpudu-vasai', 2, 0.539),
+('tamu-papar', 'tamu-ground-thursday-morning-market', 3, 0.589),
+('tamu-papar', 'pasar-melinsung-papar-sabah', 4, 5.938),
+('tamu-papar', 'tamu-kinarut', 5, 15.836),
+('downtown-tawau', 'pasar-sayur-malam-tawau-sabah-malaysia', 1, 0.125),
+('downtown-tawau', 'pasar-malam-chester-chester-night-market', 2, 0.298),
+('downtown-tawau', 'pasar-malam-greenline-tawau', 3, 4.153),
+('downtown-tawau', 'pasar-hot-spring', 4, 4.606),
+('downtown-tawau', 'laksa-mama-cali', 5, 5.916),
+('pasar-malam-mpks-unigarden', 'market-bandar-riyal-samarahan-sarawak', 1, 1.212),
+('pasar-malam-mpks-unigarden', 'pasar-malam-desa-ilmu-uptown-kota-samarahan', 2, 3.847),
+('pasar-malam-mpks-unigarden', 'tapak-pasar-malam-aiman-mall', 3, 3.869),
+('pasar-malam-mpks-unigarden', 'pasar-malam-summer-mall', 4, 4.558),
+('pasar-malam-mpks-unigarden', 'mini-uptown-kpg-meranek', 5, 5.353),
+('kolok-pak-lah-metrocity', 'uptown-metrocity-matang', 1, 0.138),
+('kolok-pak-lah-metrocity', 'iza-collections', 2, 0.159),
+('kolok-pak-lah-metrocity', 'new-place-for-uptown-metrocitypasar-malam-belia', 3, 0.203),
+('kolok-pak-lah-metrocity', 'metromall-metrocity-square', 4, 0.209),
+('kolok-pak-lah-metrocity', 'metrocity-kuching', 5, 0.322),
+('siniawan-night-market', 'siniawan-old-town', 1, 0.051),
+('siniawan-night-market', 'paku-night-market', 2, 4.158),
+('siniawan-night-market', 'bau-night-market', 3, 7.960),
+('siniawan-night-market', 'semeba-weekend-market', 4, 8.966),
+('siniawan-night-market', 'cats-walk-street-weekend-market', 5, 10.428),
+('uptown-metrocity-matang', 'iza-collections', 1, 0.024),
+('uptown-metrocity-matang', 'new-place-for-uptown-metrocitypasar-malam-belia', 2, 0.082),
+('uptown-metrocity-matang', 'kolok-pak-lah-metrocity', 3, 0.138),
+('uptown-metrocity-matang', 'metrocity-kuching', 4, 0.210),
+('uptown-metrocity-matang', 'pasar-malam-metrocity', 5, 0.210),
+('saberkas-night-market', 'pasar-besar-krokop', 1, 1.884),
+('saberkas-night-market', 'pulau-termenung-night-market', 2, 3.848),
+('saberkas-night-market', 'miri-central-market', 3, 4.361),
+('saberkas-night-market', 'tamu-kedayan', 4, 4.702),
+('saberkas-night-market', 'tamu-muhibbah', 5, 4.736),
+('jalan-stephen-yong-market', 'cats-walk-street-weekend-market', 1, 0.038),
+('jalan-stephen-yong-market', 'semeba-weekend-market', 2, 1.960),
+('jalan-stephen-yong-market', 'mjc-roadside-market', 3, 2.191),
+('jalan-stephen-yong-market', 'mjc-night-street-market', 4, 2.468),
+('jalan-stephen-yong-market', 'pasar-malam-lee-ling', 5, 3.798),
+('semeba-weekend-market', 'cats-walk-street-weekend-market', 1, 1.923),
+('semeba-weekend-market', 'jalan-stephen-yong-market', 2, 1.960),
+('semeba-weekend-market', 'neon-trend-market', 3, 4.126),
+('semeba-weekend-market', 'pasar-malam-lee-ling', 4, 4.127),
+('semeba-weekend-market', 'mjc-roadside-market', 5, 4.149),
+('pasar-malam-batu-7', 'kota-sentosa-street-market', 1, 0.073),
+('pasar-malam-batu-7', 'pasar-basah-batu-7', 2, 0.129),
+('pasar-malam-batu-7', 'pasar-pagi-kota-sentosa', 3, 0.130),
+('pasar-malam-batu-7', 'neon-trend-market', 4, 1.128),
+('pasar-malam-batu-7', 'pasar-malam-lee-ling', 5, 1.149),
+('pasar-malam-desa-ilmu-uptown-kota-samarahan', 'tapak-pasar-malam-aiman-mall', 1, 0.043),
+('pasar-malam-desa-ilmu-uptown-kota-samarahan', 'pasar-malam-summer-mall', 2, 0.716),
+('pasar-malam-desa-ilmu-uptown-kota-samarahan', 'mini-uptown-kpg-meranek', 3, 2.126),
+('pasar-malam-desa-ilmu-uptown-kota-samarahan', 'pasar-malam-mpks-unigarden', 4, 3.847),
+('pasar-malam-desa-ilmu-uptown-kota-samarahan', 'market-bandar-riyal-samarahan-sarawak', 5, 4.455),
+('pasar-malam-bintulu', 'bintulu-night-market', 1, 0.000),
+('pasar-malam-bintulu', 'car-park-pasar-malam', 2, 0.050),
+('pasar-malam-bintulu', 'parking-lot-pasar-malam', 3, 0.074),
+('pasar-malam-bintulu', 'bintulu-main-market', 4, 0.346),
+('pasar-malam-bintulu', 'pasar-tamu-bintulu', 5, 0.351),
+('sibu-night-market-sarawak', 'pasar-malam-mamak-kafe', 1, 0.005),
+('sibu-night-market-sarawak', 'pasar-malam-kopitiam', 2, 0.138),
+('sibu-night-market-sarawak', 'sibu-central-market', 3, 0.230),
+('sibu-night-market-sarawak', 'permai-market', 4, 7.544),
+('sibu-night-market-sarawak', 'milah-char-kuey-teow', 5, 10.145),
+('paku-night-market', 'bau-night-market', 1, 4.115),
+('paku-night-market', 'siniawan-night-market', 2, 4.158),
+('paku-night-market', 'siniawan-old-town', 3, 4.165),
+('paku-night-market', 'semeba-weekend-market', 4, 13.010),
+('paku-night-market', 'cats-walk-street-weekend-market', 5, 14.551),
+('cats-walk-street-weekend-market', 'jalan-stephen-yong-market', 1, 0.038),
+('cats-walk-street-weekend-market', 'semeba-weekend-market', 2, 1.923),
+('cats-walk-street-weekend-market', 'mjc-roadside-market', 3, 2.229),
+('cats-walk-street-weekend-market', 'mjc-night-street-market', 4, 2.506),
+('cats-walk-street-weekend-market', 'pasar-malam-lee-ling', 5, 3.796),
+('metrocity-kuching', 'pasar-malam-metrocity', 1, 0.000),
+('metrocity-kuching', 'new-place-for-uptown-metrocitypasar-malam-belia', 2, 0.128),
+('metrocity-kuching', 'iza-collections', 3, 0.204),
+('metrocity-kuching', 'uptown-metrocity-matang', 4, 0.210),
+('metrocity-kuching', 'kolok-pak-lah-metrocity', 5, 0.322),
+('medan-niaga-satok', 'pasar-satok-food-court', 1, 0.154),
+('medan-niaga-satok', 'pasar-komuniti-pakar-medan-niaga-satok-sarawak', 2, 0.200),
+('medan-niaga-satok', 'sunday-market-medan-niaga-satok', 3, 0.281),
+('medan-niaga-satok', 'sungai-maong-market', 4, 1.352),
+('medan-niaga-satok', 'metrocity-kuching', 5, 2.015),
+('pasar-malam-benteng-bandar-baru-samariang', 'pasar-tani-bandar-baru-samariang', 1, 0.126),
+('pasar-malam-benteng-bandar-baru-samariang', 'pasar-tani-matang-jaya', 2, 8.288),
+('pasar-malam-benteng-bandar-baru-samariang', 'metromall-metrocity-square', 3, 8.427),
+('pasar-malam-benteng-bandar-baru-samariang', 'dbenteng-matang-taman-lee-ling', 4, 8.447),
+('pasar-malam-benteng-bandar-baru-samariang', 'kai-joo-walk', 5, 8.543),
+('pasar-malam-lee-ling', 'neon-trend-market', 1, 0.021),
+('pasar-malam-lee-ling', 'pasar-pagi-kota-sentosa', 2, 1.020),
+('pasar-malam-lee-ling', 'pasar-basah-batu-7', 3, 1.067),
+('pasar-malam-lee-ling', 'kota-sentosa-street-market', 4, 1.086),
+('pasar-malam-lee-ling', 'pasar-malam-batu-7', 5, 1.149),
+('kai-joo-walk', 'sunday-market-medan-niaga-satok', 1, 2.332),
+('kai-joo-walk', 'pasar-komuniti-pakar-medan-niaga-satok-sarawak', 2, 2.345),
+('kai-joo-walk', 'pasar-satok-food-court', 3, 2.398),
+('kai-joo-walk', 'medan-niaga-satok', 4, 2.545),
+('kai-joo-walk', 'sungai-maong-market', 5, 3.505),
+('pasar-malam-batu-niah', 'pasar-malam-bekenu', 1, 30.001),
+('pasar-malam-batu-niah', 'pasar-tamu-simpang-bekenu', 2, 40.097),
+('pasar-malam-batu-niah', 'taman-tunku-market', 3, 63.182),
+('pasar-malam-batu-niah', 'tamu-dato-haji-ahmad-lai-luak-bay', 4, 65.786),
+('pasar-malam-batu-niah', 'tamu-muhibbah', 5, 69.992),
+('medan-niaga-lawas-night-market', 'pasar-tamu-lawas', 1, 0.194),
+('medan-niaga-lawas-night-market', 'limbang-vegetables-wet-market', 2, 45.977),
+('medan-niaga-lawas-night-market', 'night-street-market-padang-sentral', 3, 45.978),
+('medan-niaga-lawas-night-market', 'limbang-night-street-foods-stall', 4, 45.979),
+('medan-niaga-lawas-night-market', 'pasar-tani-limbang', 5, 45.983),
+('pulau-termenung-night-market', 'miri-central-market', 1, 0.592),
+('pulau-termenung-night-market', 'tamu-kedayan', 2, 1.069),
+('pulau-termenung-night-market', 'tamu-muhibbah', 3, 1.105),
+('pulau-termenung-night-market', 'pasar-besar-krokop', 4, 3.527),
+('pulau-termenung-night-market', 'saberkas-night-market', 5, 3.848),
+('pasar-tani-bandar-baru-samariang', 'pasar-malam-benteng-bandar-baru-samariang', 1, 0.126),
+('pasar-tani-bandar-baru-samariang', 'pasar-tani-matang-jaya', 2, 8.188),
+('pasar-tani-bandar-baru-samariang', 'metromall-metrocity-square', 3, 8.340),
+('pasar-tani-bandar-baru-samariang', 'dbenteng-matang-taman-lee-ling', 4, 8.354),
+('pasar-tani-bandar-baru-samariang', 'kai-joo-walk', 5, 8.510),
+('mini-uptown-kpg-meranek', 'pasar-malam-summer-mall', 1, 1.909),
+('mini-uptown-kpg-meranek', 'pasar-malam-desa-ilmu-uptown-kota-samarahan', 2, 2.126),
+('mini-uptown-kpg-meranek', 'tapak-pasar-malam-aiman-mall', 3, 2.144),
+('mini-uptown-kpg-meranek', 'pasar-malam-mpks-unigarden', 4, 5.353),
+('mini-uptown-kpg-meranek', 'market-bandar-riyal-samarahan-sarawak', 5, 5.561),
+('pasar-malam-metrocity', 'metrocity-kuching', 1, 0.000),
+('pasar-malam-metrocity', 'new-place-for-uptown-metrocitypasar-malam-belia', 2, 0.128),
+('pasar-malam-metrocity', 'iza-collections', 3, 0.204),
+('pasar-malam-metrocity', 'uptown-metrocity-matang', 4, 0.210),
+('pasar-malam-metrocity', 'kolok-pak-lah-metrocity', 5, 0.322),
+('pasar-malam-tamu-nyelong-lama', 'pasar-tamu-sentral-sarikei-sarawak', 1, 0.214),
+('pasar-malam-tamu-nyelong-lama', 'pusat-penjaja-sg-sarikei', 2, 0.521),
+('pasar-malam-tamu-nyelong-lama', 'char-kuey-teow-udang-galah-milah-tanjung-manis-belawai-sarawak', 3, 22.152),
+('pasar-malam-tamu-nyelong-lama', 'milah-char-kuey-teow', 4, 30.257),
+('pasar-malam-tamu-nyelong-lama', 'pasar-malam-mamak-kafe', 5, 37.780),
+('serian-night-street-market', 'pasar-malam-non-muslim-baru', 1, 1.522),
+('serian-night-street-market', 'pasar-malam-melayu-serian', 2, 1.629),
+('serian-night-street-market', 'mini-uptown-kpg-meranek', 3, 31.142),
+('serian-night-street-market', 'simunjan-market', 4, 31.562),
+('serian-night-street-market', 'pasar-malam-summer-mall', 5, 32.932),
+('sunday-market-medan-niaga-satok', 'pasar-satok-food-court', 1, 0.150),
+('sunday-market-medan-niaga-satok', 'pasar-komuniti-pakar-medan-niaga-satok-sarawak', 2, 0.175),
+('sunday-market-medan-niaga-satok', 'medan-niaga-satok', 3, 0.281),
+('sunday-market-medan-niaga-satok', 'sungai-maong-market', 4, 1.624),
+('sunday-market-medan-niaga-satok', 'metrocity-kuching', 5, 2.056),
+('night-street-market-padang-sentral', 'pasar-tani-limbang', 1, 0.005),
+('night-street-market-padang-sentral', 'limbang-night-street-foods-stall', 2, 0.012),
+('night-street-market-padang-sentral', 'limbang-vegetables-wet-market', 3, 0.172),
+('night-street-market-padang-sentral', 'medan-niaga-lawas-night-market', 4, 45.978),
+('night-street-market-padang-sentral', 'pasar-tamu-lawas', 5, 46.096),
+('iza-collections', 'uptown-metrocity-matang', 1, 0.024),
+('iza-collections', 'new-place-for-uptown-metrocitypasar-malam-belia', 2, 0.078),
+('iza-collections', 'kolok-pak-lah-metrocity', 3, 0.159),
+('iza-collections', 'metrocity-kuching', 4, 0.204),
+('iza-collections', 'pasar-malam-metrocity', 5, 0.204),
+('pasar-tamu-sentral-sarikei-sarawak', 'pasar-malam-tamu-nyelong-lama', 1, 0.214),
+('pasar-tamu-sentral-sarikei-sarawak', 'pusat-penjaja-sg-sarikei', 2, 0.485),
+('pasar-tamu-sentral-sarikei-sarawak', 'char-kuey-teow-udang-galah-milah-tanjung-manis-belawai-sarawak', 3, 22.074),
+('pasar-tamu-sentral-sarikei-sarawak', 'milah-char-kuey-teow', 4, 30.170),
+('pasar-tamu-sentral-sarikei-sarawak', 'pasar-malam-mamak-kafe', 5, 37.734),
+('kapit-night-street-market', 'market-tamu-sibu-jaya', 1, 109.832),
+('kapit-night-street-market', 'pasar-malam-balingian-jsm', 2, 110.816),
+('kapit-night-street-market', 'permai-market', 3, 120.150),
+('kapit-night-street-market', 'pasar-basah-belaga', 4, 121.199),
+('kapit-night-street-market', 'sibu-central-market', 5, 126.839),
+('betong-night-market', 'tapak-pasar-malam-betong', 1, 0.207),
+('betong-night-market', 'pasar-malam-betong', 2, 0.214),
+('betong-night-market', 'betong-market', 3, 1.103),
+('betong-night-market', 'open-air-market', 4, 20.164),
+('betong-night-market', 'pasar-malam-sri-aman', 5, 20.178),
+('sungai-maong-market', 'medan-niaga-satok', 1, 1.352),
+('sungai-maong-market', 'pasar-satok-food-court', 2, 1.477),
+('sungai-maong-market', 'pasar-komuniti-pakar-medan-niaga-satok-sarawak', 3, 1.478),
+('sungai-maong-market', 'sunday-market-medan-niaga-satok', 4, 1.624),
+('sungai-maong-market', 'metrocity-kuching', 5, 2.638),
+('dbenteng-matang-taman-lee-ling', 'kolok-pak-lah-metrocity', 1, 0.535),
+('dbenteng-matang-taman-lee-ling', 'iza-collections', 2, 0.577),
+('dbenteng-matang-taman-lee-ling', 'uptown-metrocity-matang', 3, 0.577),
+('dbenteng-matang-taman-lee-ling', 'metromall-metrocity-square', 4, 0.600),
+('dbenteng-matang-taman-lee-ling', 'new-place-for-uptown-metrocitypasar-malam-belia', 5, 0.655),
+('pasar-malam-bekenu', 'pasar-tamu-simpang-bekenu', 1, 13.698),
+('pasar-malam-bekenu', 'pasar-malam-batu-niah', 2, 30.001),
+('pasar-malam-bekenu', 'taman-tunku-market', 3, 33.361),
+('pasar-malam-bekenu', 'tamu-dato-haji-ahmad-lai-luak-bay', 4, 35.801),
+('pasar-malam-bekenu', 'tamu-muhibbah', 5, 40.006),
+('dalat-market', 'market-baru-mukah', 1, 23.663),
+('dalat-market', 'pasar-baru-mukah', 2, 23.703),
+('dalat-market', 'mukah-food-street', 3, 23.776),
+('dalat-market', 'pasar-serbaguna-mddm-mukah', 4, 24.636),
+('dalat-market', 'pasar-sayur-mukah', 5, 24.645),
+('pasar-komuniti-pakar-medan-niaga-satok-sarawak', 'pasar-satok-food-court', 1, 0.068),
+('pasar-komuniti-pakar-medan-niaga-satok-sarawak', 'sunday-market-medan-niaga-satok', 2, 0.175),
+('pasar-komuniti-pakar-medan-niaga-satok-sarawak', 'medan-niaga-satok', 3, 0.200),
+('pasar-komuniti-pakar-medan-niaga-satok-sarawak', 'sungai-maong-market', 4, 1.478),
+('pasar-komuniti-pakar-medan-niaga-satok-sarawak', 'metrocity-kuching', 5, 2.155),
+('pasar-malam-summer-mall', 'tapak-pasar-malam-aiman-mall', 1, 0.690),
+('pasar-malam-summer-mall', 'pasar-malam-desa-ilmu-uptown-kota-samarahan', 2, 0.716),
+('pasar-malam-summer-mall', 'mini-uptown-kpg-meranek', 3, 1.909),
+('pasar-malam-summer-mall', 'pasar-malam-mpks-unigarden', 4, 4.558),
+('pasar-malam-summer-mall', 'market-bandar-riyal-samarahan-sarawak', 5, 5.167),
+('pasar-malam-non-muslim-baru', 'pasar-malam-melayu-serian', 1, 0.113),
+('pasar-malam-non-muslim-baru', 'serian-night-street-market', 2, 1.522),
+('pasar-malam-non-muslim-baru', 'simunjan-market', 3, 32.445),
+('pasar-malam-non-muslim-baru', 'mini-uptown-kpg-meranek', 4, 32.652),
+('pasar-malam-non-muslim-baru', 'pasar-malam-summer-mall', 5, 34.445),
+('pasar-tani-sabtu-tian', 'matu-night-market', 1, 4.427),
+('pasar-tani-sabtu-tian', 'milah-char-kuey-teow', 2, 44.649),
+('pasar-tani-sabtu-tian', 'dalat-market', 3, 48.149),
+('pasar-tani-sabtu-tian', 'pasar-malam-mamak-kafe', 4, 52.024),
+('pasar-tani-sabtu-tian', 'sibu-night-market-sarawak', 5, 52.027),
+('wet-market-sri-aman', 'open-air-market', 1, 0.181),
+('wet-market-sri-aman', 'pasar-malam-sri-aman', 2, 0.249),
+('wet-market-sri-aman', 'uptown-sri-aman', 3, 0.406),
+('wet-market-sri-aman', 'tamu-simanggang', 4, 0.841),
+('wet-market-sri-aman', 'betong-night-market', 5, 20.280),
+('pasar-malam-kopitiam', 'sibu-night-market-sarawak', 1, 0.138),
+('pasar-malam-kopitiam', 'pasar-malam-mamak-kafe', 2, 0.142),
+('pasar-malam-kopitiam', 'sibu-central-market', 3, 0.146),
+('pasar-malam-kopitiam', 'permai-market', 4, 7.414),
+('pasar-malam-kopitiam', 'milah-char-kuey-teow', 5, 10.254),
+('limbang-night-street-foods-stall', 'night-street-market-padang-sentral', 1, 0.012),
+('limbang-night-street-foods-stall', 'pasar-tani-limbang', 2, 0.012),
+('limbang-night-street-foods-stall', 'limbang-vegetables-wet-market', 3, 0.160),
+('limbang-night-street-foods-stall', 'medan-niaga-lawas-night-market', 4, 45.979),
+('limbang-night-street-foods-stall', 'pasar-tamu-lawas', 5, 46.098),
+('uptown-sri-aman', 'pasar-malam-sri-aman', 1, 0.346),
+('uptown-sri-aman', 'open-air-market', 2, 0.395),
+('uptown-sri-aman', 'wet-market-sri-aman', 3, 0.406),
+('uptown-sri-aman', 'tamu-simanggang', 4, 0.584),
+('uptown-sri-aman', 'betong-night-market', 5, 20.507),
+('betong-market', 'pasar-malam-betong', 1, 0.943),
+('betong-market', 'tapak-pasar-malam-betong', 2, 0.976),
+('betong-market', 'betong-night-market', 3, 1.103),
+('betong-market', 'open-air-market', 4, 20.519),
+('betong-market', 'pasar-malam-sri-aman', 5, 20.529),
+('pasar-tamu-bintulu', 'bintulu-main-market', 1, 0.009),
+('pasar-tamu-bintulu', 'car-park-pasar-malam', 2, 0.345),
+('pasar-tamu-bintulu', 'pasar-malam-bintulu', 3, 0.351),
+('pasar-tamu-bintulu', 'bintulu-night-market', 4, 0.351),
+('pasar-tamu-bintulu', 'parking-lot-pasar-malam', 5, 0.419),
+('pasar-malam-mamak-kafe', 'sibu-night-market-sarawak', 1, 0.005),
+('pasar-malam-mamak-kafe', 'pasar-malam-kopitiam', 2, 0.142),
+('pasar-malam-mamak-kafe', 'sibu-central-market', 3, 0.235),
+('pasar-malam-mamak-kafe', 'permai-market', 4, 7.549),
+('pasar-malam-mamak-kafe', 'milah-char-kuey-teow', 5, 10.140),
+('permai-market', 'sibu-central-market', 1, 7.324),
+('permai-market', 'pasar-malam-kopitiam', 2, 7.414),
+('permai-market', 'sibu-night-market-sarawak', 3, 7.544),
+('permai-market', 'pasar-malam-mamak-kafe', 4, 7.549),
+('permai-market', 'market-tamu-sibu-jaya', 5, 11.156),
+('pasar-satok-food-court', 'pasar-komuniti-pakar-medan-niaga-satok-sarawak', 1, 0.068),
+('pasar-satok-food-court', 'sunday-market-medan-niaga-satok', 2, 0.150),
+('pasar-satok-food-court', 'medan-niaga-satok', 3, 0.154),
+('pasar-satok-food-court', 'sungai-maong-market', 4, 1.477),
+('pasar-satok-food-court', 'metrocity-kuching', 5, 2.087),
+('bau-night-market', 'paku-night-market', 1, 4.115),
+('bau-night-market', 'siniawan-night-market', 2, 7.960),
+('bau-night-market', 'siniawan-old-town', 3, 7.980),
+('bau-night-market', 'semeba-weekend-market', 4, 16.926),
+('bau-night-market', 'cats-walk-street-weekend-market', 5, 18.356),
+('pasar-malam-melayu-serian', 'pasar-malam-non-muslim-baru', 1, 0.113),
+('pasar-malam-melayu-serian', 'serian-night-street-market', 2, 1.629),
+('pasar-malam-melayu-serian', 'simunjan-market', 3, 32.537),
+('pasar-malam-melayu-serian', 'mini-uptown-kpg-meranek', 4, 32.754),
+('pasar-malam-melayu-serian', 'pasar-malam-summer-mall', 5, 34.549),
+('market-baru-mukah', 'pasar-baru-mukah', 1, 0.040),
+('market-baru-mukah', 'mukah-food-street', 2, 0.434),
+('market-baru-mukah', 'pasar-serbaguna-mddm-mukah', 3, 0.986),
+('market-baru-mukah', 'pasar-sayur-mukah', 4, 1.000),
+('market-baru-mukah', 'pasar-tani-mukah', 5, 1.004),
+('sibu-central-market', 'pasar-malam-kopitiam', 1, 0.146),
+('sibu-central-market', 'sibu-night-market-sarawak', 2, 0.230),
+('sibu-central-market', 'pasar-malam-mamak-kafe', 3, 0.235),
+('sibu-central-market', 'permai-market', 4, 7.324),
+('sibu-central-market', 'milah-char-kuey-teow', 5, 10.375),
+('pasar-tamu-simpang-bekenu', 'pasar-malam-bekenu', 1, 13.698),
+('pasar-tamu-simpang-bekenu', 'taman-tunku-market', 2, 24.947),
+('pasar-tamu-simpang-bekenu', 'tamu-dato-haji-ahmad-lai-luak-bay', 3, 28.562),
+('pasar-tamu-simpang-bekenu', 'tamu-muhibbah', 4, 32.560),
+('pasar-tamu-simpang-bekenu', 'tamu-kedayan', 5, 32.595),
+('miri-central-market', 'tamu-kedayan', 1, 0.495),
+('miri-central-market', 'tamu-muhibbah', 2, 0.528),
+('miri-central-market', 'pulau-termenung-night-market', 3, 0.592),
+('miri-central-market', 'pasar-besar-krokop', 4, 4.119),
+('miri-central-market', 'saberkas-night-market', 5, 4.361),
+('pasar-besar-krokop', 'saberkas-night-market', 1, 1.884),
+('pasar-besar-krokop', 'pulau-termenung-night-market', 2, 3.527),
+('pasar-besar-krokop', 'miri-central-market', 3, 4.119),
+('pasar-besar-krokop', 'tamu-kedayan', 4, 4.577),
+('pasar-besar-krokop', 'tamu-muhibbah', 5, 4.614),
+('pasar-basah-batu-7', 'pasar-pagi-kota-sentosa', 1, 0.117),
+('pasar-basah-batu-7', 'pasar-malam-batu-7', 2, 0.129),
+('pasar-basah-batu-7', 'kota-sentosa-street-market', 3, 0.133),
+('pasar-basah-batu-7', 'neon-trend-market', 4, 1.046),
+('pasar-basah-batu-7', 'pasar-malam-lee-ling', 5, 1.067),
+('simunjan-market', 'pasar-tani-kampung-baru-samarahan', 1, 30.501),
+('simunjan-market', 'serian-night-street-market', 2, 31.562),
+('simunjan-market', 'pasar-malam-non-muslim-baru', 3, 32.445),
+('simunjan-market', 'pasar-malam-melayu-serian', 4, 32.537),
+('simunjan-market', 'mini-uptown-kpg-meranek', 5, 32.789),
+('pasar-basah-belaga', 'parking-lot-pasar-malam', 1, 97.144),
+('pasar-basah-belaga', 'pasar-malam-bintulu', 2, 97.213),
+('pasar-basah-belaga', 'bintulu-night-market', 3, 97.213),
+('pasar-basah-belaga', 'car-park-pasar-malam', 4, 97.255),
+('pasar-basah-belaga', 'bintulu-main-market', 5, 97.444),
+('pasar-sungai-apong', 'pasar-ikan-sayo-tabuan-melayu', 1, 0.611),
+('pasar-sungai-apong', 'stutong-community-market', 2, 2.668),
+('pasar-sungai-apong', 'kai-joo-walk', 3, 4.884),
+('pasar-sungai-apong', 'pasar-komuniti-pakar-medan-niaga-satok-sarawak', 4, 6.937),
+('pasar-sungai-apong', 'sunday-market-medan-niaga-satok', 5, 6.991),
+('pasar-pagi-kota-sentosa', 'kota-sentosa-street-market', 1, 0.069),
+('pasar-pagi-kota-sentosa', 'pasar-basah-batu-7', 2, 0.117),
+('pasar-pagi-kota-sentosa', 'pasar-malam-batu-7', 3, 0.130),
+('pasar-pagi-kota-sentosa', 'neon-trend-market', 4, 1.000),
+('pasar-pagi-kota-sentosa', 'pasar-malam-lee-ling', 5, 1.020),
+('mjc-night-street-market', 'mjc-roadside-market', 1, 0.277),
+('mjc-night-street-market', 'jalan-stephen-yong-market', 2, 2.468),
+('mjc-night-street-market', 'cats-walk-street-weekend-market', 3, 2.506),
+('mjc-night-street-market', 'sungai-maong-market', 4, 3.110),
+('mjc-night-street-market', 'semeba-weekend-market', 5, 4.426),
+('market-tamu-sibu-jaya', 'permai-market', 1, 11.156),
+('market-tamu-sibu-jaya', 'sibu-central-market', 2, 17.074),
+('market-tamu-sibu-jaya', 'pasar-malam-kopitiam', 3, 17.207),
+('market-tamu-sibu-jaya', 'sibu-night-market-sarawak', 4, 17.300),
+('market-tamu-sibu-jaya', 'pasar-malam-mamak-kafe', 5, 17.305),
+('matu-night-market', 'pasar-tani-sabtu-tian', 1, 4.427),
+('matu-night-market', 'dalat-market', 2, 45.593),
+('matu-night-market', 'milah-char-kuey-teow', 3, 47.210),
+('matu-night-market', 'pasar-malam-mamak-kafe', 4, 54.028),
+('matu-night-market', 'sibu-night-market-sarawak', 5, 54.032),
+('mukah-food-street', 'pasar-baru-mukah', 1, 0.420),
+('mukah-food-street', 'market-baru-mukah', 2, 0.434),
+('mukah-food-street', 'pasar-sayur-mukah', 3, 0.899),
+('mukah-food-street', 'pasar-serbaguna-mddm-mukah', 4, 0.900),
+('mukah-food-street', 'pasar-tani-mukah', 5, 0.909),
+('tamu-simanggang', 'uptown-sri-aman', 1, 0.584),
+('tamu-simanggang', 'pasar-malam-sri-aman', 2, 0.611),
+('tamu-simanggang', 'open-air-market', 3, 0.700),
+('tamu-simanggang', 'wet-market-sri-aman', 4, 0.841),
+('tamu-simanggang', 'betong-night-market', 5, 20.219),
+('stutong-community-market', 'pasar-ikan-sayo-tabuan-melayu', 1, 2.234),
+('stutong-community-market', 'pasar-sungai-apong', 2, 2.668),
+('stutong-community-market', 'kai-joo-walk', 3, 5.926),
+('stutong-community-market', 'pasar-malam-lee-ling', 4, 6.835),
+('stutong-community-market', 'neon-trend-market', 5, 6.849),
+('kota-sentosa-street-market', 'pasar-pagi-kota-sentosa', 1, 0.069),
+('kota-sentosa-street-market', 'pasar-malam-batu-7', 2, 0.073),
+('kota-sentosa-street-market', 'pasar-basah-batu-7', 3, 0.133),
+('kota-sentosa-street-market', 'neon-trend-market', 4, 1.065),
+('kota-sentosa-street-market', 'pasar-malam-lee-ling', 5, 1.086),
+('bintulu-night-market', 'pasar-malam-bintulu', 1, 0.000),
+('bintulu-night-market', 'car-park-pasar-malam', 2, 0.050),
+('bintulu-night-market', 'parking-lot-pasar-malam', 3, 0.074),
+('bintulu-night-market', 'bintulu-main-market', 4, 0.346),
+('bintulu-night-market', 'pasar-tamu-bintulu', 5, 0.351),
+('pusat-penjaja-sg-sarikei', 'pasar-tamu-sentral-sarikei-sarawak', 1, 0.485),
+('pusat-penjaja-sg-sarikei', 'pasar-malam-tamu-nyelong-lama', 2, 0.521),
+('pusat-penjaja-sg-sarikei', 'char-kuey-teow-udang-galah-milah-tanjung-manis-belawai-sarawak', 3, 21.632),
+('pusat-penjaja-sg-sarikei', 'milah-char-kuey-teow', 4, 30.625),
+('pusat-penjaja-sg-sarikei', 'pasar-malam-mamak-kafe', 5, 38.213),
+('pasar-tani-limbang', 'night-street-market-padang-sentral', 1, 0.005),
+('pasar-tani-limbang', 'limbang-night-street-foods-stall', 2, 0.012),
+('pasar-tani-limbang', 'limbang-vegetables-wet-market', 3, 0.172),
+('pasar-tani-limbang', 'medan-niaga-lawas-night-market', 4, 45.983),
+('pasar-tani-limbang', 'pasar-tamu-lawas', 5, 46.101),
+('pasar-tani-mukah', 'pasar-sayur-mukah', 1, 0.015),
+('pasar-tani-mukah', 'pasar-serbaguna-mddm-mukah', 2, 0.025),
+('pasar-tani-mukah', 'market-ikan-sayur', 3, 0.093),
+('pasar-tani-mukah', 'mukah-food-street', 4, 0.909),
+('pasar-tani-mukah', 'pasar-baru-mukah', 5, 0.964),
+('taman-tunku-market', 'tamu-dato-haji-ahmad-lai-luak-bay', 1, 4.425),
+('taman-tunku-market', 'tamu-muhibbah', 2, 7.761),
+('taman-tunku-market', 'tamu-kedayan', 3, 7.793),
+('taman-tunku-market', 'miri-central-market', 4, 8.286),
+('taman-tunku-market', 'pulau-termenung-night-market', 5, 8.822),
+('pasar-tani-kampung-baru-samarahan', 'pasar-malam-summer-mall', 1, 6.383),
+('pasar-tani-kampung-baru-samarahan', 'tapak-pasar-malam-aiman-mall', 2, 6.780),
+('pasar-tani-kampung-baru-samarahan', 'pasar-malam-desa-ilmu-uptown-kota-samarahan', 3, 6.823),
+('pasar-tani-kampung-baru-samarahan', 'mini-uptown-kpg-meranek', 4, 7.885),
+('pasar-tani-kampung-baru-samarahan', 'pasar-malam-mpks-unigarden', 5, 9.472),
+('mjc-roadside-market', 'mjc-night-street-market', 1, 0.277),
+('mjc-roadside-market', 'jalan-stephen-yong-market', 2, 2.191),
+('mjc-roadside-market', 'cats-walk-street-weekend-market', 3, 2.229),
+('mjc-roadside-market', 'sungai-maong-market', 4, 3.382),
+('mjc-roadside-market', 'semeba-weekend-market', 5, 4.149),
+('market-bandar-riyal-samarahan-sarawak', 'pasar-malam-mpks-unigarden', 1, 1.212),
+('market-bandar-riyal-samarahan-sarawak', 'pasar-malam-desa-ilmu-uptown-kota-samarahan', 2, 4.455),
+('market-bandar-riyal-samarahan-sarawak', 'tapak-pasar-malam-aiman-mall', 3, 4.486),
+('market-bandar-riyal-samarahan-sarawak', 'pasar-malam-summer-mall', 4, 5.167),
+('market-bandar-riyal-samarahan-sarawak', 'mini-uptown-kpg-meranek', 5, 5.561),
+('new-place-for-uptown-metrocitypasar-malam-belia', 'iza-collections', 1, 0.078),
+('new-place-for-uptown-metrocitypasar-malam-belia', 'uptown-metrocity-matang', 2, 0.082),
+('new-place-for-uptown-metrocitypasar-malam-belia', 'metrocity-kuching', 3, 0.128),
+('new-place-for-uptown-metrocitypasar-malam-belia', 'pasar-malam-metrocity', 4, 0.128),
+('new-place-for-uptown-metrocitypasar-malam-belia', 'kolok-pak-lah-metrocity', 5, 0.203),
+('limbang-vegetables-wet-market', 'limbang-night-street-foods-stall', 1, 0.160),
+('limbang-vegetables-wet-market', 'pasar-tani-limbang', 2, 0.172),
+('limbang-vegetables-wet-market', 'night-street-market-padang-sentral', 3, 0.172),
+('limbang-vegetables-wet-market', 'medan-niaga-lawas-night-market', 4, 45.977),
+('limbang-vegetables-wet-market', 'pasar-tamu-lawas', 5, 46.095),
+('siniawan-old-town', 'siniawan-night-market', 1, 0.051),
+('siniawan-old-town', 'paku-night-market', 2, 4.165),
+('siniawan-old-town', 'bau-night-market', 3, 7.980),
+('siniawan-old-town', 'semeba-weekend-market', 4, 8.946),
+('siniawan-old-town', 'cats-walk-street-weekend-market', 5, 10.414),
+('tapak-pasar-malam-betong', 'pasar-malam-betong', 1, 0.038),
+('tapak-pasar-malam-betong', 'betong-night-market', 2, 0.207),
+('tapak-pasar-malam-betong', 'betong-market', 3, 0.976),
+('tapak-pasar-malam-betong', 'open-air-market', 4, 20.352),
+('tapak-pasar-malam-betong', 'pasar-malam-sri-aman', 5, 20.366),
+('pasar-sayur-mukah', 'pasar-tani-mukah', 1, 0.015),
+('pasar-sayur-mukah', 'pasar-serbaguna-mddm-mukah', 2, 0.034),
+('pasar-sayur-mukah', 'market-ikan-sayur', 3, 0.107),
+('pasar-sayur-mukah', 'mukah-food-street', 4, 0.899),
+('pasar-sayur-mukah', 'pasar-baru-mukah', 5, 0.960),
+('pasar-tamu-lawas', 'medan-niaga-lawas-night-market', 1, 0.194),
+('pasar-tamu-lawas', 'limbang-vegetables-wet-market', 2, 46.095),
+('pasar-tamu-lawas', 'night-street-market-padang-sentral', 3, 46.096),
+('pasar-tamu-lawas', 'limbang-night-street-foods-stall', 4, 46.098),
+('pasar-tamu-lawas', 'pasar-tani-limbang', 5, 46.101),
+('tapak-pasar-malam-aiman-mall', 'pasar-malam-desa-ilmu-uptown-kota-samarahan', 1, 0.043),
+('tapak-pasar-malam-aiman-mall', 'pasar-malam-summer-mall', 2, 0.690),
+('tapak-pasar-malam-aiman-mall', 'mini-uptown-kpg-meranek', 3, 2.144),
+('tapak-pasar-malam-aiman-mall', 'pasar-malam-mpks-unigarden', 4, 3.869),
+('tapak-pasar-malam-aiman-mall', 'market-bandar-riyal-samarahan-sarawak', 5, 4.486),
+('pasar-serbaguna-mddm-mukah', 'pasar-tani-mukah', 1, 0.025),
+('pasar-serbaguna-mddm-mukah', 'pasar-sayur-mukah', 2, 0.034),
+('pasar-serbaguna-mddm-mukah', 'market-ikan-sayur', 3, 0.081),
+('pasar-serbaguna-mddm-mukah', 'mukah-food-street', 4, 0.900),
+('pasar-serbaguna-mddm-mukah', 'pasar-baru-mukah', 5, 0.946),
+('metromall-metrocity-square', 'kolok-pak-lah-metrocity', 1, 0.209),
+('metromall-metrocity-square', 'uptown-metrocity-matang', 2, 0.342),
+('metromall-metrocity-square', 'iza-collections', 3, 0.365),
+('metromall-metrocity-square', 'new-place-for-uptown-metrocitypasar-malam-belia', 4, 0.392),
+('metromall-metrocity-square', 'metrocity-kuching', 5, 0.489),
+('pasar-malam-sri-aman', 'open-air-market', 1, 0.089),
+('pasar-malam-sri-aman', 'wet-market-sri-aman', 2, 0.249),
+('pasar-malam-sri-aman', 'uptown-sri-aman', 3, 0.346),
+('pasar-malam-sri-aman', 'tamu-simanggang', 4, 0.611),
+('pasar-malam-sri-aman', 'betong-night-market', 5, 20.178),
+('neon-trend-market', 'pasar-malam-lee-ling', 1, 0.021),
+('neon-trend-market', 'pasar-pagi-kota-sentosa', 2, 1.000),
+('neon-trend-market', 'pasar-basah-batu-7', 3, 1.046),
+('neon-trend-market', 'kota-sentosa-street-market', 4, 1.065),
+('neon-trend-market', 'pasar-malam-batu-7', 5, 1.128),
+('pasar-ikan-sayo-tabuan-melayu', 'pasar-sungai-apong', 1, 0.611),
+('pasar-ikan-sayo-tabuan-melayu', 'stutong-community-market', 2, 2.234),
+('pasar-ikan-sayo-tabuan-melayu', 'kai-joo-walk', 3, 5.360),
+('pasar-ikan-sayo-tabuan-melayu', 'pasar-komuniti-pakar-medan-niaga-satok-sarawak', 4, 7.328),
+('pasar-ikan-sayo-tabuan-melayu', 'sunday-market-medan-niaga-satok', 5, 7.393),
+('bintulu-main-market', 'pasar-tamu-bintulu', 1, 0.009),
+('bintulu-main-market', 'car-park-pasar-malam', 2, 0.341),
+('bintulu-main-market', 'pasar-malam-bintulu', 3, 0.346),
+('bintulu-main-market', 'bintulu-night-market', 4, 0.346),
+('bintulu-main-market', 'parking-lot-pasar-malam', 5, 0.413),
+('pasar-baru-mukah', 'market-baru-mukah', 1, 0.040),
+('pasar-baru-mukah', 'mukah-food-street', 2, 0.420),
+('pasar-baru-mukah', 'pasar-serbaguna-mddm-mukah', 3, 0.946),
+('pasar-baru-mukah', 'pasar-sayur-mukah', 4, 0.960),
+('pasar-baru-mukah', 'pasar-tani-mukah', 5, 0.964),
+('parking-lot-pasar-malam', 'pasar-malam-bintulu', 1, 0.074),
+('parking-lot-pasar-malam', 'bintulu-night-market', 2, 0.074),
+('parking-lot-pasar-malam', 'car-park-pasar-malam', 3, 0.112),
+('parking-lot-pasar-malam', 'bintulu-main-market', 4, 0.413),
+('parking-lot-pasar-malam', 'pasar-tamu-bintulu', 5, 0.419),
+('tamu-kedayan', 'tamu-muhibbah', 1, 0.037),
+('tamu-kedayan', 'miri-central-market', 2, 0.495),
+('tamu-kedayan', 'pulau-termenung-night-market', 3, 1.069),
+('tamu-kedayan', 'tamu-dato-haji-ahmad-lai-luak-bay', 4, 4.242),
+('tamu-kedayan', 'pasar-besar-krokop', 5, 4.577),
+('pasar-tani-matang-jaya', 'dbenteng-matang-taman-lee-ling', 1, 0.739),
+('pasar-tani-matang-jaya', 'kolok-pak-lah-metrocity', 2, 1.274),
+('pasar-tani-matang-jaya', 'iza-collections', 3, 1.301),
+('pasar-tani-matang-jaya', 'uptown-metrocity-matang', 4, 1.305),
+('pasar-tani-matang-jaya', 'metromall-metrocity-square', 5, 1.321),
+('market-ikan-sayur', 'pasar-serbaguna-mddm-mukah', 1, 0.081),
+('market-ikan-sayur', 'pasar-tani-mukah', 2, 0.093),
+('market-ikan-sayur', 'pasar-sayur-mukah', 3, 0.107),
+('market-ikan-sayur', 'mukah-food-street', 4, 0.961),
+('market-ikan-sayur', 'pasar-baru-mukah', 5, 0.978),
+('tamu-muhibbah', 'tamu-kedayan', 1, 0.037),
+('tamu-muhibbah', 'miri-central-market', 2, 0.528),
+('tamu-muhibbah', 'pulau-termenung-night-market', 3, 1.105),
+('tamu-muhibbah', 'tamu-dato-haji-ahmad-lai-luak-bay', 4, 4.206),
+('tamu-muhibbah', 'pasar-besar-krokop', 5, 4.614),
+('open-air-market', 'pasar-malam-sri-aman', 1, 0.089),
+('open-air-market', 'wet-market-sri-aman', 2, 0.181),
+('open-air-market', 'uptown-sri-aman', 3, 0.395),
+('open-air-market', 'tamu-simanggang', 4, 0.700),
+('open-air-market', 'betong-night-market', 5, 20.164),
+('tamu-dato-haji-ahmad-lai-luak-bay', 'tamu-muhibbah', 1, 4.206),
+('tamu-dato-haji-ahmad-lai-luak-bay', 'tamu-kedayan', 2, 4.242),
+('tamu-dato-haji-ahmad-lai-luak-bay', 'taman-tunku-market', 3, 4.425),
+('tamu-dato-haji-ahmad-lai-luak-bay', 'miri-central-market', 4, 4.707),
+('tamu-dato-haji-ahmad-lai-luak-bay', 'pulau-termenung-night-market', 5, 5.299),
+('milah-char-kuey-teow', 'pasar-malam-mamak-kafe', 1, 10.140),
+('milah-char-kuey-teow', 'sibu-night-market-sarawak', 2, 10.145),
+('milah-char-kuey-teow', 'pasar-malam-kopitiam', 3, 10.254),
+('milah-char-kuey-teow', 'sibu-central-market', 4, 10.375),
+('milah-char-kuey-teow', 'permai-market', 5, 17.466),
+('pasar-malam-balingian-jsm', 'pasar-sayur-mukah', 1, 49.910),
+('pasar-malam-balingian-jsm', 'pasar-tani-mukah', 2, 49.914),
+('pasar-malam-balingian-jsm', 'pasar-serbaguna-mddm-mukah', 3, 49.938),
+('pasar-malam-balingian-jsm', 'market-ikan-sayur', 4, 49.952),
+('pasar-malam-balingian-jsm', 'mukah-food-street', 5, 50.436),
+('char-kuey-teow-udang-galah-milah-tanjung-manis-belawai-sarawak', 'pusat-penjaja-sg-sarikei', 1, 21.632),
+('char-kuey-teow-udang-galah-milah-tanjung-manis-belawai-sarawak', 'pasar-tamu-sentral-sarikei-sarawak', 2, 22.074),
+('char-kuey-teow-udang-galah-milah-tanjung-manis-belawai-sarawak', 'pasar-malam-tamu-nyelong-lama', 3, 22.152),
+('char-kuey-teow-udang-galah-milah-tanjung-manis-belawai-sarawak', 'milah-char-kuey-teow', 4, 48.403),
+('char-kuey-teow-udang-galah-milah-tanjung-manis-belawai-sarawak', 'pasar-malam-mamak-kafe', 5, 57.476),
+('car-park-pasar-malam', 'pasar-malam-bintulu', 1, 0.050),
+('car-park-pasar-malam', 'bintulu-night-market', 2, 0.050),
+('car-park-pasar-malam', 'parking-lot-pasar-malam', 3, 0.112),
+('car-park-pasar-malam', 'bintulu-main-market', 4, 0.341),
+('car-park-pasar-malam', 'pasar-tamu-bintulu', 5, 0.345),
+('pasar-malam-betong', 'tapak-pasar-malam-betong', 1, 0.038),
+('pasar-malam-betong', 'betong-night-market', 2, 0.214),
+('pasar-malam-betong', 'betong-market', 3, 0.943),
+('pasar-malam-betong', 'open-air-market', 4, 20.340),
+('pasar-malam-betong', 'pasar-malam-sri-aman', 5, 20.353),
+('pasar-malam-gong-badak', 'carboot-sale-unisza', 1, 0.845),
+('pasar-malam-gong-badak', 'pasar-malam-masjid-baru-tok-jembal', 2, 1.893),
+('pasar-malam-gong-badak', 'pasar-malam-pak-tuyu', 3, 2.093),
+('pasar-malam-gong-badak', 'pasar-malam-wakaf-tembesu', 4, 3.540),
+('pasar-malam-gong-badak', 'churros-pantai-teluk-ketapang-by-orked-d-churros', 5, 4.061),
+('pulau-duyong-night-market', 'uptown-pulau-warisan', 1, 1.077),
+('pulau-duyong-night-market', 'kt-night-market', 2, 1.130),
+('pulau-duyong-night-market', 'churros-churros-kt', 3, 1.175),
+('pulau-duyong-night-market', 'pulau-warisan-river-cruise', 4, 1.182),
+('pulau-duyong-night-market', 'bandaraya-warisan-pesisir-air-night-market', 5, 1.315),
+('pasarnita-tanjung-kuala-terengganu', 'pasar-malam-tanjung', 1, 0.043),
+('pasarnita-tanjung-kuala-terengganu', 'bazar-malam-tanjung', 2, 0.129),
+('pasarnita-tanjung-kuala-terengganu', 'dtrn-shhbndr-dataran-shahbandar', 3, 0.721),
+('pasarnita-tanjung-kuala-terengganu', 'pasar-malam-drawbridge', 4, 0.807),
+('pasarnita-tanjung-kuala-terengganu', 'hari-hari-kanopi', 5, 0.873),
+('kt-walk-uptown-market', 'bandaraya-warisan-pesisir-air-night-market', 1, 0.686),
+('kt-walk-uptown-market', 'uptown-pulau-warisan', 2, 0.720),
+('kt-walk-uptown-market', 'churros-churros-kt', 3, 0.764),
+('kt-walk-uptown-market', 'pulau-warisan-river-cruise', 4, 0.767),
+('kt-walk-uptown-market', 'kt-night-market', 5, 0.775),
+('pasar-malam-wakaf-tengah', 'pasar-wakaf-tengah', 1, 0.336),
+('pasar-malam-wakaf-tengah', 'pasar-maras', 2, 2.369),
+('pasar-malam-wakaf-tengah', 'pasar-malam-pak-tuyu', 3, 3.638),
+('pasar-malam-wakaf-tengah', 'carboot-sale-unisza', 4, 4.508),
+('pasar-malam-wakaf-tengah', 'pasar-malam-gong-badak', 5, 4.867),
+('pasar-malam-tok-adis', 'pasar-malam-permint-jaya', 1, 1.142),
+('pasar-malam-tok-adis', 'pasar-pagi-gong-tok-nasek', 2, 1.740),
+('pasar-malam-tok-adis', 'pasar-pagi', 3, 2.300),
+('pasar-malam-tok-adis', 'pasar-malam-simpang-4-chenderingselasa', 4, 2.526),
+('pasar-malam-tok-adis', 'pasar-malam-seri-budiman', 5, 3.294),
+('pasar-malam-kampung-baru-seberang-takir', 'pasar-malam-taman-permint-perdana', 1, 1.131),
+('pasar-malam-kampung-baru-seberang-takir', 'air-balang-ummi', 2, 1.918),
+('pasar-malam-kampung-baru-seberang-takir', 'pasar-payang', 3, 2.659),
+('pasar-malam-kampung-baru-seberang-takir', 'pasar-malam-drawbridge', 4, 2.689),
+('pasar-malam-kampung-baru-seberang-takir', 'churros-pantai-teluk-ketapang-by-orked-d-churros', 5, 2.762),
+('pasar-malam-nibong-stesen', 'dungun-market-vsr-bsr-dwghwn', 1, 1.716),
+('pasar-malam-nibong-stesen', 'pasar-minggu-petang-khamis-dungun-thursday', 2, 1.807),
+('pasar-malam-nibong-stesen', 'pasar-malam-isnin-batu-48-baru-bazar-ramadan-batu-48', 3, 3.014),
+('pasar-malam-nibong-stesen', 'car-boot-sales-dungun-tepi-pantai', 4, 5.768),
+('pasar-malam-nibong-stesen', 'pasar-malam-paka', 5, 15.777),
+('pasar-malam-kebor-besarkhamis', 'pasar-malam-kebor-airrabu', 1, 1.518),
+('pasar-malam-kebor-besarkhamis', 'pasar-malam-banggol-peradongisnin', 2, 2.018),
+('pasar-malam-kebor-besarkhamis', 'churros-manir-by-orked-dchurros', 3, 2.961),
+('pasar-malam-kebor-besarkhamis', 'pasar-malam-manir', 4, 2.967),
+('pasar-malam-kebor-besarkhamis', 'pasar-malam-kesomahad', 5, 3.005),
+('uptown-pulau-warisan', 'kt-night-market', 1, 0.128),
+('uptown-pulau-warisan', 'churros-churros-kt', 2, 0.165),
+('uptown-pulau-warisan', 'pulau-warisan-river-cruise', 3, 0.175),
+('uptown-pulau-warisan', 'bandaraya-warisan-pesisir-air-night-market', 4, 0.266),
+('uptown-pulau-warisan', 'kt-walk-uptown-market', 5, 0.720),
+('pasar-malam-paka', 'kampung-moreh-pantai-paka', 1, 2.104),
+('pasar-malam-paka', 'pasar-malam-hari-selasa', 2, 3.991),
+('pasar-malam-paka', 'car-boot-sales-dungun-tepi-pantai', 3, 10.395),
+('pasar-malam-paka', 'pasar-malam-isnin-batu-48-baru-bazar-ramadan-batu-48', 4, 12.772),
+('pasar-malam-paka', 'pasar-malam-kerteh', 5, 14.114),
+('pasar-malam-tanjung', 'pasarnita-tanjung-kuala-terengganu', 1, 0.043),
+('pasar-malam-tanjung', 'bazar-malam-tanjung', 2, 0.103),
+('pasar-malam-tanjung', 'dtrn-shhbndr-dataran-shahbandar', 3, 0.688),
+('pasar-malam-tanjung', 'pasar-malam-drawbridge', 4, 0.827),
+('pasar-malam-tanjung', 'hari-hari-kanopi', 5, 0.847),
+('pasar-malam-wakaf-dua', 'bukit-payung-wet-market', 1, 1.502),
+('pasar-malam-wakaf-dua', 'pasar-bukit-payong', 2, 1.511),
+('pasar-malam-wakaf-dua', 'churros-bukit-payong-by-orked-dchurros-pasar-malam', 3, 1.570),
+('pasar-malam-wakaf-dua', 'pasar-malam-taman-safiah-murni', 4, 3.812),
+('pasar-malam-wakaf-dua', 'pasar-kedai-buluh', 5, 4.021),
+('pasar-malam-seri-budiman', 'pasar-bukit-besar', 1, 1.293),
+('pasar-malam-seri-budiman', 'pasar-pagi-gong-tok-nasek', 2, 1.944),
+('pasar-malam-seri-budiman', 'hari-hari-kanopi', 3, 2.314),
+('pasar-malam-seri-budiman', 'pasar-malam-giant', 4, 2.374),
+('pasar-malam-seri-budiman', 'chuross-hiliran-by-orked-dchurros', 5, 2.554),
+('pasar-malam-wakaf-tembesu', 'pisang-goreng-dataran-austin', 1, 0.869),
+('pasar-malam-wakaf-tembesu', 'pasar-batu-enam', 2, 1.584),
+('pasar-malam-wakaf-tembesu', 'pasar-malam-kg-gong-pak-damat', 3, 1.591),
+('pasar-malam-wakaf-tembesu', 'pasar-malam-baru-enam', 4, 1.706),
+('pasar-malam-wakaf-tembesu', 'kelab-komuniti-peniaga-bersatu-terengganu', 5, 2.205),
+('pasar-malam-kijal', 'tapak-pasar-malam-bukit-kuang-tmn-rakyat-bistari', 1, 10.343),
+('pasar-malam-kijal', 'pasar-malam-kg-baru', 2, 10.706),
+('pasar-malam-kijal', 'pasar-malam-kuala-kemaman', 3, 12.140),
+('pasar-malam-kijal', 'pasar-malam-chukai', 4, 13.013),
+('pasar-malam-kijal', 'padang-astaka', 5, 13.261),
+('pasar-malam-batu-hamparkhamis', 'pasar-malam-kesomahad', 1, 2.167),
+('pasar-malam-batu-hamparkhamis', 'pasar-malam-kg-padang-macangjumaat', 2, 3.336),
+('pasar-malam-batu-hamparkhamis', 'pasar-malam-kebor-besarkhamis', 3, 4.464),
+('pasar-malam-batu-hamparkhamis', 'pasar-malam-ktelemong', 4, 5.505),
+('pasar-malam-batu-hamparkhamis', 'pasar-malam-kebor-airrabu', 5, 5.914),
+('pasar-malam-taman-safiah-murni', 'churros-bukit-payong-by-orked-dchurros-pasar-malam', 1, 2.302),
+('pasar-malam-taman-safiah-murni', 'pasar-bukit-payong', 2, 2.393),
+('pasar-malam-taman-safiah-murni', 'bukit-payung-wet-market', 3, 2.409),
+('pasar-malam-taman-safiah-murni', 'pasar-malam-kampung-rawai', 4, 2.758),
+('pasar-malam-taman-safiah-murni', 'pasar-malam-wakaf-dua', 5, 3.812),
+('pasar-malam-banggol-peradongisnin', 'pasar-malam-kebor-airrabu', 1, 1.792),
+('pasar-malam-banggol-peradongisnin', 'pasar-malam-kebor-besarkhamis', 2, 2.018),
+('pasar-malam-banggol-peradongisnin', 'pasar-malam-petai-bubussabtu', 3, 3.567),
+('pasar-malam-banggol-peradongisnin', 'churros-manir-by-orked-dchurros', 4, 4.002),
+('pasar-malam-banggol-peradongisnin', 'pasar-malam-manir', 5, 4.054),
+('pasar-minggu-padang-hiliran', 'chuross-hiliran-by-orked-dchurros', 1, 0.028),
+('pasar-minggu-padang-hiliran', 'pasar-malam-giant', 2, 0.201),
+('pasar-minggu-padang-hiliran', 'pasar-tani-padang-hiliran-kterengganu', 3, 0.217),
+('pasar-minggu-padang-hiliran', 'dorayaki-amar-kt', 4, 0.251),
+('pasar-minggu-padang-hiliran', 'pasar-chabang-tiga', 5, 0.834),
+('pasar-malam-drawbridge', 'pasarnita-tanjung-kuala-terengganu', 1, 0.807),
+('pasar-malam-drawbridge', 'air-balang-ummi', 2, 0.809),
+('pasar-malam-drawbridge', 'pasar-malam-tanjung', 3, 0.827),
+('pasar-malam-drawbridge', 'bazar-malam-tanjung', 4, 0.930),
+('pasar-malam-drawbridge', 'dtrn-shhbndr-dataran-shahbandar', 5, 0.976),
+('pasar-malam-pak-tuyu', 'carboot-sale-unisza', 1, 1.308),
+('pasar-malam-pak-tuyu', 'pasar-malam-gong-badak', 2, 2.093),
+('pasar-malam-pak-tuyu', 'pasar-malam-masjid-baru-tok-jembal', 3, 2.620),
+('pasar-malam-pak-tuyu', 'pasar-malam-wakaf-tengah', 4, 3.638),
+('pasar-malam-pak-tuyu', 'pasar-wakaf-tengah', 5, 3.907),
+('pasar-malam-sungai-kerak', 'pasar-marang', 1, 1.275),
+('pasar-malam-sungai-kerak', 'churros-marang-by-orked-dchurros-pasar-malam', 2, 1.297),
+('pasar-malam-sungai-kerak', 'pasar-malam-rhu-muda-hari-khamis', 3, 3.386),
+('pasar-malam-sungai-kerak', 'pasar-malam-simpang-4-chenderingselasa', 4, 7.541),
+('pasar-malam-sungai-kerak', 'pasar-malam-permint-jaya', 5, 8.606),
+('pasar-malam-kg-gong-pak-damat', 'pisang-goreng-dataran-austin', 1, 0.740),
+('pasar-malam-kg-gong-pak-damat', 'pasar-malam-baru-enam', 2, 1.082),
+('pasar-malam-kg-gong-pak-damat', 'pasar-batu-enam', 3, 1.096),
+('pasar-malam-kg-gong-pak-damat', 'pasar-bukit-tunggal', 4, 1.556),
+('pasar-malam-kg-gong-pak-damat', 'pasar-malam-wakaf-tembesu', 5, 1.591),
+('pasar-malam-giant', 'chuross-hiliran-by-orked-dchurros', 1, 0.193),
+('pasar-malam-giant', 'pasar-minggu-padang-hiliran', 2, 0.201),
+('pasar-malam-giant', 'pasar-tani-padang-hiliran-kterengganu', 3, 0.246),
+('pasar-malam-giant', 'dorayaki-amar-kt', 4, 0.384),
+('pasar-malam-giant', 'pasar-chabang-tiga', 5, 0.889),
+('pasar-malam-kampung-baru-dataran-pok-leh', 'pasar-tani-kekal-kerteh-terengganu', 1, 1.400),
+('pasar-malam-kampung-baru-dataran-pok-leh', 'pasar-malam-kerteh', 2, 1.524),
+('pasar-malam-kampung-baru-dataran-pok-leh', 'pasar-malam-kg-baru', 3, 7.802),
+('pasar-malam-kampung-baru-dataran-pok-leh', 'pasar-malam-hari-selasa', 4, 11.706),
+('pasar-malam-kampung-baru-dataran-pok-leh', 'kampung-moreh-pantai-paka', 5, 13.706),
+('pasar-malam-kampung-rawai', 'pasar-malam-taman-safiah-murni', 1, 2.758),
+('pasar-malam-kampung-rawai', 'churros-bukit-payong-by-orked-dchurros-pasar-malam', 2, 3.818),
+('pasar-malam-kampung-rawai', 'pasar-bukit-payong', 3, 3.927),
+('pasar-malam-kampung-rawai', 'bukit-payung-wet-market', 4, 3.946),
+('pasar-malam-kampung-rawai', 'pasar-malam-wakaf-dua', 5, 4.675),
+('pasar-malam-permint-jaya', 'pasar-malam-tok-adis', 1, 1.142),
+('pasar-malam-permint-jaya', 'pasar-malam-simpang-4-chenderingselasa', 2, 1.637),
+('pasar-malam-permint-jaya', 'pasar-pagi', 3, 2.493),
+('pasar-malam-permint-jaya', 'pasar-pagi-gong-tok-nasek', 4, 2.784),
+('pasar-malam-permint-jaya', 'churros-kedai-buloh-by-orked-dchurros-pasar-malam', 5, 4.298),
+('pasar-malam-merchang', 'pasar-minggu-tok-faqir', 1, 3.129),
+('pasar-malam-merchang', 'tapak-pasar-minggu-petang-isnin-kg-tok-dor', 2, 16.631),
+('pasar-malam-merchang', 'pasar-malam-rhu-muda-hari-khamis', 3, 17.893),
+('pasar-malam-merchang', 'pasar-minggu-petang-jumaat-felda-jerangau', 4, 18.827),
+('pasar-malam-merchang', 'churros-marang-by-orked-dchurros-pasar-malam', 5, 21.026),
+('pasar-malam-bukit-payong', 'night-market-kg-bukit-payong', 1, 0.156),
+('pasar-malam-bukit-payong', 'night-market-kg-pasir-akar', 2, 6.177),
+('pasar-malam-bukit-payong', 'pasar-renek', 3, 14.431),
+('pasar-malam-bukit-payong', 'pasar-jertih', 4, 16.658),
+('pasar-malam-bukit-payong', 'pasar-tani-kekal-ptk-nyiur-tujuh-besut', 5, 18.355),
+('pasar-malam-baru-enam', 'pasar-batu-enam', 1, 0.138),
+('pasar-malam-baru-enam', 'pasar-malam-kg-gong-pak-damat', 2, 1.082),
+('pasar-malam-baru-enam', 'pisang-goreng-dataran-austin', 3, 1.267),
+('pasar-malam-baru-enam', 'pasar-malam-petai-bubussabtu', 4, 1.625),
+('pasar-malam-baru-enam', 'pasar-malam-wakaf-tembesu', 5, 1.706),
+('pasar-malam-kg-baru', 'pasar-malam-kampung-baru-dataran-pok-leh', 1, 7.802),
+('pasar-malam-kg-baru', 'pasar-tani-kekal-kerteh-terengganu', 2, 9.146),
+('pasar-malam-kg-baru', 'pasar-malam-kerteh', 3, 9.282),
+('pasar-malam-kg-baru', 'pasar-malam-kijal', 4, 10.706),
+('pasar-malam-kg-baru', 'tapak-pasar-malam-bukit-kuang-tmn-rakyat-bistari', 5, 18.181),
+('night-market-kg-bukit-payong', 'pasar-malam-bukit-payong', 1, 0.156),
+('night-market-kg-bukit-payong', 'night-market-kg-pasir-akar', 2, 6.033),
+('night-market-kg-bukit-payong', 'pasar-renek', 3, 14.286),
+('night-market-kg-bukit-payong', 'pasar-jertih', 4, 16.522),
+('night-market-kg-bukit-payong', 'pasar-tani-kekal-ptk-nyiur-tujuh-besut', 5, 18.211),
+('pasar-malam-tembila', 'pasar-tembila', 1, 1.135),
+('pasar-malam-tembila', 'tapk-pasar-malam-gong-bayor', 2, 3.393),
+('pasar-malam-tembila', 'pasar-malam-gong-kepas-supermas', 3, 7.355),
+('pasar-malam-tembila', 'tapak-psar-malam-kampong-raja', 4, 7.905),
+('pasar-malam-tembila', 'pasar-kampung-raja', 5, 8.021),
+('pasar-malam-kuala-kemaman', 'pasar-tani-kekal-chukai', 1, 1.754),
+('pasar-malam-kuala-kemaman', 'pasar-dusun-nyior', 2, 1.776),
+('pasar-malam-kuala-kemaman', 'padang-astaka', 3, 2.682),
+('pasar-malam-kuala-kemaman', 'pasar-malam-chukai', 4, 2.698),
+('pasar-malam-kuala-kemaman', 'tapak-pasar-malam-bukit-kuang-tmn-rakyat-bistari', 5, 3.700),
+('chuross-hiliran-by-orked-dchurros', 'pasar-minggu-padang-hiliran', 1, 0.028),
+('chuross-hiliran-by-orked-dchurros', 'pasar-malam-giant', 2, 0.193),
+('chuross-hiliran-by-orked-dchurros', 'pasar-tani-padang-hiliran-kterengganu', 3, 0.239),
+('chuross-hiliran-by-orked-dchurros', 'dorayaki-amar-kt', 4, 0.279),
+('chuross-hiliran-by-orked-dchurros', 'pasar-chabang-tiga', 5, 0.862),
+('pasar-malam-taman-permint-perdana', 'pasar-malam-kampung-baru-seberang-takir', 1, 1.131),
+('pasar-malam-taman-permint-perdana', 'air-balang-ummi', 2, 1.184),
+('pasar-malam-taman-permint-perdana', 'pasar-payang', 3, 1.584),
+('pasar-malam-taman-permint-perdana', 'pulau-warisan-river-cruise', 4, 1.770),
+('pasar-malam-taman-permint-perdana', 'churros-churros-kt', 5, 1.779),
+('pasar-malam-wakaf-mesira', 'pasar-maras', 1, 4.280),
+('pasar-malam-wakaf-mesira', 'pasar-malam-gong-badak', 2, 5.200),
+('pasar-malam-wakaf-mesira', 'kelab-komuniti-peniaga-bersatu-terengganu', 3, 5.261),
+('pasar-malam-wakaf-mesira', 'pasar-malam-wakaf-tengah', 4, 5.764),
+('pasar-malam-wakaf-mesira', 'carboot-sale-unisza', 5, 5.781),
+('bazar-malam-tanjung', 'pasar-malam-tanjung', 1, 0.103),
+('bazar-malam-tanjung', 'pasarnita-tanjung-kuala-terengganu', 2, 0.129),
+('bazar-malam-tanjung', 'dtrn-shhbndr-dataran-shahbandar', 3, 0.713),
+('bazar-malam-tanjung', 'hari-hari-kanopi', 4, 0.745),
+('bazar-malam-tanjung', 'pasar-malam-drawbridge', 5, 0.930),
+('pasar-minggu-petang-khamis-dungun-thursday', 'pasar-malam-isnin-batu-48-baru-bazar-ramadan-batu-48', 1, 1.413),
+('pasar-minggu-petang-khamis-dungun-thursday', 'pasar-malam-nibong-stesen', 2, 1.807),
+('pasar-minggu-petang-khamis-dungun-thursday', 'dungun-market-vsr-bsr-dwghwn', 3, 2.044),
+('pasar-minggu-petang-khamis-dungun-thursday', 'car-boot-sales-dungun-tepi-pantai', 4, 3.972),
+('pasar-minggu-petang-khamis-dungun-thursday', 'pasar-malam-paka', 5, 14.120),
+('night-market-kg-pasir-akar', 'night-market-kg-bukit-payong', 1, 6.033),
+('night-market-kg-pasir-akar', 'pasar-malam-bukit-payong', 2, 6.177),
+('night-market-kg-pasir-akar', 'pasar-jertih', 3, 10.552),
+('night-market-kg-pasir-akar', 'pasar-renek', 4, 10.828),
+('night-market-kg-pasir-akar', 'pasar-tani-kekal-ptk-nyiur-tujuh-besut', 5, 12.179),
+('pasar-malam-simpang-4-chenderingselasa', 'pasar-malam-permint-jaya', 1, 1.637),
+('pasar-malam-simpang-4-chenderingselasa', 'pasar-malam-tok-adis', 2, 2.526),
+('pasar-malam-simpang-4-chenderingselasa', 'pasar-pagi', 3, 4.089),
+('pasar-malam-simpang-4-chenderingselasa', 'pasar-pagi-gong-tok-nasek', 4, 4.265),
+('pasar-malam-simpang-4-chenderingselasa', 'churros-kedai-buloh-by-orked-dchurros-pasar-malam', 5, 5.487),
+('kt-night-market', 'churros-churros-kt', 1, 0.047),
+('kt-night-market', 'pulau-warisan-river-cruise', 2, 0.056),
+('kt-night-market', 'uptown-pulau-warisan', 3, 0.128),
+('kt-night-market', 'bandaraya-warisan-pesisir-air-night-market', 4, 0.185),
+('kt-night-market', 'pasar-payang', 5, 0.648),
+('pasar-malam-sabtu-kuala-berang', 'tapak-pasar-minggu-kuala-berang', 1, 0.174),
+('pasar-malam-sabtu-kuala-berang', 'pasar-besar-kuala-berang', 2, 0.210),
+('pasar-malam-sabtu-kuala-berang', 'pasar-ajil', 3, 8.667),
+('pasar-malam-sabtu-kuala-berang', 'churros-wakaf-tapai-by-orked-dchurros-pasar-malam', 4, 10.895),
+('pasar-malam-sabtu-kuala-berang', 'pasar-wakaf-tapai', 5, 10.900),
+('pasar-malam-rhu-muda-hari-khamis', 'churros-marang-by-orked-dchurros-pasar-malam', 1, 3.134),
+('pasar-malam-rhu-muda-hari-khamis', 'pasar-marang', 2, 3.170),
+('pasar-malam-rhu-muda-hari-khamis', 'pasar-malam-sungai-kerak', 3, 3.386),
+('pasar-malam-rhu-muda-hari-khamis', 'pasar-malam-simpang-4-chenderingselasa', 4, 10.498),
+('pasar-malam-rhu-muda-hari-khamis', 'pasar-malam-permint-jaya', 5, 11.742),
+('pasar-manir', 'pasar-malam-manir', 1, 0.077),
+('pasar-manir', 'churros-manir-by-orked-dchurros', 2, 0.085),
+('pasar-manir', 'pasar-malam-kebor-airrabu', 3, 2.294),
+('pasar-manir', 'pasar-malam-kebor-besarkhamis', 4, 3.028),
+('pasar-manir', 'pasar-malam-petai-bubussabtu', 5, 3.295),
+('bandaraya-warisan-pesisir-air-night-market', 'pulau-warisan-river-cruise', 1, 0.136),
+('bandaraya-warisan-pesisir-air-night-market', 'churros-churros-kt', 2, 0.141),
+('bandaraya-warisan-pesisir-air-night-market', 'kt-night-market', 3, 0.185),
+('bandaraya-warisan-pesisir-air-night-market', 'uptown-pulau-warisan', 4, 0.266),
+('bandaraya-warisan-pesisir-air-night-market', 'pasar-payang', 5, 0.479),
+('pasar-minggu-bandar-baharu-bukit-mentok', 'padang-astaka', 1, 1.789),
+('pasar-minggu-bandar-baharu-bukit-mentok', 'pasar-malam-chukai', 2, 1.900),
+('pasar-minggu-bandar-baharu-bukit-mentok', 'pasar-dusun-nyior', 3, 2.825),
+('pasar-minggu-bandar-baharu-bukit-mentok', 'pasar-tani-kekal-chukai', 4, 2.894),
+('pasar-minggu-bandar-baharu-bukit-mentok', 'tapak-pasar-malam-bukit-kuang-tmn-rakyat-bistari', 5, 4.315),
+('pasar-malam-kerteh', 'pasar-tani-kekal-kerteh-terengganu', 1, 0.141),
+('pasar-malam-kerteh', 'pasar-malam-kampung-baru-dataran-pok-leh', 2, 1.524),
+('pasar-malam-kerteh', 'pasar-malam-kg-baru', 3, 9.282),
+('pasar-malam-kerteh', 'pasar-malam-hari-selasa', 4, 10.188),
+('pasar-malam-kerteh', 'kampung-moreh-pantai-paka', 5, 12.187),
+('pasar-malam-isnin-batu-48-baru-bazar-ramadan-batu-48', 'pasar-minggu-petang-khamis-dungun-thursday', 1, 1.413),
+('pasar-malam-isnin-batu-48-baru-bazar-ramadan-batu-48', 'car-boot-sales-dungun-tepi-pantai', 2, 2.907),
+('pasar-malam-isnin-batu-48-baru-bazar-ramadan-batu-48', 'pasar-malam-nibong-stesen', 3, 3.014),
+('pasar-malam-isnin-batu-48-baru-bazar-ramadan-batu-48', 'dungun-market-vsr-bsr-dwghwn', 4, 3.442),
+('pasar-malam-isnin-batu-48-baru-bazar-ramadan-batu-48', 'pasar-malam-paka', 5, 12.772),
+('pasar-malam-kesomahad', 'pasar-malam-batu-hamparkhamis', 1, 2.167),
+('pasar-malam-kesomahad', 'pasar-malam-kebor-besarkhamis', 2, 3.005),
+('pasar-malam-kesomahad', 'pasar-malam-kg-padang-macangjumaat', 3, 3.926),
+('pasar-malam-kesomahad', 'pasar-malam-banggol-peradongisnin', 4, 4.287),
+('pasar-malam-kesomahad', 'pasar-malam-kebor-airrabu', 5, 4.518),
+('churros-churros-kt', 'pulau-warisan-river-cruise', 1, 0.010),
+('churros-churros-kt', 'kt-night-market', 2, 0.047),
+('churros-churros-kt', 'bandaraya-warisan-pesisir-air-night-market', 3, 0.141),
+('churros-churros-kt', 'uptown-pulau-warisan', 4, 0.165),
+('churros-churros-kt', 'pasar-payang', 5, 0.601),
+('pasar-batu-enam', 'pasar-malam-baru-enam', 1, 0.138),
+('pasar-batu-enam', 'pasar-malam-kg-gong-pak-damat', 2, 1.096),
+('pasar-batu-enam', 'pisang-goreng-dataran-austin', 3, 1.196),
+('pasar-batu-enam', 'pasar-malam-wakaf-tembesu', 4, 1.584),
+('pasar-batu-enam', 'pasar-malam-petai-bubussabtu', 5, 1.628),
+('pasar-malam-ktelemong', 'pasar-malam-batu-hamparkhamis', 1, 5.505),
+('pasar-malam-ktelemong', 'pasar-malam-kampung-rawai', 2, 5.639),
+('pasar-malam-ktelemong', 'pasar-malam-kesomahad', 3, 7.443),
+('pasar-malam-ktelemong', 'pasar-malam-wakaf-dua', 4, 7.699),
+('pasar-malam-ktelemong', 'pasar-malam-kg-padang-macangjumaat', 5, 7.833),
+('pasar-malam-petai-bubussabtu', 'pasar-malam-baru-enam', 1, 1.625),
+('pasar-malam-petai-bubussabtu', 'pasar-batu-enam', 2, 1.628),
+('pasar-malam-petai-bubussabtu', 'kelab-komuniti-peniaga-bersatu-terengganu', 3, 1.760),
+('pasar-malam-petai-bubussabtu', 'pasar-malam-kg-gong-pak-damat', 4, 2.708),
+('pasar-malam-petai-bubussabtu', 'pasar-malam-kebor-airrabu', 5, 2.756),
+('pasar-malam-kebor-airrabu', 'pasar-malam-kebor-besarkhamis', 1, 1.518),
+('pasar-malam-kebor-airrabu', 'pasar-malam-banggol-peradongisnin', 2, 1.792),
+('pasar-malam-kebor-airrabu', 'churros-manir-by-orked-dchurros', 3, 2.210),
+('pasar-malam-kebor-airrabu', 'pasar-malam-manir', 4, 2.264),
+('pasar-malam-kebor-airrabu', 'pasar-manir', 5, 2.294),
+('pasar-bukit-payong', 'bukit-payung-wet-market', 1, 0.020),
+('pasar-bukit-payong', 'churros-bukit-payong-by-orked-dchurros-pasar-malam', 2, 0.111),
+('pasar-bukit-payong', 'pasar-malam-wakaf-dua', 3, 1.511),
+('pasar-bukit-payong', 'pasar-malam-taman-safiah-murni', 4, 2.393),
+('pasar-bukit-payong', 'pasar-kedai-buluh', 5, 3.809),
+('pasar-minggu-tok-faqir', 'pasar-malam-merchang', 1, 3.129),
+('pasar-minggu-tok-faqir', 'tapak-pasar-minggu-petang-isnin-kg-tok-dor', 2, 16.854),
+('pasar-minggu-tok-faqir', 'pasar-minggu-petang-jumaat-felda-jerangau', 3, 17.308),
+('pasar-minggu-tok-faqir', 'pasar-malam-rhu-muda-hari-khamis', 4, 21.004),
+('pasar-minggu-tok-faqir', 'pasar-malam-sungai-kerak', 5, 24.118),
+('pasar-malam-gong-kepas-supermas', 'tapak-psar-malam-kampong-raja', 1, 2.064),
+('pasar-malam-gong-kepas-supermas', 'pasar-kampung-raja', 2, 2.088),
+('pasar-malam-gong-kepas-supermas', 'tapk-pasar-malam-gong-bayor', 3, 4.502),
+('pasar-malam-gong-kepas-supermas', 'pasar-nelayan-seberang-kastam', 4, 4.977),
+('pasar-malam-gong-kepas-supermas', 'kuala-besut-farmers-market', 5, 5.300),
+('tapk-pasar-malam-gong-bayor', 'pasar-malam-tembila', 1, 3.393),
+('tapk-pasar-malam-gong-bayor', 'pasar-malam-gong-kepas-supermas', 2, 4.502),
+('tapk-pasar-malam-gong-bayor', 'pasar-tembila', 3, 4.528),
+('tapk-pasar-malam-gong-bayor', 'tapak-psar-malam-kampong-raja', 4, 5.720),
+('tapk-pasar-malam-gong-bayor', 'pasar-kampung-raja', 5, 5.818),
+('pasar-payang', 'dtrn-shhbndr-dataran-shahbandar', 1, 0.379),
+('pasar-payang', 'bandaraya-warisan-pesisir-air-night-market', 2, 0.479),
+('pasar-payang', 'pulau-warisan-river-cruise', 3, 0.592),
+('pasar-payang', 'churros-churros-kt', 4, 0.601),
+('pasar-payang', 'kt-night-market', 5, 0.648),
+('churros-kedai-buloh-by-orked-dchurros-pasar-malam', 'pasar-kedai-buluh', 1, 0.024),
+('churros-kedai-buloh-by-orked-dchurros-pasar-malam', 'pasar-pagi', 2, 2.622),
+('churros-kedai-buloh-by-orked-dchurros-pasar-malam', 'bukit-payung-wet-market', 3, 3.814),
+('churros-kedai-buloh-by-orked-dchurros-pasar-malam', 'pasar-bukit-payong', 4, 3.832),
+('churros-kedai-buloh-by-orked-dchurros-pasar-malam', 'churros-bukit-payong-by-orked-dchurros-pasar-malam', 5, 3.930),
+('pekan-rabu-dendang', 'pasar-minggu-petang-jumaat-felda-jerangau', 1, 9.391),
+('pekan-rabu-dendang', 'tapak-pasar-minggu-petang-isnin-kg-tok-dor', 2, 18.601),
+('pekan-rabu-dendang', 'pasar-minggu-tok-faqir', 3, 25.397),
+('pekan-rabu-dendang', 'pasar-malam-nibong-stesen', 4, 25.568),
+('pekan-rabu-dendang', 'pasar-minggu-petang-khamis-dungun-thursday', 5, 26.894),
+('pasar-maras', 'pasar-malam-wakaf-tengah', 1, 2.369),
+('pasar-maras', 'pasar-wakaf-tengah', 2, 2.427),
+('pasar-maras', 'pasar-malam-wakaf-mesira', 3, 4.280),
+('pasar-maras', 'pasar-malam-pak-tuyu', 4, 5.299),
+('pasar-maras', 'carboot-sale-unisza', 5, 5.721),
+('pasar-renek', 'pasar-tembila', 1, 7.968),
+('pasar-renek', 'pasar-malam-tembila', 2, 8.041),
+('pasar-renek', 'tapk-pasar-malam-gong-bayor', 3, 9.120),
+('pasar-renek', 'night-market-kg-pasir-akar', 4, 10.828),
+('pasar-renek', 'pasar-tani-kekal-ptk-nyiur-tujuh-besut', 5, 12.631),
+('pasar-malam-kg-padang-macangjumaat', 'pasar-malam-batu-hamparkhamis', 1, 3.336),
+('pasar-malam-kg-padang-macangjumaat', 'pasar-malam-manir', 2, 3.511),
+('pasar-malam-kg-padang-macangjumaat', 'pasar-malam-kebor-besarkhamis', 3, 3.572),
+('pasar-malam-kg-padang-macangjumaat', 'pasar-manir', 4, 3.578),
+('pasar-malam-kg-padang-macangjumaat', 'churros-manir-by-orked-dchurros', 5, 3.596),
+('pasar-malam-masjid-baru-tok-jembal', 'carboot-sale-unisza', 1, 1.716),
+('pasar-malam-masjid-baru-tok-jembal', 'pasar-malam-gong-badak', 2, 1.893),
+('pasar-malam-masjid-baru-tok-jembal', 'churros-pantai-teluk-ketapang-by-orked-d-churros', 3, 2.230),
+('pasar-malam-masjid-baru-tok-jembal', 'pasar-malam-pak-tuyu', 4, 2.620),
+('pasar-malam-masjid-baru-tok-jembal', 'pasar-malam-wakaf-tembesu', 5, 3.291),
+('pasar-chabang-tiga', 'dorayaki-amar-kt', 1, 0.599),
+('pasar-chabang-tiga', 'pasar-tani-padang-hiliran-kterengganu', 2, 0.649),
+('pasar-chabang-tiga', 'pasar-minggu-padang-hiliran', 3, 0.834),
+('pasar-chabang-tiga', 'chuross-hiliran-by-orked-dchurros', 4, 0.862),
+('pasar-chabang-tiga', 'pasar-malam-giant', 5, 0.889),
+('pasar-minggu-petang-sabtu-dan-isninbazar-ramadhanwakaf-tapai', 'pasar-wakaf-tapai', 1, 0.040),
+('pasar-minggu-petang-sabtu-dan-isninbazar-ramadhanwakaf-tapai', 'churros-wakaf-tapai-by-orked-dchurros-pasar-malam', 2, 0.042),
+('pasar-minggu-petang-sabtu-dan-isninbazar-ramadhanwakaf-tapai', 'pasar-ajil', 3, 5.668),
+('pasar-minggu-petang-sabtu-dan-isninbazar-ramadhanwakaf-tapai', 'pasar-malam-kampung-rawai', 4, 8.074),
+('pasar-minggu-petang-sabtu-dan-isninbazar-ramadhanwakaf-tapai', 'pasar-malam-taman-safiah-murni', 5, 8.841),
+('churros-bukit-payong-by-orked-dchurros-pasar-malam', 'pasar-bukit-payong', 1, 0.111),
+('churros-bukit-payong-by-orked-dchurros-pasar-malam', 'bukit-payung-wet-market', 2, 0.130),
+('churros-bukit-payong-by-orked-dchurros-pasar-malam', 'pasar-malam-wakaf-dua', 3, 1.570),
+('churros-bukit-payong-by-orked-dchurros-pasar-malam', 'pasar-malam-taman-safiah-murni', 4, 2.302),
+('churros-bukit-payong-by-orked-dchurros-pasar-malam', 'pasar-malam-kampung-rawai', 5, 3.818),
+('kampung-moreh-pantai-paka', 'pasar-malam-hari-selasa', 1, 2.000),
+('kampung-moreh-pantai-paka', 'pasar-malam-paka', 2, 2.104),
+('kampung-moreh-pantai-paka', 'pasar-malam-kerteh', 3, 12.187),
+('kampung-moreh-pantai-paka', 'pasar-tani-kekal-kerteh-terengganu', 4, 12.319),
+('kampung-moreh-pantai-paka', 'car-boot-sales-dungun-tepi-pantai', 5, 12.402),
+('pasar-bukit-besar', 'pasar-malam-giant', 1, 1.203),
+('pasar-bukit-besar', 'pasar-malam-seri-budiman', 2, 1.293),
+('pasar-bukit-besar', 'chuross-hiliran-by-orked-dchurros', 3, 1.356),
+('pasar-bukit-besar', 'pasar-minggu-padang-hiliran', 4, 1.376),
+('pasar-bukit-besar', 'pasar-tani-padang-hiliran-kterengganu', 5, 1.431),
+('pasar-tani-padang-hiliran-kterengganu', 'dorayaki-amar-kt', 1, 0.179),
+('pasar-tani-padang-hiliran-kterengganu', 'pasar-minggu-padang-hiliran', 2, 0.217),
+('pasar-tani-padang-hiliran-kterengganu', 'chuross-hiliran-by-orked-dchurros', 3, 0.239),
+('pasar-tani-padang-hiliran-kterengganu', 'pasar-malam-giant', 4, 0.246),
+('pasar-tani-padang-hiliran-kterengganu', 'pasar-chabang-tiga', 5, 0.649),
+('pasar-wakaf-tapai', 'churros-wakaf-tapai-by-orked-dchurros-pasar-malam', 1, 0.006),
+('pasar-wakaf-tapai', 'pasar-minggu-petang-sabtu-dan-isninbazar-ramadhanwakaf-tapai', 2, 0.040),
+('pasar-wakaf-tapai', 'pasar-ajil', 3, 5.668),
+('pasar-wakaf-tapai', 'pasar-malam-kampung-rawai', 4, 8.072),
+('pasar-wakaf-tapai', 'pasar-malam-taman-safiah-murni', 5, 8.851),
+('pasar-kedai-buluh', 'churros-kedai-buloh-by-orked-dchurros-pasar-malam', 1, 0.024),
+('pasar-kedai-buluh', 'pasar-pagi', 2, 2.645),
+('pasar-kedai-buluh', 'bukit-payung-wet-market', 3, 3.791),
+('pasar-kedai-buluh', 'pasar-bukit-payong', 4, 3.809),
+('pasar-kedai-buluh', 'churros-bukit-payong-by-orked-dchurros-pasar-malam', 5, 3.907),
+('churros-wakaf-tapai-by-orked-dchurros-pasar-malam', 'pasar-wakaf-tapai', 1, 0.006),
+('churros-wakaf-tapai-by-orked-dchurros-pasar-malam', 'pasar-minggu-petang-sabtu-dan-isninbazar-ramadhanwakaf-tapai', 2, 0.042),
+('churros-wakaf-tapai-by-orked-dchurros-pasar-malam', 'pasar-ajil', 3, 5.662),
+('churros-wakaf-tapai-by-orked-dchurros-pasar-malam', 'pasar-malam-kampung-rawai', 4, 8.078),
+('churros-wakaf-tapai-by-orked-dchurros-pasar-malam', 'pasar-malam-taman-safiah-murni', 5, 8.857),
+('pasar-bukit-tunggal', 'pasar-malam-kg-gong-pak-damat', 1, 1.556),
+('pasar-bukit-tunggal', 'pasar-malam-baru-enam', 2, 1.881),
+('pasar-bukit-tunggal', 'pulau-duyong-night-market', 3, 1.907),
+('pasar-bukit-tunggal', 'pasar-batu-enam', 4, 1.999),
+('pasar-bukit-tunggal', 'pisang-goreng-dataran-austin', 5, 2.295),
+('pasar-tani-kuala-ping', 'pasar-malam-sabtu-kuala-berang', 1, 15.293),
+('pasar-tani-kuala-ping', 'pasar-malam-ktelemong', 2, 15.382),
+('pasar-tani-kuala-ping', 'tapak-pasar-minggu-kuala-berang', 3, 15.440),
+('pasar-tani-kuala-ping', 'pasar-besar-kuala-berang', 4, 15.453),
+('pasar-tani-kuala-ping', 'pasar-malam-batu-hamparkhamis', 5, 19.380),
+('pasar-ajil', 'churros-wakaf-tapai-by-orked-dchurros-pasar-malam', 1, 5.662),
+('pasar-ajil', 'pasar-wakaf-tapai', 2, 5.668),
+('pasar-ajil', 'pasar-minggu-petang-sabtu-dan-isninbazar-ramadhanwakaf-tapai', 3, 5.668),
+('pasar-ajil', 'pasar-besar-kuala-berang', 4, 8.459),
+('pasar-ajil', 'tapak-pasar-minggu-kuala-berang', 5, 8.501),
+('pasar-marang', 'churros-marang-by-orked-dchurros-pasar-malam', 1, 0.043),
+('pasar-marang', 'pasar-malam-sungai-kerak', 2, 1.275),
+('pasar-marang', 'pasar-malam-rhu-muda-hari-khamis', 3, 3.170),
+('pasar-marang', 'pasar-malam-simpang-4-chenderingselasa', 4, 7.331),
+('pasar-marang', 'pasar-malam-permint-jaya', 5, 8.580),
+('pasar-tani-kekal-kerteh-terengganu', 'pasar-malam-kerteh', 1, 0.141),
+('pasar-tani-kekal-kerteh-terengganu', 'pasar-malam-kampung-baru-dataran-pok-leh', 2, 1.400),
+('pasar-tani-kekal-kerteh-terengganu', 'pasar-malam-kg-baru', 3, 9.146),
+('pasar-tani-kekal-kerteh-terengganu', 'pasar-malam-hari-selasa', 4, 10.320),
+('pasar-tani-kekal-kerteh-terengganu', 'kampung-moreh-pantai-paka', 5, 12.319),
+('pasar-kampung-raja', 'tapak-psar-malam-kampong-raja', 1, 0.119),
+('pasar-kampung-raja', 'pasar-malam-gong-kepas-supermas', 2, 2.088),
+('pasar-kampung-raja', 'pasar-nelayan-seberang-kastam', 3, 3.046),
+('pasar-kampung-raja', 'kuala-besut-farmers-market', 4, 3.733),
+('pasar-kampung-raja', 'tapk-pasar-malam-gong-bayor', 5, 5.818),
+('tapak-psar-malam-kampong-raja', 'pasar-kampung-raja', 1, 0.119),
+('tapak-psar-malam-kampong-raja', 'pasar-malam-gong-kepas-supermas', 2, 2.064),
+('tapak-psar-malam-kampong-raja', 'pasar-nelayan-seberang-kastam', 3, 3.127),
+('tapak-psar-malam-kampong-raja', 'kuala-besut-farmers-market', 4, 3.840),
+('tapak-psar-malam-kampong-raja', 'tapk-pasar-malam-gong-bayor', 5, 5.720),
+('pasar-wakaf-tengah', 'pasar-malam-wakaf-tengah', 1, 0.336),
+('pasar-wakaf-tengah', 'pasar-maras', 2, 2.427),
+('pasar-wakaf-tengah', 'pasar-malam-pak-tuyu', 3, 3.907),
+('pasar-wakaf-tengah', 'carboot-sale-unisza', 4, 4.816),
+('pasar-wakaf-tengah', 'pasar-malam-gong-badak', 5, 5.192),
+('pasar-besar-kuala-berang', 'tapak-pasar-minggu-kuala-berang', 1, 0.046),
+('pasar-besar-kuala-berang', 'pasar-malam-sabtu-kuala-berang', 2, 0.210),
+('pasar-besar-kuala-berang', 'pasar-ajil', 3, 8.459),
+('pasar-besar-kuala-berang', 'churros-wakaf-tapai-by-orked-dchurros-pasar-malam', 4, 10.735),
+('pasar-besar-kuala-berang', 'pasar-wakaf-tapai', 5, 10.739),
+('kelab-komuniti-peniaga-bersatu-terengganu', 'pasar-malam-petai-bubussabtu', 1, 1.760),
+('kelab-komuniti-peniaga-bersatu-terengganu', 'pasar-batu-enam', 2, 2.174),
+('kelab-komuniti-peniaga-bersatu-terengganu', 'pasar-malam-wakaf-tembesu', 3, 2.205),
+('kelab-komuniti-peniaga-bersatu-terengganu', 'pasar-malam-baru-enam', 4, 2.280),
+('kelab-komuniti-peniaga-bersatu-terengganu', 'pisang-goreng-dataran-austin', 5, 2.701),
+('tapak-pasar-malam-bukit-kuang-tmn-rakyat-bistari', 'pasar-malam-chukai', 1, 2.851),
+('tapak-pasar-malam-bukit-kuang-tmn-rakyat-bistari', 'padang-astaka', 2, 3.133),
+('tapak-pasar-malam-bukit-kuang-tmn-rakyat-bistari', 'pasar-malam-kuala-kemaman', 3, 3.700),
+('tapak-pasar-malam-bukit-kuang-tmn-rakyat-bistari', 'pasar-dusun-nyior', 4, 3.942),
+('tapak-pasar-malam-bukit-kuang-tmn-rakyat-bistari', 'pasar-tani-kekal-chukai', 5, 4.016),
+('pasar-tembila', 'pasar-malam-tembila', 1, 1.135),
+('pasar-tembila', 'tapk-pasar-malam-gong-bayor', 2, 4.528),
+('pasar-tembila', 'pasar-renek', 3, 7.968),
+('pasar-tembila', 'pasar-malam-gong-kepas-supermas', 4, 8.403),
+('pasar-tembila', 'tapak-psar-malam-kampong-raja', 5, 8.812),
+('pasar-pagi-gong-tok-nasek', 'pasar-malam-tok-adis', 1, 1.740),
+('pasar-pagi-gong-tok-nasek', 'pasar-malam-seri-budiman', 2, 1.944),
+('pasar-pagi-gong-tok-nasek', 'pasar-bukit-besar', 3, 2.025),
+('pasar-pagi-gong-tok-nasek', 'pasar-pagi', 4, 2.175),
+('pasar-pagi-gong-tok-nasek', 'pasar-malam-permint-jaya', 5, 2.784),
+('hari-hari-kanopi', 'bazar-malam-tanjung', 1, 0.745),
+('hari-hari-kanopi', 'kt-walk-uptown-market', 2, 0.822),
+('hari-hari-kanopi', 'pasar-malam-tanjung', 3, 0.847),
+('hari-hari-kanopi', 'pasarnita-tanjung-kuala-terengganu', 4, 0.873),
+('hari-hari-kanopi', 'dtrn-shhbndr-dataran-shahbandar', 5, 1.116),
+('churros-manir-by-orked-dchurros', 'pasar-manir', 1, 0.085),
+('churros-manir-by-orked-dchurros', 'pasar-malam-manir', 2, 0.097),
+('churros-manir-by-orked-dchurros', 'pasar-malam-kebor-airrabu', 3, 2.210),
+('churros-manir-by-orked-dchurros', 'pasar-malam-kebor-besarkhamis', 4, 2.961),
+('churros-manir-by-orked-dchurros', 'pasar-malam-petai-bubussabtu', 5, 3.240),
+('pasar-malam-manir', 'pasar-manir', 1, 0.077),
+('pasar-malam-manir', 'churros-manir-by-orked-dchurros', 2, 0.097),
+('pasar-malam-manir', 'pasar-malam-kebor-airrabu', 3, 2.264),
+('pasar-malam-manir', 'pasar-malam-kebor-besarkhamis', 4, 2.967),
+('pasar-malam-manir', 'pasar-malam-petai-bubussabtu', 5, 3.336),
+('dungun-market-vsr-bsr-dwghwn', 'pasar-malam-nibong-stesen', 1, 1.716),
+('dungun-market-vsr-bsr-dwghwn', 'pasar-minggu-petang-khamis-dungun-thursday', 2, 2.044),
+('dungun-market-vsr-bsr-dwghwn', 'pasar-malam-isnin-batu-48-baru-bazar-ramadan-batu-48', 3, 3.442),
+('dungun-market-vsr-bsr-dwghwn', 'car-boot-sales-dungun-tepi-pantai', 4, 5.610),
+('dungun-market-vsr-bsr-dwghwn', 'pasar-malam-paka', 5, 15.960),
+('kuala-besut-farmers-market', 'pasar-nelayan-seberang-kastam', 1, 1.464),
+('kuala-besut-farmers-market', 'pasar-kampung-raja', 2, 3.733),
+('kuala-besut-farmers-market', 'tapak-psar-malam-kampong-raja', 3, 3.840),
+('kuala-besut-farmers-market', 'pasar-malam-gong-kepas-supermas', 4, 5.300),
+('kuala-besut-farmers-market', 'tapk-pasar-malam-gong-bayor', 5, 9.524),
+('pasar-malam-hari-selasa', 'kampung-moreh-pantai-paka', 1, 2.000),
+('pasar-malam-hari-selasa', 'pasar-malam-paka', 2, 3.991),
+('pasar-malam-hari-selasa', 'pasar-malam-kerteh', 3, 10.188),
+('pasar-malam-hari-selasa', 'pasar-tani-kekal-kerteh-terengganu', 4, 10.320),
+('pasar-malam-hari-selasa', 'pasar-malam-kampung-baru-dataran-pok-leh', 5, 11.706),
+('churros-pantai-teluk-ketapang-by-orked-d-churros', 'pasar-malam-masjid-baru-tok-jembal', 1, 2.230),
+('churros-pantai-teluk-ketapang-by-orked-d-churros', 'pasar-malam-kampung-baru-seberang-takir', 2, 2.762),
+('churros-pantai-teluk-ketapang-by-orked-d-churros', 'pisang-goreng-dataran-austin', 3, 3.590),
+('churros-pantai-teluk-ketapang-by-orked-d-churros', 'pasar-malam-wakaf-tembesu', 4, 3.599),
+('churros-pantai-teluk-ketapang-by-orked-d-churros', 'pasar-malam-taman-permint-perdana', 5, 3.850),
+('carboot-sale-unisza', 'pasar-malam-gong-badak', 1, 0.845),
+('carboot-sale-unisza', 'pasar-malam-pak-tuyu', 2, 1.308),
+('carboot-sale-unisza', 'pasar-malam-masjid-baru-tok-jembal', 3, 1.716),
+('carboot-sale-unisza', 'churros-pantai-teluk-ketapang-by-orked-d-churros', 4, 3.940),
+('carboot-sale-unisza', 'pasar-malam-wakaf-tembesu', 5, 4.151),
+('pasar-binjai', 'pasar-minggu-bandar-baharu-bukit-mentok', 1, 4.598),
+('pasar-binjai', 'padang-astaka', 2, 6.362),
+('pasar-binjai', 'pasar-malam-chukai', 3, 6.420),
+('pasar-binjai', 'pasar-dusun-nyior', 4, 7.380),
+('pasar-binjai', 'pasar-tani-kekal-chukai', 5, 7.440),
+('pasar-pagi', 'pasar-pagi-gong-tok-nasek', 1, 2.175),
+('pasar-pagi', 'pasar-malam-tok-adis', 2, 2.300),
+('pasar-pagi', 'pasar-malam-permint-jaya', 3, 2.493),
+('pasar-pagi', 'churros-kedai-buloh-by-orked-dchurros-pasar-malam', 4, 2.622),
+('pasar-pagi', 'pasar-kedai-buluh', 5, 2.645),
+('tapak-pasar-minggu-kuala-berang', 'pasar-besar-kuala-berang', 1, 0.046),
+('tapak-pasar-minggu-kuala-berang', 'pasar-malam-sabtu-kuala-berang', 2, 0.174),
+('tapak-pasar-minggu-kuala-berang', 'pasar-ajil', 3, 8.501),
+('tapak-pasar-minggu-kuala-berang', 'churros-wakaf-tapai-by-orked-dchurros-pasar-malam', 4, 10.780),
+('tapak-pasar-minggu-kuala-berang', 'pasar-wakaf-tapai', 5, 10.785),
+('pasar-jertih', 'pasar-tani-kekal-ptk-nyiur-tujuh-besut', 1, 2.762),
+('pasar-jertih', 'pasar-malam-gong-kepas-supermas', 2, 8.308),
+('pasar-jertih', 'tapk-pasar-malam-gong-bayor', 3, 8.991),
+('pasar-jertih', 'pasar-kampung-raja', 4, 10.263),
+('pasar-jertih', 'tapak-psar-malam-kampong-raja', 5, 10.275),
+('car-boot-sales-dungun-tepi-pantai', 'pasar-malam-isnin-batu-48-baru-bazar-ramadan-batu-48', 1, 2.907),
+('car-boot-sales-dungun-tepi-pantai', 'pasar-minggu-petang-khamis-dungun-thursday', 2, 3.972),
+('car-boot-sales-dungun-tepi-pantai', 'dungun-market-vsr-bsr-dwghwn', 3, 5.610),
+('car-boot-sales-dungun-tepi-pantai', 'pasar-malam-nibong-stesen', 4, 5.768),
+('car-boot-sales-dungun-tepi-pantai', 'pasar-malam-paka', 5, 10.395),
+('air-balang-ummi', 'pasar-malam-drawbridge', 1, 0.809),
+('air-balang-ummi', 'dtrn-shhbndr-dataran-shahbandar', 2, 1.076),
+('air-balang-ummi', 'pasar-payang', 3, 1.107),
+('air-balang-ummi', 'pasar-malam-taman-permint-perdana', 4, 1.184),
+('air-balang-ummi', 'pasar-malam-tanjung', 5, 1.397),
+('pasar-tani-kekal-ptk-nyiur-tujuh-besut', 'pasar-jertih', 1, 2.762),
+('pasar-tani-kekal-ptk-nyiur-tujuh-besut', 'pasar-malam-gong-kepas-supermas', 2, 5.557),
+('pasar-tani-kekal-ptk-nyiur-tujuh-besut', 'tapk-pasar-malam-gong-bayor', 3, 6.605),
+('pasar-tani-kekal-ptk-nyiur-tujuh-besut', 'pasar-kampung-raja', 4, 7.546),
+('pasar-tani-kekal-ptk-nyiur-tujuh-besut', 'tapak-psar-malam-kampong-raja', 5, 7.551),
+('dorayaki-amar-kt', 'pasar-tani-padang-hiliran-kterengganu', 1, 0.179),
+('dorayaki-amar-kt', 'pasar-minggu-padang-hiliran', 2, 0.251),
+('dorayaki-amar-kt', 'chuross-hiliran-by-orked-dchurros', 3, 0.279),
+('dorayaki-amar-kt', 'pasar-malam-giant', 4, 0.384),
+('dorayaki-amar-kt', 'pasar-chabang-tiga', 5, 0.599),
+('dtrn-shhbndr-dataran-shahbandar', 'pasar-payang', 1, 0.379),
+('dtrn-shhbndr-dataran-shahbandar', 'pasar-malam-tanjung', 2, 0.688),
+('dtrn-shhbndr-dataran-shahbandar', 'bazar-malam-tanjung', 3, 0.713),
+('dtrn-shhbndr-dataran-shahbandar', 'pasarnita-tanjung-kuala-terengganu', 4, 0.721),
+('dtrn-shhbndr-dataran-shahbandar', 'bandaraya-warisan-pesisir-air-night-market', 5, 0.778),
+('pasar-awam-seri-langkap', 'pasar-malam-wakaf-mesira', 1, 16.982),
+('pasar-awam-seri-langkap', 'pasar-maras', 2, 18.351),
+('pasar-awam-seri-langkap', 'pasar-malam-kesomahad', 3, 18.919),
+('pasar-awam-seri-langkap', 'pasar-malam-banggol-peradongisnin', 4, 18.968),
+('pasar-awam-seri-langkap', 'pasar-malam-kebor-besarkhamis', 5, 20.109),
+('pasar-dusun-nyior', 'pasar-tani-kekal-chukai', 1, 0.091),
+('pasar-dusun-nyior', 'padang-astaka', 2, 1.397),
+('pasar-dusun-nyior', 'pasar-malam-chukai', 3, 1.588),
+('pasar-dusun-nyior', 'pasar-malam-kuala-kemaman', 4, 1.776),
+('pasar-dusun-nyior', 'pasar-minggu-bandar-baharu-bukit-mentok', 5, 2.825),
+('pasar-minggu-petang-jumaat-felda-jerangau', 'pekan-rabu-dendang', 1, 9.391),
+('pasar-minggu-petang-jumaat-felda-jerangau', 'tapak-pasar-minggu-petang-isnin-kg-tok-dor', 2, 10.000),
+('pasar-minggu-petang-jumaat-felda-jerangau', 'pasar-minggu-tok-faqir', 3, 17.308),
+('pasar-minggu-petang-jumaat-felda-jerangau', 'pasar-malam-merchang', 4, 18.827),
+('pasar-minggu-petang-jumaat-felda-jerangau', 'pasar-ajil', 5, 23.243),
+('bandar-permaisuri-market', 'pasar-renek', 1, 23.292),
+('bandar-permaisuri-market', 'pasar-awam-seri-langkap', 2, 23.349),
+('bandar-permaisuri-market', 'pasar-tembila', 3, 28.008),
+('bandar-permaisuri-market', 'night-market-kg-bukit-payong', 4, 28.643),
+('bandar-permaisuri-market', 'pasar-malam-bukit-payong', 5, 28.682),
+('churros-marang-by-orked-dchurros-pasar-malam', 'pasar-marang', 1, 0.043),
+('churros-marang-by-orked-dchurros-pasar-malam', 'pasar-malam-sungai-kerak', 2, 1.297),
+('churros-marang-by-orked-dchurros-pasar-malam', 'pasar-malam-rhu-muda-hari-khamis', 3, 3.134),
+('churros-marang-by-orked-dchurros-pasar-malam', 'pasar-malam-simpang-4-chenderingselasa', 4, 7.366),
+('churros-marang-by-orked-dchurros-pasar-malam', 'pasar-malam-permint-jaya', 5, 8.618),
+('pulau-warisan-river-cruise', 'churros-churros-kt', 1, 0.010),
+('pulau-warisan-river-cruise', 'kt-night-market', 2, 0.056),
+('pulau-warisan-river-cruise', 'bandaraya-warisan-pesisir-air-night-market', 3, 0.136),
+('pulau-warisan-river-cruise', 'uptown-pulau-warisan', 4, 0.175),
+('pulau-warisan-river-cruise', 'pasar-payang', 5, 0.592),
+('bukit-payung-wet-market', 'pasar-bukit-payong', 1, 0.020),
+('bukit-payung-wet-market', 'churros-bukit-payong-by-orked-dchurros-pasar-malam', 2, 0.130),
+('bukit-payung-wet-market', 'pasar-malam-wakaf-dua', 3, 1.502),
+('bukit-payung-wet-market', 'pasar-malam-taman-safiah-murni', 4, 2.409),
+('bukit-payung-wet-market', 'pasar-kedai-buluh', 5, 3.791),
+('padang-astaka', 'pasar-malam-chukai', 1, 0.288),
+('padang-astaka', 'pasar-dusun-nyior', 2, 1.397),
+('padang-astaka', 'pasar-tani-kekal-chukai', 3, 1.487),
+('padang-astaka', 'pasar-minggu-bandar-baharu-bukit-mentok', 4, 1.789),
+('padang-astaka', 'pasar-malam-kuala-kemaman', 5, 2.682),
+('tapak-pasar-minggu-petang-isnin-kg-tok-dor', 'pasar-minggu-petang-jumaat-felda-jerangau', 1, 10.000),
+('tapak-pasar-minggu-petang-isnin-kg-tok-dor', 'pasar-ajil', 2, 13.304),
+('tapak-pasar-minggu-petang-isnin-kg-tok-dor', 'pasar-malam-merchang', 3, 16.631),
+('tapak-pasar-minggu-petang-isnin-kg-tok-dor', 'pasar-minggu-tok-faqir', 4, 16.854),
+('tapak-pasar-minggu-petang-isnin-kg-tok-dor', 'pasar-minggu-petang-sabtu-dan-isninbazar-ramadhanwakaf-tapai', 5, 18.363),
+('pasar-nelayan-seberang-kastam', 'kuala-besut-farmers-market', 1, 1.464),
+('pasar-nelayan-seberang-kastam', 'pasar-kampung-raja', 2, 3.046),
+('pasar-nelayan-seberang-kastam', 'tapak-psar-malam-kampong-raja', 3, 3.127),
+('pasar-nelayan-seberang-kastam', 'pasar-malam-gong-kepas-supermas', 4, 4.977),
+('pasar-nelayan-seberang-kastam', 'tapk-pasar-malam-gong-bayor', 5, 8.809),
+('pisang-goreng-dataran-austin', 'pasar-malam-kg-gong-pak-damat', 1, 0.740),
+('pisang-goreng-dataran-austin', 'pasar-malam-wakaf-tembesu', 2, 0.869),
+('pisang-goreng-dataran-austin', 'pasar-batu-enam', 3, 1.196),
+('pisang-goreng-dataran-austin', 'pasar-malam-baru-enam', 4, 1.267),
+('pisang-goreng-dataran-austin', 'pasar-bukit-tunggal', 5, 2.295),
+('pasar-tani-kekal-chukai', 'pasar-dusun-nyior', 1, 0.091),
+('pasar-tani-kekal-chukai', 'padang-astaka', 2, 1.487),
+('pasar-tani-kekal-chukai', 'pasar-malam-chukai', 3, 1.678),
+('pasar-tani-kekal-chukai', 'pasar-malam-kuala-kemaman', 4, 1.754),
+('pasar-tani-kekal-chukai', 'pasar-minggu-bandar-baharu-bukit-mentok', 5, 2.894)
+;
+
+-- End of seed script
\ No newline at end of file
@@ -14,9 +14,17 @@ COLUMNS = [
     "parking_available", "parking_accessible", "parking_notes",
     "amen_toilet", "amen_prayer_room",
     "location", "schedule",
-    "created_at", "updated_at", "shop_list"
+    "created_at", "updated_at", "shop_list",
+    "crowd_profile"
 ]
 
+def parse_sql_columns(sql_text):
+    """Read the column list from the INSERT statement, falling back to COLUMNS."""
+    match = re.search(r'INSERT INTO\s+\S+\s*\((.*?)\)\s*VALUES', sql_text, re.DOTALL)
+    if not match:
+        return COLUMNS
+    return [c.strip().strip('"') for c in match.group(1).split(',') if c.strip()]
+
 def parse_sql_values(sql_text):
     # Extract everything between VALUES\n\n and the final semicolon
     match = re.search(r'VALUES\s*\n\n(.+);?\s*$', sql_text, re.DOTALL)
@@ -138,23 +146,37 @@ def parse_row(row_str):
 
     return normalized
 
+def sql_to_rows(sql_text):
+    """
+    Convert seed SQL to (columns, rows, skipped).
+    skipped lists (row number, preview) for rows whose column count is wrong.
+    """
+    columns = parse_sql_columns(sql_text)
+    rows = []
+    skipped = []
+    for i, row_str in enumerate(parse_sql_values(sql_text)):
+        values = parse_row(row_str)
+        if len(values) != len(columns):
+            skipped.append((i + 1, len(values), row_str[:120]))
+            continue
+        rows.append(values)
+    return columns, rows, skipped
+
 def main():
     with open(INPUT, encoding='utf-8') as f:
         sql = f.read()
 
-    rows_str = parse_sql_values(sql)
-    print(f"Found {len(rows_str)} rows")
+    columns, rows, skipped = sql_to_rows(sql)
+    print(f"Found {len(rows) + len(skipped)} rows")
 
     with open(OUTPUT, 'w', newline='', encoding='utf-8') as f:
         writer = csv.writer(f)
-        writer.writerow(COLUMNS)
-        for i, row_str in enumerate(rows_str):
-            values = parse_row(row_str)
-            if len(values) != len(COLUMNS):
-                print(f"Row {i+1}: expected {len(COLUMNS)} cols, got {len(values)} — skipping", file=sys.stderr)
-                print(f"  Preview: {row_str[:120]}", file=sys.stderr)
-                continue
-            writer.writerow(values)
+        writer.writerow(columns)
+        writer.writerows(rows)
+
+    for row_number, count, preview in skipped:
+        print(f"Row {row_number}: expected {len(columns)} cols, got {count} — skipping", file=sys.stderr)
+        print(f"  Preview: {preview}", file=sys.stderr)
 
     print(f"Written to {OUTPUT}")
 